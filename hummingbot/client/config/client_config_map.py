@@ -1,3 +1,4 @@
+import importlib.util
 import json
 import random
 import re
@@ -172,6 +173,117 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class DBWriteBehindConfigMap(BaseClientModel):
+    db_write_behind_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Write the orders and trades to the database in batches from a background thread? (True/False)"
+            ),
+        ),
+    )
+    db_write_behind_batch_size: int = Field(
+        default=100,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the max number of records written in a single transaction (Default=100)"
+            ),
+        ),
+    )
+    db_write_behind_flush_interval: float = Field(
+        default=0.5,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the max seconds a record waits before its batch is written (Default=0.5)"
+            ),
+        ),
+    )
+    db_write_behind_max_backlog: int = Field(
+        default=10000,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the max number of records waiting to be written. Recording waits for the pending writes while "
+                "it is full (Default=10000)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "db_write_behind"
+
+    @validator("db_write_behind_max_backlog")
+    def validate_db_write_behind_max_backlog(cls, v: int, values: Dict):
+        batch_size = values.get("db_write_behind_batch_size")
+        if batch_size is not None and v < batch_size:
+            raise ValueError(f"The backlog ({v}) can't be lower than the batch size ({batch_size}).")
+        return v
+
+
+class TradesExportFormat(str, ClientConfigEnum):
+    csv = "csv"
+    parquet = "parquet"
+    csv_and_parquet = "csv_and_parquet"
+
+
+class TradesExportConfigMap(BaseClientModel):
+    trades_export_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Export the trades of each strategy to a file in the data folder as they are filled? (True/False)"
+            ),
+        ),
+    )
+    trades_export_format: TradesExportFormat = Field(
+        default=TradesExportFormat.csv,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Select the format of the exported trades ({'/'.join(list(TradesExportFormat))})"
+            ),
+        ),
+    )
+    trades_export_flush_interval: float = Field(
+        default=5.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the max seconds an exported trade waits before it is written to disk (Default=5)"
+            ),
+        ),
+    )
+    trades_export_batch_size: int = Field(
+        default=100,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the max number of exported trades waiting to be written to disk (Default=100)"
+            ),
+        ),
+    )
+    trades_export_max_csv_file_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the size in bytes after which the trades CSV file is rotated (leave empty to never rotate)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "trades_export"
+
+    @validator("trades_export_format")
+    def validate_trades_export_format(cls, v: TradesExportFormat):
+        if v in (TradesExportFormat.parquet, TradesExportFormat.csv_and_parquet) and \
+                importlib.util.find_spec("pyarrow") is None:
+            raise ValueError("The Parquet export requires the pyarrow package, which is not installed.")
+        return v
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -316,6 +428,16 @@ class PaperTradeConfigMap(BaseClientModel):
         ),
     )
 
+    paper_trade_queue_position_fills: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Fill paper trade limit orders only after the order book volume ahead of them at their price level "
+                "has traded (Yes/No)?"
+            ),
+        ),
+    )
+
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
         if isinstance(v, str):
@@ -1036,6 +1158,14 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    sliding_window_throttler: bool = Field(
+        default=False,
+        description=("Use the sliding window throttler for the exchange API requests. It keeps a running total per "
+                     "rate limit instead of scanning all the requests of the last time interval on each check."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to use the sliding window throttler? (True/False)",
+        ),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
@@ -1066,6 +1196,8 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    db_write_behind: DBWriteBehindConfigMap = Field(default=DBWriteBehindConfigMap())
+    trades_export: TradesExportConfigMap = Field(default=TradesExportConfigMap())
 
     class Config:
         title = "client_config_map"
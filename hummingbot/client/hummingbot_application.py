@@ -326,6 +326,15 @@ class HummingbotApplication(*commands):
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            write_behind=self.client_config_map.db_write_behind.db_write_behind_enabled,
+            write_behind_batch_size=self.client_config_map.db_write_behind.db_write_behind_batch_size,
+            write_behind_flush_interval=self.client_config_map.db_write_behind.db_write_behind_flush_interval,
+            write_behind_max_backlog=self.client_config_map.db_write_behind.db_write_behind_max_backlog,
+            trades_export_format=(self.client_config_map.trades_export.trades_export_format.value
+                                  if self.client_config_map.trades_export.trades_export_enabled else None),
+            trades_export_flush_interval=self.client_config_map.trades_export.trades_export_flush_interval,
+            trades_export_batch_size=self.client_config_map.trades_export.trades_export_batch_size,
+            trades_csv_max_file_size=self.client_config_map.trades_export.trades_export_max_csv_file_size,
         )
         self.markets_recorder.start()
         if self._mqtt is not None:
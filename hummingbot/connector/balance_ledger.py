@@ -0,0 +1,156 @@
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from hummingbot.connector.constants import s_decimal_0
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class BalanceLedger:
+    """
+    Keeps, per asset, the balance changes since the last balance snapshot of a connector without real time balance
+    updates, so that the available balance can be adjusted without going through all the in-flight orders and the
+    event logs on each lookup.
+
+    The ledger holds the balances locked by the orders of the snapshot, the balances locked by the orders currently
+    tracked and the balances traded by the fills after the snapshot. The tracked orders are updated by the
+    ClientOrderTracker, and the fills are received as OrderFilled events through `fill_forwarder`. The amounts are
+    calculated like ConnectorBase.in_flight_asset_balances and ConnectorBase.order_filled_balances, so each lookup is
+    a few dictionary reads.
+    """
+
+    def __init__(self, maker_fee_pct: Callable[[], Decimal]):
+        """
+        :param maker_fee_pct: returns the estimated maker fee percentage, added to the balance locked by buy orders.
+            It is only called on lookups, like ConnectorBase.in_flight_asset_balances does.
+        """
+        self._maker_fee_pct = maker_fee_pct
+        # Balances locked by sell orders (base asset) and by buy orders (quote asset, before fees)
+        self._snapshot_sell_balances: Dict[str, Decimal] = {}
+        self._snapshot_buy_balances: Dict[str, Decimal] = {}
+        self._in_flight_sell_balances: Dict[str, Decimal] = {}
+        self._in_flight_buy_balances: Dict[str, Decimal] = {}
+        self._order_balances: Dict[str, Tuple[bool, str, Decimal]] = {}
+        self._filled_balances: Dict[str, Decimal] = {}
+        self._snapshot_timestamp = 0.0
+        self._fill_forwarder = EventForwarder(self.add_fill)
+
+    @property
+    def fill_forwarder(self) -> EventForwarder:
+        """
+        The listener to register for the OrderFilled events of the connector.
+        """
+        return self._fill_forwarder
+
+    @property
+    def filled_balances(self) -> Dict[str, Decimal]:
+        return self._filled_balances
+
+    def snapshot_balance(self, currency: str) -> Decimal:
+        """
+        :return: the balance locked by the orders of the snapshot, including fees
+        """
+        return self._locked_balance(self._snapshot_sell_balances, self._snapshot_buy_balances, currency)
+
+    def in_flight_balance(self, currency: str) -> Decimal:
+        """
+        :return: the balance locked by the tracked orders, including fees
+        """
+        return self._locked_balance(self._in_flight_sell_balances, self._in_flight_buy_balances, currency)
+
+    def balance_update_since_snapshot(self, currency: str) -> Decimal:
+        """
+        :param currency: the token symbol
+        :return: the amount to add to the available balance of the snapshot to get the current available balance
+        """
+        return (self.snapshot_balance(currency)
+                - self.in_flight_balance(currency)
+                + self._filled_balances.get(currency, s_decimal_0))
+
+    def set_snapshot_orders(self, in_flight_orders: Dict[str, any]):
+        """
+        Sets the orders alive when the balances were updated.
+        :param in_flight_orders: the in-flight orders of the snapshot by client order id
+        """
+        self._snapshot_sell_balances = {}
+        self._snapshot_buy_balances = {}
+        for order in (in_flight_orders or {}).values():
+            order_balance = self._order_balance(order)
+            if order_balance is not None:
+                self._add_balance(self._snapshot_sell_balances, self._snapshot_buy_balances, *order_balance)
+
+    def set_snapshot_timestamp(self, timestamp: float, events: Iterable[any]):
+        """
+        Sets the time the balances were updated, and takes the fills after it from the connector event logs.
+        :param timestamp: the timestamp of the balance snapshot
+        :param events: the events logged by the connector
+        """
+        self._snapshot_timestamp = timestamp
+        self._filled_balances = {}
+        for event in events:
+            if isinstance(event, OrderFilledEvent):
+                self.add_fill(event)
+
+    def update_order(self, order: any):
+        """
+        Updates the balance locked by a tracked order after it is created or updated.
+        """
+        self.remove_order(order.client_order_id)
+        order_balance = self._order_balance(order)
+        if order_balance is not None:
+            self._order_balances[order.client_order_id] = order_balance
+            self._add_balance(self._in_flight_sell_balances, self._in_flight_buy_balances, *order_balance)
+
+    def remove_order(self, client_order_id: str):
+        """
+        Releases the balance locked by an order that is no longer tracked.
+        """
+        order_balance = self._order_balances.pop(client_order_id, None)
+        if order_balance is not None:
+            is_buy, asset, amount = order_balance
+            self._add_balance(self._in_flight_sell_balances, self._in_flight_buy_balances, is_buy, asset, -amount)
+
+    def add_fill(self, event: OrderFilledEvent):
+        if event.timestamp <= self._snapshot_timestamp:
+            return
+        base, quote = event.trading_pair.split("-")
+        quote_value = event.price * event.amount
+        if event.trade_type is TradeType.BUY:
+            base_value, quote_value = event.amount, -quote_value
+        else:
+            base_value = -event.amount
+        self._filled_balances[base] = self._filled_balances.get(base, s_decimal_0) + base_value
+        self._filled_balances[quote] = self._filled_balances.get(quote, s_decimal_0) + quote_value
+
+    def _locked_balance(self,
+                        sell_balances: Dict[str, Decimal],
+                        buy_balances: Dict[str, Decimal],
+                        currency: str) -> Decimal:
+        balance = sell_balances.get(currency, s_decimal_0)
+        buy_balance = buy_balances.get(currency, s_decimal_0)
+        if buy_balance != s_decimal_0:
+            balance += buy_balance * (Decimal(1) + self._maker_fee_pct())
+        return balance
+
+    @staticmethod
+    def _add_balance(sell_balances: Dict[str, Decimal],
+                     buy_balances: Dict[str, Decimal],
+                     is_buy: bool,
+                     asset: str,
+                     amount: Decimal):
+        balances = buy_balances if is_buy else sell_balances
+        balances[asset] = balances.get(asset, s_decimal_0) + amount
+
+    @staticmethod
+    def _order_balance(order: any) -> Optional[Tuple[bool, str, Decimal]]:
+        """
+        :return: whether the order is a buy, the asset it locks and the locked amount before fees, or None for the
+            orders that are no longer alive
+        """
+        if order.is_done or order.is_failure or order.is_cancelled:
+            return None
+        outstanding_amount = order.amount - order.executed_amount_base
+        if order.trade_type is TradeType.BUY:
+            return True, order.quote_asset, outstanding_amount * order.price
+        return False, order.base_asset, outstanding_amount
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Callable, Dict, Optional
 
 from cachetools import TTLCache
 
+from hummingbot.connector.balance_ledger import BalanceLedger
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
@@ -61,6 +62,7 @@ class ClientOrderTracker:
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
+        self._balance_ledger: Optional[BalanceLedger] = None
 
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
@@ -140,13 +142,30 @@ class ClientOrderTracker:
     def lost_order_count_limit(self, value: int):
         self._lost_order_count_limit = value
 
+    @property
+    def balance_ledger(self) -> Optional[BalanceLedger]:
+        return self._balance_ledger
+
+    @balance_ledger.setter
+    def balance_ledger(self, value: Optional[BalanceLedger]):
+        """
+        Sets the ledger to keep updated with the balances locked by the active orders.
+        """
+        self._balance_ledger = value
+        if value is not None:
+            for order in self._in_flight_orders.values():
+                value.update_order(order)
+
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._update_order_balance(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
+            if self._balance_ledger is not None:
+                self._balance_ledger.remove_order(client_order_id)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
@@ -210,6 +229,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
             if updated:
+                self._update_order_balance(tracked_order)
                 self._trigger_order_fills(
                     tracked_order=tracked_order,
                     prev_executed_amount_base=previous_executed_amount_base,
@@ -291,6 +311,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._update_order_balance(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -304,6 +325,10 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _update_order_balance(self, order: InFlightOrder):
+        if self._balance_ledger is not None and order.client_order_id in self._in_flight_orders:
+            self._balance_ledger.update_order(order)
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
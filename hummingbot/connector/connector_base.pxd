@@ -12,6 +12,7 @@ cdef class ConnectorBase(NetworkIterator):
         public bint _real_time_balance_update
         public dict _in_flight_orders_snapshot
         public double _in_flight_orders_snapshot_timestamp
+        public object _balance_ledger
         public set _current_trade_fills
         public dict _exchange_order_ids
         public object _trade_fee_schema
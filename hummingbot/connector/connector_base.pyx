@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -19,6 +19,7 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
 if TYPE_CHECKING:
+    from hummingbot.connector.balance_ledger import BalanceLedger
     from hummingbot.client.config.client_config_map import ClientConfigMap
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
@@ -62,6 +63,9 @@ cdef class ConnectorBase(NetworkIterator):
         # for _in_flight_orders_snapshot and _in_flight_orders_snapshot_timestamp when the update user balances.
         self._in_flight_orders_snapshot = {}  # Dict[order_id:str, InFlightOrderBase]
         self._in_flight_orders_snapshot_timestamp = 0.0
+        # Optional BalanceLedger that keeps the balance changes since the snapshot up to date. If not set, they are
+        # calculated from the in flight orders and the event logs on each available balance lookup.
+        self._balance_ledger = None
         self._current_trade_fills = set()
         self._exchange_order_ids = dict()
         self._trade_fee_schema = None
@@ -87,6 +91,8 @@ cdef class ConnectorBase(NetworkIterator):
     @in_flight_orders_snapshot.setter
     def in_flight_orders_snapshot(self, value: Dict[str, InFlightOrderBase]):
         self._in_flight_orders_snapshot = value
+        if self._balance_ledger is not None:
+            self._balance_ledger.set_snapshot_orders(value)
 
     @property
     def in_flight_orders_snapshot_timestamp(self) -> float:
@@ -95,6 +101,12 @@ cdef class ConnectorBase(NetworkIterator):
     @in_flight_orders_snapshot_timestamp.setter
     def in_flight_orders_snapshot_timestamp(self, value: float):
         self._in_flight_orders_snapshot_timestamp = value
+        if self._balance_ledger is not None:
+            self._balance_ledger.set_snapshot_timestamp(value, self.event_logs)
+
+    @property
+    def balance_ledger(self) -> Optional["BalanceLedger"]:
+        return self._balance_ledger
 
     def estimate_fee_pct(self, is_maker: bool) -> Decimal:
         """
@@ -401,6 +413,8 @@ cdef class ConnectorBase(NetworkIterator):
         _update_balances()
         :returns the real available that accounts for changes in flight orders and filled orders
         """
+        if self._balance_ledger is not None:
+            return available_balance + self._balance_ledger.balance_update_since_snapshot(currency)
         snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
         in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
         orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
@@ -103,9 +103,10 @@ class HyperliquidPerpetualAuth(AuthBase):
         return payload
 
     def _sign_cancel_params(self, params, base_url, timestamp):
+        cancels = params["cancels"]
         order_action = {
             "type": "cancelByCloid",
-            "cancels": [params["cancels"]],
+            "cancels": cancels if isinstance(cancels, list) else [cancels],
         }
         signature = self.sign_l1_action(
             self.wallet,
@@ -125,11 +126,13 @@ class HyperliquidPerpetualAuth(AuthBase):
 
     def _sign_order_params(self, params, base_url, timestamp):
 
-        order = params["orders"]
+        orders = params["orders"]
+        if not isinstance(orders, list):
+            orders = [orders]
         grouping = params["grouping"]
         order_action = {
             "type": "order",
-            "orders": [order_spec_to_order_wire(order)],
+            "orders": [order_spec_to_order_wire(order) for order in orders],
             "grouping": grouping,
         }
         signature = self.sign_l1_action(
@@ -19,6 +19,7 @@ from hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual
     HyperliquidPerpetualUserStreamDataSource,
 )
 from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.perpetual_derivative_py_base import PerpetualDerivativePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair, get_new_client_order_id
@@ -43,6 +44,8 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
 
     SHORT_POLL_INTERVAL = 5.0
     LONG_POLL_INTERVAL = 12.0
+    BATCH_ORDER_CREATE_LIMIT = CONSTANTS.MAX_ORDERS_PER_BATCH
+    BATCH_ORDER_CANCEL_LIMIT = CONSTANTS.MAX_ORDERS_PER_BATCH
 
     def __init__(
             self,
@@ -279,6 +282,97 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
 
     # === Orders placing ===
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        order_specs = []
+        for order in orders:
+            price = order.price
+            if order.order_type is OrderType.MARKET and (price is None or price.is_nan()):
+                price = self._market_order_price(trading_pair=order.trading_pair,
+                                                 is_buy=order.trade_type is TradeType.BUY)
+            order_specs.append(await self._order_spec(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=price,
+                position_action=order.position,
+            ))
+        api_params = {
+            "type": "order",
+            "grouping": "na",
+            "orders": order_specs,
+        }
+        order_result = await self._api_post(
+            path_url=CONSTANTS.CREATE_ORDER_URL,
+            data=api_params,
+            is_auth_required=True)
+        if order_result.get("status") == "err":
+            raise IOError(f"Error submitting orders batch: {order_result['response']}")
+
+        # The statuses are listed in the same order as the orders in the request
+        results = []
+        for order, status in zip(orders, order_result["response"]["data"]["statuses"]):
+            exchange_order_id = None
+            exception = None
+            if "error" in status:
+                exception = IOError(f"Error submitting order {order.client_order_id}: {status['error']}")
+            else:
+                o_data = status.get("resting") or status.get("filled")
+                exchange_order_id = str(o_data["oid"])
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=order.trading_pair,
+                exception=exception,
+            ))
+        return results
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        cancels = []
+        for order in orders:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair)
+            cancels.append({"asset": self.coin_to_asset[symbol.split("-")[0]], "cloid": order.client_order_id})
+        api_params = {
+            "type": "cancel",
+            "cancels": cancels,
+        }
+        cancel_result = await self._api_post(
+            path_url=CONSTANTS.CANCEL_ORDER_URL,
+            data=api_params,
+            is_auth_required=True)
+        if cancel_result.get("status") == "err":
+            raise IOError(f"Error cancelling orders batch: {cancel_result['response']}")
+
+        results = []
+        for order, status in zip(orders, cancel_result["response"]["data"]["statuses"]):
+            # Like for single cancelations, a failed cancelation means the order is no longer in the exchange
+            is_error = isinstance(status, dict) and "error" in status
+            results.append(CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                not_found=is_error,
+            ))
+        return results
+
+    def _new_client_order_id(self, is_buy: bool, trading_pair: str) -> str:
+        order_id = get_new_client_order_id(
+            is_buy=is_buy,
+            trading_pair=trading_pair,
+            hbot_order_id_prefix=self.client_order_id_prefix,
+            max_id_len=self.client_order_id_max_length
+        )
+        md5 = hashlib.md5()
+        md5.update(order_id.encode('utf-8'))
+        return f"0x{md5.hexdigest()}"
+
+    def _market_order_price(self, trading_pair: str, is_buy: bool) -> Decimal:
+        mid_price = self.get_mid_price(trading_pair)
+        slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
+        market_price = mid_price * Decimal(1 + slippage if is_buy else 1 - slippage)
+        return self.quantize_order_price(trading_pair, market_price)
+
     def buy(self,
             trading_pair: str,
             amount: Decimal,
@@ -295,20 +389,9 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
 
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=True,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._new_client_order_id(is_buy=True, trading_pair=trading_pair)
         if order_type is OrderType.MARKET:
-            mid_price = self.get_mid_price(trading_pair)
-            slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
-            market_price = mid_price * Decimal(1 + slippage)
-            price = self.quantize_order_price(trading_pair, market_price)
+            price = self._market_order_price(trading_pair=trading_pair, is_buy=True)
 
         safe_ensure_future(self._create_order(
             trade_type=TradeType.BUY,
@@ -334,20 +417,9 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         :param price: the order price
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=False,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._new_client_order_id(is_buy=False, trading_pair=trading_pair)
         if order_type is OrderType.MARKET:
-            mid_price = self.get_mid_price(trading_pair)
-            slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
-            market_price = mid_price * Decimal(1 - slippage)
-            price = self.quantize_order_price(trading_pair, market_price)
+            price = self._market_order_price(trading_pair=trading_pair, is_buy=False)
 
         safe_ensure_future(self._create_order(
             trade_type=TradeType.SELL,
@@ -359,7 +431,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
             **kwargs))
         return hex_order_id
 
-    async def _place_order(
+    async def _order_spec(
             self,
             order_id: str,
             trading_pair: str,
@@ -368,9 +440,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
             order_type: OrderType,
             price: Decimal,
             position_action: PositionAction = PositionAction.NIL,
-            **kwargs,
-    ) -> Tuple[str, float]:
-
+    ) -> Dict[str, Any]:
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         coin = symbol.split("-")[0]
         param_order_type = {"limit": {"tif": "Gtc"}}
@@ -379,18 +449,40 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         if order_type is OrderType.MARKET:
             param_order_type = {"limit": {"tif": "Ioc"}}
 
+        return {
+            "asset": self.coin_to_asset[coin],
+            "isBuy": True if trade_type is TradeType.BUY else False,
+            "limitPx": float(price),
+            "sz": float(amount),
+            "reduceOnly": position_action == PositionAction.CLOSE,
+            "orderType": param_order_type,
+            "cloid": order_id,
+        }
+
+    async def _place_order(
+            self,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            trade_type: TradeType,
+            order_type: OrderType,
+            price: Decimal,
+            position_action: PositionAction = PositionAction.NIL,
+            **kwargs,
+    ) -> Tuple[str, float]:
+
         api_params = {
             "type": "order",
             "grouping": "na",
-            "orders": {
-                "asset": self.coin_to_asset[coin],
-                "isBuy": True if trade_type is TradeType.BUY else False,
-                "limitPx": float(price),
-                "sz": float(amount),
-                "reduceOnly": position_action == PositionAction.CLOSE,
-                "orderType": param_order_type,
-                "cloid": order_id,
-            }
+            "orders": await self._order_spec(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=price,
+                position_action=position_action,
+            ),
         }
         order_result = await self._api_post(
             path_url=CONSTANTS.CREATE_ORDER_URL,
@@ -7,6 +7,8 @@ REST_API_VERSION = "v5"
 HBOT_BROKER_ID = "Hummingbot"
 CLIENT_ID_PREFIX = "93027a12dac34fBC"
 MAX_ID_LEN = 32
+# Max number of orders in each request to the batch order endpoints
+MAX_ORDERS_PER_BATCH = 20
 
 # -------------------------------------------
 # BASE URLS
@@ -124,6 +126,10 @@ REST_PLACE_ACTIVE_ORDER = {METHOD: POST,
                            ENDPOINT: f"/api/{REST_API_VERSION}/trade/order"}
 REST_CANCEL_ACTIVE_ORDER = {METHOD: POST,
                             ENDPOINT: f"/api/{REST_API_VERSION}/trade/cancel-order"}
+REST_PLACE_BATCH_ORDERS = {METHOD: POST,
+                           ENDPOINT: f"/api/{REST_API_VERSION}/trade/batch-orders"}
+REST_CANCEL_BATCH_ORDERS = {METHOD: POST,
+                            ENDPOINT: f"/api/{REST_API_VERSION}/trade/cancel-batch-orders"}
 REST_QUERY_ACTIVE_ORDER = {METHOD: GET,
                            ENDPOINT: REST_PLACE_ACTIVE_ORDER[ENDPOINT]}
 REST_USER_TRADE_RECORDS = {METHOD: GET,
@@ -15,6 +15,7 @@ from hummingbot.connector.derivative.okx_perpetual.okx_perpetual_user_stream_dat
     OkxPerpetualUserStreamDataSource,
 )
 from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.perpetual_derivative_py_base import PerpetualDerivativePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
@@ -39,6 +40,9 @@ s_decimal_0 = Decimal(0)
 
 class OkxPerpetualDerivative(PerpetualDerivativePyBase):
 
+    BATCH_ORDER_CREATE_LIMIT = CONSTANTS.MAX_ORDERS_PER_BATCH
+    BATCH_ORDER_CANCEL_LIMIT = CONSTANTS.MAX_ORDERS_PER_BATCH
+
     web_utils = web_utils
 
     def __init__(
@@ -242,12 +246,82 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
     ) -> Tuple[str, float]:
         if position_action == PositionAction.NIL:
             raise NotImplementedError
-        ex_trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair)
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            position_action=position_action,
+        )
+
+        exchange_order_id = await self._api_post(
+            path_url=CONSTANTS.REST_PLACE_ACTIVE_ORDER[CONSTANTS.ENDPOINT],
+            data=data,
+            is_auth_required=True,
+            trading_pair=data["instId"],
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+            **kwargs,
+        )
+
+        data = exchange_order_id["data"][0]
+        if data["sCode"] != "0":
+            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
+        return str(data["ordId"]), self.current_timestamp
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                position_action=order.position,
+            )
+            for order in orders
+        ]
+        response = await self._api_post(
+            path_url=CONSTANTS.REST_PLACE_BATCH_ORDERS[CONSTANTS.ENDPOINT],
+            data=data,
+            is_auth_required=True,
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+        )
+        if not response.get("data"):
+            raise IOError(f"Error submitting orders batch: {response}")
+
+        trading_pairs = {order.client_order_id: order.trading_pair for order in orders}
+        results = []
+        for order_data in response["data"]:
+            exception = None
+            if order_data["sCode"] != CONSTANTS.RET_CODE_OK:
+                exception = IOError(f"Error submitting order {order_data['clOrdId']}: {order_data['sMsg']}")
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order_data["clOrdId"],
+                exchange_order_id=order_data["ordId"],
+                trading_pair=trading_pairs.get(order_data["clOrdId"]),
+                exception=exception,
+            ))
+        return results
+
+    async def _order_request_data(
+        self,
+        order_id: str,
+        trading_pair: str,
+        amount: Decimal,
+        trade_type: TradeType,
+        order_type: OrderType,
+        price: Decimal,
+        position_action: PositionAction,
+    ) -> Dict[str, Any]:
         data = {
             "clOrdId": order_id,
             "tdMode": "cross",
             "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
-            "instId": ex_trading_pair,
+            "instId": await self.exchange_symbol_associated_to_pair(trading_pair),
             "side": "buy" if trade_type.name == "BUY" else "sell",
             "sz": str(self._format_amount_to_size(trading_pair, amount)),
         }
@@ -260,20 +334,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
                 data["posSide"] = "short" if trade_type is TradeType.BUY else "long"
         else:
             data["posSide"] = "net"
-
-        exchange_order_id = await self._api_post(
-            path_url=CONSTANTS.REST_PLACE_ACTIVE_ORDER[CONSTANTS.ENDPOINT],
-            data=data,
-            is_auth_required=True,
-            trading_pair=ex_trading_pair,
-            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
-            **kwargs,
-        )
-
-        data = exchange_order_id["data"][0]
-        if data["sCode"] != "0":
-            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
-        return str(data["ordId"]), self.current_timestamp
+        return data
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         data = {"instId": await self.exchange_symbol_associated_to_pair(tracked_order.trading_pair)}
@@ -287,16 +348,47 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
             is_auth_required=True,
             trading_pair=tracked_order.trading_pair,
         )
-        data = cancel_result["data"][0]
-        ret_code_ok = data["sCode"] == CONSTANTS.RET_CODE_OK
-        ret_code_order_not_exists = data["sCode"] == CONSTANTS.RET_CODE_CANCEL_FAILED_BECAUSE_ORDER_NOT_EXISTS
-        ret_code_already_canceled = data["sCode"] == CONSTANTS.RET_CODE_ORDER_ALREADY_CANCELLED
-        if ret_code_ok or ret_code_order_not_exists or ret_code_already_canceled:
+        if self._is_cancel_result_successful(cancel_result["data"][0]):
             final_result = True
         else:
             raise IOError(f"Error cancelling order {order_id}: {cancel_result}")
         return final_result
 
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        data = []
+        for order in orders:
+            order_data = {"instId": await self.exchange_symbol_associated_to_pair(order.trading_pair)}
+            if order.exchange_order_id:
+                order_data["ordId"] = order.exchange_order_id
+            order_data["clOrdId"] = order.client_order_id
+            data.append(order_data)
+        response = await self._api_post(
+            path_url=CONSTANTS.REST_CANCEL_BATCH_ORDERS[CONSTANTS.ENDPOINT],
+            data=data,
+            is_auth_required=True,
+        )
+        if not response.get("data"):
+            raise IOError(f"Error cancelling orders batch: {response}")
+
+        trading_pairs = {order.client_order_id: order.trading_pair for order in orders}
+        results = []
+        for cancel_data in response["data"]:
+            exception = None
+            if not self._is_cancel_result_successful(cancel_data):
+                exception = IOError(f"Error cancelling order {cancel_data['clOrdId']}: {cancel_data}")
+            results.append(CancelOrderResult(
+                client_order_id=cancel_data["clOrdId"],
+                trading_pair=trading_pairs.get(cancel_data["clOrdId"]),
+                exception=exception,
+            ))
+        return results
+
+    @staticmethod
+    def _is_cancel_result_successful(cancel_data: Dict[str, Any]) -> bool:
+        return cancel_data["sCode"] in (CONSTANTS.RET_CODE_OK,
+                                        CONSTANTS.RET_CODE_CANCEL_FAILED_BECAUSE_ORDER_NOT_EXISTS,
+                                        CONSTANTS.RET_CODE_ORDER_ALREADY_CANCELLED)
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {"uly": trading_pair, "instType": "SWAP"}
 
@@ -49,8 +49,8 @@ class BinanceOrderBook(OrderBook):
             "trading_pair": msg["trading_pair"],
             "first_update_id": msg["U"],
             "update_id": msg["u"],
-            "bids": msg["b"],
-            "asks": msg["a"]
+            "bids": cls.price_levels_array(msg["b"], msg["u"]),
+            "asks": cls.price_levels_array(msg["a"], msg["u"])
         }, timestamp=timestamp)
 
     @classmethod
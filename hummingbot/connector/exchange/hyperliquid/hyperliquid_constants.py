@@ -6,6 +6,8 @@ BROKER_ID = "HBOT"
 MAX_ORDER_ID_LEN = None
 
 MARKET_ORDER_SLIPPAGE = 0.05
+# Orders and cancels sent in each exchange action. Actions of up to 40 orders weigh as a single request
+MAX_ORDERS_PER_BATCH = 40
 
 DOMAIN = EXCHANGE_NAME
 TESTNET_DOMAIN = "hyperliquid_testnet"
@@ -18,6 +18,7 @@ from hummingbot.connector.exchange.hyperliquid.hyperliquid_api_user_stream_data_
 )
 from hummingbot.connector.exchange.hyperliquid.hyperliquid_auth import HyperliquidAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair, get_new_client_order_id
 from hummingbot.core.api_throttler.data_types import RateLimit
@@ -36,6 +37,8 @@ if TYPE_CHECKING:
 
 class HyperliquidExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    BATCH_ORDER_CREATE_LIMIT = CONSTANTS.MAX_ORDERS_PER_BATCH
+    BATCH_ORDER_CANCEL_LIMIT = CONSTANTS.MAX_ORDERS_PER_BATCH
 
     web_utils = web_utils
 
@@ -263,6 +266,96 @@ class HyperliquidExchange(ExchangePyBase):
 
     # === Orders placing ===
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        order_specs = []
+        for order in orders:
+            price = order.price
+            if order.order_type is OrderType.MARKET and (price is None or price.is_nan()):
+                price = self._market_order_price(trading_pair=order.trading_pair,
+                                                 is_buy=order.trade_type is TradeType.BUY)
+            order_specs.append(await self._order_spec(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=price,
+            ))
+        api_params = {
+            "type": "order",
+            "grouping": "na",
+            "orders": order_specs,
+        }
+        order_result = await self._api_post(
+            path_url=CONSTANTS.CREATE_ORDER_URL,
+            data=api_params,
+            is_auth_required=True)
+        if order_result.get("status") == "err":
+            raise IOError(f"Error submitting orders batch: {order_result['response']}")
+
+        # The statuses are listed in the same order as the orders in the request
+        results = []
+        for order, status in zip(orders, order_result["response"]["data"]["statuses"]):
+            exchange_order_id = None
+            exception = None
+            if "error" in status:
+                exception = IOError(f"Error submitting order {order.client_order_id}: {status['error']}")
+            else:
+                o_data = status.get("resting") or status.get("filled")
+                exchange_order_id = str(o_data["oid"])
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=order.trading_pair,
+                exception=exception,
+            ))
+        return results
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        cancels = []
+        for order in orders:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair)
+            cancels.append({"asset": self.coin_to_asset[symbol], "cloid": order.client_order_id})
+        api_params = {
+            "type": "cancel",
+            "cancels": cancels,
+        }
+        cancel_result = await self._api_post(
+            path_url=CONSTANTS.CANCEL_ORDER_URL,
+            data=api_params,
+            is_auth_required=True)
+        if cancel_result.get("status") == "err":
+            raise IOError(f"Error cancelling orders batch: {cancel_result['response']}")
+
+        results = []
+        for order, status in zip(orders, cancel_result["response"]["data"]["statuses"]):
+            # Like for single cancelations, a failed cancelation means the order is no longer in the exchange
+            is_error = isinstance(status, dict) and "error" in status
+            results.append(CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                not_found=is_error,
+            ))
+        return results
+
+    def _new_client_order_id(self, is_buy: bool, trading_pair: str) -> str:
+        order_id = get_new_client_order_id(
+            is_buy=is_buy,
+            trading_pair=trading_pair,
+            hbot_order_id_prefix=self.client_order_id_prefix,
+            max_id_len=self.client_order_id_max_length
+        )
+        md5 = hashlib.md5()
+        md5.update(order_id.encode('utf-8'))
+        return f"0x{md5.hexdigest()}"
+
+    def _market_order_price(self, trading_pair: str, is_buy: bool) -> Decimal:
+        mid_price = self.get_mid_price(trading_pair)
+        slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
+        market_price = mid_price * Decimal(1 + slippage if is_buy else 1 - slippage)
+        return self.quantize_order_price(trading_pair, market_price)
+
     def buy(self,
             trading_pair: str,
             amount: Decimal,
@@ -279,20 +372,9 @@ class HyperliquidExchange(ExchangePyBase):
 
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=True,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._new_client_order_id(is_buy=True, trading_pair=trading_pair)
         if order_type is OrderType.MARKET:
-            mid_price = self.get_mid_price(trading_pair)
-            slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
-            market_price = mid_price * Decimal(1 + slippage)
-            price = self.quantize_order_price(trading_pair, market_price)
+            price = self._market_order_price(trading_pair=trading_pair, is_buy=True)
 
         safe_ensure_future(self._create_order(
             trade_type=TradeType.BUY,
@@ -318,20 +400,9 @@ class HyperliquidExchange(ExchangePyBase):
         :param price: the order price
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=False,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._new_client_order_id(is_buy=False, trading_pair=trading_pair)
         if order_type is OrderType.MARKET:
-            mid_price = self.get_mid_price(trading_pair)
-            slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
-            market_price = mid_price * Decimal(1 - slippage)
-            price = self.quantize_order_price(trading_pair, market_price)
+            price = self._market_order_price(trading_pair=trading_pair, is_buy=False)
 
         safe_ensure_future(self._create_order(
             trade_type=TradeType.SELL,
@@ -343,7 +414,7 @@ class HyperliquidExchange(ExchangePyBase):
             **kwargs))
         return hex_order_id
 
-    async def _place_order(
+    async def _order_spec(
             self,
             order_id: str,
             trading_pair: str,
@@ -351,9 +422,7 @@ class HyperliquidExchange(ExchangePyBase):
             trade_type: TradeType,
             order_type: OrderType,
             price: Decimal,
-            **kwargs,
-    ) -> Tuple[str, float]:
-
+    ) -> Dict[str, Any]:
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         param_order_type = {"limit": {"tif": "Gtc"}}
         if order_type is OrderType.LIMIT_MAKER:
@@ -361,18 +430,38 @@ class HyperliquidExchange(ExchangePyBase):
         if order_type is OrderType.MARKET:
             param_order_type = {"limit": {"tif": "Ioc"}}
 
+        return {
+            "asset": self.coin_to_asset[symbol],
+            "isBuy": True if trade_type is TradeType.BUY else False,
+            "limitPx": float(price),
+            "sz": float(amount),
+            "reduceOnly": False,
+            "orderType": param_order_type,
+            "cloid": order_id,
+        }
+
+    async def _place_order(
+            self,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            trade_type: TradeType,
+            order_type: OrderType,
+            price: Decimal,
+            **kwargs,
+    ) -> Tuple[str, float]:
+
         api_params = {
             "type": "order",
             "grouping": "na",
-            "orders": {
-                "asset": self.coin_to_asset[symbol],
-                "isBuy": True if trade_type is TradeType.BUY else False,
-                "limitPx": float(price),
-                "sz": float(amount),
-                "reduceOnly": False,
-                "orderType": param_order_type,
-                "cloid": order_id,
-            }
+            "orders": await self._order_spec(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=price,
+            ),
         }
         order_result = await self._api_post(
             path_url = CONSTANTS.CREATE_ORDER_URL,
@@ -24,7 +24,9 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 
 # Auth required
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
+OKX_BATCH_ORDERS_PATH = '/api/v5/trade/batch-orders'
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
+OKX_OPEN_ORDERS_PATH = '/api/v5/trade/orders-pending'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
 OKX_BALANCE_PATH = '/api/v5/account/balance'
@@ -64,6 +66,11 @@ ORDER_TYPE_MAP = {
 
 NO_LIMIT = sys.maxsize
 
+# Max number of orders in each request to the batch order endpoints
+MAX_ORDERS_PER_BATCH = 20
+# Max number of results in each page of the open orders and fills endpoints
+MAX_RESULTS_PER_PAGE = 100
+
 RATE_LIMITS = [
     RateLimit(WS_CONNECTION_LIMIT_ID, limit=3, time_interval=1),
     RateLimit(WS_REQUEST_LIMIT_ID, limit=100, time_interval=10),
@@ -76,8 +83,11 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_ORDER_BOOK_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=20, time_interval=2),
+    RateLimit(limit_id=OKX_OPEN_ORDERS_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=20, time_interval=2),
-    RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
+    # The batch endpoints limits are 300 orders every 2 seconds
+    RateLimit(limit_id=OKX_BATCH_ORDERS_PATH, limit=300 // MAX_ORDERS_PER_BATCH, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300 // MAX_ORDERS_PER_BATCH, time_interval=2),
     RateLimit(limit_id=OKX_BALANCE_PATH, limit=10, time_interval=2),
     RateLimit(limit_id=OKX_TRADE_FILLS_PATH, limit=60, time_interval=2),
 ]
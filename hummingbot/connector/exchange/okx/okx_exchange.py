@@ -10,6 +10,7 @@ from hummingbot.connector.exchange.okx.okx_api_user_stream_data_source import Ok
 from hummingbot.connector.exchange.okx.okx_auth import OkxAuth
 from hummingbot.connector.exchange_base import s_decimal_NaN
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -27,6 +28,11 @@ if TYPE_CHECKING:
 
 class OkxExchange(ExchangePyBase):
 
+    BATCH_ORDER_CREATE_LIMIT = CONSTANTS.MAX_ORDERS_PER_BATCH
+    BATCH_ORDER_CANCEL_LIMIT = CONSTANTS.MAX_ORDERS_PER_BATCH
+    ORDER_BOOK_INIT_CONCURRENCY = 5
+    ORDER_UPDATE_CONCURRENCY = 5
+
     web_utils = web_utils
 
     def __init__(self,
@@ -185,6 +191,70 @@ class OkxExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
 
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        exchange_order_id = await self._api_request(
+            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
+        )
+        data = exchange_order_id["data"][0]
+        if data["sCode"] != "0":
+            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
+        return str(data["ordId"]), self.current_timestamp
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+        )
+        if not response.get("data"):
+            raise IOError(f"Error submitting orders batch: {response}")
+
+        trading_pairs = {order.client_order_id: order.trading_pair for order in orders}
+        results = []
+        for order_data in response["data"]:
+            exception = None
+            if order_data["sCode"] != "0":
+                exception = IOError(f"Error submitting order {order_data['clOrdId']}: {order_data['sMsg']}")
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order_data["clOrdId"],
+                exchange_order_id=order_data["ordId"],
+                trading_pair=trading_pairs.get(order_data["clOrdId"]),
+                exception=exception,
+            ))
+        return results
+
+    async def _order_request_data(self,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  trade_type: TradeType,
+                                  order_type: OrderType,
+                                  price: Decimal) -> Dict[str, Any]:
         data = {
             "clOrdId": order_id,
             "tdMode": "cash",
@@ -198,18 +268,7 @@ class OkxExchange(ExchangePyBase):
         else:
             # Specify that the the order quantity for market orders is denominated in base currency
             data["tgtCcy"] = "base_ccy"
-
-        exchange_order_id = await self._api_request(
-            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
-            method=RESTMethod.POST,
-            data=data,
-            is_auth_required=True,
-            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
-        )
-        data = exchange_order_id["data"][0]
-        if data["sCode"] != "0":
-            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
-        return str(data["ordId"]), self.current_timestamp
+        return data
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -224,19 +283,41 @@ class OkxExchange(ExchangePyBase):
             data=params,
             is_auth_required=True,
         )
-        if cancel_result["data"][0]["sCode"] == "0":
-            final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51400":
-            # Cancelation failed because the order does not exist
-            final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51401":
-            # Cancelation failed because order has been cancelled
+        if self._is_cancel_result_successful(cancel_result["data"][0]):
             final_result = True
         else:
             raise IOError(f"Error cancelling order {order_id}: {cancel_result}")
 
         return final_result
 
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        data = [{"clOrdId": order.client_order_id, "instId": order.trading_pair} for order in orders]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        if not response.get("data"):
+            raise IOError(f"Error cancelling orders batch: {response}")
+
+        trading_pairs = {order.client_order_id: order.trading_pair for order in orders}
+        results = []
+        for cancel_data in response["data"]:
+            exception = None
+            if not self._is_cancel_result_successful(cancel_data):
+                exception = IOError(f"Error cancelling order {cancel_data['clOrdId']}: {cancel_data}")
+            results.append(CancelOrderResult(
+                client_order_id=cancel_data["clOrdId"],
+                trading_pair=trading_pairs.get(cancel_data["clOrdId"]),
+                exception=exception,
+            ))
+        return results
+
+    @staticmethod
+    def _is_cancel_result_successful(cancel_data: Dict[str, Any]) -> bool:
+        # 51400: the order does not exist, 51401: the order has already been cancelled
+        return cancel_data["sCode"] in ("0", "51400", "51401")
+
     async def get_last_traded_prices(self, trading_pairs: List[str] = None) -> Dict[str, float]:
         params = {"instType": "SPOT"}
 
@@ -344,6 +425,59 @@ class OkxExchange(ExchangePyBase):
                 "ordId": await order.get_exchange_order_id()},
             is_auth_required=True)
 
+    async def _request_all_pages(self, path_url: str, params: Dict[str, Any], cursor_key: str) -> List[Dict[str, Any]]:
+        """
+        Requests all the pages of a paginated query, from the newest results to the oldest ones.
+
+        :param cursor_key: the field of the results used to request the page after the last result received
+        """
+        results = []
+        page_params = dict(params, limit=str(CONSTANTS.MAX_RESULTS_PER_PAGE))
+        while True:
+            response = await self._api_request(
+                method=RESTMethod.GET,
+                path_url=path_url,
+                params=page_params,
+                is_auth_required=True)
+            if response.get("code") != "0":
+                raise IOError(f"Error requesting {path_url}: {response}")
+            page = response["data"]
+            results.extend(page)
+            if len(page) < CONSTANTS.MAX_RESULTS_PER_PAGE:
+                break
+            page_params["after"] = page[-1][cursor_key]
+        return results
+
+    async def _request_open_orders_updates(self) -> List[OrderUpdate]:
+        orders_data = await self._request_all_pages(
+            path_url=CONSTANTS.OKX_OPEN_ORDERS_PATH,
+            params={"instType": "SPOT"},
+            cursor_key="ordId")
+
+        updatable_orders = self._order_tracker.all_updatable_orders
+        order_updates = []
+        for order_data in orders_data:
+            tracked_order = updatable_orders.get(order_data["clOrdId"])
+            if tracked_order is not None:
+                order_updates.append(self._order_update_from_data(order_data=order_data, order=tracked_order))
+        return order_updates
+
+    async def _request_trade_updates_since(self, timestamp: float) -> List[TradeUpdate]:
+        fills_data = await self._request_all_pages(
+            path_url=CONSTANTS.OKX_TRADE_FILLS_PATH,
+            params={"instType": "SPOT", "begin": str(int(timestamp * 1e3))},
+            cursor_key="billId")
+
+        fillable_orders = self._order_tracker.all_fillable_orders
+        fillable_orders_by_exchange_order_id = self._order_tracker.all_fillable_orders_by_exchange_order_id
+        trade_updates = []
+        for fill_data in fills_data:
+            tracked_order = (fillable_orders.get(fill_data["clOrdId"])
+                             or fillable_orders_by_exchange_order_id.get(str(fill_data["ordId"])))
+            if tracked_order is not None:
+                trade_updates.append(self._trade_update_from_fill_data(fill_data=fill_data, order=tracked_order))
+        return trade_updates
+
     async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
         trade_updates = []
 
@@ -352,41 +486,42 @@ class OkxExchange(ExchangePyBase):
             fills_data = all_fills_response["data"]
 
             for fill_data in fills_data:
-                fee = TradeFeeBase.new_spot_fee(
-                    fee_schema=self.trade_fee_schema(),
-                    trade_type=order.trade_type,
-                    percent_token=fill_data["feeCcy"],
-                    flat_fees=[TokenAmount(amount=-Decimal(fill_data["fee"]), token=fill_data["feeCcy"])]
-                )
-                trade_update = TradeUpdate(
-                    trade_id=str(fill_data["tradeId"]),
-                    client_order_id=order.client_order_id,
-                    exchange_order_id=str(fill_data["ordId"]),
-                    trading_pair=order.trading_pair,
-                    fee=fee,
-                    fill_base_amount=Decimal(fill_data["fillSz"]),
-                    fill_quote_amount=Decimal(fill_data["fillSz"]) * Decimal(fill_data["fillPx"]),
-                    fill_price=Decimal(fill_data["fillPx"]),
-                    fill_timestamp=int(fill_data["ts"]) * 1e-3,
-                )
-                trade_updates.append(trade_update)
+                trade_updates.append(self._trade_update_from_fill_data(fill_data=fill_data, order=order))
 
         return trade_updates
 
+    def _trade_update_from_fill_data(self, fill_data: Dict[str, Any], order: InFlightOrder) -> TradeUpdate:
+        fee = TradeFeeBase.new_spot_fee(
+            fee_schema=self.trade_fee_schema(),
+            trade_type=order.trade_type,
+            percent_token=fill_data["feeCcy"],
+            flat_fees=[TokenAmount(amount=-Decimal(fill_data["fee"]), token=fill_data["feeCcy"])]
+        )
+        return TradeUpdate(
+            trade_id=str(fill_data["tradeId"]),
+            client_order_id=order.client_order_id,
+            exchange_order_id=str(fill_data["ordId"]),
+            trading_pair=order.trading_pair,
+            fee=fee,
+            fill_base_amount=Decimal(fill_data["fillSz"]),
+            fill_quote_amount=Decimal(fill_data["fillSz"]) * Decimal(fill_data["fillPx"]),
+            fill_price=Decimal(fill_data["fillPx"]),
+            fill_timestamp=int(fill_data["ts"]) * 1e-3,
+        )
+
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         updated_order_data = await self._request_order_update(order=tracked_order)
+        return self._order_update_from_data(order_data=updated_order_data["data"][0], order=tracked_order)
 
-        order_data = updated_order_data["data"][0]
-        new_state = CONSTANTS.ORDER_STATE[order_data["state"]]
-
-        order_update = OrderUpdate(
-            client_order_id=tracked_order.client_order_id,
+    @staticmethod
+    def _order_update_from_data(order_data: Dict[str, Any], order: InFlightOrder) -> OrderUpdate:
+        return OrderUpdate(
+            client_order_id=order.client_order_id,
             exchange_order_id=str(order_data["ordId"]),
-            trading_pair=tracked_order.trading_pair,
+            trading_pair=order.trading_pair,
             update_timestamp=int(order_data["uTime"]) * 1e-3,
-            new_state=new_state,
+            new_state=CONSTANTS.ORDER_STATE[order_data["state"]],
         )
-        return order_update
 
     async def _user_stream_event_listener(self):
         async for stream_message in self._iter_user_event_queue():
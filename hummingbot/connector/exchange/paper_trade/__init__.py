@@ -21,4 +21,5 @@ def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfi
     return PaperTradeExchange(client_config_map,
                               tracker,
                               get_connector_class(exchange_name),
-                              exchange_name=exchange_name)
+                              exchange_name=exchange_name,
+                              queue_position_fill_model=client_config_map.paper_trade.paper_trade_queue_position_fills)
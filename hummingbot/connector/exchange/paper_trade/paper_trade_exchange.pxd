@@ -15,6 +15,8 @@ ctypedef pair[string, SingleTradingPairLimitOrders] LimitOrdersPair
 ctypedef unordered_map[string, SingleTradingPairLimitOrders] LimitOrders
 ctypedef cpp_set[CPPLimitOrder].iterator SingleTradingPairLimitOrdersIterator
 ctypedef cpp_set[CPPLimitOrder].reverse_iterator SingleTradingPairLimitOrdersRIterator
+ctypedef unordered_map[string, SingleTradingPairLimitOrdersIterator] LimitOrdersIndex
+ctypedef unordered_map[string, SingleTradingPairLimitOrdersIterator].iterator LimitOrdersIndexIterator
 ctypedef cpp_set[CPPOrderExpirationEntry] LimitOrderExpirationSet
 ctypedef cpp_set[CPPOrderExpirationEntry].iterator LimitOrderExpirationSetIterator
 
@@ -31,6 +33,9 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef:
         LimitOrders _bid_limit_orders
         LimitOrders _ask_limit_orders
+        LimitOrdersIndex _limit_orders_index
+        object _on_hold_balances
+        dict _limit_orders_by_id
         bint _paper_trade_market_initialized
         dict _trading_pairs
         object _queued_orders
@@ -40,6 +45,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
         str _exchange_name
+        bint _queue_position_fill_model
+        dict _queue_positions
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
@@ -53,29 +60,41 @@ cdef class PaperTradeExchange(ExchangeBase):
                           object amount,
                           object price,
                           object is_maker=*)
+    cdef c_add_limit_order(self, LimitOrders *limit_orders_map_ptr, CPPLimitOrder limit_order)
+    cdef c_update_on_hold_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, object amount)
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleTradingPairLimitOrdersIterator orders_it)
+    cdef c_set_limit_order_filled_amount(self,
+                                         LimitOrdersIterator *map_it_ptr,
+                                         SingleTradingPairLimitOrdersIterator orders_it,
+                                         object filled_amount)
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=*)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=*)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef object c_get_queue_position(self, str trading_pair, bint is_buy, object price)
+    cdef c_update_queue_positions(self, bint is_buy, SingleTradingPairLimitOrders *orders_collection_ptr)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef dict c_consume_queue_positions(self, str trading_pair, dict remaining_amounts, object trade_quantity)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
@@ -157,7 +157,13 @@ cdef class PaperTradeExchange(ExchangeBase):
         order_book_tracker: OrderBookTracker,
         target_market: Callable,
         exchange_name: str,
+        queue_position_fill_model: bool = False,
     ):
+        """
+        :param queue_position_fill_model: if True, a limit order resting at a price level of the order book waits
+            for the volume ahead of it at that level to trade before it is filled, and it can be filled partially.
+            Otherwise, limit orders are filled in full as soon as a trade or the order book crosses their price.
+        """
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._set_order_book_tracker(order_book_tracker)
         self._budget_checker = BudgetChecker(exchange=self)
@@ -172,6 +178,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
+        self._queue_position_fill_model = queue_position_fill_model
+        self._queue_positions = {}
+        self._on_hold_balances = defaultdict(Decimal)
+        self._limit_orders_by_id = {}
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
 
         # Trade volume metrics should never be gather for paper trade connector
@@ -242,53 +252,38 @@ cdef class PaperTradeExchange(ExchangeBase):
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
 
+    @property
+    def queue_position_fill_model(self) -> bool:
+        return self._queue_position_fill_model
+
+    @property
+    def queue_positions(self) -> Dict[str, Decimal]:
+        """
+        The order book volume ahead of each resting limit order, by client order id, when the queue position fill
+        model is enabled.
+        """
+        return self._queue_positions
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
-        cdef:
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *single_trading_pair_collection_ptr
-            SingleTradingPairLimitOrdersIterator collection_it
-            SingleTradingPairLimitOrdersRIterator collection_rit
-            const CPPLimitOrder *cpp_limit_order_ptr
-            list retval = []
-
-        map_it = self._bid_limit_orders.begin()
-        while map_it != self._bid_limit_orders.end():
-            single_trading_pair_collection_ptr = address(deref(map_it).second)
-            collection_rit = single_trading_pair_collection_ptr.rbegin()
-            while collection_rit != single_trading_pair_collection_ptr.rend():
-                cpp_limit_order_ptr = address(deref(collection_rit))
-                retval.append(c_create_limit_order_from_cpp_limit_order(deref(cpp_limit_order_ptr)))
-                inc(collection_rit)
-            inc(map_it)
-
-        map_it = self._ask_limit_orders.begin()
-        while map_it != self._ask_limit_orders.end():
-            single_trading_pair_collection_ptr = address(deref(map_it).second)
-            collection_it = single_trading_pair_collection_ptr.begin()
-            while collection_it != single_trading_pair_collection_ptr.end():
-                cpp_limit_order_ptr = address(deref(collection_it))
-                retval.append(c_create_limit_order_from_cpp_limit_order(deref(cpp_limit_order_ptr)))
-                inc(collection_it)
-            inc(map_it)
-
-        return retval
+        """
+        The resting limit orders, in the order they were placed.
+        """
+        return list(self._limit_orders_by_id.values())
 
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
-        _on_hold_balances = defaultdict(Decimal)
-        for limit_order in self.limit_orders:
-            if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
-            else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
-        return _on_hold_balances
+        """
+        The balances locked by the unfilled amounts of the resting limit orders. They are updated when the limit
+        orders are placed, filled and removed.
+        """
+        return defaultdict(Decimal, self._on_hold_balances)
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
         _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
+        for currency in _available_balances:
+            _available_balances[currency] -= self._on_hold_balances.get(currency, s_decimal_0)
         return _available_balances
 
     # </editor-fold>
@@ -337,9 +332,6 @@ cdef class PaperTradeExchange(ExchangeBase):
             string cpp_base_asset = self._trading_pairs[trading_pair_str].base_asset.encode("utf8")
             string cpp_quote_asset = quote_asset.encode("utf8")
             string cpp_position = "NIL".encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -350,14 +342,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
 
-            map_it = self._bid_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._bid_limit_orders.end():
-                insert_result = self._bid_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            self.c_add_limit_order(address(self._bid_limit_orders), CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 True,
@@ -365,11 +350,13 @@ cdef class PaperTradeExchange(ExchangeBase):
                 cpp_quote_asset,
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount,
-                <PyObject *> None,
+                <PyObject *> s_decimal_0,
                 int(self._current_timestamp * 1e6),
                 0,
                 cpp_position,
             ))
+            if self._queue_position_fill_model:
+                self._queue_positions[order_id] = self.c_get_queue_position(trading_pair_str, True, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -398,9 +385,6 @@ cdef class PaperTradeExchange(ExchangeBase):
             string cpp_base_asset = base_asset.encode("utf8")
             string cpp_quote_asset = self._trading_pairs[trading_pair_str].quote_asset.encode("utf8")
             string cpp_position = "NIL".encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -410,14 +394,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, False, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
-            map_it = self._ask_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._ask_limit_orders.end():
-                insert_result = self._ask_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
+            self.c_add_limit_order(address(self._ask_limit_orders), CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
                 False,
@@ -425,11 +402,13 @@ cdef class PaperTradeExchange(ExchangeBase):
                 cpp_quote_asset,
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount,
-                <PyObject *> None,
+                <PyObject *> s_decimal_0,
                 int(self._current_timestamp * 1e6),
                 0,
                 cpp_position,
             ))
+            if self._queue_position_fill_model:
+                self._queue_positions[order_id] = self.c_get_queue_position(trading_pair_str, False, quantized_price)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -622,13 +601,57 @@ cdef class PaperTradeExchange(ExchangeBase):
             else:
                 return
 
+    cdef c_add_limit_order(self, LimitOrders *limit_orders_map_ptr, CPPLimitOrder limit_order):
+        """
+        Adds a limit order to the collection of its trading pair, and indexes it by client order id.
+        """
+        cdef:
+            string cpp_trading_pair = limit_order.getTradingPair()
+            LimitOrdersIterator map_it = limit_orders_map_ptr.find(cpp_trading_pair)
+            pair[LimitOrders.iterator, cppbool] map_insert_result
+
+        if map_it == limit_orders_map_ptr.end():
+            map_insert_result = limit_orders_map_ptr.insert(LimitOrdersPair(cpp_trading_pair,
+                                                                            SingleTradingPairLimitOrders()))
+            map_it = map_insert_result.first
+        self._limit_orders_index[limit_order.getClientOrderID()] = deref(map_it).second.insert(limit_order).first
+        self._limit_orders_by_id[limit_order.getClientOrderID().decode("utf8")] = (
+            c_create_limit_order_from_cpp_limit_order(limit_order))
+        self.c_update_on_hold_balance(address(limit_order), <object> limit_order.getQuantity())
+
+    cdef c_update_on_hold_balance(self, const CPPLimitOrder *cpp_limit_order_ptr, object amount):
+        """
+        Adds the balance locked by an amount of a limit order to the on-hold balances, or releases it if the amount
+        is negative.
+        """
+        cdef:
+            str currency
+        if cpp_limit_order_ptr.getIsBuy():
+            currency = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
+            amount = amount * <object> cpp_limit_order_ptr.getPrice()
+        else:
+            currency = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
+        on_hold_balance = self._on_hold_balances[currency] + amount
+        if on_hold_balance == s_decimal_0:
+            del self._on_hold_balances[currency]
+        else:
+            self._on_hold_balances[currency] = on_hold_balance
+
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleTradingPairLimitOrdersIterator orders_it):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
         try:
+            if self._queue_position_fill_model:
+                self._queue_positions.pop(cpp_limit_order_ptr.getClientOrderID().decode("utf8"), None)
+            self._limit_orders_index.erase(cpp_limit_order_ptr.getClientOrderID())
+            self.c_update_on_hold_balance(
+                cpp_limit_order_ptr,
+                (<object> cpp_limit_order_ptr.getFilledQuantity()) - (<object> cpp_limit_order_ptr.getQuantity()))
+            self._limit_orders_by_id.pop(cpp_limit_order_ptr.getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -637,10 +660,43 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
+    cdef c_set_limit_order_filled_amount(self,
+                                         LimitOrdersIterator *map_it_ptr,
+                                         SingleTradingPairLimitOrdersIterator orders_it,
+                                         object filled_amount):
+        """
+        Replaces a partially filled limit order with a copy holding the new filled amount, since the orders in the
+        collection can't be modified in place. The copy keeps the position of the order in the collection.
+        """
+        cdef:
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
+            CPPLimitOrder updated_limit_order = CPPLimitOrder(
+                cpp_limit_order_ptr.getClientOrderID(),
+                cpp_limit_order_ptr.getTradingPair(),
+                cpp_limit_order_ptr.getIsBuy(),
+                cpp_limit_order_ptr.getBaseCurrency(),
+                cpp_limit_order_ptr.getQuoteCurrency(),
+                cpp_limit_order_ptr.getPrice(),
+                cpp_limit_order_ptr.getQuantity(),
+                <PyObject *> filled_amount,
+                cpp_limit_order_ptr.getCreationTimestamp(),
+                cpp_limit_order_ptr.getStatus(),
+                cpp_limit_order_ptr.getPosition(),
+            )
+        self.c_update_on_hold_balance(cpp_limit_order_ptr,
+                                      (<object> cpp_limit_order_ptr.getFilledQuantity()) - filled_amount)
+        self._limit_orders_by_id[updated_limit_order.getClientOrderID().decode("utf8")] = (
+            c_create_limit_order_from_cpp_limit_order(updated_limit_order))
+        orders_collection_ptr.erase(orders_it)
+        self._limit_orders_index[updated_limit_order.getClientOrderID()] = (
+            orders_collection_ptr.insert(updated_limit_order).first)
+
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -648,16 +704,20 @@ cdef class PaperTradeExchange(ExchangeBase):
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_amount = <object> cpp_limit_order_ptr.getFilledQuantity()
+            object remaining_amount = amount - filled_amount
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
 
+        if fill_amount is None or fill_amount > remaining_amount:
+            fill_amount = remaining_amount
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
             is_maker=True,
             order_type=OrderType.LIMIT,
             order_side=TradeType.BUY,
-            amount=amount,
+            amount=fill_amount,
             price=price,
             from_total_balances=True
         )
@@ -710,11 +770,21 @@ cdef class PaperTradeExchange(ExchangeBase):
                 TradeType.BUY,
                 OrderType.LIMIT,
                 <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                fill_amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if fill_amount < remaining_amount:
+            self.c_set_limit_order_filled_amount(map_it_ptr, orders_it, filled_amount + fill_amount)
+            return
+        if filled_amount > s_decimal_0:
+            # The completed event reports the amounts of the whole order
+            order_candidate.amount = amount
+            adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+            paid_amount = adjusted_order_candidate.order_collateral.amount
+            acquired_amount = adjusted_order_candidate.potential_returns.amount
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -731,7 +801,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -739,17 +810,21 @@ cdef class PaperTradeExchange(ExchangeBase):
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
             object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_amount = <object> cpp_limit_order_ptr.getFilledQuantity()
+            object remaining_amount = amount - filled_amount
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
 
+        if fill_amount is None or fill_amount > remaining_amount:
+            fill_amount = remaining_amount
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
             # Market orders are not maker orders
             is_maker=True,
             order_type=OrderType.LIMIT,
             order_side=TradeType.SELL,
-            amount=amount,
+            amount=fill_amount,
             price=price,
             from_total_balances=True
         )
@@ -801,11 +876,21 @@ cdef class PaperTradeExchange(ExchangeBase):
                 TradeType.SELL,
                 OrderType.LIMIT,
                 <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                fill_amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if fill_amount < remaining_amount:
+            self.c_set_limit_order_filled_amount(map_it_ptr, orders_it, filled_amount + fill_amount)
+            return
+        if filled_amount > s_decimal_0:
+            # The completed event reports the amounts of the whole order
+            order_candidate.amount = amount
+            adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+            sold_amount = adjusted_order_candidate.order_collateral.amount
+            acquired_amount = adjusted_order_candidate.potential_returns.amount
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -823,12 +908,13 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -840,6 +926,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
         This implies someone was ready to fill the limit order, if that limit order was on the market.
 
+        With the queue position fill model, the opposite side has to go past the limit order's price, since an order
+        book touching it only means the volume resting at that price hasn't been taken yet. The queue positions of
+        the orders that are not crossed are updated with the order book volume at their price levels.
+
         :param is_buy: are the limit orders on the bid side?
         :param limit_orders_map_ptr: pointer to the limit orders map
         :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
@@ -852,12 +942,15 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            bint queue_position_fill_model = self._queue_position_fill_model
 
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
                 if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
                     break
+                if queue_position_fill_model and opposite_order_book_price == <object>cpp_limit_order_ptr.getPrice():
+                    break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
@@ -866,12 +959,51 @@ cdef class PaperTradeExchange(ExchangeBase):
                 cpp_limit_order_ptr = address(deref(orders_it))
                 if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
                     break
+                if queue_position_fill_model and opposite_order_book_price == <object>cpp_limit_order_ptr.getPrice():
+                    break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
             self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
 
+        if queue_position_fill_model and map_it_ptr[0] != limit_orders_map_ptr.end():
+            self.c_update_queue_positions(is_buy, address(deref(deref(map_it_ptr)).second))
+
+    cdef object c_get_queue_position(self, str trading_pair, bint is_buy, object price):
+        """
+        :return: the order book volume resting at the price level of a limit order, which is ahead of the order in
+            the queue of the level
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+        return Decimal(str(order_book.c_get_volume_at_price(is_buy, float(price))))
+
+    cdef c_update_queue_positions(self, bint is_buy, SingleTradingPairLimitOrders *orders_collection_ptr):
+        """
+        Moves the limit orders forward in their queues when the volume resting at their price levels is reduced below
+        their queue positions, e.g. because the orders ahead were cancelled. The queue positions never grow back,
+        since the volume added to a level after an order is placed is queued behind it.
+        """
+        cdef:
+            SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            OrderBook order_book = None
+            str order_id
+
+        while orders_it != orders_collection_ptr.end():
+            cpp_limit_order_ptr = address(deref(orders_it))
+            order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            queue_position = self._queue_positions.get(order_id, s_decimal_0)
+            if queue_position > s_decimal_0:
+                if order_book is None:
+                    order_book = self.c_get_order_book(cpp_limit_order_ptr.getTradingPair().decode("utf8"))
+                level_volume = Decimal(str(order_book.c_get_volume_at_price(
+                    is_buy, float(<object>cpp_limit_order_ptr.getPrice()))))
+                if level_volume < queue_position:
+                    self._queue_positions[order_id] = level_volume
+            inc(orders_it)
+
     cdef c_process_crossed_limit_orders(self):
         cdef:
             LimitOrders *limit_orders_ptr = address(self._bid_limit_orders)
@@ -895,6 +1027,11 @@ cdef class PaperTradeExchange(ExchangeBase):
         """
         Trigger limit orders when incoming market orders have crossed the limit order's price.
 
+        With the queue position fill model, the limit orders at the trade price are also matched, in time priority.
+        The trade amount first consumes the volume ahead of an order in the queue of the price level, then fills the
+        order, partially if it is smaller than the order's remaining amount, and only what is left goes on to the
+        next order.
+
         :param order_book_trade_event: trade event from order book
         """
         cdef:
@@ -910,37 +1047,113 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersIterator orders_it
             SingleTradingPairLimitOrdersRIterator orders_rit
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            list level_order_ids = []
+            dict remaining_amounts = {}
+            dict fill_amounts = {}
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            bint queue_position_fill_model = self._queue_position_fill_model
+            str order_id
+            object fill_amount
+            size_t i
 
         if map_it == limit_orders_map_ptr.end():
             return
 
+        if queue_position_fill_model:
+            # Compared for equality with the order prices
+            trade_price = Decimal(str(trade_price))
         orders_collection_ptr = address(deref(map_it).second)
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() < trade_price:
                     break
+                if <object>cpp_limit_order_ptr.getPrice() == trade_price:
+                    if not queue_position_fill_model:
+                        break
+                    order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+                    remaining_amounts[order_id] = (<object>cpp_limit_order_ptr.getQuantity() -
+                                                   <object>cpp_limit_order_ptr.getFilledQuantity())
+                else:
+                    order_id = None
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                level_order_ids.append(order_id)
                 inc(orders_rit)
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() > trade_price:
                     break
+                if <object>cpp_limit_order_ptr.getPrice() == trade_price:
+                    if not queue_position_fill_model:
+                        break
+                    order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+                    remaining_amounts[order_id] = (<object>cpp_limit_order_ptr.getQuantity() -
+                                                   <object>cpp_limit_order_ptr.getFilledQuantity())
+                else:
+                    order_id = None
                 process_order_its.push_back(orders_it)
+                level_order_ids.append(order_id)
                 inc(orders_it)
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+        if len(remaining_amounts) > 0:
+            fill_amounts = self.c_consume_queue_positions(order_book_trade_event.trading_pair,
+                                                          remaining_amounts,
+                                                          trade_quantity)
+        for i in range(process_order_its.size()):
+            order_id = level_order_ids[i]
+            fill_amount = None if order_id is None else fill_amounts[order_id]
+            if fill_amount is not None and fill_amount <= s_decimal_0:
+                continue
+            self.c_process_limit_order(is_maker_buy,
+                                       limit_orders_map_ptr,
+                                       address(map_it),
+                                       process_order_its[i],
+                                       fill_amount)
+
+    cdef dict c_consume_queue_positions(self, str trading_pair, dict remaining_amounts, object trade_quantity):
+        """
+        Consumes a trade at the price level of resting limit orders, one order at a time in time priority, i.e. in
+        the order they were placed, which is the order of the queue positions.
+
+        The trade first consumes the volume ahead of an order and then fills the order, and only the remainder of the
+        trade is passed to the next order. The volume consumed ahead of an order was also ahead of the orders placed
+        after it, so it is taken out of their queue positions too.
+
+        :param trading_pair: the trading pair of the trade
+        :param remaining_amounts: the remaining amounts of the limit orders at the trade price, by client order id
+        :param trade_quantity: the amount of the trade
+        :return: the amounts of the trade filling the orders, quantized to the order size quantum, by client order id
+        """
+        cdef:
+            object trade_amount = Decimal(str(trade_quantity))
+            object consumed_volume = s_decimal_0
+            dict fill_amounts = {}
+            str order_id
+
+        for order_id, queue_position in self._queue_positions.items():
+            if order_id not in remaining_amounts:
+                continue
+            queue_position = max(queue_position - consumed_volume, s_decimal_0)
+            queue_consumed = min(trade_amount, queue_position)
+            self._queue_positions[order_id] = queue_position - queue_consumed
+            consumed_volume += queue_consumed
+            trade_amount -= queue_consumed
+            fill_amount = self.c_quantize_order_amount(trading_pair, min(trade_amount, remaining_amounts[order_id]))
+            fill_amounts[order_id] = fill_amount
+            trade_amount -= fill_amount
+        return fill_amounts
 
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
-        return self.available_balances.get(currency.upper(), s_decimal_0)
+        currency = currency.upper()
+        if currency not in self._account_balances:
+            return s_decimal_0
+        return self._account_balances[currency] - self._on_hold_balances.get(currency, s_decimal_0)
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         cdef:
@@ -967,6 +1180,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrdersIterator map_it = orders_map.find(cpp_trading_pair)
             SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
             SingleTradingPairLimitOrdersIterator orders_it
+            LimitOrdersIndexIterator index_it
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *limit_order_ptr = NULL
             str limit_order_cid
@@ -976,13 +1190,18 @@ cdef class PaperTradeExchange(ExchangeBase):
                 return []
 
             limit_orders_collection_ptr = address(deref(map_it).second)
-            orders_it = limit_orders_collection_ptr.begin()
-            while orders_it != limit_orders_collection_ptr.end():
-                limit_order_ptr = address(deref(orders_it))
-                limit_order_cid = limit_order_ptr.getClientOrderID().decode("utf8")
-                if (not cancel_all and limit_order_cid == client_order_id) or cancel_all:
+            if cancel_all:
+                orders_it = limit_orders_collection_ptr.begin()
+                while orders_it != limit_orders_collection_ptr.end():
                     process_order_its.push_back(orders_it)
-                inc(orders_it)
+                    inc(orders_it)
+            else:
+                index_it = self._limit_orders_index.find(client_order_id.encode("utf8"))
+                if index_it != self._limit_orders_index.end():
+                    limit_order_ptr = address(deref(deref(index_it).second))
+                    if (limit_order_ptr.getTradingPair() == cpp_trading_pair
+                            and limit_order_ptr.getIsBuy() == (orders_map == address(self._bid_limit_orders))):
+                        process_order_its.push_back(deref(index_it).second)
 
             for orders_it in process_order_its:
                 limit_order_ptr = address(deref(orders_it))
@@ -4,30 +4,37 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
+from hummingbot.connector.balance_ledger import BalanceLedger
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.event.events import MarketEvent
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.bounded_queue import QueueStats
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -45,12 +52,36 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Max number of order book snapshots requested concurrently on start. None initializes them one by one, waiting a
+    # second between them. Connectors enable it after checking the exchange snapshot rate limits; the requests still go
+    # through the throttler.
+    ORDER_BOOK_INIT_CONCURRENCY: Optional[int] = None
+    # When True the order book diffs queued while the event loop is busy are merged and applied at once.
+    ORDER_BOOK_COALESCE_DIFFS: bool = False
+    # Max number of messages of the order book tracker queues, overriding OrderBookTracker.DEFAULT_QUEUE_LIMITS
+    ORDER_BOOK_QUEUE_LIMITS: Optional[Dict[str, int]] = None
+    # Max number of orders sent in each request to the exchange batch order creation and cancelation endpoints.
+    # Connectors supporting them set the limits and implement _place_orders_batch and _place_cancels_batch. None sends
+    # one request per order.
+    BATCH_ORDER_CREATE_LIMIT: Optional[int] = None
+    BATCH_ORDER_CANCEL_LIMIT: Optional[int] = None
+    # Max number of per-order status and fill requests in flight while updating the orders. None requests them one by
+    # one. Connectors enable it after checking that the exchange accepts the requests in any order; they still go
+    # through the throttler, so the exchange rate limits are respected.
+    ORDER_UPDATE_CONCURRENCY: Optional[int] = None
+    # Seconds of overlap between consecutive fills queries done with _request_trade_updates_since, so that the fills
+    # reported late by the exchange are not missed. The fills received twice are ignored by the order tracker.
+    TRADE_UPDATES_QUERY_OVERLAP = 10.0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
 
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
+        # Start of the last successful _request_trade_updates_since query. A single cursor for all the trading pairs is
+        # enough because that query returns the fills of the whole account, and the cursor only moves forward when it
+        # succeeds, so no fill of any trading pair is skipped.
+        self._last_trade_updates_query_timestamp = 0
         self._trading_rules = {}
         self._trading_fees = {}
 
@@ -62,9 +93,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
-            rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+        self._throttler = self._create_throttler(client_config_map)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -76,13 +105,21 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            init_concurrency=self.ORDER_BOOK_INIT_CONCURRENCY,
+            coalesce_diffs=self.ORDER_BOOK_COALESCE_DIFFS,
+            queue_limits=self.ORDER_BOOK_QUEUE_LIMITS))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
+        # Keeps the balance changes since the last balance update for the exchanges without real time balance updates
+        self._balance_ledger = BalanceLedger(maker_fee_pct=lambda: self.estimate_fee_pct(True))
+        self._order_tracker.balance_ledger = self._balance_ledger
+        self.add_listener(MarketEvent.OrderFilled, self._balance_ledger.fill_forwarder)
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -175,6 +212,13 @@ class ExchangePyBase(ExchangeBase, ABC):
             "user_stream_initialized": self._is_user_stream_initialized(),
         }
 
+    @property
+    def order_book_queue_stats(self) -> Dict[str, QueueStats]:
+        """
+        The size, high-water mark and number of dropped messages of the order book tracker queues.
+        """
+        return self.order_book_tracker.queue_stats
+
     @property
     def ready(self) -> bool:
         """
@@ -183,6 +227,19 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return all(self.status_dict.values())
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order book is already initialized, even if the connector is not ready yet.
+        """
+        return self.order_book_tracker.ready_trading_pairs
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Returns True if the order book of the trading pair is already initialized.
+        """
+        return self.order_book_tracker.is_trading_pair_ready(trading_pair)
+
     @property
     def name_cap(self) -> str:
         return self.name.capitalize()
@@ -258,6 +315,14 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     # === Orders placing ===
 
+    def _new_client_order_id(self, is_buy: bool, trading_pair: str) -> str:
+        return get_new_client_order_id(
+            is_buy=is_buy,
+            trading_pair=trading_pair,
+            hbot_order_id_prefix=self.client_order_id_prefix,
+            max_id_len=self.client_order_id_max_length
+        )
+
     def buy(self,
             trading_pair: str,
             amount: Decimal,
@@ -274,12 +339,7 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=True,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
+        order_id = self._new_client_order_id(is_buy=True, trading_pair=trading_pair)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.BUY,
             order_id=order_id,
@@ -304,12 +364,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param price: the order price
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=False,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
+        order_id = self._new_client_order_id(is_buy=False, trading_pair=trading_pair)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.SELL,
             order_id=order_id,
@@ -320,6 +375,42 @@ class ExchangePyBase(ExchangeBase, ABC):
             **kwargs))
         return order_id
 
+    def batch_order_create(
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Issues a batch order creation. Connectors with a batch order creation endpoint send the orders in chunks of
+        BATCH_ORDER_CREATE_LIMIT orders, the others send one request per order.
+
+        :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The
+            order IDs can be blanc.
+        :return: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
+            generated order IDs.
+        """
+        if self.BATCH_ORDER_CREATE_LIMIT is None:
+            return super().batch_order_create(orders_to_create=orders_to_create)
+        orders_with_ids_to_create = [
+            order.copy_with_id(
+                client_order_id=self._new_client_order_id(is_buy=order.is_buy, trading_pair=order.trading_pair))
+            for order in orders_to_create
+        ]
+        safe_ensure_future(self._create_orders_in_batches(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Issues a batch order cancelation. Connectors with a batch cancelation endpoint send the cancelations in chunks
+        of BATCH_ORDER_CANCEL_LIMIT orders, the others send one request per order.
+
+        :param orders_to_cancel: A list of the orders to cancel.
+        """
+        if self.BATCH_ORDER_CANCEL_LIMIT is None:
+            super().batch_order_cancel(orders_to_cancel=orders_to_cancel)
+            return
+        tracked_orders = [self._order_tracker.fetch_tracked_order(order.client_order_id) for order in orders_to_cancel]
+        safe_ensure_future(self._cancel_orders_in_batches(
+            orders=[order for order in tracked_orders if order is not None]))
+
     def get_fee(self,
                 base_currency: str,
                 quote_currency: str,
@@ -407,6 +498,48 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = self._track_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            return
+        try:
+            await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+
+    def _track_and_validate_order(self,
+                                  trade_type: TradeType,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  order_type: OrderType,
+                                  price: Optional[Decimal] = None,
+                                  **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking a new order with the amount and price quantized, and checks it against the trading rules.
+        The orders not passing the checks are marked as failed.
+
+        :return: the tracked order, or None if the order can not be sent to the exchange
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -433,37 +566,22 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
                                   f"amount to be higher than the minimum order size.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif notional_size < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {notional_size} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. The order will not be "
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-        try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
-
-        except asyncio.CancelledError:
-            raise
-        except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
-                **kwargs,
-            )
+            return None
+        return order
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -501,7 +619,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self.logger().network(
             f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
             f"{amount} {trading_pair} {price}.",
-            exc_info=True,
+            exc_info=exception,
             app_warning_msg=f"Failed to submit {trade_type.name.upper()} order to {self.name_cap}. Check API key and network connection."
         )
         self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
@@ -539,20 +657,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
         cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
-            update_timestamp = self.current_timestamp
-            if update_timestamp is None or math.isnan(update_timestamp):
-                update_timestamp = self._time()
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order.client_order_id,
-                trading_pair=order.trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=(OrderState.CANCELED
-                           if self.is_cancel_request_in_exchange_synchronous
-                           else OrderState.PENDING_CANCEL),
-            )
-            self._order_tracker.process_order_update(order_update)
+            self._update_order_after_cancelation(order=order)
         return cancelled
 
+    def _update_order_after_cancelation(self, order: InFlightOrder):
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -567,6 +688,114 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    async def _create_orders_in_batches(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        orders = []
+        for order_to_create in orders_to_create:
+            kwargs = {}
+            if order_to_create.position is not PositionAction.NIL:
+                kwargs["position_action"] = order_to_create.position
+            order = self._track_and_validate_order(
+                trade_type=TradeType.BUY if order_to_create.is_buy else TradeType.SELL,
+                order_id=order_to_create.client_order_id,
+                trading_pair=order_to_create.trading_pair,
+                amount=order_to_create.quantity,
+                order_type=order_to_create.order_type(),
+                price=s_decimal_NaN if order_to_create.price is None else order_to_create.price,
+                **kwargs,
+            )
+            if order is not None:
+                orders.append(order)
+
+        limit = self.BATCH_ORDER_CREATE_LIMIT
+        await safe_gather(*[self._execute_orders_batch(orders=orders[i:i + limit])
+                            for i in range(0, len(orders), limit)])
+
+    async def _execute_orders_batch(self, orders: List[InFlightOrder]):
+        """
+        Sends one batch of orders to the exchange, and updates each order with its own result. Orders rejected by the
+        exchange are marked as failed, while the rest of the batch is processed as created.
+        """
+        try:
+            results = await self._place_orders_batch(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            results = [PlaceOrderResult(update_timestamp=self.current_timestamp,
+                                        client_order_id=order.client_order_id,
+                                        exchange_order_id=None,
+                                        trading_pair=order.trading_pair,
+                                        exception=ex)
+                       for order in orders]
+
+        results_by_order_id = {result.client_order_id: result for result in results}
+        for order in orders:
+            result = results_by_order_id.get(order.client_order_id)
+            if result is None:
+                # The exchange did not report the order, the status update will find out if it was created
+                self.logger().warning(f"No result received for the order {order.client_order_id} in the batch "
+                                      f"order creation request.")
+            elif result.exception is not None:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=result.exception,
+                )
+            else:
+                self._order_tracker.process_order_update(OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(result.exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=result.update_timestamp,
+                    new_state=OrderState.OPEN,
+                    misc_updates=result.misc_updates or None,
+                ))
+
+    async def _cancel_orders_in_batches(self, orders: List[InFlightOrder]) -> List[CancellationResult]:
+        limit = self.BATCH_ORDER_CANCEL_LIMIT
+        batches_results = await safe_gather(*[self._execute_cancels_batch(orders=orders[i:i + limit])
+                                              for i in range(0, len(orders), limit)])
+        return [result for batch_results in batches_results for result in batch_results]
+
+    async def _execute_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancellationResult]:
+        """
+        Sends one batch of cancelations to the exchange, and updates each order with its own result.
+
+        :return: the cancelation result of each order
+        """
+        try:
+            results = await self._place_cancels_batch(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            results = [CancelOrderResult(client_order_id=order.client_order_id,
+                                         trading_pair=order.trading_pair,
+                                         exception=ex)
+                       for order in orders]
+
+        results_by_order_id = {result.client_order_id: result for result in results}
+        cancellation_results = []
+        for order in orders:
+            result = results_by_order_id.get(order.client_order_id)
+            cancelled = False
+            if result is None:
+                self.logger().warning(f"No result received for the order {order.client_order_id} in the batch "
+                                      f"cancelation request.")
+            elif result.not_found or (result.exception is not None
+                                      and self._is_order_not_found_during_cancelation_error(result.exception)):
+                self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+            elif result.exception is not None:
+                self.logger().error(f"Failed to cancel order {order.client_order_id}: {result.exception}")
+            else:
+                self._update_order_after_cancelation(order=order)
+                cancelled = True
+            cancellation_results.append(CancellationResult(order.client_order_id, cancelled))
+        return cancellation_results
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -640,6 +869,26 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """
+        Sends a batch of at most BATCH_ORDER_CREATE_LIMIT orders in a single request. Only required for the connectors
+        setting BATCH_ORDER_CREATE_LIMIT.
+
+        :param orders: the tracked orders to create
+        :return: one result per order, with the exception set for the orders rejected by the exchange
+        """
+        raise NotImplementedError
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """
+        Cancels a batch of at most BATCH_ORDER_CANCEL_LIMIT orders in a single request. Only required for the
+        connectors setting BATCH_ORDER_CANCEL_LIMIT.
+
+        :param orders: the tracked orders to cancel
+        :return: one result per order, flagged as not found or with the exception set for the failed cancelations
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -768,13 +1017,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         It contains the backup logic to update status using API requests in case the main update source
         (the user stream data source websocket) fails.
         It also updates the time synchronizer. This is necessary because the exchange requires
-        the time of the client to be the same as the time in the exchange.
+        the time of the client to be the same as the time in the exchange. The server time is only requested when the
+        synchronizer requires it, which is less often while the time offset is stable.
         Executes when the _poll_notifier event is enabled by the `tick` function.
         """
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                if self._time_synchronizer.is_update_required():
+                    await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
                 await self._status_polling_loop_fetch_updates()
@@ -939,8 +1190,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             await self._update_balances()
             if not self.real_time_balance_update:
                 # This is only required for exchanges that do not provide balance update notifications through websocket
-                self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.in_flight_orders.items()}
-                self._in_flight_orders_snapshot_timestamp = self.current_timestamp
+                self.in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.in_flight_orders.items()}
+                self.in_flight_orders_snapshot_timestamp = self.current_timestamp
         except asyncio.CancelledError:
             raise
         except Exception as request_error:
@@ -950,18 +1201,74 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        orders = await self._update_orders_fills_in_bulk(orders=orders)
+        await self._process_orders_concurrently(orders=orders, process_order=self._update_order_fills)
+
+    async def _update_orders_fills_in_bulk(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Requests in a single query the fills of all the fillable orders, when the exchange supports it.
+
+        The query starts at the last successful query (or at the creation of the oldest fillable order), so the fills of
+        every tracked order are covered and not only the ones of the orders received.
+
+        :return: the orders whose fills have to be requested one by one
+        """
+        if len(orders) == 0:
+            return orders
+        query_timestamp = self.current_timestamp
+        fillable_orders = list(self._order_tracker.all_fillable_orders.values()) + orders
+        start_timestamp = max(self._last_trade_updates_query_timestamp,
+                              min(order.creation_timestamp for order in fillable_orders))
+        try:
+            trade_updates = await self._request_trade_updates_since(
+                timestamp=start_timestamp - self.TRADE_UPDATES_QUERY_OVERLAP)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the trade updates since {start_timestamp}. Requesting them for each order. "
+                f"Error: {request_error}",
+                exc_info=request_error,
+            )
+            return orders
+        if trade_updates is None:
+            return orders
+
+        self._last_trade_updates_query_timestamp = query_timestamp
+        for trade_update in trade_updates:
+            self._order_tracker.process_trade_update(trade_update)
+        return []
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+    async def _process_orders_concurrently(self,
+                                           orders: List[InFlightOrder],
+                                           process_order: Callable[[InFlightOrder], Awaitable]):
+        """
+        Runs `process_order` for each order, keeping at most ORDER_UPDATE_CONCURRENCY of them running at the same time.
+        """
+        if self.ORDER_UPDATE_CONCURRENCY is None:
+            for order in orders:
+                await process_order(order)
+        else:
+            semaphore = asyncio.Semaphore(self.ORDER_UPDATE_CONCURRENCY)
+
+            async def _process_order(order: InFlightOrder):
+                async with semaphore:
+                    await process_order(order)
+
+            await safe_gather(*[_process_order(order) for order in orders])
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -990,7 +1297,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
+        async def _update_order(order: InFlightOrder):
             try:
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
@@ -999,12 +1306,47 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
+        await self._process_orders_concurrently(orders=orders, process_order=_update_order)
+
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
+        orders = await self._update_open_orders_in_bulk(orders=list(orders_to_update.values()))
         await self._update_orders_with_error_handler(
-            orders=list(orders_to_update.values()), error_handler=self._handle_update_error_for_active_order
+            orders=orders, error_handler=self._handle_update_error_for_active_order
         )
 
+    async def _update_open_orders_in_bulk(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Requests in a single query the orders that are open in the exchange, when the exchange supports it, and
+        processes the updates of the orders received.
+
+        :return: the orders not listed as open by the exchange, whose status has to be requested one by one
+        """
+        if len(orders) == 0:
+            return orders
+        try:
+            open_order_updates = await self._request_open_orders_updates()
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the open orders. Requesting the status of each order. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return orders
+        if open_order_updates is None:
+            return orders
+
+        updates_by_order_id = {order_update.client_order_id: order_update for order_update in open_order_updates}
+        missing_orders = []
+        for order in orders:
+            order_update = updates_by_order_id.get(order.client_order_id)
+            if order_update is None:
+                missing_orders.append(order)
+            else:
+                self._order_tracker.process_order_update(order_update)
+        return missing_orders
+
     async def _update_lost_orders(self):
         orders_to_update = self._order_tracker.lost_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1049,6 +1391,30 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_open_orders_updates(self) -> Optional[List[OrderUpdate]]:
+        """
+        Requests all the orders open in the exchange in as few requests as possible. Connectors for exchanges with an
+        open orders query override it to avoid requesting the status of each tracked order.
+
+        :return: an update for each open order with the client order id of the tracked order, or None if the exchange
+            does not support the query. The updates of the orders not tracked by the connector are ignored.
+        """
+        return None
+
+    async def _request_trade_updates_since(self, timestamp: float) -> Optional[List[TradeUpdate]]:
+        """
+        Requests all the fills of the account since the given time in as few requests as possible. Connectors for
+        exchanges with an account fills query override it to avoid requesting the fills of each tracked order.
+
+        The fills of every trading pair must be returned, since the start of the next query is shared by all of them.
+        Exchanges that only query the fills of one trading pair at a time should not override it.
+
+        :param timestamp: the time of the oldest fill to request, in seconds
+        :return: the trade updates of the fills, or None if the exchange does not support the query. The updates of the
+            fills for orders not tracked by the connector are ignored.
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1065,6 +1431,14 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
         raise NotImplementedError
 
+    def _create_throttler(self, client_config_map: "ClientConfigAdapter") -> AsyncThrottlerBase:
+        throttler_class = (SlidingWindowThrottler
+                           if client_config_map.sliding_window_throttler
+                           else AsyncThrottler)
+        return throttler_class(
+            rate_limits=self.rate_limits_rules,
+            limits_share_percentage=client_config_map.rate_limits_share_pct)
+
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
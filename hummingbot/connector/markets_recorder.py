@@ -5,8 +5,7 @@ import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -14,6 +13,7 @@ from sqlalchemy.orm import Query, Session
 from hummingbot import data_path
 from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.trade_fill_exporter import TradeFillCsvWriter, TradeFillParquetWriter
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -46,6 +46,7 @@ from hummingbot.model.position import Position
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLOperation, SQLWriteBehindQueue
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -76,7 +77,28 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 write_behind: bool = False,
+                 write_behind_batch_size: int = 100,
+                 write_behind_flush_interval: float = 0.5,
+                 write_behind_max_backlog: int = 10000,
+                 trades_export_format: Optional[str] = None,
+                 trades_export_flush_interval: float = 5.0,
+                 trades_export_batch_size: int = 100,
+                 trades_csv_max_file_size: Optional[int] = None):
+        """
+        :param write_behind: if True the order and fill events are written to the database in batched transactions
+            from a worker thread once the recorder is started, instead of in a synchronous transaction per event
+        :param write_behind_batch_size: max number of events written in a single transaction
+        :param write_behind_flush_interval: max seconds an event waits in the queue before its batch is written
+        :param write_behind_max_backlog: max number of events waiting to be written. While the backlog is full,
+            recording an event waits until the pending writes make room for it
+        :param trades_export_format: the files each filled trade is exported to: "csv", "parquet" or
+            "csv_and_parquet". None disables the export
+        :param trades_export_flush_interval: max seconds an exported trade stays buffered before it is written to disk
+        :param trades_export_batch_size: max number of exported trades buffered before they are written to disk
+        :param trades_csv_max_file_size: size in bytes after which the trades CSV file is rotated
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,6 +109,23 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._write_behind_queue: Optional[SQLWriteBehindQueue] = None
+        self._trades_export_format: Optional[str] = trades_export_format
+        self._trades_export_flush_interval: float = trades_export_flush_interval
+        self._trades_export_batch_size: int = trades_export_batch_size
+        self._trades_csv_max_file_size: Optional[int] = trades_csv_max_file_size
+        self._trades_csv_writers: Dict[str, TradeFillCsvWriter] = {}
+        self._trades_parquet_writers: Dict[str, TradeFillParquetWriter] = {}
+        self._trades_export_flush_task: Optional[asyncio.Task] = None
+        # Creation timestamps (ms) of the open orders, to export the age of their trades
+        self._order_creation_timestamps: Dict[str, int] = {}
+        if write_behind:
+            self._write_behind_queue = SQLWriteBehindQueue(
+                sql_manager=self._sql_manager,
+                batch_size=write_behind_batch_size,
+                flush_interval=write_behind_flush_interval,
+                max_backlog=write_behind_max_backlog,
+            )
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -144,6 +183,7 @@ class MarketsRecorder:
                                     best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
                                     order_book = market.get_order_book(trading_pair)
                                     depth = self._market_data_collection_config.market_data_collection_depth + 1
+                                    bids, asks = order_book.top_n(depth)
                                     market_data = MarketData(
                                         timestamp=self.db_timestamp,
                                         exchange=exchange,
@@ -152,8 +192,8 @@ class MarketsRecorder:
                                         best_bid=best_bid,
                                         best_ask=best_ask,
                                         order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
+                                            "bid": bids.tolist(),
+                                            "ask": asks.tolist()}
                                     )
                                     session.add(market_data)
             except asyncio.CancelledError:
@@ -180,11 +220,15 @@ class MarketsRecorder:
         return int(time.time() * 1e3)
 
     def start(self):
+        if self._write_behind_queue is not None:
+            self._write_behind_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
+        if self._trades_export_format is not None:
+            self._trades_export_flush_task = self._ev_loop.create_task(self._flush_trade_exporters_loop())
 
     def stop(self):
         for market in self._markets:
@@ -192,6 +236,32 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._write_behind_queue is not None:
+            # Writes all the pending events before stopping
+            self._write_behind_queue.stop()
+        if self._trades_export_flush_task is not None:
+            self._trades_export_flush_task.cancel()
+            self._trades_export_flush_task = None
+        # Writes the buffered trades to disk before closing the files
+        self._close_trade_exporters()
+
+    def flush(self):
+        """
+        Blocks until all the events recorded so far are written to the database. Only relevant in write-behind mode.
+        """
+        if self._write_behind_queue is not None and self._write_behind_queue.is_running:
+            self._write_behind_queue.flush()
+
+    def _persist(self, operation: SQLOperation):
+        """
+        Runs the operation in its own transaction, or queues it to be written in a batch if the write-behind mode is on.
+        """
+        if self._write_behind_queue is not None and self._write_behind_queue.is_running:
+            self._write_behind_queue.put(operation)
+        else:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    operation(session)
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -268,19 +338,52 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._save_market_states(config_file_path=config_file_path,
+                                 market_name=market.display_name,
+                                 saved_state=market.tracking_states,
+                                 timestamp=self.db_timestamp,
+                                 session=session)
+
+    def _save_market_states(self,
+                            config_file_path: str,
+                            market_name: str,
+                            saved_state: Dict[str, Any],
+                            timestamp: int,
+                            session: Session):
+        query: Query = (session
+                        .query(MarketState)
+                        .filter(MarketState.config_file_path == config_file_path,
+                                MarketState.market == market_name))
+        market_states: Optional[MarketState] = query.one_or_none()
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
+    def _market_states_saver(self, market: ConnectorBase) -> SQLOperation:
+        """
+        Captures the market tracking states at the time of the event, so they can be stored later from another thread.
+        """
+        config_file_path = self._config_file_path
+        market_name = market.display_name
+        saved_state = market.tracking_states
+        timestamp = self.db_timestamp
+
+        def save(session: Session):
+            self._save_market_states(config_file_path=config_file_path,
+                                     market_name=market_name,
+                                     saved_state=saved_state,
+                                     timestamp=timestamp,
+                                     session=session)
+
+        return save
+
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
@@ -311,31 +414,36 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        save_market_states = self._market_states_saver(market)
+
+        def persist(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+            save_market_states(session)
+
+        self._persist(persist)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        if self._trades_export_format is not None:
+            self._order_creation_timestamps[evt.order_id] = timestamp
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -350,56 +458,73 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        save_market_states = self._market_states_saver(market)
+        export_row: Optional[Tuple[str, Tuple[str, ...], Tuple[Any, ...]]] = None
+        if self._trades_export_format is not None:
+            # The exported row is read before persisting, since the record can't be read once it is handed to the
+            # session, and written after it so an export error can't prevent the trade from being stored
+            try:
+                export_row = (self._trades_export_file_name(trade_fill_record),
+                              *self._trades_export_row(trade_fill_record, self._order_creation_timestamps.get(order_id)))
+            except Exception:
+                self.logger().error(f"Unexpected error preparing the export of the trade {evt.exchange_trade_id}.",
+                                    exc_info=True)
+
+        def persist(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            save_market_states(session)
+
+        self._persist(persist)
+        # Built from the event, the record can't be read once it is handed to the session
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        if export_row is not None:
+            try:
+                self._export_trade_row(*export_row)
+            except Exception:
+                self.logger().error(f"Unexpected error exporting the trade {evt.exchange_trade_id}.", exc_info=True)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -410,48 +535,102 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        market_name: str = market.display_name
+
+        def persist(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._persist(persist)
+
+    def export_trade_fill(self, trade: TradeFill, order_creation_timestamp: Optional[int] = None):
+        """
+        Appends the trade to the export files of the configured format.
+        :param trade: the trade fill record, before it is added to a session
+        :param order_creation_timestamp: the creation timestamp (ms) of the order, to calculate the age of the trade.
+            The order record of the trade is used when not provided
+        """
+        self._export_trade_row(self._trades_export_file_name(trade), *self._trades_export_row(trade, order_creation_timestamp))
+
+    def _export_trade_row(self, file_name: str, field_names: Tuple[str, ...], field_data: Tuple[Any, ...]):
+        if self._trades_export_format in ("csv", "csv_and_parquet"):
+            self._append_row_to_csv(file_name, field_names, field_data)
+        if self._trades_export_format in ("parquet", "csv_and_parquet"):
+            self._append_row_to_parquet(file_name, field_names, field_data)
+
+    def append_to_csv(self, trade: TradeFill, order_creation_timestamp: Optional[int] = None):
+        self._append_row_to_csv(self._trades_export_file_name(trade), *self._trades_export_row(trade, order_creation_timestamp))
+
+    def append_to_parquet(self, trade: TradeFill, order_creation_timestamp: Optional[int] = None):
+        self._append_row_to_parquet(self._trades_export_file_name(trade),
+                                    *self._trades_export_row(trade, order_creation_timestamp))
+
+    def _append_row_to_csv(self, file_name: str, field_names: Tuple[str, ...], field_data: Tuple[Any, ...]):
+        csv_writer = self._trades_csv_writers.get(file_name)
+        if csv_writer is None:
+            csv_writer = TradeFillCsvWriter(path=os.path.join(data_path(), file_name + ".csv"),
+                                            field_names=field_names,
+                                            flush_interval=self._trades_export_flush_interval,
+                                            max_file_size=self._trades_csv_max_file_size,
+                                            batch_size=self._trades_export_batch_size)
+            self._trades_csv_writers[file_name] = csv_writer
+        csv_writer.write_row(field_data)
+
+    def _append_row_to_parquet(self, file_name: str, field_names: Tuple[str, ...], field_data: Tuple[Any, ...]):
+        parquet_writer = self._trades_parquet_writers.get(file_name)
+        if parquet_writer is None:
+            parquet_path = os.path.join(
+                data_path(), file_name + "_" + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".parquet")
+            parquet_writer = TradeFillParquetWriter(path=parquet_path,
+                                                    field_names=field_names,
+                                                    batch_size=self._trades_export_batch_size,
+                                                    flush_interval=self._trades_export_flush_interval)
+            self._trades_parquet_writers[file_name] = parquet_writer
+        parquet_writer.write_row(field_data)
 
     @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
-
-    def append_to_csv(self, trade: TradeFill):
-        csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
-        csv_path = os.path.join(data_path(), csv_filename)
+    def _trades_export_file_name(trade: TradeFill) -> str:
+        return "trades_" + trade.config_file_path[:-4]
 
+    @staticmethod
+    def _trades_export_row(trade: TradeFill,
+                           order_creation_timestamp: Optional[int]) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
         field_names = tuple(trade.attribute_names_for_file_export())
         field_data = tuple(getattr(trade, attr) for attr in field_names)
 
         # adding extra field "age"
         # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-        age = pd.Timestamp(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)), unit='s').strftime(
-            '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
-        field_names += ("age",)
-        field_data += (age,)
+        if order_creation_timestamp is None and trade.order is not None:
+            order_creation_timestamp = trade.order.creation_timestamp
+        age = pd.Timestamp(int((trade.timestamp * 1e-3) - (order_creation_timestamp * 1e-3)), unit='s').strftime(
+            '%H:%M:%S') if (order_creation_timestamp is not None and "//" not in trade.order_id) else "n/a"
+        return field_names + ("age",), field_data + (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+    async def _flush_trade_exporters_loop(self):
+        while True:
+            await self._sleep(self._trades_export_flush_interval)
+            try:
+                for writer in list(self._trades_csv_writers.values()) + list(self._trades_parquet_writers.values()):
+                    writer.flush_if_due()
+            except Exception:
+                self.logger().error("Unexpected error while writing the exported trades to disk.", exc_info=True)
+
+    def _close_trade_exporters(self):
+        for csv_writer in self._trades_csv_writers.values():
+            csv_writer.close()
+        self._trades_csv_writers.clear()
+        for parquet_writer in self._trades_parquet_writers.values():
+            parquet_writer.close()
+        self._trades_parquet_writers.clear()
 
     def _update_order_status(self,
                              event_tag: int,
@@ -468,19 +647,22 @@ class MarketsRecorder:
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
+        save_market_states = self._market_states_saver(market)
+        self._order_creation_timestamps.pop(order_id, None)
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def persist(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                save_market_states(session)
+
+        self._persist(persist)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -515,16 +697,18 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        save_market_states = self._market_states_saver(connector)
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def persist(session: Session):
+            session.add(rp_update)
+            save_market_states(session)
+
+        self._persist(persist)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -534,17 +718,20 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        save_market_states = self._market_states_saver(connector)
+
+        def persist(session: Session):
+            session.add(rp_fees)
+            save_market_states(session)
+
+        self._persist(persist)
 
     @staticmethod
     async def _sleep(delay):
@@ -10,7 +10,7 @@ from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.perpetual_trading import PerpetualTrading
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
-from hummingbot.core.data_type.in_flight_order import PerpetualDerivativeInFlightOrder
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, PerpetualDerivativeInFlightOrder
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.events import (
@@ -250,6 +250,36 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             **kwargs,
         )
 
+    def _track_and_validate_order(
+        self,
+        trade_type: TradeType,
+        order_id: str,
+        trading_pair: str,
+        amount: Decimal,
+        order_type: OrderType,
+        price: Optional[Decimal] = None,
+        position_action: PositionAction = PositionAction.NIL,
+        **kwargs,
+    ) -> Optional[InFlightOrder]:
+        order = super()._track_and_validate_order(
+            trade_type,
+            order_id,
+            trading_pair,
+            amount,
+            order_type,
+            price,
+            position_action=position_action,
+            **kwargs,
+        )
+        if order is not None and position_action not in self.VALID_POSITION_ACTIONS:
+            # Only reachable by the batch order creation, single orders are rejected before being tracked
+            self.logger().error(
+                f"Invalid position action {position_action}. Must be one of {self.VALID_POSITION_ACTIONS}"
+            )
+            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+            return None
+        return order
+
     def get_fee(
         self,
         base_currency: str,
@@ -25,13 +25,17 @@ s_decimal_0 = Decimal("0")
 
 cdef class MockPaperExchange(PaperTradeExchange):
 
-    def __init__(self, client_config_map: "ClientConfigAdapter", trade_fee_schema: Optional[TradeFeeSchema] = None):
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 trade_fee_schema: Optional[TradeFeeSchema] = None,
+                 queue_position_fill_model: bool = False):
         PaperTradeExchange.__init__(
             self,
             client_config_map,
             MockOrderTracker(),
             MockPaperExchange,
             exchange_name="mock",
+            queue_position_fill_model=queue_position_fill_model,
         )
 
         trade_fee_schema = trade_fee_schema or TradeFeeSchema(
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Optional
 
 import numpy
 
@@ -15,13 +15,23 @@ class TimeSynchronizer:
     This class is useful when timestamp-based signatures are required by the exchange for authentication.
     Upon receiving a timestamped message from the server, use `update_server_time_offset_with_time_provider`
     to synchronize local time with the server's time.
+
+    The offset is calculated when a sample is added, so getting the time is a single addition. The interval between
+    synchronizations (see `is_update_required`) doubles each time a new sample confirms the current offset, up to
+    MAX_UPDATE_INTERVAL, and is reset when a sample deviates more than OFFSET_STABILITY_THRESHOLD_MS.
     """
 
     NaN = float("nan")
+    MIN_UPDATE_INTERVAL = 10.0
+    MAX_UPDATE_INTERVAL = 600.0
+    OFFSET_STABILITY_THRESHOLD_MS = 100.0
     _logger = None
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        self._calculated_time_offset_ms: Optional[float] = None
+        self._last_update_seconds_counter: Optional[float] = None
+        self._update_interval = 0.0
         self._lock = asyncio.Lock()
 
     @classmethod
@@ -32,20 +42,33 @@ class TimeSynchronizer:
 
     @property
     def time_offset_ms(self) -> float:
-        if not self._time_offset_ms:
-            offset = (self._time() - self._current_seconds_counter()) * 1e3
-        else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
+        if self._calculated_time_offset_ms is None:
+            return (self._time() - self._current_seconds_counter()) * 1e3
+        return self._calculated_time_offset_ms
 
-        return offset
+    @property
+    def update_interval(self) -> float:
+        """
+        Seconds to wait after the last synchronization with the server before synchronizing again
+        """
+        return self._update_interval
 
     def add_time_offset_ms_sample(self, offset: float):
         self._time_offset_ms.append(offset)
+        self._calculated_time_offset_ms = self._calculate_time_offset_ms()
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._calculated_time_offset_ms = None
+        self._last_update_seconds_counter = None
+        self._update_interval = 0.0
+
+    def is_update_required(self) -> bool:
+        """
+        :return: True if the offset has not been synchronized with the server in the last `update_interval` seconds
+        """
+        return (self._last_update_seconds_counter is None
+                or self._current_seconds_counter() - self._last_update_seconds_counter >= self._update_interval)
 
     def time(self) -> float:
         """
@@ -67,7 +90,10 @@ class TimeSynchronizer:
             local_after_ms: float = self._current_seconds_counter() * 1e3
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
             time_offset_ms: float = server_time_ms - local_server_time_pre_image_ms
+            previous_time_offset_ms = self._calculated_time_offset_ms
             self.add_time_offset_ms_sample(time_offset_ms)
+            self._update_interval_with_sample(time_offset_ms=time_offset_ms, previous_time_offset_ms=previous_time_offset_ms)
+            self._last_update_seconds_counter = local_after_ms * 1e-3
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -89,6 +115,19 @@ class TimeSynchronizer:
                 # This is done to avoid the warning message from asyncio framework saying a coroutine was not awaited
                 time_provider.close()
 
+    def _calculate_time_offset_ms(self) -> float:
+        median = numpy.median(self._time_offset_ms)
+        weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+        return float(numpy.mean([median, weighted_average]))
+
+    def _update_interval_with_sample(self, time_offset_ms: float, previous_time_offset_ms: Optional[float]):
+        if (previous_time_offset_ms is not None
+                and abs(time_offset_ms - previous_time_offset_ms) <= self.OFFSET_STABILITY_THRESHOLD_MS):
+            self._update_interval = min(max(self._update_interval * 2, self.MIN_UPDATE_INTERVAL),
+                                        self.MAX_UPDATE_INTERVAL)
+        else:
+            self._update_interval = 0.0
+
     def _current_seconds_counter(self):
         return time.perf_counter()
 
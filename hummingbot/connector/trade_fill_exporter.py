@@ -0,0 +1,219 @@
+import csv
+import logging
+import os
+import time
+from shutil import move
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from hummingbot.logger import HummingbotLogger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Types of the exported trade fill columns in the Parquet files. Any other column is exported as a string.
+PARQUET_COLUMN_TYPES: Dict[str, str] = {
+    "timestamp": "int64",
+    "price": "float64",
+    "amount": "float64",
+    "leverage": "int64",
+    "trade_fee_in_quote": "float64",
+}
+
+
+def _timestamp_suffix() -> str:
+    return pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S")
+
+
+class TradeFillCsvWriter:
+    """
+    Appends trade fills to a CSV file keeping the file open between writes.
+
+    The header of an existing file is checked only once, when the writer opens it. If it does not match the exported
+    fields, the old file is moved aside and a new one is started. The rows are buffered and flushed to disk once
+    `batch_size` rows are pending or when `flush_interval` seconds have passed since the last flush. Since rows may stop
+    coming, the owner is expected to call `flush_if_due` periodically. When `max_file_size` is set, the file is rotated
+    once it reaches that size.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 path: str,
+                 field_names: Sequence[str],
+                 flush_interval: float = 5.0,
+                 max_file_size: Optional[int] = None,
+                 batch_size: int = 100):
+        """
+        :param path: path of the CSV file
+        :param field_names: the exported columns, written as the file header
+        :param flush_interval: max seconds a written row can stay in the buffer before it is flushed to disk
+        :param max_file_size: size in bytes after which the file is rotated. None disables the rotation
+        :param batch_size: max number of rows that can stay in the buffer before they are flushed to disk
+        """
+        self._path: str = path
+        self._field_names: Tuple[str, ...] = tuple(field_names)
+        self._flush_interval: float = flush_interval
+        self._max_file_size: Optional[int] = max_file_size
+        self._batch_size: int = batch_size
+        self._file = None
+        self._writer = None
+        self._last_flush_time: float = 0
+        self._pending_rows: int = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def write_row(self, row: Sequence[Any]):
+        if self._file is None:
+            self._open()
+        self._writer.writerow(row)
+        self._pending_rows += 1
+        if self._pending_rows >= self._batch_size:
+            self.flush()
+        else:
+            self.flush_if_due()
+        if self._max_file_size is not None and self._file.tell() >= self._max_file_size:
+            self._rotate()
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+        self._pending_rows = 0
+        self._last_flush_time = self._time()
+
+    def flush_if_due(self):
+        """
+        Flushes the pending rows if `flush_interval` seconds have passed since the last flush.
+        """
+        if self._pending_rows > 0 and self._time() - self._last_flush_time >= self._flush_interval:
+            self.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._pending_rows = 0
+            self._file = None
+            self._writer = None
+
+    def _open(self):
+        if os.path.exists(self._path) and not self._file_matches_header():
+            move(self._path, self._path[:-4] + "_old_" + _timestamp_suffix() + ".csv")
+        write_header = not os.path.exists(self._path) or os.path.getsize(self._path) == 0
+        self._file = open(self._path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(self._field_names)
+        self._last_flush_time = self._time()
+
+    def _file_matches_header(self) -> bool:
+        with open(self._path, newline="") as file:
+            header = next(csv.reader(file), None)
+        return header is None or tuple(header) == self._field_names
+
+    def _rotate(self):
+        self.close()
+        rotated_prefix = self._path[:-4] + "_" + _timestamp_suffix()
+        rotated_path = rotated_prefix + ".csv"
+        index = 1
+        while os.path.exists(rotated_path):
+            rotated_path = f"{rotated_prefix}_{index}.csv"
+            index += 1
+        move(self._path, rotated_path)
+        self.logger().info(f"Trades file {self._path} rotated to {rotated_path}.")
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
+
+
+class TradeFillParquetWriter:
+    """
+    Writes trade fills to a Parquet file with the same columns as the CSV export, for downstream analysis.
+
+    Rows are buffered and written as a row group every `batch_size` rows, or by `flush_if_due` once `flush_interval`
+    seconds have passed since the first buffered row. Each writer creates a new file, so a Parquet file is only complete
+    and readable after the writer is closed.
+    """
+
+    def __init__(self, path: str, field_names: Sequence[str], batch_size: int = 1000, flush_interval: float = 60.0):
+        if pa is None:
+            raise ImportError("The Parquet trades export requires the pyarrow package.")
+        self._path: str = path
+        self._field_names: List[str] = list(field_names)
+        self._batch_size: int = batch_size
+        self._flush_interval: float = flush_interval
+        self._first_row_time: float = 0
+        self._schema = pa.schema([
+            (name, getattr(pa, PARQUET_COLUMN_TYPES.get(name, "string"))())
+            for name in self._field_names
+        ])
+        self._rows: List[Sequence[Any]] = []
+        self._writer = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def write_row(self, row: Sequence[Any]):
+        if not self._rows:
+            self._first_row_time = self._time()
+        self._rows.append(row)
+        if len(self._rows) >= self._batch_size:
+            self.flush()
+
+    def flush_if_due(self):
+        """
+        Writes the buffered rows if the oldest of them has waited `flush_interval` seconds.
+        """
+        if self._rows and self._time() - self._first_row_time >= self._flush_interval:
+            self.flush()
+
+    def flush(self):
+        if not self._rows:
+            return
+        columns = list(zip(*self._rows))
+        arrays = [
+            pa.array([self._convert(value, field.type) for value in column], type=field.type)
+            for column, field in zip(columns, self._schema)
+        ]
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._path, self._schema)
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        self._rows = []
+
+    def close(self):
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    @staticmethod
+    def _convert(value: Any, arrow_type) -> Any:
+        if value is None:
+            return None
+        if pa.types.is_floating(arrow_type):
+            return float(value)
+        if pa.types.is_integer(arrow_type):
+            return int(value)
+        return str(value)
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+
+class LimitWindow:
+    """
+    Sliding window of the requests logged against a single RateLimit. It keeps the (timestamp, weight) pairs in a deque
+    ordered by time and the running total of the weights in the window, so checking the used capacity is O(1) and
+    expiring old requests is amortized O(1).
+    """
+
+    __slots__ = ("rate_limit", "expiration_interval", "entries", "used_capacity")
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.entries: Deque[Tuple[float, int]] = deque()
+        self.used_capacity: int = 0
+        self.set_rate_limit(rate_limit=rate_limit, safety_margin_pct=safety_margin_pct)
+
+    def set_rate_limit(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.rate_limit: RateLimit = rate_limit
+        self.expiration_interval: float = rate_limit.time_interval * (1 + safety_margin_pct)
+
+    def expire(self, now: float):
+        entries = self.entries
+        threshold = now - self.expiration_interval
+        while entries and entries[0][0] < threshold:
+            _, weight = entries.popleft()
+            self.used_capacity -= weight
+
+    def append(self, timestamp: float, weight: int):
+        self.entries.append((timestamp, weight))
+        self.used_capacity += weight
+
+    def seconds_until_capacity(self, weight: int, now: float) -> float:
+        """
+        Time until enough requests leave the window for a new request with the given weight to fit in it.
+        """
+        capacity_to_free = self.used_capacity + weight - self.rate_limit.limit
+        freed = 0
+        for timestamp, entry_weight in self.entries:
+            freed += entry_weight
+            if freed >= capacity_to_free:
+                return max(0.0, timestamp + self.expiration_interval - now)
+        return 0.0
+
+
+class SlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that checks the rate limits against the per limit sliding windows of
+    a SlidingWindowThrottler. When there is no capacity, it sleeps until the oldest request blocking the new one
+    leaves its window instead of polling every retry interval.
+    """
+
+    def __init__(self,
+                 windows: Dict[str, LimitWindow],
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 ):
+        """
+        :param windows: Shared sliding windows, keyed by limit_id
+        :param rate_limit: The RateLimit associated with this API Request
+        :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
+        :param lock: A shared asyncio.Lock used between all instances of SlidingWindowRequestContext
+        :param safety_margin_pct: Percentage of the time interval added to each window as a safety margin
+        :param retry_interval: Upper bound for the time slept between capacity checks
+        """
+        super().__init__(
+            task_logs=[],
+            rate_limit=rate_limit,
+            related_limits=related_limits,
+            lock=lock,
+            safety_margin_pct=safety_margin_pct,
+            retry_interval=retry_interval,
+        )
+        self._windows: Dict[str, LimitWindow] = windows
+        self._limits_with_weights: List[Tuple[LimitWindow, int]] = []
+        if rate_limit is not None:
+            self._limits_with_weights = [
+                (self._window(limit), weight)
+                for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits
+            ]
+
+    def _window(self, rate_limit: RateLimit) -> LimitWindow:
+        window = self._windows.get(rate_limit.limit_id)
+        if window is None:
+            window = LimitWindow(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            self._windows[rate_limit.limit_id] = window
+        return window
+
+    def flush(self):
+        """
+        Remove the requests that have passed their rate limit periods from the windows used by this request
+        """
+        now = self._time()
+        for window, _ in self._limits_with_weights:
+            window.expire(now)
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if an additional task is within the defined RateLimit(s). Logs a warning message if the limit is about
+        to be reached.
+        :return: True if it is within capacity to add a new task
+        """
+        return self._seconds_until_capacity() == 0
+
+    def _seconds_until_capacity(self) -> float:
+        now = self._time()
+        wait_time = 0.0
+        for window, weight in self._limits_with_weights:
+            rate_limit = window.rate_limit
+            if window.used_capacity + weight > rate_limit.limit:
+                if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {window.used_capacity} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    AsyncRequestContextBase._last_max_cap_warning_ts = now
+                # A request that can never fit still has to be retried, so it never waits less than a retry interval
+                wait_time = max(wait_time, window.seconds_until_capacity(weight=weight, now=now) or self._retry_interval)
+        return wait_time
+
+    async def acquire(self):
+        while True:
+            async with self._lock:
+                self.flush()
+                wait_time = self._seconds_until_capacity()
+                if wait_time == 0:
+                    now = self._time()
+                    for window, weight in self._limits_with_weights:
+                        window.append(timestamp=now, weight=weight)
+                    break
+            await asyncio.sleep(wait_time)
+
+    def _time(self) -> float:
+        return time.time()
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Drop-in replacement for AsyncThrottler that keeps a sliding window with a running total per limit_id instead of a
+    single list of task logs that is scanned on every capacity check. Checking a request costs O(number of limits
+    of the request), regardless of how many requests were made in the last time interval.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None
+                 ):
+        self._windows: Dict[str, LimitWindow] = {}
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        # The windows keep a reference to the limit they were created for. They are updated in place for the limits
+        # that still exist, so the requests already made keep counting against the new limits.
+        for limit_id in list(self._windows):
+            rate_limit = self._id_to_limit_map.get(limit_id)
+            if rate_limit is None:
+                del self._windows[limit_id]
+            else:
+                self._windows[limit_id].set_rate_limit(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+
+    def execute_task(self, limit_id: str) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return SlidingWindowRequestContext(
+            windows=self._windows,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+        )
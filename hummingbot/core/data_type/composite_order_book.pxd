@@ -6,3 +6,4 @@ cdef class CompositeOrderBook(OrderBook):
         OrderBook _traded_order_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef double c_get_volume_at_price(self, bint is_bid, double price)
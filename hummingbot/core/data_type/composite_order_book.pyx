@@ -1,7 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from itertools import islice
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
@@ -9,6 +12,7 @@ from libcpp.set cimport set
 from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import levels_array_from_rows
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 cdef class CompositeOrderBook(OrderBook):
@@ -78,6 +82,10 @@ cdef class CompositeOrderBook(OrderBook):
     def original_ask_entries(self) -> Iterator[OrderBookRow]:
         return super().ask_entries()
 
+    def top_n(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        return (levels_array_from_rows(list(islice(self.bid_entries(), depth))),
+                levels_array_from_rows(list(islice(self.ask_entries(), depth))))
+
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
             set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
@@ -192,3 +200,12 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef double c_get_volume_at_price(self, bint is_bid, double price):
+        """
+        :return: the amount resting at the price level, less the amount of the recorded filled orders at that price
+        """
+        cdef:
+            double volume = (OrderBook.c_get_volume_at_price(self, is_bid, price) -
+                             self._traded_order_book.c_get_volume_at_price(is_bid, price))
+        return max(volume, 0)
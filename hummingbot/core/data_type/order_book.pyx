@@ -34,6 +34,15 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+# Price levels returned by OrderBook.top_n, with the same columns as the snapshot data frames
+ORDER_BOOK_LEVEL_DTYPE = np.dtype([("price", np.float64), ("amount", np.float64), ("update_id", np.int64)])
+
+
+def levels_array_from_rows(rows: List[OrderBookRow]) -> np.ndarray:
+    """
+    :return: the order book rows as a structured array of ORDER_BOOK_LEVEL_DTYPE
+    """
+    return np.array([tuple(row) for row in rows], dtype=ORDER_BOOK_LEVEL_DTYPE)
 
 
 cdef class OrderBook(PubSub):
@@ -171,12 +180,48 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids, asks = self.top_n()
+        bids_df = pd.DataFrame(data=bids, columns=OrderBookRow._fields)
+        asks_df = pd.DataFrame(data=asks, columns=OrderBookRow._fields)
         return bids_df, asks_df
 
+    def top_n(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reads the best price levels of the book without going through OrderBookRow objects.
+        :param depth: the number of levels to read on each side, or None for the whole book
+        :return: the bids and the asks, best price first, as structured arrays of ORDER_BOOK_LEVEL_DTYPE with the
+            fields price, amount and update_id
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            size_t bids_depth = self._bid_book.size()
+            size_t asks_depth = self._ask_book.size()
+            size_t i
+            double[:] bid_prices, bid_amounts, ask_prices, ask_amounts
+            int64_t[:] bid_update_ids, ask_update_ids
+
+        if depth is not None:
+            if depth < 0:
+                raise ValueError(f"The order book depth must not be negative (got {depth}).")
+            bids_depth = min(bids_depth, <size_t>depth)
+            asks_depth = min(asks_depth, <size_t>depth)
+        bids = np.empty(bids_depth, dtype=ORDER_BOOK_LEVEL_DTYPE)
+        asks = np.empty(asks_depth, dtype=ORDER_BOOK_LEVEL_DTYPE)
+        bid_prices, bid_amounts, bid_update_ids = bids["price"], bids["amount"], bids["update_id"]
+        ask_prices, ask_amounts, ask_update_ids = asks["price"], asks["amount"], asks["update_id"]
+        for i in range(bids_depth):
+            bid_prices[i] = deref(bid_it).getPrice()
+            bid_amounts[i] = deref(bid_it).getAmount()
+            bid_update_ids[i] = deref(bid_it).getUpdateId()
+            inc(bid_it)
+        for i in range(asks_depth):
+            ask_prices[i] = deref(ask_it).getPrice()
+            ask_amounts[i] = deref(ask_it).getAmount()
+            ask_update_ids[i] = deref(ask_it).getUpdateId()
+            inc(ask_it)
+        return bids, asks
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -208,16 +253,19 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        :param update_id: the update id of the diffs, the highest update id of the rows if not specified
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -226,14 +274,17 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+            Py_ssize_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
         """
@@ -253,15 +304,39 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
+    @staticmethod
+    def price_levels_array(list price_levels, int64_t update_id) -> np.ndarray:
+        """
+        Converts the price levels of an exchange message to the array of doubles taken by apply_numpy_diffs, without
+        creating an OrderBookRow for each level.
+
+        :param price_levels: the price levels as [price, amount, ...] sequences of strings or numbers
+        :param update_id: the update id of the message
+        :return: an array with the [price, amount, update_id] rows of the price levels
+        """
+        cdef:
+            Py_ssize_t i
+            Py_ssize_t levels_count = len(price_levels)
+            np.ndarray[np.float64_t, ndim=2] levels_array = np.empty((levels_count, 3), dtype=np.float64)
+        for i in range(levels_count):
+            price_level = price_levels[i]
+            levels_array[i, 0] = float(price_level[0])
+            levels_array[i, 1] = float(price_level[1])
+            levels_array[i, 2] = update_id
+        return levels_array
+
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
             set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
@@ -457,6 +532,19 @@ cdef class OrderBook(PubSub):
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef double c_get_volume_at_price(self, bint is_bid, double price):
+        """
+        :param is_bid: True to look up the price level in the bid book, False for the ask book
+        :param price: the price of the level
+        :return: the amount resting at the price level, or 0 if there is no such level
+        """
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+        if it == deref(book).end():
+            return 0
+        return deref(it).getAmount()
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -475,9 +563,15 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_volume_at_price(self, is_bid: bool, price: float) -> float:
+        return self.c_get_volume_at_price(is_bid, price)
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
         self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            if diff.has_price_levels_arrays:
+                self.c_apply_numpy_diffs(diff.content["bids"], diff.content["asks"], diff.update_id)
+            else:
+                self.apply_diffs(diff.bids, diff.asks, diff.update_id)
@@ -3,6 +3,8 @@ from enum import Enum
 from functools import total_ordering
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -54,15 +56,19 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
 
     @property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        return self._order_book_rows(self.content["asks"])
 
     @property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        return self._order_book_rows(self.content["bids"])
+
+    @property
+    def has_price_levels_arrays(self) -> bool:
+        """
+        True if the bids and asks of the message are [price, amount, update_id] arrays built with
+        OrderBook.price_levels_array, which can be applied to the order book with OrderBook.apply_numpy_diffs.
+        """
+        return isinstance(self.content.get("bids"), np.ndarray) and isinstance(self.content.get("asks"), np.ndarray)
 
     @property
     def has_update_id(self) -> bool:
@@ -72,6 +78,12 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def has_trade_id(self) -> bool:
         return self.type == OrderBookMessageType.TRADE
 
+    def _order_book_rows(self, price_levels) -> List[OrderBookRow]:
+        update_id = self.update_id
+        if isinstance(price_levels, np.ndarray):
+            return [OrderBookRow(price, amount, update_id) for price, amount in price_levels[:, :2].tolist()]
+        return [OrderBookRow(float(price), float(amount), update_id) for price, amount, *trash in price_levels]
+
     def __eq__(self, other: "OrderBookMessage") -> bool:
         eq = (
             (self.type == other.type)
@@ -2,9 +2,11 @@ import asyncio
 import logging
 import time
 from collections import defaultdict, deque
+from dataclasses import dataclass
 from enum import Enum
 from typing import Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
@@ -13,6 +15,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage, Order
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.bounded_queue import BoundedQueue, QueueOverflowPolicy, QueueStats
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +24,36 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class OrderBookTrackingMetrics:
+    """
+    Progress of the diff processing of a tracked order book.
+    The queue depth is the number of messages that were waiting when the last diff was taken from the queue, and the
+    lag is the time the oldest diff of the last applied batch waited between its local reception by the tracker and
+    its application. The exchange timestamps of the messages are not used, since their unit and clock depend on the
+    connector.
+    """
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    diffs_applied: int = 0
+    diff_batches_applied: int = 0
+    resnapshots: int = 0
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Max number of messages kept in each queue of the tracker. When a queue is full, its oldest message is dropped.
+    # The order books that lose a diff or a snapshot are restored from a new snapshot.
+    DEFAULT_QUEUE_LIMITS: Dict[str, int] = {
+        "order_book_diff_stream": 10000,
+        "order_book_snapshot_stream": 1000,
+        "order_book_trade_stream": 10000,
+        # Per trading pair queues
+        "tracking_messages": 1000,
+        "saved_messages": 1000,
+    }
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,20 +62,60 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 init_concurrency: Optional[int] = None,
+                 coalesce_diffs: bool = False,
+                 queue_limits: Optional[Dict[str, int]] = None):
+        """
+        :param data_source: the data source used to fetch snapshots and listen to the exchange streams
+        :param trading_pairs: the trading pairs to track
+        :param domain: which domain we are connecting to
+        :param init_concurrency: maximum number of order book snapshots requested at the same time during
+            initialization. When None the order books are initialized one at a time with a delay between them.
+        :param coalesce_diffs: when True, all the diffs queued for a trading pair are merged by price level and
+            applied to the order book at once, instead of one by one
+        :param queue_limits: max number of messages of the queues, overriding the values of DEFAULT_QUEUE_LIMITS
+        """
+        if init_concurrency is not None and init_concurrency < 1:
+            raise ValueError(f"init_concurrency must be a positive integer (got {init_concurrency}).")
+        unknown_queues = set(queue_limits or {}) - set(self.DEFAULT_QUEUE_LIMITS)
+        if unknown_queues:
+            raise ValueError(f"Unknown order book tracker queues: {sorted(unknown_queues)}.")
+        self._queue_limits: Dict[str, int] = {**self.DEFAULT_QUEUE_LIMITS, **(queue_limits or {})}
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
+        self._init_concurrency: Optional[int] = init_concurrency
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._tracking_metrics: Dict[str, OrderBookTrackingMetrics] = defaultdict(OrderBookTrackingMetrics)
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
-        self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
+        self._tracking_message_queues: Dict[str, BoundedQueue] = {}
         self._past_diffs_windows: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
+        self._order_book_diff_stream: BoundedQueue = BoundedQueue(
+            maxsize=self._queue_limits["order_book_diff_stream"],
+            overflow_policy=QueueOverflowPolicy.DROP_OLDEST,
+            on_overflow=self._on_order_book_message_dropped)
+        self._order_book_snapshot_stream: BoundedQueue = BoundedQueue(
+            maxsize=self._queue_limits["order_book_snapshot_stream"],
+            overflow_policy=QueueOverflowPolicy.DROP_OLDEST,
+            on_overflow=self._on_order_book_message_dropped)
+        self._order_book_trade_stream: BoundedQueue = BoundedQueue(
+            maxsize=self._queue_limits["order_book_trade_stream"],
+            overflow_policy=QueueOverflowPolicy.DROP_OLDEST)
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
-        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self._queue_limits["saved_messages"]))
+        self._saved_messages_high_water_marks: Dict[str, int] = defaultdict(int)
+        self._saved_messages_dropped: Dict[str, int] = defaultdict(int)
+        # Local time at which each queued diff was received by the tracker, by id of the message
+        self._diff_received_timestamps: Dict[int, float] = {}
+        self._resnapshot_tasks: Dict[str, asyncio.Task] = {}
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +139,55 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order book has been initialized and is being tracked, even if the tracker is not fully
+        ready yet.
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_trading_pair_ready(trading_pair)]
+
+    @property
+    def tracking_metrics(self) -> Dict[str, OrderBookTrackingMetrics]:
+        """
+        The diff queue depth and lag of the tracked order books, by trading pair.
+        """
+        return {trading_pair: self._tracking_metrics[trading_pair] for trading_pair in self._tracking_tasks}
+
+    @property
+    def queue_stats(self) -> Dict[str, QueueStats]:
+        """
+        The size, high-water mark and number of dropped messages of the tracker queues. The per trading pair queues
+        are named `tracking_messages:<trading pair>` and `saved_messages:<trading pair>`.
+        """
+        stats = {
+            "order_book_diff_stream": self._order_book_diff_stream.stats,
+            "order_book_snapshot_stream": self._order_book_snapshot_stream.stats,
+            "order_book_trade_stream": self._order_book_trade_stream.stats,
+        }
+        for trading_pair, message_queue in self._tracking_message_queues.items():
+            stats[f"tracking_messages:{trading_pair}"] = message_queue.stats
+        for trading_pair, saved_messages in self._saved_message_queues.items():
+            stats[f"saved_messages:{trading_pair}"] = QueueStats(
+                size=len(saved_messages),
+                max_size=saved_messages.maxlen,
+                high_water_mark=self._saved_messages_high_water_marks[trading_pair],
+                dropped=self._saved_messages_dropped[trading_pair],
+            )
+        return stats
+
+    def lagging_trading_pairs(self, max_lag_ms: float) -> List[str]:
+        """
+        :param max_lag_ms: the maximum acceptable lag in milliseconds
+        :return: the trading pairs whose last applied diff was more than max_lag_ms behind
+        """
+        return [trading_pair for trading_pair, metrics in self.tracking_metrics.items()
+                if metrics.lag_ms > max_lag_ms]
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        event = self._order_book_ready_events.get(trading_pair)
+        return event is not None and event.is_set()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -133,15 +253,30 @@ class OrderBookTracker:
             self._update_last_trade_prices_task = None
         if self._order_book_stream_listener_task is not None:
             self._order_book_stream_listener_task.cancel()
+        for task in self._resnapshot_tasks.values():
+            task.cancel()
+        self._resnapshot_tasks.clear()
         if len(self._tracking_tasks) > 0:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_ready_events.values():
+            event.clear()
+        self._diff_received_timestamps.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    async def wait_trading_pair_ready(self, trading_pair: str):
+        """
+        Waits until the order book of the trading pair is initialized.
+        :param trading_pair: one of the trading pairs of the tracker
+        """
+        if trading_pair not in self._trading_pairs:
+            raise KeyError(f"The order book of {trading_pair} is not tracked.")
+        await self._order_book_ready_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -176,15 +311,54 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        if self._init_concurrency is None:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                self._start_tracking_order_book(trading_pair=trading_pair, order_book=order_book)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await self._sleep(delay=1)
+        else:
+            await self._init_order_books_concurrently()
         self._order_books_initialized.set()
 
+    async def _init_order_books_concurrently(self):
+        """
+        Requests the order book snapshots for all trading pairs keeping at most `init_concurrency` requests in flight.
+        The requests still go through the connector's throttler, so the rate limits are respected. Each order book
+        starts being tracked as soon as its snapshot arrives. If a snapshot request fails the pending ones are cancelled
+        and the error is raised.
+        """
+        semaphore = asyncio.Semaphore(self._init_concurrency)
+        completed = 0
+
+        async def _init_order_book(trading_pair: str):
+            nonlocal completed
+            async with semaphore:
+                order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+            self._start_tracking_order_book(trading_pair=trading_pair, order_book=order_book)
+            completed += 1
+            self.logger().info(f"Initialized order book for {trading_pair}. "
+                               f"{completed}/{len(self._trading_pairs)} completed.")
+
+        tasks = [asyncio.ensure_future(_init_order_book(trading_pair)) for trading_pair in self._trading_pairs]
+        try:
+            await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _start_tracking_order_book(self, trading_pair: str, order_book: OrderBook):
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = BoundedQueue(
+            maxsize=self._queue_limits["tracking_messages"],
+            overflow_policy=QueueOverflowPolicy.DROP_OLDEST,
+            on_overflow=self._on_order_book_message_dropped)
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -197,12 +371,20 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                received_timestamp: float = time.time()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
                     # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
+                    saved_messages = self._saved_message_queues[trading_pair]
+                    if len(saved_messages) == saved_messages.maxlen:
+                        self._saved_messages_dropped[trading_pair] += 1
+                        self._diff_received_timestamps.pop(id(saved_messages[0]), None)
+                    self._diff_received_timestamps[id(ob_message)] = received_timestamp
+                    saved_messages.append(ob_message)
+                    self._saved_messages_high_water_marks[trading_pair] = max(
+                        self._saved_messages_high_water_marks[trading_pair], len(saved_messages))
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -211,6 +393,7 @@ class OrderBookTracker:
                 if order_book.snapshot_uid > ob_message.update_id:
                     messages_rejected += 1
                     continue
+                self._diff_received_timestamps[id(ob_message)] = received_timestamp
                 await message_queue.put(ob_message)
                 messages_accepted += 1
 
@@ -258,23 +441,39 @@ class OrderBookTracker:
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        metrics: OrderBookTrackingMetrics = self._tracking_metrics[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        # Message taken from the queue while coalescing diffs, processed in the next iteration
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
                 # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                if pending_message is not None:
+                    message, pending_message = pending_message, None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    self._update_queue_depth(metrics, len(saved_messages) + message_queue.qsize())
+                    if self._coalesce_diffs:
+                        diffs, pending_message = self._drain_pending_diffs(message, saved_messages, message_queue)
+                        self._apply_coalesced_diffs(order_book, diffs)
+                    else:
+                        diffs = [message]
+                        if message.has_price_levels_arrays:
+                            order_book.apply_numpy_diffs(
+                                message.content["bids"], message.content["asks"], message.update_id)
+                        else:
+                            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    past_diffs_window.extend(diffs)
+                    self._record_applied_diffs(metrics, diffs)
+                    diff_messages_accepted += len(diffs)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -295,6 +494,99 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _on_order_book_message_dropped(self, message: OrderBookMessage):
+        """
+        Called when a full queue drops an order book message. The order book has missed an update, so it is restored
+        from a new snapshot.
+        """
+        self._diff_received_timestamps.pop(id(message), None)
+        if message.type in (OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT):
+            self._schedule_resnapshot(message.trading_pair)
+
+    def _schedule_resnapshot(self, trading_pair: str):
+        if trading_pair not in self._tracking_message_queues or trading_pair in self._resnapshot_tasks:
+            return
+        self._resnapshot_tasks[trading_pair] = safe_ensure_future(self._resnapshot(trading_pair))
+
+    async def _resnapshot(self, trading_pair: str):
+        try:
+            self.logger().warning(f"Order book messages for {trading_pair} were dropped. Requesting a new snapshot.")
+            snapshot: OrderBookMessage = await self._data_source._order_book_snapshot(trading_pair=trading_pair)
+            self._tracking_message_queues[trading_pair].put_nowait(snapshot)
+            self._tracking_metrics[trading_pair].resnapshots += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Unexpected error requesting the order book snapshot for {trading_pair}.",
+                                  exc_info=True)
+        finally:
+            self._resnapshot_tasks.pop(trading_pair, None)
+
+    @staticmethod
+    def _drain_pending_diffs(
+            message: OrderBookMessage,
+            saved_messages: Deque[OrderBookMessage],
+            message_queue: asyncio.Queue) -> Tuple[List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Takes the diffs already waiting after `message`, without waiting for new ones.
+        :return: the diffs to apply, and the first message that is not a diff if one was taken from the queue
+        """
+        diffs = [message]
+        while len(saved_messages) > 0 or not message_queue.empty():
+            next_message = saved_messages.popleft() if len(saved_messages) > 0 else message_queue.get_nowait()
+            if next_message.type is not OrderBookMessageType.DIFF:
+                return diffs, next_message
+            diffs.append(next_message)
+        return diffs, None
+
+    @staticmethod
+    def _apply_coalesced_diffs(order_book: OrderBook, diffs: List[OrderBookMessage]):
+        """
+        Merges the diffs by price level, keeping for each price the amount with the highest update id (the last one
+        received for equal update ids), and applies the result as a single diff.
+        """
+        if len(diffs) == 1:
+            bids, asks = OrderBookTracker._price_levels_array(diffs[0])
+        else:
+            price_levels = [OrderBookTracker._price_levels_array(diff) for diff in diffs]
+            bids = OrderBookTracker._merge_price_levels([levels[0] for levels in price_levels])
+            asks = OrderBookTracker._merge_price_levels([levels[1] for levels in price_levels])
+        order_book.apply_numpy_diffs(bids, asks, max(diff.update_id for diff in diffs))
+
+    @staticmethod
+    def _price_levels_array(message: OrderBookMessage) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: the bids and asks of a diff message as (n, 3) arrays of [price, amount, update_id]
+        """
+        if message.has_price_levels_arrays:
+            return message.content["bids"], message.content["asks"]
+        return (
+            np.array([[row.price, row.amount, row.update_id] for row in message.bids], dtype=np.float64).reshape(-1, 3),
+            np.array([[row.price, row.amount, row.update_id] for row in message.asks], dtype=np.float64).reshape(-1, 3),
+        )
+
+    @staticmethod
+    def _merge_price_levels(price_levels: List[np.ndarray]) -> np.ndarray:
+        levels = np.concatenate(price_levels)
+        # Stable sort by update id, so that the last level of each price is the one that wins
+        levels = levels[np.argsort(levels[:, 2], kind="stable")]
+        _, last_indices = np.unique(levels[::-1, 0], return_index=True)
+        return levels[len(levels) - 1 - last_indices]
+
+    @staticmethod
+    def _update_queue_depth(metrics: OrderBookTrackingMetrics, queue_depth: int):
+        metrics.queue_depth = queue_depth
+        metrics.max_queue_depth = max(metrics.max_queue_depth, queue_depth)
+
+    def _record_applied_diffs(self, metrics: OrderBookTrackingMetrics, diffs: List[OrderBookMessage]):
+        received_timestamps = [self._diff_received_timestamps.pop(id(diff), None) for diff in diffs]
+        received_timestamps = [timestamp for timestamp in received_timestamps if timestamp is not None]
+        if len(received_timestamps) > 0:
+            metrics.lag_ms = max(0.0, (time.time() - min(received_timestamps)) * 1e3)
+            metrics.max_lag_ms = max(metrics.max_lag_ms, metrics.lag_ms)
+        metrics.diffs_applied += len(diffs)
+        metrics.diff_batches_applied += 1
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
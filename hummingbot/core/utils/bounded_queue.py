@@ -0,0 +1,68 @@
+import asyncio
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Optional
+
+
+class QueueOverflowPolicy(Enum):
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+@dataclass
+class QueueStats:
+    size: int
+    max_size: int
+    high_water_mark: int
+    dropped: int
+
+
+class BoundedQueue(asyncio.Queue):
+    """
+    An asyncio.Queue with a maximum size that never blocks the producers nor raises QueueFull. When the queue is full,
+    a new item makes the queue drop either its oldest item or the new one, depending on the overflow policy. The
+    dropped item is passed to `on_overflow`, so that the owner can recover from the loss.
+    """
+
+    def __init__(self,
+                 maxsize: int,
+                 overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.DROP_OLDEST,
+                 on_overflow: Optional[Callable[[Any], None]] = None):
+        if maxsize < 1:
+            raise ValueError(f"The queue size must be a positive integer (got {maxsize}).")
+        super().__init__(maxsize=maxsize)
+        self._overflow_policy = overflow_policy
+        self._on_overflow = on_overflow
+        self._high_water_mark = 0
+        self._dropped = 0
+
+    @property
+    def overflow_policy(self) -> QueueOverflowPolicy:
+        return self._overflow_policy
+
+    @property
+    def stats(self) -> QueueStats:
+        return QueueStats(
+            size=self.qsize(),
+            max_size=self.maxsize,
+            high_water_mark=self._high_water_mark,
+            dropped=self._dropped,
+        )
+
+    async def put(self, item: Any):
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any):
+        if self.full():
+            self._dropped += 1
+            if self._overflow_policy is QueueOverflowPolicy.DROP_NEWEST:
+                dropped_item = item
+            else:
+                dropped_item = self.get_nowait()
+                self.task_done()
+            if self._on_overflow is not None:
+                self._on_overflow(dropped_item)
+            if dropped_item is item:
+                return
+        super().put_nowait(item)
+        self._high_water_mark = max(self._high_water_mark, self.qsize())
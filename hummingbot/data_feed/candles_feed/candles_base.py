@@ -1,8 +1,7 @@
 import asyncio
 import os
 import time
-from collections import deque
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -15,13 +14,15 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.indicators import CandlesIndicator, IndicatorPipeline
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -51,7 +52,9 @@ class CandlesBase(NetworkBase):
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(maxlen=max_records, columns=len(self.columns))
+        self._candles_df_cache: Optional[Tuple[CandlesBuffer, int, pd.DataFrame]] = None
+        self._indicator_pipelines: List[IndicatorPipeline] = []
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -91,7 +94,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,9 +144,34 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+
+        The DataFrame is built once for each version of the candles, and each call returns a copy of it, so the callers
+        can change it without affecting the others.
+        """
+        cache = self._candles_df_cache
+        if cache is None or cache[0] is not self._candles or cache[1] != self._candles.version:
+            cache = (self._candles, self._candles.version,
+                     pd.DataFrame(self._candles.values.copy(), columns=self.columns))
+            self._candles_df_cache = cache
+        return cache[2].copy()
+
+    def add_indicators(self, indicators: List[CandlesIndicator], max_records: int = 0) -> IndicatorPipeline:
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        This method returns a pipeline that keeps the given indicators updated with the candles of the feed, instead of
+        computing them again over the candles DataFrame.
+        :param indicators: the indicators to update
+        :param max_records: number of candles for which the values are kept in the pipeline history
+        """
+        pipeline = IndicatorPipeline(indicators, max_records=max_records)
+        pipeline.update_candles(self._candles)
+        self._indicator_pipelines.append(pipeline)
+        return pipeline
+
+    def _rebuild_indicators(self):
+        for pipeline in self._indicator_pipelines:
+            pipeline.reset()
+            pipeline.update_candles(self._candles)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -160,6 +188,7 @@ class CandlesBase(NetworkBase):
         df = pd.read_csv(file_path)
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
+        self._rebuild_indicators()
 
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
         candles_df = pd.DataFrame()
@@ -213,6 +242,7 @@ class CandlesBase(NetworkBase):
     def _reset_candles(self):
         self._ws_candle_available.clear()
         self._candles.clear()
+        self._rebuild_indicators()
 
     def _rest_payload(self, **kwargs) -> Optional[dict]:
         return None
@@ -320,7 +350,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
@@ -331,6 +361,8 @@ class CandlesBase(NetworkBase):
                 candles = candles[candles[:, 0] < end_time]
                 records_to_add = min(missing_records, len(candles))
                 self._candles.extendleft(candles[-records_to_add:][::-1])
+                # The indicators need the candles in order, so they are computed again with the older ones
+                self._rebuild_indicators()
             except asyncio.CancelledError:
                 raise
             except ValueError:
@@ -407,27 +439,23 @@ class CandlesBase(NetworkBase):
             if isinstance(parsed_message, WSJSONRequest):
                 await websocket_assistant.send(request=parsed_message)
             elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
+                # The values are written in the preallocated row of the candle
+                candles_row = [parsed_message[column] for column in self.columns]
                 if len(self._candles) == 0:
                     self._candles.append(candles_row)
                     self._ws_candle_available.set()
                     safe_ensure_future(self.fill_historical_candles())
                 else:
-                    latest_timestamp = int(self._candles[-1][0])
+                    latest_timestamp = int(self._candles.values[-1][0])
                     current_timestamp = int(parsed_message["timestamp"])
                     if current_timestamp > latest_timestamp:
                         self._candles.append(candles_row)
                     elif current_timestamp == latest_timestamp:
-                        self._candles[-1] = candles_row
+                        self._candles.update_last(candles_row)
+                    else:
+                        continue
+                for pipeline in self._indicator_pipelines:
+                    pipeline.update(self._candles.values[-1])
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
@@ -471,6 +499,7 @@ class CandlesBase(NetworkBase):
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
         websocket_assistant and await websocket_assistant.disconnect()
         self._candles.clear()
+        self._rebuild_indicators()
 
     def get_seconds_from_interval(self, interval: str) -> int:
         """
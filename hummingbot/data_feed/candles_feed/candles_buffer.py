@@ -0,0 +1,103 @@
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+
+
+class CandlesBuffer:
+    """
+    Preallocated ring buffer of candles, one row per candle and one column per value, that keeps the last `maxlen`
+    candles like a deque with that maxlen.
+
+    Each row is written twice, `maxlen` rows apart, so the candles are always contiguous and `values` returns them
+    oldest first as a read-only view, without copying them. The last candle can be updated in place, and `version`
+    changes with every update so the views built from the candles can be cached.
+    """
+
+    def __init__(self, maxlen: int, columns: int):
+        self._maxlen = maxlen
+        self._data = np.full((2 * maxlen, columns), np.nan)
+        self._start = 0
+        self._count = 0
+        self._version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        The candles, oldest first. The view is only valid until the next update of the buffer, copy it to keep it.
+        """
+        view = self._data[self._start:self._start + self._count]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.values[index].copy()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.values)
+
+    def append(self, candle: Sequence[float]):
+        """
+        Adds a candle after the last one, dropping the oldest one when the buffer is full.
+        """
+        self._write((self._start + self._count) % self._maxlen, candle)
+        if self._count < self._maxlen:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % self._maxlen
+
+    def update_last(self, candle: Sequence[float]):
+        """
+        Replaces the values of the last candle in place.
+        """
+        if self._count == 0:
+            raise IndexError("The candles buffer is empty")
+        self._write((self._start + self._count - 1) % self._maxlen, candle)
+
+    def extend(self, candles: Iterable[Sequence[float]]):
+        """
+        Adds the candles after the last one, in order, keeping the last `maxlen` candles.
+        """
+        rows = self._as_rows(candles)[-self._maxlen:]
+        if len(rows) == 0:
+            return
+        end = self._start + self._count
+        self._write((end + np.arange(len(rows))) % self._maxlen, rows)
+        self._count = min(self._count + len(rows), self._maxlen)
+        self._start = (end + len(rows) - self._count) % self._maxlen
+
+    def extendleft(self, candles: Iterable[Sequence[float]]):
+        """
+        Adds the candles before the first one, one at a time like deque.extendleft, so they end up in reverse order. When
+        the buffer is full the newest candles are dropped.
+        """
+        rows = self._as_rows(candles)[::-1][:self._maxlen]
+        if len(rows) == 0:
+            return
+        self._start = (self._start - len(rows)) % self._maxlen
+        self._write((self._start + np.arange(len(rows))) % self._maxlen, rows)
+        self._count = min(self._count + len(rows), self._maxlen)
+
+    def clear(self):
+        self._start = 0
+        self._count = 0
+        self._version += 1
+
+    def _as_rows(self, candles: Iterable[Sequence[float]]) -> np.ndarray:
+        rows = np.asarray(candles if isinstance(candles, (np.ndarray, Sequence)) else list(candles), dtype=float)
+        return rows[:, None] if rows.ndim == 1 else rows
+
+    def _write(self, slots, rows):
+        self._data[slots] = rows
+        self._data[slots + self._maxlen] = rows
+        self._version += 1
@@ -0,0 +1,239 @@
+import json
+import logging
+import os
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.logger import HummingbotLogger
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+CANDLES_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
+                   "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+SECONDS_PER_DAY = 86400
+COVERED_RANGES_FILE_NAME = "covered_ranges.json"
+
+
+def default_candles_store_path() -> str:
+    return os.path.join(data_path(), "candles")
+
+
+class CandlesStore:
+    """
+    Local store of historical candles, saved as Parquet files partitioned by connector, trading pair, interval and UTC
+    day:
+
+        <root>/<connector>/<trading_pair>/<interval>/<YYYY-MM-DD>.parquet
+
+    `get_historical_candles` serves the candles of a range from the files and only downloads the candles missing in
+    them. Only closed candles are stored. The span of each download, from its first to its last candle, is recorded in
+    a `covered_ranges.json` file next to the partitions, so the periods without candles inside it (like a maintenance)
+    are not requested again. The parts of a range the exchange returned no candles for are requested again next time.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, root_path: Optional[str] = None):
+        if pyarrow is None:
+            raise ImportError("The candles store requires the pyarrow package.")
+        self._root_path: str = root_path or default_candles_store_path()
+
+    @property
+    def root_path(self) -> str:
+        return self._root_path
+
+    async def get_historical_candles(self, candles_feed: CandlesBase, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        """
+        Returns the candles between the start and end time of the config, downloading with the candles feed only the
+        ranges that are not stored yet.
+
+        :param candles_feed: candles feed of the connector, trading pair and interval of the config
+        :param config: the range of candles to get
+        """
+        interval_in_seconds = CandlesBase.interval_to_seconds[config.interval]
+        stored_candles = self.load(config.connector_name, config.trading_pair, config.interval,
+                                   config.start_time, config.end_time)
+        covered_ranges = self.load_covered_ranges(config.connector_name, config.trading_pair, config.interval)
+        gaps = self.missing_ranges(stored_candles["timestamp"].to_numpy(), config.start_time,
+                                   self._last_closed_candle_time(config.end_time, interval_in_seconds),
+                                   interval_in_seconds, candles_feed.candles_max_result_per_rest_request,
+                                   covered_ranges)
+        if len(gaps) == 0:
+            return stored_candles
+
+        downloaded_candles = []
+        downloaded_ranges = []
+        for gap_start, gap_end in gaps:
+            self.logger().info(f"Downloading {config.connector_name} {config.trading_pair} {config.interval} candles "
+                               f"from {gap_start} to {gap_end}.")
+            candles = await candles_feed.get_historical_candles(HistoricalCandlesConfig(
+                connector_name=config.connector_name,
+                trading_pair=config.trading_pair,
+                interval=config.interval,
+                # The feed doesn't return ranges of a single candle, the extra candles are discarded as duplicates
+                start_time=gap_start - interval_in_seconds,
+                end_time=gap_end + interval_in_seconds,
+            ))
+            # The feed returns an empty frame, sometimes without columns, for the ranges without candles
+            if candles.empty or "timestamp" not in candles.columns:
+                continue
+            downloaded_candles.append(candles)
+            # Only the span the feed returned candles for is covered, the rest of the gap is requested again next time
+            timestamps = candles["timestamp"]
+            gap_timestamps = timestamps[(timestamps >= gap_start) & (timestamps <= gap_end)]
+            if not gap_timestamps.empty:
+                downloaded_ranges.append((int(gap_timestamps.min()), int(gap_timestamps.max())))
+        if len(downloaded_candles) > 0:
+            downloaded_df = pd.concat(downloaded_candles)
+            closed_candles = downloaded_df[downloaded_df["timestamp"] + interval_in_seconds <= self._time()]
+        else:
+            closed_candles = pd.DataFrame(columns=CANDLES_COLUMNS, dtype=float)
+        self.save(config.connector_name, config.trading_pair, config.interval, closed_candles)
+        self.save_covered_ranges(config.connector_name, config.trading_pair, config.interval,
+                                 list(covered_ranges) + downloaded_ranges)
+        candles_df = self._clean(pd.concat([stored_candles, closed_candles]), interval_in_seconds)
+        candles_df = candles_df[(candles_df["timestamp"] >= config.start_time) &
+                                (candles_df["timestamp"] <= config.end_time)]
+        return candles_df.reset_index(drop=True)
+
+    def load(self, connector_name: str, trading_pair: str, interval: str, start_time: int,
+             end_time: int) -> pd.DataFrame:
+        """
+        Reads the stored candles between the start and end time.
+        """
+        directory = self._directory(connector_name, trading_pair, interval)
+        frames = []
+        for day in self._days(start_time, end_time):
+            file_path = os.path.join(directory, f"{day}.parquet")
+            if os.path.exists(file_path):
+                frames.append(pd.read_parquet(file_path))
+        if len(frames) == 0:
+            return pd.DataFrame(columns=CANDLES_COLUMNS, dtype=float)
+        candles_df = pd.concat(frames, ignore_index=True)
+        candles_df = candles_df[(candles_df["timestamp"] >= start_time) & (candles_df["timestamp"] <= end_time)]
+        return candles_df.reset_index(drop=True)
+
+    def save(self, connector_name: str, trading_pair: str, interval: str, candles: pd.DataFrame):
+        """
+        Merges the candles with the stored ones, rewriting the file of each day with new candles.
+        """
+        interval_in_seconds = CandlesBase.interval_to_seconds[interval]
+        candles = self._clean(candles, interval_in_seconds)
+        if candles.empty:
+            return
+        directory = self._directory(connector_name, trading_pair, interval)
+        os.makedirs(directory, exist_ok=True)
+        days = pd.to_datetime(candles["timestamp"], unit="s", utc=True).dt.strftime("%Y-%m-%d")
+        for day, day_candles in candles.groupby(days.values):
+            file_path = os.path.join(directory, f"{day}.parquet")
+            if os.path.exists(file_path):
+                day_candles = self._clean(pd.concat([pd.read_parquet(file_path), day_candles]), interval_in_seconds)
+            temporary_path = f"{file_path}.tmp"
+            day_candles.reset_index(drop=True).to_parquet(temporary_path, index=False)
+            # The file is replaced at once, so an interrupted write doesn't leave a corrupted partition
+            os.replace(temporary_path, file_path)
+
+    def load_covered_ranges(self, connector_name: str, trading_pair: str, interval: str) -> List[Tuple[int, int]]:
+        """
+        Reads the ranges of candle timestamps already downloaded, including the ones without candles.
+        """
+        file_path = os.path.join(self._directory(connector_name, trading_pair, interval), COVERED_RANGES_FILE_NAME)
+        if not os.path.exists(file_path):
+            return []
+        with open(file_path) as file:
+            return [(int(start), int(end)) for start, end in json.load(file)]
+
+    def save_covered_ranges(self, connector_name: str, trading_pair: str, interval: str,
+                            covered_ranges: Sequence[Tuple[int, int]]):
+        """
+        Stores the ranges of candle timestamps already downloaded, merging the overlapping and contiguous ones.
+        """
+        interval_in_seconds = CandlesBase.interval_to_seconds[interval]
+        merged_ranges: List[List[int]] = []
+        for start, end in sorted(covered_ranges):
+            if merged_ranges and start <= merged_ranges[-1][1] + interval_in_seconds:
+                merged_ranges[-1][1] = max(merged_ranges[-1][1], int(end))
+            else:
+                merged_ranges.append([int(start), int(end)])
+        directory = self._directory(connector_name, trading_pair, interval)
+        os.makedirs(directory, exist_ok=True)
+        file_path = os.path.join(directory, COVERED_RANGES_FILE_NAME)
+        temporary_path = f"{file_path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(merged_ranges, file)
+        os.replace(temporary_path, file_path)
+
+    def import_csv(self, file_path: str, connector_name: str, trading_pair: str, interval: str):
+        """
+        Adds the candles of a CSV file, like the ones read by CandlesBase.load_candles_from_csv, to the store.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File '{file_path}' does not exist.")
+        self.save(connector_name, trading_pair, interval, pd.read_csv(file_path))
+
+    @staticmethod
+    def missing_ranges(timestamps: np.ndarray, start_time: int, end_time: int, interval_in_seconds: int,
+                       max_candles_between_ranges: int = 0,
+                       covered_ranges: Sequence[Tuple[int, int]] = ()) -> List[Tuple[int, int]]:
+        """
+        Ranges of candle timestamps between the start and end time that are not in the given timestamps nor in the
+        covered ranges. Ranges separated by at most `max_candles_between_ranges` stored candles are merged, to download
+        them with less requests.
+        """
+        first_timestamp = int(np.ceil(start_time / interval_in_seconds)) * interval_in_seconds
+        expected = np.arange(first_timestamp, end_time + 1, interval_in_seconds)
+        present = np.isin(expected, timestamps)
+        for covered_start, covered_end in covered_ranges:
+            present |= (expected >= covered_start) & (expected <= covered_end)
+        missing = expected[~present]
+        if len(missing) == 0:
+            return []
+        # Split the missing candles where more than max_candles_between_ranges stored candles are between them
+        breaks = np.flatnonzero(np.diff(missing) > interval_in_seconds * (max_candles_between_ranges + 1))
+        starts = np.concatenate([[0], breaks + 1])
+        ends = np.concatenate([breaks, [len(missing) - 1]])
+        return [(int(missing[start]), int(missing[end])) for start, end in zip(starts, ends)]
+
+    def _directory(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return os.path.join(self._root_path, connector_name, trading_pair, interval)
+
+    @staticmethod
+    def _days(start_time: int, end_time: int) -> List[str]:
+        first_day = int(start_time // SECONDS_PER_DAY) * SECONDS_PER_DAY
+        return [pd.Timestamp(day, unit="s", tz="UTC").strftime("%Y-%m-%d")
+                for day in range(first_day, int(end_time) + 1, SECONDS_PER_DAY)]
+
+    def _clean(self, candles: pd.DataFrame, interval_in_seconds: int) -> pd.DataFrame:
+        """
+        Sorts the candles and drops the duplicated ones and the ones that are not aligned to the interval.
+        """
+        candles = candles[CANDLES_COLUMNS].astype(float)
+        candles = candles.drop_duplicates(subset=["timestamp"], keep="last").sort_values("timestamp")
+        aligned = candles["timestamp"] % interval_in_seconds == 0
+        if not aligned.all():
+            self.logger().warning(f"Discarding {(~aligned).sum()} candles not aligned to the {interval_in_seconds}s "
+                                  f"interval.")
+            candles = candles[aligned]
+        return candles.reset_index(drop=True)
+
+    def _last_closed_candle_time(self, end_time: int, interval_in_seconds: int) -> int:
+        return int(min(end_time, self._time() - interval_in_seconds))
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
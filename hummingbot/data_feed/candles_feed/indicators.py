@@ -0,0 +1,408 @@
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+NaN = float("nan")
+
+# Positions of the candle values in the rows of CandlesBase._candles
+TIMESTAMP, HIGH, LOW, CLOSE = 0, 2, 3, 4
+
+
+class _SmaSeededEma:
+    """
+    Exponential moving average seeded with the simple average of the first `length` values, like pandas_ta.ema.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._alpha = 2 / (length + 1)
+        self.reset()
+
+    def reset(self):
+        # (values seen, sum of the values until the seed, average)
+        self._state: Tuple[int, float, float] = (0, 0.0, NaN)
+        self._next_state = self._state
+
+    def update(self, value: float) -> float:
+        count, total, average = self._state
+        if math.isnan(value):
+            self._next_state = self._state
+            return average
+        count += 1
+        if count < self._length:
+            total += value
+        elif count == self._length:
+            total += value
+            average = total / self._length
+        else:
+            average = (1 - self._alpha) * average + self._alpha * value
+        self._next_state = (count, total, average)
+        return average
+
+    def commit(self):
+        self._state = self._next_state
+
+
+class _Rma:
+    """
+    Wilder's moving average, computed like pandas_ta.rma: an adjusted exponential average with alpha 1 / length that
+    starts after `length` values.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._decay = 1 - 1 / length
+        self.reset()
+
+    def reset(self):
+        # (values seen, weighted sum, sum of the weights)
+        self._state: Tuple[int, float, float] = (0, 0.0, 0.0)
+        self._next_state = self._state
+
+    def update(self, value: float) -> float:
+        count, weighted_sum, weights = self._state
+        if not math.isnan(value):
+            count += 1
+            weighted_sum = value + self._decay * weighted_sum
+            weights = 1 + self._decay * weights
+        self._next_state = (count, weighted_sum, weights)
+        return weighted_sum / weights if count >= self._length else NaN
+
+    def commit(self):
+        self._state = self._next_state
+
+
+class _TrueRange:
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._previous_close = NaN
+        self._close = NaN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        self._close = close
+        previous_close = self._previous_close
+        if math.isnan(previous_close):
+            return NaN
+        return max(abs(high - low), abs(high - previous_close), abs(low - previous_close))
+
+    def commit(self):
+        self._previous_close = self._close
+
+
+class CandlesIndicator(ABC):
+    """
+    Base class of the indicators that an IndicatorPipeline updates with each new or updated candle, instead of
+    computing them again over all the candles.
+
+    The indicators keep their state up to the last closed candle and compute their values with the current one, so the
+    current candle can be updated any number of times. The columns are named like the ones pandas_ta appends to the
+    candles DataFrame.
+    """
+
+    @property
+    @abstractmethod
+    def columns(self) -> List[str]:
+        ...
+
+    @abstractmethod
+    def reset(self):
+        """
+        Clears the state, like if no candle had been seen.
+        """
+        ...
+
+    @abstractmethod
+    def update(self, high: float, low: float, close: float) -> Tuple[float, ...]:
+        """
+        Computes the values of the current candle, one for each column.
+        """
+        ...
+
+    @abstractmethod
+    def commit(self):
+        """
+        Closes the current candle, called before the first update with the next one.
+        """
+        ...
+
+
+class EMA(CandlesIndicator):
+
+    def __init__(self, length: int = 10):
+        self._length = length
+        self._ema = _SmaSeededEma(length)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"EMA_{self._length}"]
+
+    def reset(self):
+        self._ema.reset()
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, ...]:
+        return self._ema.update(close),
+
+    def commit(self):
+        self._ema.commit()
+
+
+class BBands(CandlesIndicator):
+
+    def __init__(self, length: int = 5, std: float = 2.0, ddof: int = 0):
+        self._length = length
+        self._std = float(std)
+        self._ddof = ddof
+        self.reset()
+
+    @property
+    def columns(self) -> List[str]:
+        props = f"_{self._length}_{self._std}"
+        return [f"BBL{props}", f"BBM{props}", f"BBU{props}", f"BBB{props}", f"BBP{props}"]
+
+    def reset(self):
+        self._closes = deque(maxlen=self._length - 1)
+        self._close = NaN
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, ...]:
+        self._close = close
+        if len(self._closes) < self._length - 1:
+            return (NaN,) * 5
+        window = [*self._closes, close]
+        mid = math.fsum(window) / self._length
+        deviation = self._std * math.sqrt(math.fsum((value - mid) ** 2 for value in window) / (self._length - self._ddof))
+        lower = mid - deviation
+        upper = mid + deviation
+        width = upper - lower
+        return lower, mid, upper, 100 * width / mid if mid else NaN, (close - lower) / width if width else NaN
+
+    def commit(self):
+        self._closes.append(self._close)
+
+
+class MACD(CandlesIndicator):
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        if slow < fast:
+            fast, slow = slow, fast
+        self._props = f"_{fast}_{slow}_{signal}"
+        self._fast = _SmaSeededEma(fast)
+        self._slow = _SmaSeededEma(slow)
+        self._signal = _SmaSeededEma(signal)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"MACD{self._props}", f"MACDh{self._props}", f"MACDs{self._props}"]
+
+    def reset(self):
+        self._fast.reset()
+        self._slow.reset()
+        self._signal.reset()
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, ...]:
+        macd = self._fast.update(close) - self._slow.update(close)
+        signal = self._signal.update(macd)
+        return macd, macd - signal, signal
+
+    def commit(self):
+        self._fast.commit()
+        self._slow.commit()
+        self._signal.commit()
+
+
+class ATR(CandlesIndicator):
+    """
+    Average true range with Wilder's moving average, the default of pandas_ta.atr.
+    """
+
+    def __init__(self, length: int = 14):
+        self._length = length
+        self._true_range = _TrueRange()
+        self._rma = _Rma(length)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"ATRr_{self._length}"]
+
+    def reset(self):
+        self._true_range.reset()
+        self._rma.reset()
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, ...]:
+        return self._rma.update(self._true_range.update(high, low, close)),
+
+    def commit(self):
+        self._true_range.commit()
+        self._rma.commit()
+
+
+class NATR(ATR):
+    """
+    Average true range as a percentage of the close price.
+    """
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"NATR_{self._length}"]
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, ...]:
+        atr = super().update(high, low, close)[0]
+        return 100 * atr / close if close else NaN,
+
+
+class Donchian(CandlesIndicator):
+
+    def __init__(self, lower_length: int = 20, upper_length: int = 20):
+        self._lower_length = lower_length
+        self._upper_length = upper_length
+        self.reset()
+
+    @property
+    def columns(self) -> List[str]:
+        props = f"_{self._lower_length}_{self._upper_length}"
+        return [f"DCL{props}", f"DCM{props}", f"DCU{props}"]
+
+    def reset(self):
+        self._lows = deque(maxlen=self._lower_length - 1)
+        self._highs = deque(maxlen=self._upper_length - 1)
+        self._low = self._high = NaN
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, ...]:
+        self._low, self._high = low, high
+        lower = min(min(self._lows, default=low), low) if len(self._lows) == self._lower_length - 1 else NaN
+        upper = max(max(self._highs, default=high), high) if len(self._highs) == self._upper_length - 1 else NaN
+        return lower, 0.5 * (lower + upper), upper
+
+    def commit(self):
+        self._lows.append(self._low)
+        self._highs.append(self._high)
+
+
+class SuperTrend(CandlesIndicator):
+
+    def __init__(self, length: int = 7, multiplier: float = 3.0):
+        self._length = length
+        self._multiplier = float(multiplier)
+        self._true_range = _TrueRange()
+        self._rma = _Rma(length)
+        self.reset()
+
+    @property
+    def columns(self) -> List[str]:
+        props = f"_{self._length}_{self._multiplier}"
+        return [f"SUPERT{props}", f"SUPERTd{props}", f"SUPERTl{props}", f"SUPERTs{props}"]
+
+    def reset(self):
+        self._true_range.reset()
+        self._rma.reset()
+        # (direction, upper band, lower band) of the last closed candle, None before the first candle
+        self._state: Optional[Tuple[int, float, float]] = None
+        self._next_state = self._state
+
+    def update(self, high: float, low: float, close: float) -> Tuple[float, ...]:
+        band = self._multiplier * self._rma.update(self._true_range.update(high, low, close))
+        mid = 0.5 * (high + low)
+        upper, lower = mid + band, mid - band
+        if self._state is None:
+            self._next_state = (1, upper, lower)
+            return 0.0, 1, NaN, NaN
+        direction, previous_upper, previous_lower = self._state
+        # The comparisons with the bands are False while the ATR is not available, like in pandas_ta
+        if close > previous_upper:
+            direction = 1
+        elif close < previous_lower:
+            direction = -1
+        else:
+            if direction > 0 and lower < previous_lower:
+                lower = previous_lower
+            if direction < 0 and upper > previous_upper:
+                upper = previous_upper
+        self._next_state = (direction, upper, lower)
+        if direction > 0:
+            return lower, direction, lower, NaN
+        return upper, direction, NaN, upper
+
+    def commit(self):
+        self._true_range.commit()
+        self._rma.commit()
+        self._state = self._next_state
+
+
+class IndicatorPipeline:
+    """
+    Keeps a set of indicators up to date with the candles of a feed, one candle at a time.
+
+    A candle with a newer timestamp than the last one closes the last one; a candle with the same timestamp replaces
+    it. The latest values are in `latest`, and when `max_records` is set the values of the last candles are kept in a
+    ring buffer that `history` returns as a read-only array, one row per candle and one column per indicator column,
+    oldest first.
+    """
+
+    def __init__(self, indicators: List[CandlesIndicator], max_records: int = 0):
+        self._indicators = indicators
+        self.columns: List[str] = [column for indicator in indicators for column in indicator.columns]
+        self._max_records = max_records
+        # Each row is written twice, max_records apart, so the last max_records rows are always contiguous
+        self._history = np.full((2 * max_records, len(self.columns)), np.nan)
+        self.reset()
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        return self._last_timestamp
+
+    @property
+    def latest(self) -> Dict[str, float]:
+        """
+        The values of the indicators for the last candle, by column.
+        """
+        return dict(zip(self.columns, self._latest))
+
+    @property
+    def history(self) -> np.ndarray:
+        end = self._position + self._max_records + 1
+        view = self._history[end - self._records:end]
+        view.flags.writeable = False
+        return view
+
+    def reset(self):
+        for indicator in self._indicators:
+            indicator.reset()
+        self._last_timestamp: Optional[float] = None
+        self._latest: List[float] = [np.nan] * len(self.columns)
+        self._position = -1
+        self._records = 0
+
+    def update(self, candle: Sequence[float]):
+        """
+        Updates the indicators with a candle row, with the values in the order of CandlesBase.columns. Candles older
+        than the last one are ignored.
+        """
+        timestamp = candle[TIMESTAMP]
+        if self._last_timestamp is not None:
+            if timestamp < self._last_timestamp:
+                return
+            if timestamp > self._last_timestamp:
+                for indicator in self._indicators:
+                    indicator.commit()
+        is_new_candle = self._last_timestamp is None or timestamp > self._last_timestamp
+        self._last_timestamp = timestamp
+        high, low, close = float(candle[HIGH]), float(candle[LOW]), float(candle[CLOSE])
+        latest = []
+        for indicator in self._indicators:
+            latest.extend(indicator.update(high, low, close))
+        self._latest = latest
+        if self._max_records > 0:
+            if is_new_candle:
+                self._position = (self._position + 1) % self._max_records
+                self._records = min(self._records + 1, self._max_records)
+            self._history[self._position] = latest
+            self._history[self._position + self._max_records] = latest
+
+    def update_candles(self, candles: Iterable[Sequence[float]]):
+        for candle in candles:
+            self.update(candle)
@@ -4,6 +4,7 @@ import time
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -17,6 +18,7 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.indicators import CandlesIndicator, IndicatorPipeline
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 
@@ -238,6 +240,26 @@ class MarketDataProvider:
         ))
         return candles.candles_df.iloc[-max_records:]
 
+    def add_candles_indicators(self, connector_name: str, trading_pair: str, interval: str,
+                               indicators: List[CandlesIndicator], max_records: int = 500) -> IndicatorPipeline:
+        """
+        Adds to the candles feed of a trading pair a pipeline that updates the indicators with each candle, so they are
+        not computed again over the candles dataframe.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param indicators: List[CandlesIndicator]
+        :param max_records: int, also the number of candles kept in the history of the pipeline
+        :return: IndicatorPipeline
+        """
+        candles = self.get_candles_feed(CandlesConfig(
+            connector=connector_name,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        ))
+        return candles.add_indicators(indicators, max_records=max_records)
+
     def get_trading_pairs(self, connector_name: str):
         """
         Retrieves the trading pairs from the specified connector.
@@ -279,16 +301,32 @@ class MarketDataProvider:
         order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_price_for_volume(is_buy, volume)
 
-    def get_order_book_snapshot(self, connector_name, trading_pair) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def get_order_book_snapshot(self, connector_name, trading_pair,
+                                depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Retrieves the order book snapshot for a trading pair from the specified connector, as a tuple of bid and ask in
         DataFrame format.
         :param connector_name: str
         :param trading_pair: str
+        :param depth: the number of levels of each side, or None for the whole book
         :return: Tuple of bid and ask in DataFrame format.
         """
+        if depth is None:
+            return self.get_order_book(connector_name, trading_pair).snapshot
+        bids, asks = self.get_order_book_top_n(connector_name, trading_pair, depth)
+        return pd.DataFrame(bids), pd.DataFrame(asks)
+
+    def get_order_book_top_n(self, connector_name: str, trading_pair: str,
+                             depth: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieves the best levels of the order book for a trading pair from the specified connector.
+        :param connector_name: str
+        :param trading_pair: str
+        :param depth: the number of levels of each side
+        :return: Tuple of bid and ask structured arrays with the fields price, amount and update_id.
+        """
         order_book = self.get_order_book(connector_name, trading_pair)
-        return order_book.snapshot
+        return order_book.top_n(depth)
 
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float,
                                    is_buy: bool) -> OrderBookQueryResult:
@@ -0,0 +1,146 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger.logger import HummingbotLogger
+from hummingbot.model.transaction_base import TransactionBase
+
+SQLOperation = Callable[[Session], None]
+
+
+class SQLWriteBehindQueue:
+    """
+    Persists SQL operations from a worker thread, grouping them in batched transactions.
+
+    Each operation is a callable that receives the session of the batch and adds or updates ORM records. Operations
+    are applied in the same order they were queued. A batch is committed when it reaches `batch_size` operations or
+    when `flush_interval` seconds have passed since its first operation arrived, whatever happens first.
+
+    The backlog is bounded by `max_backlog`, which caps the number of operations that could be lost in a crash. When
+    the backlog is full `put` blocks the caller until the worker makes room, and a warning is logged, so no operation
+    is lost. Writing it from the caller instead could commit it before older operations still queued, and the
+    operations that update a record expect it to exist already. `stop` writes everything pending before returning.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+    _STOP = object()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 sql_manager: TransactionBase,
+                 batch_size: int = 100,
+                 flush_interval: float = 0.5,
+                 max_backlog: int = 10000):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer (got {batch_size}).")
+        if max_backlog < batch_size:
+            raise ValueError(f"max_backlog ({max_backlog}) can't be lower than batch_size ({batch_size}).")
+        self._sql_manager: TransactionBase = sql_manager
+        self._batch_size: int = batch_size
+        self._flush_interval: float = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_backlog)
+        self._worker: Optional[threading.Thread] = None
+        self._overflow_count: int = 0
+        self._overflowing: bool = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    @property
+    def backlog_size(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def overflow_count(self) -> int:
+        """
+        The number of operations that found the backlog full and waited for the worker to make room.
+        """
+        return self._overflow_count
+
+    def start(self):
+        if self.is_running:
+            return
+        self._worker = threading.Thread(target=self._run, name="SQLWriteBehindQueue", daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        """
+        Flushes all the pending operations and stops the worker thread.
+        """
+        if not self.is_running:
+            return
+        self._queue.put(self._STOP)
+        self._worker.join()
+        self._worker = None
+
+    def put(self, operation: SQLOperation):
+        try:
+            self._queue.put_nowait(operation)
+        except queue.Full:
+            self._overflow_count += 1
+            if not self._overflowing:
+                # Logs once per overflow, not once per blocked operation
+                self._overflowing = True
+                self.logger().warning(
+                    f"The database write backlog is full ({self._queue.maxsize} operations). Recording waits until "
+                    f"the pending writes catch up.")
+            self._queue.put(operation)
+        else:
+            self._overflowing = False
+
+    def flush(self):
+        """
+        Blocks until all the operations queued so far have been written.
+        """
+        self._queue.join()
+
+    def _run(self):
+        stop_requested = False
+        while not stop_requested:
+            batch: List[SQLOperation] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if item is self._STOP:
+                    stop_requested = True
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[SQLOperation]):
+        try:
+            with self._sql_manager.begin() as session:
+                for operation in batch:
+                    operation(session)
+        except Exception:
+            if len(batch) == 1:
+                self.logger().error("Unexpected error while writing a record to the database.", exc_info=True)
+                return
+            self.logger().warning(
+                f"Error writing a batch of {len(batch)} records to the database. Writing them one by one.",
+                exc_info=True)
+            for operation in batch:
+                self._write_batch([operation])
@@ -8,6 +8,10 @@ cdef class RingBuffer:
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        bint _track_stats
+        double _running_mean
+        double _running_m2
+        int64_t _updates_since_recompute
 
     cdef void c_add_value(self, float val)
     cdef void c_increment_delimiter(self)
@@ -18,3 +22,9 @@ cdef class RingBuffer:
     cdef double c_variance(self)
     cdef double c_std_dev(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
+    cdef int64_t c_size(self)
+    cdef void c_update_stats(self, double new_value, double old_value, bint replaced)
+    cdef void c_recompute_stats(self)
+    cdef void c_reset_stats(self)
+    cdef double c_running_mean(self)
+    cdef double c_running_variance(self)
@@ -1,6 +1,7 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isnan
 
 
 pmm_logger = None
@@ -13,17 +14,22 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int length, bint track_stats=False):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._track_stats = track_stats
+        self.c_reset_stats()
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
+        cdef double old_value = self._buffer[self._delimiter]
         self._buffer[self._delimiter] = val
+        if self._track_stats:
+            self.c_update_stats(self._buffer[self._delimiter], old_value, self._is_full)
         self.c_increment_delimiter()
 
     cdef void c_increment_delimiter(self):
@@ -60,6 +66,49 @@ cdef class RingBuffer:
             result = np.std(self.c_get_as_numpy_array())
         return result
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef void c_update_stats(self, double new_value, double old_value, bint replaced):
+        # Welford's algorithm, extended to remove the value that leaves the buffer when it is full
+        cdef double previous_mean = self._running_mean
+        if replaced:
+            self._running_mean += (new_value - old_value) / self._length
+            self._running_m2 += (new_value - old_value) * (new_value - self._running_mean + old_value - previous_mean)
+            self._updates_since_recompute += 1
+            # Recomputing once per buffer length bounds the rounding error at an amortized O(1) cost. A NaN leaving
+            # the buffer can't be removed from the running values, so they are recomputed too.
+            if self._updates_since_recompute >= self._length or isnan(self._running_m2):
+                self.c_recompute_stats()
+        else:
+            self._running_mean += (new_value - previous_mean) / (self._delimiter + 1)
+            self._running_m2 += (new_value - previous_mean) * (new_value - self._running_mean)
+
+    cdef void c_recompute_stats(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = np.asarray(self._buffer)
+        self._running_mean = np.mean(values)
+        self._running_m2 = np.sum(np.square(values - self._running_mean))
+        self._updates_since_recompute = 0
+
+    cdef void c_reset_stats(self):
+        self._running_mean = 0
+        self._running_m2 = 0
+        self._updates_since_recompute = 0
+
+    cdef double c_running_mean(self):
+        if self.c_is_empty():
+            return np.nan
+        if not self._track_stats:
+            return np.mean(self.c_get_as_numpy_array())
+        return self._running_mean
+
+    cdef double c_running_variance(self):
+        if self.c_is_empty():
+            return np.nan
+        if not self._track_stats:
+            return np.var(self.c_get_as_numpy_array())
+        return max(self._running_m2 / self.c_size(), 0)
+
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
         cdef np.ndarray[np.int16_t, ndim=1] indexes
 
@@ -70,11 +119,18 @@ cdef class RingBuffer:
                                 dtype=np.int16) % self._length
         return np.asarray(self._buffer)[indexes]
 
-    def __init__(self, length):
+    def __init__(self, length, track_stats=False):
+        """
+        :param length: max number of values in the buffer
+        :param track_stats: if True, the mean and the variance of the values in the buffer are updated on each added
+        value, so running_mean and running_variance don't need to go through the whole buffer
+        """
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._track_stats = track_stats
+        self.c_reset_stats()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -101,6 +157,28 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def track_stats(self) -> bool:
+        return self._track_stats
+
+    @property
+    def running_mean(self) -> float:
+        """
+        Mean of the values in the buffer, even if it is not full. NaN if it is empty.
+        """
+        return self.c_running_mean()
+
+    @property
+    def running_variance(self) -> float:
+        """
+        Population variance of the values in the buffer, even if it is not full. NaN if it is empty.
+        """
+        return self.c_running_variance()
+
     @property
     def length(self) -> int:
         return self._length
@@ -113,6 +191,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_stats()
 
         for val in data[-value:]:
             self.add_value(val)
@@ -16,13 +16,26 @@ class BaseTrailingIndicator(ABC):
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __init__(self, sampling_length: int = 30, processing_length: int = 15):
+    def __init__(self, sampling_length: int = 30, processing_length: int = 15, incremental: bool = False):
+        """
+        :param sampling_length: number of samples used to calculate the indicator
+        :param processing_length: number of indicator values processed to return the final value
+        :param incremental: if True, the indicator is updated with each sample in O(1) instead of being calculated
+        again from the whole sampling buffer. Only the indicators implementing _update_incremental_state support it
+        """
+        if incremental and type(self)._update_incremental_state is BaseTrailingIndicator._update_incremental_state:
+            raise ValueError(f"{self.__class__.__name__} doesn't support incremental calculation.")
+        self._incremental = incremental
         self._sampling_buffer = RingBuffer(sampling_length)
-        self._processing_buffer = RingBuffer(processing_length)
+        self._processing_buffer = RingBuffer(processing_length, incremental)
         self._samples_length = 0
 
     def add_sample(self, value: float):
+        previous_value = self._sampling_buffer.get_last_value()
         self._sampling_buffer.add_value(value)
+        if self._incremental:
+            # The value as stored in the buffer, as a float, like the ones used by the non incremental calculation
+            self._update_incremental_state(previous_value, self._sampling_buffer.get_last_value())
         indicator_value = self._indicator_calculation()
         self._processing_buffer.add_value(indicator_value)
 
@@ -30,11 +43,34 @@ class BaseTrailingIndicator(ABC):
     def _indicator_calculation(self) -> float:
         raise NotImplementedError
 
+    def _update_incremental_state(self, previous_value: float, value: float):
+        """
+        Updates the state used by the incremental calculation with a new sample.
+        :param previous_value: the last sample before this one, NaN if there was none
+        :param value: the new sample
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support incremental calculation.")
+
+    def _reset_incremental_state(self):
+        """
+        Rebuilds the incremental state from the samples in the sampling buffer.
+        """
+        previous_value = np.nan
+        for value in self._sampling_buffer.get_as_numpy_array():
+            self._update_incremental_state(previous_value, value)
+            previous_value = value
+
+    @property
+    def incremental(self) -> bool:
+        return self._incremental
+
     def _processing_calculation(self) -> float:
         """
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
+        if self._incremental:
+            return self._processing_buffer.running_mean
         return np.mean(self._processing_buffer.get_as_numpy_array())
 
     @property
@@ -63,6 +99,8 @@ class BaseTrailingIndicator(ABC):
     @sampling_length.setter
     def sampling_length(self, value):
         self._sampling_buffer.length = value
+        if self._incremental:
+            self._reset_incremental_state()
 
     @property
     def processing_length(self) -> int:
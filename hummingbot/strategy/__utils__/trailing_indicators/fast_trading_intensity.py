@@ -0,0 +1,255 @@
+import warnings
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.optimize import OptimizeWarning, curve_fit
+
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
+
+# Intensity used for the price levels without traded amount, to be able to take its log
+MIN_INTENSITY = 1e-10
+
+
+def fit_log_linear_intensity(price_levels: np.ndarray, intensities: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Closed-form fit of intensity = alpha * exp(-kappa * price_level), as a linear regression of the intensity log.
+
+    Each point is weighted by its squared intensity. The error of a point in log scale is close to its relative error,
+    so these weights make the fit close to the least squares fit of the intensities, instead of giving the levels with
+    almost no trades the same weight as the others.
+
+    :return: alpha and kappa, or None if the points don't define a curve
+    """
+    intensities = np.where(intensities > 0, intensities, MIN_INTENSITY)
+    weights = np.square(intensities)
+    log_intensities = np.log(intensities)
+    total_weight = np.sum(weights)
+    mean_level = np.sum(weights * price_levels) / total_weight
+    mean_log_intensity = np.sum(weights * log_intensities) / total_weight
+    level_deviations = price_levels - mean_level
+    level_variance = np.sum(weights * np.square(level_deviations))
+    if not level_variance > 0:
+        return None
+    slope = np.sum(weights * level_deviations * (log_intensities - mean_log_intensity)) / level_variance
+    if slope > 0:
+        # The intensity can't grow with the distance to the mid price, the least squares fit within the bounds is the
+        # flat line at the mean intensity
+        return float(np.mean(intensities)), 0.0
+    return float(np.exp(mean_log_intensity - slope * mean_level)), float(-slope)
+
+
+class _ArrayQueue:
+    """
+    Rows of float columns appended at the end and removed from the front, stored in preallocated NumPy arrays.
+
+    The removed rows are only skipped, and the live rows are moved to the front of the arrays once they run out of
+    space, doubling their size if they are more than half full, so appending and removing cost amortized O(1) per row.
+    """
+
+    def __init__(self, columns: int, capacity: int = 64):
+        self._data = np.empty((columns, capacity))
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def column(self, index: int) -> np.ndarray:
+        """
+        :return: a view of the live values of the column, only valid until the next change
+        """
+        return self._data[index, self._start:self._end]
+
+    def append(self, *values: np.ndarray):
+        count = len(values[0])
+        if self._end + count > self._data.shape[1]:
+            live = self._data[:, self._start:self._end]
+            capacity = self._data.shape[1]
+            while len(live[0]) + count > capacity // 2:
+                capacity *= 2
+            data = self._data if capacity == self._data.shape[1] else np.empty((len(self._data), capacity))
+            data[:, :len(live[0])] = live
+            self._data = data
+            self._end -= self._start
+            self._start = 0
+        for index, column_values in enumerate(values):
+            self._data[index, self._end:self._end + count] = column_values
+        self._end += count
+
+    def pop_front(self, count: int):
+        self._start = min(self._start + count, self._end)
+
+    def replace(self, *values: np.ndarray):
+        self._start = self._end = 0
+        self.append(*values)
+
+
+class FastTradingIntensityIndicator:
+    """
+    Estimates the same trading intensity as TradingIntensityIndicator with a lower cost per tick.
+
+    The quotes and the trades of the sampling window are kept in preallocated NumPy arrays, and the trades are matched
+    to the last quote before them with a binary search. The trades are kept ordered by tick with the number of trades
+    of each tick, and the traded amount of each price level is updated as trades enter and leave the window, so the
+    cost of a tick depends on its trades and on the number of price levels instead of on the whole window. The
+    intensity curve is fitted in closed form with fit_log_linear_intensity. With `refine`, the closed-form estimate is
+    the starting point of the same nonlinear fit done by TradingIntensityIndicator, which then converges in fewer
+    iterations.
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 refine: bool = False):
+        self._alpha = 0
+        self._kappa = 0
+        self._refine = refine
+        # Quotes ordered by timestamp: timestamp and price
+        self._quotes = _ArrayQueue(columns=2)
+        self._current_trade_sample: List[OrderBookTradeEvent] = []
+        # Matched trades ordered by tick: the tick (timestamp of the quote + 1) they belong to, distance to the quote
+        # and amount
+        self._trades = _ArrayQueue(columns=3)
+        # Ticks in the window with their number of trades, and traded amount and number of trades of each price level
+        self._tick_trade_counts: Deque[List] = deque()
+        self._level_amounts: Dict[float, List] = {}
+        self._ticks_count = 0
+        self._trades_forwarder = EventForwarder(self.register_trade)
+        self._order_book = order_book
+        self._order_book.add_listener(OrderBookEvent.TradeEvent, self._trades_forwarder)
+        self._price_delegate = price_delegate
+        self._sampling_length = sampling_length
+        self._samples_length = 0
+
+        warnings.simplefilter("ignore", OptimizeWarning)
+
+    @property
+    def current_value(self) -> Tuple[float, float]:
+        return self._alpha, self._kappa
+
+    @property
+    def is_sampling_buffer_full(self) -> bool:
+        return self._ticks_count == self._sampling_length
+
+    @property
+    def is_sampling_buffer_changed(self) -> bool:
+        is_changed = self._samples_length != self._ticks_count
+        self._samples_length = self._ticks_count
+        return is_changed
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_length
+
+    @sampling_length.setter
+    def sampling_length(self, new_len: int):
+        self._sampling_length = new_len
+
+    @property
+    def last_quotes(self) -> list:
+        """A helper method to be used in unit tests"""
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(self._quotes.column(0)[::-1], self._quotes.column(1)[::-1])]
+
+    @last_quotes.setter
+    def last_quotes(self, value):
+        """A helper method to be used in unit tests"""
+        self._quotes.replace(np.array([float(quote["timestamp"]) for quote in value[::-1]]),
+                             np.array([float(quote["price"]) for quote in value[::-1]]))
+
+    @property
+    def _trade_ticks(self) -> np.ndarray:
+        return self._trades.column(0)
+
+    def register_trade(self, trade: OrderBookTradeEvent):
+        self._current_trade_sample.append(trade)
+
+    def calculate(self, timestamp: float):
+        price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
+        self._quotes.append(np.array([float(timestamp)]), np.array([float(price)]))
+
+        if len(self._current_trade_sample) > 0:
+            self._add_trades(self._current_trade_sample)
+            self._current_trade_sample = []
+        self._trim_sampling_window()
+
+        if self.is_sampling_buffer_full:
+            self.estimate_intensity()
+
+    def _add_trades(self, trades: List[OrderBookTradeEvent]):
+        quote_timestamps = self._quotes.column(0)
+        trade_timestamps = np.array([trade.timestamp for trade in trades], dtype=float)
+        # Index of the last quote before each trade
+        quote_indexes = np.searchsorted(quote_timestamps, trade_timestamps, side="left") - 1
+        matched = quote_indexes >= 0
+        if not np.any(matched):
+            return
+        quote_indexes = quote_indexes[matched]
+        trade_prices = np.array([trade.price for trade in trades], dtype=float)[matched]
+        trade_amounts = np.array([trade.amount for trade in trades], dtype=float)[matched]
+        trade_ticks = quote_timestamps[quote_indexes] + 1
+        trade_price_levels = np.abs(trade_prices - self._quotes.column(1)[quote_indexes])
+
+        # The quotes before the latest matched one are discarded, so new trades can't belong to older ticks than the
+        # ones in the window and sorting them keeps the whole window sorted
+        order = np.argsort(trade_ticks, kind="stable")
+        trade_ticks, trade_price_levels, trade_amounts = (
+            trade_ticks[order], trade_price_levels[order], trade_amounts[order])
+        self._trades.append(trade_ticks, trade_price_levels, trade_amounts)
+        for tick in trade_ticks:
+            if len(self._tick_trade_counts) > 0 and self._tick_trade_counts[-1][0] == tick:
+                self._tick_trade_counts[-1][1] += 1
+            else:
+                self._tick_trade_counts.append([tick, 1])
+        for price_level, amount in zip(trade_price_levels, trade_amounts):
+            self._update_level_amount(price_level, amount, 1)
+
+        # Only the quotes after the latest matched one, and that one, can match the next trades
+        self._quotes.pop_front(quote_indexes.max())
+
+    def _update_level_amount(self, price_level: float, amount: float, trades_count: int):
+        level_amount = self._level_amounts.get(price_level)
+        if level_amount is None:
+            self._level_amounts[price_level] = [amount, trades_count]
+            return
+        level_amount[0] += amount
+        level_amount[1] += trades_count
+        if level_amount[1] == 0:
+            del self._level_amounts[price_level]
+
+    def _trim_sampling_window(self):
+        while len(self._tick_trade_counts) > self._sampling_length:
+            _, trades_count = self._tick_trade_counts.popleft()
+            for price_level, amount in zip(self._trades.column(1)[:trades_count],
+                                           self._trades.column(2)[:trades_count]):
+                self._update_level_amount(price_level, -amount, -1)
+            self._trades.pop_front(trades_count)
+        self._ticks_count = len(self._tick_trade_counts)
+
+    def estimate_intensity(self):
+        price_levels = np.fromiter(self._level_amounts.keys(), dtype=float, count=len(self._level_amounts))
+        intensities = np.fromiter((level_amount[0] for level_amount in self._level_amounts.values()),
+                                  dtype=float, count=len(self._level_amounts))
+        order = np.argsort(price_levels)
+        price_levels, intensities = price_levels[order], intensities[order]
+        estimate = fit_log_linear_intensity(price_levels, intensities)
+        if estimate is None:
+            return
+        if self._refine:
+            try:
+                params = curve_fit(lambda t, a, b: a * np.exp(-b * t),
+                                   price_levels[::-1],
+                                   np.where(intensities == 0, MIN_INTENSITY, intensities)[::-1],
+                                   p0=estimate,
+                                   method="dogbox",
+                                   bounds=([0, 0], [np.inf, np.inf]))
+                estimate = (float(params[0][0]), float(params[0][1]))
+            except (RuntimeError, ValueError):
+                pass
+        self._alpha, self._kappa = estimate
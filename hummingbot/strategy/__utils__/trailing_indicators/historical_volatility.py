@@ -1,18 +1,38 @@
+import math
+
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
-    def __init__(self, sampling_length: int = 30, processing_length: int = 15):
-        super().__init__(sampling_length, processing_length)
+    def __init__(self, sampling_length: int = 30, processing_length: int = 15, incremental: bool = False):
+        super().__init__(sampling_length, processing_length, incremental)
+        if incremental:
+            self._reset_incremental_state()
 
     def _indicator_calculation(self) -> float:
+        if self._incremental:
+            # Zero instead of NaN before there are two prices, like the processing calculation treats it
+            variance = self._log_returns.running_variance
+            return 0.0 if math.isnan(variance) else variance
         prices = self._sampling_buffer.get_as_numpy_array()
         if prices.size > 0:
             log_returns = np.diff(np.log(prices))
             return np.var(log_returns)
 
+    def _update_incremental_state(self, previous_value: float, value: float):
+        if not math.isnan(previous_value) and self.sampling_length > 1:
+            self._log_returns.add_value(np.log(value) - np.log(previous_value))
+
+    def _reset_incremental_state(self):
+        # Log returns of the prices in the sampling buffer
+        self._log_returns = RingBuffer(max(self.sampling_length - 1, 1), True)
+        super()._reset_incremental_state()
+
     def _processing_calculation(self) -> float:
+        if self._incremental:
+            return math.sqrt(self._processing_buffer.running_mean)
         processing_array = self._processing_buffer.get_as_numpy_array()
         if processing_array.size > 0:
             return np.sqrt(np.mean(np.nan_to_num(processing_array)))
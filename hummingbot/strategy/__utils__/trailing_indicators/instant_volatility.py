@@ -1,19 +1,37 @@
+import math
+
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
-    def __init__(self, sampling_length: int = 30, processing_length: int = 15):
-        super().__init__(sampling_length, processing_length)
+    def __init__(self, sampling_length: int = 30, processing_length: int = 15, incremental: bool = False):
+        super().__init__(sampling_length, processing_length, incremental)
+        if incremental:
+            self._reset_incremental_state()
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
+        if self._incremental:
+            squared_diffs_sum = (self._squared_diffs.running_mean * self._squared_diffs.size
+                                 if self._squared_diffs.size > 0 else 0)
+            return math.sqrt(squared_diffs_sum / self._sampling_buffer.size)
         np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
         vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
         return vol
 
+    def _update_incremental_state(self, previous_value: float, value: float):
+        if not math.isnan(previous_value) and self.sampling_length > 1:
+            self._squared_diffs.add_value((value - previous_value) ** 2)
+
+    def _reset_incremental_state(self):
+        # Squared differences between consecutive prices of the sampling buffer
+        self._squared_diffs = RingBuffer(max(self.sampling_length - 1, 1), True)
+        super()._reset_incremental_state()
+
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
@@ -51,7 +51,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         object _optimal_ask
         str _debug_csv_path
         object _avg_vol
-        TradingIntensityIndicator _trading_intensity
+        object _trading_intensity
         bint _should_wait_order_cancel_confirmation
 
     cdef object c_get_mid_price(self)
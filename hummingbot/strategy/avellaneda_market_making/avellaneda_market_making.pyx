@@ -24,6 +24,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils import map_df_to_str
 from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.fast_trading_intensity import FastTradingIntensityIndicator
 from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
 from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
     AvellanedaMarketMakingConfigMap,
@@ -149,7 +150,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         return self._trading_intensity
 
     @trading_intensity.setter
-    def trading_intensity(self, indicator: TradingIntensityIndicator):
+    def trading_intensity(self, indicator: Union[TradingIntensityIndicator, FastTradingIntensityIndicator]):
         self._trading_intensity = indicator
 
     @property
@@ -412,7 +413,8 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             self._volatility_buffer_size = volatility_buffer_size
 
             if self._avg_vol is None:
-                self._avg_vol = InstantVolatilityIndicator(sampling_length=volatility_buffer_size)
+                self._avg_vol = InstantVolatilityIndicator(sampling_length=volatility_buffer_size,
+                                                           incremental=self._config_map.volatility_incremental)
             else:
                 self._avg_vol.sampling_length = volatility_buffer_size
 
@@ -425,11 +427,20 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 self._trading_intensity.sampling_length = trading_intensity_buffer_size
 
         if self._trading_intensity is None and self.market_info.market.ready:
-            self._trading_intensity = TradingIntensityIndicator(
-                order_book=self.market_info.order_book,
-                price_delegate=self._price_delegate,
-                sampling_length=self._trading_intensity_buffer_size,
-            )
+            estimator = self._config_map.trading_intensity_estimator
+            if estimator == "curve_fit":
+                self._trading_intensity = TradingIntensityIndicator(
+                    order_book=self.market_info.order_book,
+                    price_delegate=self._price_delegate,
+                    sampling_length=self._trading_intensity_buffer_size,
+                )
+            else:
+                self._trading_intensity = FastTradingIntensityIndicator(
+                    order_book=self.market_info.order_book,
+                    price_delegate=self._price_delegate,
+                    sampling_length=self._trading_intensity_buffer_size,
+                    refine=estimator == "log_linear_refined",
+                )
 
         self._ticks_to_be_ready += (ticks_to_be_ready_after - ticks_to_be_ready_before)
         if self._ticks_to_be_ready < 0:
@@ -175,6 +175,11 @@ HANGING_ORDER_MODELS = {
     IgnoreHangingOrdersModel.Config.title: IgnoreHangingOrdersModel,
 }
 
+# curve_fit: nonlinear fit of all the trades of the window on every tick
+# log_linear: closed-form fit with the trades stored in arrays
+# log_linear_refined: nonlinear fit started from the closed-form one
+TRADING_INTENSITY_ESTIMATORS = ["curve_fit", "log_linear", "log_linear_refined"]
+
 
 class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
     strategy: str = Field(default="avellaneda_market_making", client_data=None)
@@ -302,6 +307,14 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             prompt=lambda mi: "Enter amount of ticks that will be stored to estimate order book liquidity",
         ),
     )
+    volatility_incremental: bool = Field(
+        default=False,
+        description="If activated, the volatility is updated with each tick instead of being calculated again from "
+                    "all the ticks stored.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Do you want to update the volatility incrementally on each tick? (Yes/No)",
+        ),
+    )
     trading_intensity_buffer_size: int = Field(
         default=200,
         description="The number of ticks that will be stored to calculate order book liquidity.",
@@ -311,6 +324,14 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             prompt=lambda mi: "Enter amount of ticks that will be stored to estimate order book liquidity",
         ),
     )
+    trading_intensity_estimator: str = Field(
+        default="curve_fit",
+        description="The method used to estimate the order book liquidity from the trades. log_linear is a faster "
+                    "closed-form fit and log_linear_refined refines it with the curve_fit method.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: f"Select the order book liquidity estimator ({'/'.join(TRADING_INTENSITY_ESTIMATORS)})",
+        ),
+    )
     order_levels_mode: Union[SingleOrderLevelModel, MultiOrderLevelModel] = Field(
         default=SingleOrderLevelModel.construct(),
         description="Allows activating multi-order levels.",
@@ -390,6 +411,14 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             raise ValueError(ret)
         return v
 
+    @validator("trading_intensity_estimator", pre=True)
+    def validate_trading_intensity_estimator(cls, v: str):
+        if v not in TRADING_INTENSITY_ESTIMATORS:
+            raise ValueError(
+                f"Invalid trading intensity estimator, please choose value from {TRADING_INTENSITY_ESTIMATORS}."
+            )
+        return v
+
     @validator("order_levels_mode", pre=True)
     def validate_order_levels_mode(cls, v: Union[str, SingleOrderLevelModel, MultiOrderLevelModel]):
         if isinstance(v, (SingleOrderLevelModel, MultiOrderLevelModel, Dict)):
@@ -88,7 +88,8 @@ cdef class CrossExchangeMiningStrategy(StrategyBase):
         self._min_prof_adj = 0
         self._min_prof_adj_t = 0
         self._adjcount = []
-        self._avg_vol = InstantVolatilityIndicator(sampling_length=self.volatility_buffer_size)
+        self._avg_vol = InstantVolatilityIndicator(sampling_length=self.volatility_buffer_size,
+                                                   incremental=self._config_map.volatility_incremental)
         self._anti_hysteresis_timers = {}
         self._order_fill_buy_events = {}
         self._order_fill_sell_events = {}
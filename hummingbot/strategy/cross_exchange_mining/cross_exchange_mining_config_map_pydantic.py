@@ -89,6 +89,15 @@ class CrossExchangeMiningConfigMap(BaseTradingStrategyMakerTakerConfigMap):
         ),
     )
 
+    volatility_incremental: bool = Field(
+        default=False,
+        description="If activated, the volatility is updated with each tick instead of being calculated again from "
+                    "all the ticks stored.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Do you want to update the volatility incrementally on each tick? (Yes/No)",
+        ),
+    )
+
     min_prof_adj_timer: float = Field(
         default=Decimal("3600"),
         description="Time interval to adjust min profitability over",
@@ -1,6 +1,9 @@
+import json
 import logging
+import os
+import time
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 
@@ -8,9 +11,11 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings, ConnectorType
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 
@@ -18,6 +23,12 @@ from hummingbot.data_feed.market_data_provider import MarketDataProvider
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+TRADING_RULE_DECIMAL_FIELDS = ["min_order_size", "max_order_size", "min_price_increment", "min_base_amount_increment",
+                               "min_quote_amount_increment", "min_notional_size", "min_order_value",
+                               "max_price_significant_digits"]
+TRADING_RULE_FIELDS = ["trading_pair", "supports_limit_orders", "supports_market_orders",
+                       "buy_order_collateral_token", "sell_order_collateral_token"]
+
 
 class BacktestingDataProvider(MarketDataProvider):
     CONNECTOR_TYPES = [ConnectorType.CLOB_SPOT, ConnectorType.CLOB_PERP, ConnectorType.Exchange,
@@ -26,23 +37,54 @@ class BacktestingDataProvider(MarketDataProvider):
                            "coinbase_advanced_trade", "kraken", "dydx_v4_perpetual", "hitbtc",
                            "hyperliquid"]
 
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
+    # Trading rules shared by all the instances, so the engines created in the same process download them only once.
+    # Each entry holds the time the rules were downloaded, to expire them like the ones saved to disk.
+    _trading_rules_cache: Dict[str, Tuple[float, Dict[str, TradingRule]]] = {}
+
+    def __init__(self,
+                 connectors: Dict[str, ConnectorBase],
+                 candles_store: Optional[CandlesStore] = None,
+                 trading_rules_path: Optional[str] = None,
+                 trading_rules_max_age: float = 86400):
+        """
+        :param connectors: connectors of the market data provider. The connectors needed by the backtests that are not
+        in it are created the first time they are used
+        :param candles_store: when set, the historical candles are read from this store, which only downloads the
+        candles it doesn't have yet
+        :param trading_rules_path: directory where the trading rules of each connector are saved, to reuse them in
+        other processes
+        :param trading_rules_max_age: seconds after which the cached trading rules, in memory or in the trading rules
+        path, are downloaded again
+        """
         super().__init__(connectors)
+        self.candles_store = candles_store
+        self.trading_rules_path = trading_rules_path
+        self.trading_rules_max_age = trading_rules_max_age
         self.start_time = None
         self.end_time = None
         self.prices = {}
         self._time = None
         self.trading_rules = {}
-        self.conn_settings = AllConnectorSettings.get_connector_settings()
-        self.connectors = {name: self.get_connector(name) for name, settings in self.conn_settings.items()
-                           if settings.type in self.CONNECTOR_TYPES and name not in self.EXCLUDED_CONNECTORS and
-                           "testnet" not in name}
+
+    def is_backtesting_connector(self, connector_name: str) -> bool:
+        settings = self.conn_settings.get(connector_name)
+        return (settings is not None and settings.type in self.CONNECTOR_TYPES and
+                connector_name not in self.EXCLUDED_CONNECTORS and "testnet" not in connector_name)
 
     def get_connector(self, connector_name: str):
+        connector = self.connectors.get(connector_name)
+        if connector is None:
+            connector = self._create_connector(connector_name)
+            self.connectors[connector_name] = connector
+        return connector
+
+    def _create_connector(self, connector_name: str) -> ConnectorBase:
         conn_setting = self.conn_settings.get(connector_name)
         if conn_setting is None:
             logger.error(f"Connector {connector_name} not found")
             raise ValueError(f"Connector {connector_name} not found")
+        if not self.is_backtesting_connector(connector_name):
+            raise ValueError(f"Connector {connector_name} is not supported for backtesting")
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
         init_params = conn_setting.conn_init_parameters(
@@ -72,10 +114,60 @@ class BacktestingDataProvider(MarketDataProvider):
         return self._time
 
     async def initialize_trading_rules(self, connector_name: str):
-        if len(self.trading_rules.get(connector_name, {})) == 0:
-            connector = self.connectors.get(connector_name)
+        if len(self.trading_rules.get(connector_name, {})) > 0:
+            return
+        cached_rules = self._trading_rules_cache.get(connector_name)
+        if cached_rules is None or self._are_trading_rules_outdated(cached_rules[0]):
+            cached_rules = self._load_trading_rules(connector_name)
+        if cached_rules is None:
+            connector = self.get_connector(connector_name)
             await connector._update_trading_rules()
-            self.trading_rules[connector_name] = connector.trading_rules
+            cached_rules = (time.time(), dict(connector.trading_rules))
+            self._save_trading_rules(connector_name, cached_rules[1])
+        self._trading_rules_cache[connector_name] = cached_rules
+        # A copy, so the changes of an instance to its trading rules don't reach the cache or the other instances
+        self.trading_rules[connector_name] = dict(cached_rules[1])
+
+    def _are_trading_rules_outdated(self, update_time: float) -> bool:
+        return time.time() - update_time > self.trading_rules_max_age
+
+    def _trading_rules_file_path(self, connector_name: str) -> str:
+        return os.path.join(self.trading_rules_path, f"{connector_name}.json")
+
+    def _load_trading_rules(self, connector_name: str) -> Optional[Tuple[float, Dict[str, TradingRule]]]:
+        """
+        :return: the time the saved trading rules were downloaded and the rules, or None if they are missing or outdated
+        """
+        if self.trading_rules_path is None:
+            return None
+        file_path = self._trading_rules_file_path(connector_name)
+        if not os.path.exists(file_path):
+            return None
+        update_time = os.path.getmtime(file_path)
+        if self._are_trading_rules_outdated(update_time):
+            return None
+        try:
+            with open(file_path) as file:
+                rules_data = json.load(file)
+            return update_time, {rule_data["trading_pair"]: TradingRule(
+                **{field: rule_data[field] for field in TRADING_RULE_FIELDS},
+                **{field: Decimal(rule_data[field]) for field in TRADING_RULE_DECIMAL_FIELDS})
+                for rule_data in rules_data}
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Discarding the invalid trading rules file {file_path}.")
+            return None
+
+    def _save_trading_rules(self, connector_name: str, trading_rules: Dict[str, TradingRule]):
+        if self.trading_rules_path is None:
+            return
+        os.makedirs(self.trading_rules_path, exist_ok=True)
+        rules_data = [{**{field: getattr(rule, field) for field in TRADING_RULE_FIELDS},
+                       **{field: str(getattr(rule, field)) for field in TRADING_RULE_DECIMAL_FIELDS}}
+                      for rule in trading_rules.values()]
+        file_path = self._trading_rules_file_path(connector_name)
+        with open(f"{file_path}.tmp", "w") as file:
+            json.dump(rules_data, file)
+        os.replace(f"{file_path}.tmp", file_path)
 
     async def initialize_candles_feed(self, config: CandlesConfig):
         await self.get_candles_feed(config)
@@ -103,13 +195,17 @@ class BacktestingDataProvider(MarketDataProvider):
         # Create a new feed or restart the existing one with updated max_records
         candle_feed = CandlesFactory.get_candle(config)
         candles_buffer = config.max_records * CandlesBase.interval_to_seconds[config.interval]
-        candles_df = await candle_feed.get_historical_candles(config=HistoricalCandlesConfig(
+        historical_candles_config = HistoricalCandlesConfig(
             connector_name=config.connector,
             trading_pair=config.trading_pair,
             interval=config.interval,
             start_time=self.start_time - candles_buffer,
             end_time=self.end_time,
-        ))
+        )
+        if self.candles_store is not None:
+            candles_df = await self.candles_store.get_historical_candles(candle_feed, historical_candles_config)
+        else:
+            candles_df = await candle_feed.get_historical_candles(config=historical_candles_config)
         self.candles_feeds[key] = candles_df
         return candles_df
 
@@ -10,10 +10,11 @@ import yaml
 
 from hummingbot.client import settings
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
-from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, MarketDataArrays
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
 from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
@@ -30,10 +31,26 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class BacktestingEngineBase:
-    def __init__(self):
+    def __init__(self, vectorized: bool = False, decision_columns: Optional[List[str]] = None,
+                 candles_store_path: Optional[str] = None, trading_rules_path: Optional[str] = None):
+        """
+        :param vectorized: if True, the simulation runs over NumPy arrays of the market data and the executors are
+        simulated only until they close, producing the same results as the row by row simulation.
+        :param decision_columns: only used in vectorized mode. When set, the controller determines the executor actions
+        only when the values of these columns or the executors (created, closed or stopped) change. Use it only
+        for controllers whose actions don't depend on anything else, like the current time or the executors PnL.
+        :param candles_store_path: directory of a local candles store. When set, the candles downloaded for a backtest
+        are stored there and the next backtests only download the candles missing in it.
+        :param trading_rules_path: directory where the trading rules are saved once downloaded, so the backtests run in
+        other processes reuse them.
+        """
         self.controller = None
         self.backtesting_resolution = None
-        self.backtesting_data_provider = BacktestingDataProvider(connectors={})
+        self.vectorized = vectorized
+        self.decision_columns = decision_columns
+        candles_store = CandlesStore(candles_store_path) if candles_store_path is not None else None
+        self.backtesting_data_provider = BacktestingDataProvider(connectors={}, candles_store=candles_store,
+                                                                 trading_rules_path=trading_rules_path)
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
 
@@ -91,7 +108,10 @@ class BacktestingEngineBase:
         self.backtesting_resolution = backtesting_resolution
         await self.initialize_backtesting_data_provider()
         await self.controller.update_processed_data()
-        executors_info = await self.simulate_execution(trade_cost=trade_cost)
+        if self.vectorized:
+            executors_info = await self.simulate_execution_vectorized(trade_cost=trade_cost)
+        else:
+            executors_info = await self.simulate_execution(trade_cost=trade_cost)
         results = self.summarize_results(executors_info, controller_config.total_amount_quote)
         return {
             "executors": executors_info,
@@ -134,6 +154,77 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
+    async def simulate_execution_vectorized(self, trade_cost: float) -> list:
+        """
+        Same simulation as simulate_execution, reading the rows from NumPy arrays. The active executors are only
+        updated on the rows where one of them closes or the controller determines new actions.
+
+        Args:
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        processed_features = self.prepare_market_data()
+        self.active_executor_simulations: List[ExecutorSimulation] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+        market_data = MarketDataArrays(processed_features)
+        columns = list(processed_features.columns)
+        values = processed_features.values
+        close_prices = processed_features["close_bt"].to_numpy()
+        decision_values = processed_features[self.decision_columns].values if self.decision_columns else None
+        last_decision_values = None
+        executors_changed = True
+        next_close_index = len(market_data)
+        last_index = len(market_data) - 1
+
+        for i in range(len(market_data)):
+            timestamp = market_data.timestamp[i]
+            if i >= next_close_index:
+                executors_changed = True
+            if decision_values is None:
+                determine_actions = True
+            else:
+                row_decision_values = decision_values[i].tolist()
+                determine_actions = executors_changed or row_decision_values != last_decision_values
+                last_decision_values = row_decision_values
+            if not determine_actions and i < last_index:
+                continue
+
+            self.update_state_from_values(dict(zip(columns, values[i].tolist())), close_prices[i], timestamp)
+            if not determine_actions:
+                continue
+            executors_changed = False
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    executor_simulation = self.simulate_executor_from_index(
+                        action.executor_config, market_data, i, trade_cost)
+                    if executor_simulation.close_type != CloseType.FAILED:
+                        self.manage_active_executors(executor_simulation)
+                        executors_changed = True
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action(action, timestamp)
+                    executors_changed = True
+            next_close_index = self.next_executor_close_index(market_data)
+
+        return self.controller.executors_info
+
+    def next_executor_close_index(self, market_data: MarketDataArrays) -> int:
+        """
+        Index of the first row where an active executor is closed, so it has to be moved to the stopped executors.
+        """
+        last_timestamps = [simulation.columns["timestamp"][-1] for simulation in self.active_executor_simulations]
+        if len(last_timestamps) == 0:
+            return len(market_data)
+        return int(np.searchsorted(market_data.timestamp, min(last_timestamps), side="left"))
+
+    def update_state_from_values(self, values: Dict, close_price: float, timestamp: float):
+        key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
+        self.controller.market_data_provider.prices = {key: Decimal(close_price)}
+        self.controller.market_data_provider._time = timestamp
+        self.controller.processed_data.update(values)
+        self.update_executors_info(timestamp)
+
     async def update_state(self, row):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
@@ -213,6 +304,27 @@ class BacktestingEngineBase:
             return self.position_executor_simulator.simulate(df, config, trade_cost)
         return None
 
+    def simulate_executor_from_index(self, config: Union[PositionExecutorConfig, DCAExecutorConfig],
+                                     market_data: MarketDataArrays, start_index: int,
+                                     trade_cost: float) -> Optional[ExecutorSimulation]:
+        """
+        Vectorized version of simulate_executor, starting from a row of the market data arrays.
+
+        Args:
+            config (PositionExecutorConfig): The configuration of the executor.
+            market_data (MarketDataArrays): Column arrays of the market data.
+            start_index (int): Row of the market data where the executor starts.
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            ExecutorSimulation: The results of the simulation.
+        """
+        if isinstance(config, DCAExecutorConfig):
+            return self.dca_executor_simulator.simulate_from_index(market_data, start_index, config, trade_cost)
+        elif isinstance(config, PositionExecutorConfig):
+            return self.position_executor_simulator.simulate_from_index(market_data, start_index, config, trade_cost)
+        return None
+
     def manage_active_executors(self, simulation: ExecutorSimulation):
         """
         Manages the list of active executors based on the simulation results.
@@ -0,0 +1,275 @@
+import asyncio
+import itertools
+import json
+import logging
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client import settings
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+# Values of a random search space: a list of choices or a (low, high) range
+SearchSpaceValue = Union[Sequence[Any], Tuple[Any, Any]]
+
+
+class SweepResult(NamedTuple):
+    params: Dict[str, Any]
+    results: Dict[str, Any]
+
+
+def params_key(params: Dict[str, Any]) -> str:
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+class SweepResultsStore:
+    """
+    Append-only JSON lines file with the results of the finished runs of a sweep. A sweep that is restarted with the
+    same store skips the runs that are already in it.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def load(self) -> Dict[str, SweepResult]:
+        results = {}
+        if not os.path.exists(self._path):
+            return results
+        with open(self._path) as file:
+            for line in file:
+                line = line.strip()
+                # A line cut by an interruption is discarded, so that run is done again
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                results[params_key(row["params"])] = SweepResult(params=row["params"], results=row["results"])
+        return results
+
+    def append(self, result: SweepResult):
+        with open(self._path, "a") as file:
+            file.write(json.dumps({"params": result.params, "results": result.results}, default=str) + "\n")
+
+
+class SharedCandles:
+    """
+    Candles DataFrames saved as memory-mapped .npy files. The workers of a sweep map the same files instead of
+    receiving a pickled copy of the candles with every job.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._columns: Dict[str, List[str]] = {}
+
+    @property
+    def columns(self) -> Dict[str, List[str]]:
+        return self._columns
+
+    def add(self, key: str, candles: pd.DataFrame):
+        np.save(self._file_path(key), candles.to_numpy(dtype=float))
+        self._columns[key] = list(candles.columns)
+
+    def load(self) -> Dict[str, pd.DataFrame]:
+        return self.load_from(self._directory, self._columns)
+
+    @classmethod
+    def load_from(cls, directory: str, columns: Dict[str, List[str]]) -> Dict[str, pd.DataFrame]:
+        # Copy on write mapping, so a worker modifying its candles doesn't change the file seen by the others
+        return {key: pd.DataFrame(np.load(os.path.join(directory, f"{key}.npy"), mmap_mode="c"), columns=key_columns)
+                for key, key_columns in columns.items()}
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.npy")
+
+
+_worker_engine: Optional[BacktestingEngineBase] = None
+
+
+def _init_worker(engine_class: Type[BacktestingEngineBase], engine_kwargs: Dict[str, Any], candles_directory: str,
+                 candles_columns: Dict[str, List[str]], trading_rules: Dict[str, Dict]):
+    global _worker_engine
+    _worker_engine = engine_class(**engine_kwargs)
+    _worker_engine.backtesting_data_provider.candles_feeds.update(
+        SharedCandles.load_from(candles_directory, candles_columns))
+    _worker_engine.backtesting_data_provider.trading_rules.update(trading_rules)
+
+
+def _run_job(config_data: Dict[str, Any], controllers_module: str, start: int, end: int, backtesting_resolution: str,
+             trade_cost: float) -> Dict[str, Any]:
+    controller_config = _worker_engine.get_controller_config_instance_from_dict(config_data, controllers_module)
+    backtesting_result = asyncio.run(_worker_engine.run_backtesting(
+        controller_config, start, end, backtesting_resolution, trade_cost))
+    return backtesting_result["results"]
+
+
+class BacktestingSweep:
+    """
+    Runs the backtest of a controller for many combinations of its parameters in a pool of processes.
+
+    The candles and trading rules are loaded once, before the runs start, and shared with the workers through
+    memory-mapped files. The summarized results of each run are yielded as soon as it finishes and, when a results
+    path is set, appended to it so an interrupted sweep can be resumed.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 base_config: Dict[str, Any],
+                 start: int,
+                 end: int,
+                 backtesting_resolution: str = "1m",
+                 trade_cost: float = 0.0006,
+                 max_workers: Optional[int] = None,
+                 results_path: Optional[str] = None,
+                 controllers_module: str = settings.CONTROLLERS_MODULE,
+                 engine_class: Type[BacktestingEngineBase] = BacktestingEngineBase,
+                 engine_kwargs: Optional[Dict[str, Any]] = None):
+        """
+        :param base_config: controller config data, as in the controller yml files. Each run overrides its fields with
+        a combination of parameters
+        :param start: start timestamp of the backtests
+        :param end: end timestamp of the backtests
+        :param backtesting_resolution: interval of the candles used to simulate the executors
+        :param trade_cost: the cost per trade
+        :param max_workers: number of worker processes, defaults to the number of CPUs
+        :param results_path: JSON lines file where the results are stored. The runs already stored in it are skipped
+        :param controllers_module: module where the controller packages are
+        :param engine_class: class of the engine running the backtests, it must be importable by the workers
+        :param engine_kwargs: arguments to create the engine in each worker
+        """
+        self._base_config = base_config
+        self._start = start
+        self._end = end
+        self._backtesting_resolution = backtesting_resolution
+        self._trade_cost = trade_cost
+        self._max_workers = max_workers
+        self._results_store = SweepResultsStore(results_path) if results_path is not None else None
+        self._controllers_module = controllers_module
+        self._engine_class = engine_class
+        self._engine_kwargs = engine_kwargs or {}
+
+    @staticmethod
+    def grid(param_grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+        """
+        All the combinations of the parameter values.
+
+        :param param_grid: values to test for each parameter
+        """
+        names = list(param_grid.keys())
+        return [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+
+    @staticmethod
+    def random_search(space: Dict[str, SearchSpaceValue], n_samples: int, seed: Optional[int] = None) -> List[Dict]:
+        """
+        Random combinations of parameters.
+
+        :param space: for each parameter, a list of choices or a (low, high) tuple. Ranges of integers are sampled as
+        integers, ranges of Decimals as Decimals and any other range as floats
+        :param n_samples: number of combinations
+        :param seed: seed of the random generator, to repeat the same sweep
+        """
+        rng = random.Random(seed)
+
+        def sample(value: SearchSpaceValue):
+            if isinstance(value, tuple) and len(value) == 2:
+                low, high = value
+                if isinstance(low, int) and isinstance(high, int):
+                    return rng.randint(low, high)
+                if isinstance(low, Decimal) or isinstance(high, Decimal):
+                    return Decimal(str(rng.uniform(float(low), float(high))))
+                return rng.uniform(low, high)
+            return rng.choice(list(value))
+
+        return [{name: sample(value) for name, value in space.items()} for _ in range(n_samples)]
+
+    def config_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {**self._base_config, **params}
+
+    async def run(self, params_list: List[Dict[str, Any]]) -> AsyncIterator[SweepResult]:
+        """
+        Runs a backtest for each combination of parameters, yielding the results as the runs finish. The runs already
+        in the results store are not repeated and their results are not yielded.
+        """
+        finished = self._results_store.load() if self._results_store is not None else {}
+        pending = [params for params in params_list if params_key(params) not in finished]
+        if len(pending) == 0:
+            return
+        engine = self._engine_class(**self._engine_kwargs)
+        controller_configs = [engine.get_controller_config_instance_from_dict(self.config_data(params),
+                                                                              self._controllers_module)
+                              for params in pending]
+        data_provider = engine.backtesting_data_provider
+        await self.load_market_data(engine, controller_configs)
+
+        with tempfile.TemporaryDirectory() as candles_directory:
+            shared_candles = SharedCandles(candles_directory)
+            for key, candles in data_provider.candles_feeds.items():
+                shared_candles.add(key, candles)
+            with ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    initializer=_init_worker,
+                    initargs=(self._engine_class, self._engine_kwargs, candles_directory, shared_candles.columns,
+                              data_provider.trading_rules)) as pool:
+                try:
+                    runs = [self._run_in_pool(pool, params) for params in pending]
+                    for next_run in asyncio.as_completed(runs):
+                        result = await next_run
+                        if result is not None:
+                            yield result
+                finally:
+                    # Nothing to wait for if the consumer stops iterating before the sweep is finished
+                    pool.shutdown(cancel_futures=True)
+
+    async def _run_in_pool(self, pool: ProcessPoolExecutor, params: Dict[str, Any]) -> Optional[SweepResult]:
+        try:
+            results = await asyncio.wrap_future(pool.submit(
+                _run_job, self.config_data(params), self._controllers_module, self._start, self._end,
+                self._backtesting_resolution, self._trade_cost))
+        except Exception:
+            self.logger().error(f"Error running the backtest with parameters {params}.", exc_info=True)
+            return None
+        result = SweepResult(params=params, results=results)
+        if self._results_store is not None:
+            self._results_store.append(result)
+        return result
+
+    async def load_market_data(self, engine: BacktestingEngineBase, controller_configs: List):
+        """
+        Loads the trading rules and all the candles needed by the runs in the engine data provider, so the workers
+        don't download them again.
+        """
+        data_provider = engine.backtesting_data_provider
+        data_provider.update_backtesting_time(self._start, self._end)
+        candles_configs = {}
+        for controller_config in controller_configs:
+            await data_provider.initialize_trading_rules(controller_config.connector_name)
+            configs = [CandlesConfig(connector=controller_config.connector_name,
+                                     trading_pair=controller_config.trading_pair,
+                                     interval=self._backtesting_resolution)] + list(controller_config.candles_config)
+            for candles_config in configs:
+                key = (candles_config.connector, candles_config.trading_pair, candles_config.interval)
+                if key not in candles_configs or candles_config.max_records > candles_configs[key].max_records:
+                    candles_configs[key] = candles_config
+        # A candles feed is reused by the runs when it covers the backtest, so only the largest buffer is loaded
+        for candles_config in candles_configs.values():
+            await data_provider.initialize_candles_feed(candles_config)
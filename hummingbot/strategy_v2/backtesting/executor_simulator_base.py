@@ -1,8 +1,10 @@
+import math
 from decimal import Decimal
-from typing import Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
@@ -15,6 +17,7 @@ class ExecutorSimulation(BaseModel):
     config: Union[PositionExecutorConfig, DCAExecutorConfig]
     executor_simulation: pd.DataFrame
     close_type: CloseType
+    _columns: Optional[Dict[str, np.ndarray]] = PrivateAttr(default=None)
 
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types
@@ -25,10 +28,20 @@ class ExecutorSimulation(BaseModel):
             raise ValueError("executor_simulation must be a pandas DataFrame")
         return v
 
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Arrays of the simulation columns, cached because the simulation DataFrame is not modified once created."""
+        if self._columns is None:
+            self._columns = {column: self.executor_simulation[column].values
+                             for column in self.executor_simulation.columns}
+        return self._columns
+
     def get_executor_info_at_timestamp(self, timestamp: float) -> ExecutorInfo:
-        # Filter the DataFrame up to the specified timestamp
-        df_up_to_timestamp = self.executor_simulation[self.executor_simulation['timestamp'] <= timestamp]
-        if df_up_to_timestamp.empty:
+        # The simulation rows are sorted by timestamp, so the rows up to the specified timestamp are a prefix
+        columns = self.columns
+        timestamps = columns['timestamp']
+        rows_up_to_timestamp = int(np.searchsorted(timestamps, timestamp, side="right"))
+        if rows_up_to_timestamp == 0:
             return ExecutorInfo(
                 id=self.config.id,
                 timestamp=self.config.timestamp,
@@ -44,8 +57,9 @@ class ExecutorSimulation(BaseModel):
                 custom_info={}
             )
 
-        last_entry = df_up_to_timestamp.iloc[-1]
-        is_active = last_entry['timestamp'] < self.executor_simulation['timestamp'].max()
+        # Reading the row from the column arrays avoids building a Series for it
+        last_entry = {column: values[rows_up_to_timestamp - 1] for column, values in columns.items()}
+        is_active = last_entry['timestamp'] < timestamps[-1]
         return ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
@@ -63,7 +77,7 @@ class ExecutorSimulation(BaseModel):
             custom_info=self.get_custom_info(last_entry)
         )
 
-    def get_custom_info(self, last_entry: pd.Series) -> dict:
+    def get_custom_info(self, last_entry: Dict) -> dict:
         current_position_average_price = last_entry['current_position_average_price'] if "current_position_average_price" in last_entry else None
         return {
             "close_price": last_entry['close'],
@@ -73,9 +87,94 @@ class ExecutorSimulation(BaseModel):
         }
 
 
+class MarketDataArrays:
+    """
+    NumPy views of the columns of the backtesting market data used by the vectorized simulations. The rows must be
+    sorted by timestamp.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.timestamp = df["timestamp"].to_numpy()
+        self.high = df["high"].to_numpy(dtype=float)
+        self.low = df["low"].to_numpy(dtype=float)
+        self.close = df["close"].to_numpy(dtype=float)
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    def rows_up_to(self, timestamp: float, start_index: int = 0) -> int:
+        """Returns the index after the last row with a timestamp lower or equal than the given one."""
+        return max(int(np.searchsorted(self.timestamp, timestamp, side="right")), start_index)
+
+
+def float_at_most(value: Decimal) -> float:
+    """Largest float lower or equal than the value, so `x <= value` is the same as `x <= float_at_most(value)`."""
+    result = float(value)
+    if Decimal(result) > value:
+        result = math.nextafter(result, -math.inf)
+    return result
+
+
+def float_at_least(value: Decimal) -> float:
+    """Smallest float greater or equal than the value, so `x >= value` is the same as `x >= float_at_least(value)`."""
+    result = float(value)
+    if Decimal(result) < value:
+        result = math.nextafter(result, math.inf)
+    return result
+
+
+def first_index(mask: np.ndarray, offset: int = 0) -> Optional[int]:
+    """Index of the first True value of the mask plus the offset, or None if there is none."""
+    index = int(np.argmax(mask)) if len(mask) > 0 else 0
+    return index + offset if len(mask) > 0 and mask[index] else None
+
+
+def search_forward(start: int, stop: int, find: Callable[[int], Optional[object]],
+                   initial_window: int = 256) -> Tuple[Optional[object], int]:
+    """
+    Looks for the first event in the rows [start, stop) evaluating growing windows of rows. `find(end)` evaluates the
+    rows [start, end) and returns the event found, or None. The events must only depend on the rows before them, so
+    the first event found in a window is the first event in all the rows.
+
+    :return: the event found (or None) and the end of the last window evaluated
+    """
+    window = initial_window
+    while True:
+        end = min(start + window, stop)
+        result = find(end)
+        if result is not None or end >= stop:
+            return result, end
+        window *= 4
+
+
 class ExecutorSimulatorBase:
     """Base class for trading simulators."""
     def simulate(self, df: pd.DataFrame, config, trade_cost: float) -> ExecutorSimulation:
         """Simulates trading based on provided configuration and market data."""
         # This method should be generic enough to handle various trading strategies.
         raise NotImplementedError
+
+    def simulate_from_index(self, market_data: MarketDataArrays, start_index: int, config,
+                            trade_cost: float) -> ExecutorSimulation:
+        """
+        Simulates trading from the row start_index of the market data. The simulators override it with a vectorized
+        implementation that only evaluates the rows until the executor closes, producing the same simulation as
+        `simulate`.
+        """
+        return self.simulate(market_data.df.iloc[start_index:], config, trade_cost)
+
+    @staticmethod
+    def cumulative_returns(close: np.ndarray, side_multiplier: int, trade_cost: float) -> np.ndarray:
+        """Same values as computing the net returns with pct_change and cumprod on the close prices Series."""
+        returns = np.zeros(len(close))
+        if len(close) > 1:
+            returns[1:] = close[1:] / close[:-1] - 1
+        return ((np.cumprod(1 + returns) - 1) * side_multiplier) - trade_cost
+
+    @staticmethod
+    def simulation_df(market_data: MarketDataArrays, start_index: int, end_index: int, **columns) -> pd.DataFrame:
+        df = market_data.df.iloc[start_index:end_index].copy()
+        for name, values in columns.items():
+            df[name] = values
+        return df
@@ -1,13 +1,25 @@
 from decimal import Decimal
-from typing import List
+from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import (
+    ExecutorSimulation,
+    ExecutorSimulatorBase,
+    MarketDataArrays,
+    first_index,
+    float_at_least,
+    float_at_most,
+    search_forward,
+)
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
 from hummingbot.strategy_v2.models.executors import CloseType
 
+# Close type of the DCA stage when several barriers are hit on the same candle
+CLOSE_TYPES_PRIORITY = [CloseType.TAKE_PROFIT, CloseType.STOP_LOSS, CloseType.TRAILING_STOP, None]
+
 
 class DCAExecutorSimulator(ExecutorSimulatorBase):
 
@@ -149,3 +161,134 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
             close_type=close_type
         )
         return simulation
+
+    def simulate_from_index(self, market_data: MarketDataArrays, start_index: int, config: DCAExecutorConfig,
+                            trade_cost: float) -> ExecutorSimulation:
+        # Without stop loss the last order has no closing barrier, so the DataFrame simulation handles that case
+        if config.mode == DCAMode.TAKER or not config.stop_loss:
+            return super().simulate_from_index(market_data, start_index, config, trade_cost)
+        is_buy = config.side == TradeType.BUY
+        side_multiplier = 1 if is_buy else -1
+        close = market_data.close
+        last_timestamp = market_data.timestamp[-1]
+        tl = config.time_limit if config.time_limit else None
+        tl_timestamp = config.timestamp + tl if tl else last_timestamp
+        end_index = market_data.rows_up_to(tl_timestamp, start_index)
+
+        def below(prices: np.ndarray, price: Decimal) -> np.ndarray:
+            return prices <= float_at_most(price)
+
+        def above(prices: np.ndarray, price: Decimal) -> np.ndarray:
+            return prices >= float_at_least(price)
+
+        # Orders are filled when the price crosses them, and the targets are reached in the opposite direction
+        crossed, reached = (below, above) if is_buy else (above, below)
+
+        trailing_sl_trigger_pct = config.trailing_stop.activation_price if config.trailing_stop else None
+        trailing_sl_delta_pct = config.trailing_stop.trailing_delta if config.trailing_stop else None
+
+        dca_stages = []
+        for i in range(len(config.prices)):
+            is_last_order = i == len(config.prices) - 1
+            price = config.prices[i]
+            break_even_price = DCAExecutorSimulator.break_even_price_at_index(config.prices, config.amounts_quote, i) if i > 0 else price
+
+            entry_index, _ = search_forward(
+                start_index, end_index, lambda end: first_index(crossed(close[start_index:end], price), start_index))
+            if entry_index is None:
+                break
+
+            def find_barriers(end: int) -> Optional[Dict[Optional[CloseType], int]]:
+                hits = {}
+                prices = close[entry_index:end]
+                if trailing_sl_trigger_pct is not None and trailing_sl_delta_pct is not None:
+                    activation_price = break_even_price * (1 + trailing_sl_trigger_pct * side_multiplier)
+                    activation_index = first_index(reached(prices, activation_price))
+                    if activation_index is not None:
+                        activated_prices = prices[activation_index:]
+                        if is_buy:
+                            trigger_prices = np.maximum.accumulate(activated_prices * float(1 - trailing_sl_delta_pct))
+                            trailing_stop_condition = activated_prices <= trigger_prices
+                        else:
+                            trigger_prices = np.minimum.accumulate(activated_prices * float(1 + trailing_sl_delta_pct))
+                            trailing_stop_condition = activated_prices >= trigger_prices
+                        hits[CloseType.TRAILING_STOP] = first_index(trailing_stop_condition, entry_index + activation_index)
+                if config.take_profit:
+                    take_profit_price = break_even_price * (1 + config.take_profit * side_multiplier)
+                    hits[CloseType.TAKE_PROFIT] = first_index(reached(prices, take_profit_price), entry_index)
+                if is_last_order:
+                    stop_loss_price = break_even_price * (1 - config.stop_loss * side_multiplier)
+                    if is_buy:
+                        stop_loss_condition = below(market_data.low[entry_index:end], stop_loss_price)
+                    else:
+                        stop_loss_condition = above(market_data.high[entry_index:end], stop_loss_price)
+                    hits[CloseType.STOP_LOSS] = first_index(stop_loss_condition, entry_index)
+                else:
+                    hits[None] = first_index(crossed(prices, config.prices[i + 1]), entry_index)
+                hits = {close_type: index for close_type, index in hits.items() if index is not None}
+                return hits or None
+
+            hits, _ = search_forward(entry_index, end_index, find_barriers)
+            barrier_timestamps = {close_type: market_data.timestamp[index] for close_type, index in (hits or {}).items()}
+            close_timestamp = min(list(barrier_timestamps.values()) + [last_timestamp])
+            # A None close type means that the next order was filled before any barrier was hit
+            close_type = next((close_type for close_type in CLOSE_TYPES_PRIORITY
+                               if barrier_timestamps.get(close_type) == close_timestamp), CloseType.TIME_LIMIT)
+            dca_stages.append({
+                'entry_index': entry_index,
+                'amount': float(config.amounts_quote[i]),
+                'break_even_price': float(break_even_price),
+                'close_timestamp': close_timestamp,
+                'close_type': close_type,
+            })
+            # The stages after the first one that closes the executor are not used
+            if close_type is not None:
+                break
+
+        if len(dca_stages) == 0:
+            return ExecutorSimulation(
+                config=config,
+                executor_simulation=self.simulation_df(
+                    market_data, start_index, end_index,
+                    net_pnl_pct=0.0, net_pnl_quote=0.0, cum_fees_quote=0.0, filled_amount_quote=0.0,
+                    current_position_average_price=float(config.prices[0])),
+                close_type=CloseType.TIME_LIMIT)
+
+        close_type = dca_stages[-1]['close_type']
+        if close_type is None:
+            close_type = CloseType.FAILED
+            close_index = end_index
+        else:
+            close_index = min(market_data.rows_up_to(dca_stages[-1]['close_timestamp'], start_index), end_index)
+
+        rows = close_index - start_index
+        filled_amount_quote = 0
+        net_pnl_quote = 0
+        current_position_average_price = np.full(rows, float(config.prices[0]))
+        for dca_stage in dca_stages:
+            entry_offset = dca_stage['entry_index'] - start_index
+            stage_filled_amount_quote = np.zeros(rows)
+            stage_net_pnl_quote = np.zeros(rows)
+            if entry_offset < rows:
+                stage_filled_amount_quote[entry_offset:] = dca_stage['amount']
+                stage_net_pnl_quote[entry_offset:] = self.cumulative_returns(
+                    close[dca_stage['entry_index']:close_index], side_multiplier, trade_cost) * dca_stage['amount']
+                current_position_average_price[entry_offset:] = dca_stage['break_even_price']
+            filled_amount_quote = filled_amount_quote + stage_filled_amount_quote
+            net_pnl_quote = net_pnl_quote + stage_net_pnl_quote
+        cum_fees_quote = trade_cost * filled_amount_quote
+        net_pnl_pct = np.zeros(rows)
+        has_position = filled_amount_quote > 0
+        net_pnl_pct[has_position] = net_pnl_quote[has_position] / filled_amount_quote[has_position]
+        filled_amount_quote[-1] = filled_amount_quote[-1] * 2
+
+        simulation = ExecutorSimulation(
+            config=config,
+            executor_simulation=self.simulation_df(
+                market_data, start_index, close_index,
+                net_pnl_pct=net_pnl_pct, net_pnl_quote=net_pnl_quote, cum_fees_quote=cum_fees_quote,
+                filled_amount_quote=filled_amount_quote,
+                current_position_average_price=current_position_average_price),
+            close_type=close_type
+        )
+        return simulation
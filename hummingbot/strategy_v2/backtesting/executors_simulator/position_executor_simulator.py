@@ -1,10 +1,24 @@
+from typing import Dict, Optional
+
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import (
+    ExecutorSimulation,
+    ExecutorSimulatorBase,
+    MarketDataArrays,
+    first_index,
+    float_at_least,
+    float_at_most,
+    search_forward,
+)
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.executors import CloseType
 
+# Close type of the executor when several barriers are hit on the same candle
+CLOSE_TYPES_PRIORITY = [CloseType.TAKE_PROFIT, CloseType.STOP_LOSS, CloseType.TRAILING_STOP]
+
 
 class PositionExecutorSimulator(ExecutorSimulatorBase):
     def simulate(self, df: pd.DataFrame, config: PositionExecutorConfig, trade_cost: float) -> ExecutorSimulation:
@@ -85,3 +99,101 @@ class PositionExecutorSimulator(ExecutorSimulatorBase):
             close_type=close_type
         )
         return simulation
+
+    def simulate_from_index(self, market_data: MarketDataArrays, start_index: int, config: PositionExecutorConfig,
+                            trade_cost: float) -> ExecutorSimulation:
+        barrier_config = config.triple_barrier_config
+        close = market_data.close
+        total_rows = len(market_data)
+        last_timestamp = market_data.timestamp[-1]
+
+        if barrier_config.open_order_type.is_limit_type():
+            if config.side == TradeType.BUY:
+                entry_threshold = float_at_most(config.entry_price)
+            else:
+                entry_threshold = float_at_least(config.entry_price)
+
+            def find_entry(end: int) -> Optional[int]:
+                prices = close[start_index:end]
+                entry_condition = prices <= entry_threshold if config.side == TradeType.BUY else prices >= entry_threshold
+                return first_index(entry_condition, start_index)
+
+            entry_index, _ = search_forward(start_index, total_rows, find_entry)
+        else:
+            entry_index = start_index
+
+        tp = float(barrier_config.take_profit) if barrier_config.take_profit else None
+        trailing_sl_trigger_pct = None
+        trailing_sl_delta_pct = None
+        if barrier_config.trailing_stop:
+            trailing_sl_trigger_pct = float(barrier_config.trailing_stop.activation_price)
+            trailing_sl_delta_pct = float(barrier_config.trailing_stop.trailing_delta)
+        tl = barrier_config.time_limit if barrier_config.time_limit else None
+        tl_timestamp = config.timestamp + tl if tl else last_timestamp
+        end_index = market_data.rows_up_to(tl_timestamp, start_index)
+
+        if entry_index is None:
+            return ExecutorSimulation(
+                config=config,
+                executor_simulation=self.simulation_df(
+                    market_data, start_index, end_index,
+                    net_pnl_pct=0.0, net_pnl_quote=0.0, cum_fees_quote=0.0, filled_amount_quote=0.0,
+                    current_position_average_price=float(config.entry_price)),
+                close_type=CloseType.TIME_LIMIT)
+
+        entry_price = close[entry_index]
+        side_multiplier = 1 if config.side == TradeType.BUY else -1
+        sl_price = None
+        if barrier_config.stop_loss:
+            sl_price = entry_price * (1 - float(barrier_config.stop_loss) * side_multiplier)
+        use_trailing_stop = bool(trailing_sl_delta_pct and trailing_sl_trigger_pct)
+
+        def net_pnl_pct(end: int) -> np.ndarray:
+            pnl = np.zeros(end - start_index)
+            if entry_index < end:
+                pnl[entry_index - start_index:] = self.cumulative_returns(
+                    close[entry_index:end], side_multiplier, trade_cost)
+            return pnl
+
+        def find_barriers(end: int) -> Optional[Dict[CloseType, int]]:
+            pnl = net_pnl_pct(end)
+            hits = {}
+            if tp:
+                hits[CloseType.TAKE_PROFIT] = first_index(pnl > tp, start_index)
+            if sl_price is not None:
+                if config.side == TradeType.BUY:
+                    sl_condition = market_data.low[start_index:end] <= sl_price
+                else:
+                    sl_condition = market_data.high[start_index:end] >= sl_price
+                hits[CloseType.STOP_LOSS] = first_index(sl_condition, start_index)
+            if use_trailing_stop:
+                activated = np.maximum.accumulate(pnl > trailing_sl_trigger_pct)
+                trailing_stop = np.maximum.accumulate(pnl - trailing_sl_delta_pct)
+                hits[CloseType.TRAILING_STOP] = first_index(activated & (pnl < trailing_stop), start_index)
+            hits = {close_type: index for close_type, index in hits.items() if index is not None}
+            return hits or None
+
+        hits, _ = search_forward(start_index, end_index, find_barriers)
+        hits = hits or {}
+        barrier_timestamps = {close_type: market_data.timestamp[index] for close_type, index in hits.items()}
+        close_timestamp = min(list(barrier_timestamps.values()) + [tl_timestamp])
+        close_type = next((close_type for close_type in CLOSE_TYPES_PRIORITY
+                           if barrier_timestamps.get(close_type) == close_timestamp), CloseType.TIME_LIMIT)
+
+        close_index = market_data.rows_up_to(close_timestamp, start_index)
+        pnl = net_pnl_pct(close_index)
+        filled_amount_quote = np.where(
+            np.arange(start_index, close_index) >= entry_index, float(config.amount) * entry_price, 0.0)
+        net_pnl_quote = pnl * filled_amount_quote
+        cum_fees_quote = trade_cost * filled_amount_quote
+        filled_amount_quote[-1] = filled_amount_quote[-1] * 2
+        simulation = ExecutorSimulation(
+            config=config,
+            executor_simulation=self.simulation_df(
+                market_data, start_index, close_index,
+                net_pnl_pct=pnl, net_pnl_quote=net_pnl_quote, cum_fees_quote=cum_fees_quote,
+                filled_amount_quote=filled_amount_quote,
+                current_position_average_price=float(config.entry_price)),
+            close_type=close_type
+        )
+        return simulation
@@ -158,6 +158,8 @@ class ArbitrageExecutor(ExecutorBase):
                 await self.update_trade_pnl_pct()
                 await self.update_tx_cost()
                 self._current_profitability = (self._trade_pnl_pct * self.order_amount - self._last_tx_cost) / self.order_amount
+                # The quote prices in the custom info do not go through get_price
+                self.mark_executor_info_changed()
                 if self._current_profitability > self.min_profitability:
                     await self.execute_arbitrage()
             except Exception as e:
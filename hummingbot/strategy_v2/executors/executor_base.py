@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -25,6 +25,9 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
+
 
 class ExecutorBase(RunnableBase):
     """
@@ -48,14 +51,14 @@ class ExecutorBase(RunnableBase):
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
-        # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        # Event forwarders for different order events, delivered to the handlers in _order_event_handlers
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_event)
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_event)
+        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_event)
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_event)
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_event)
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_event)
+        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_event)
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -67,6 +70,22 @@ class ExecutorBase(RunnableBase):
             (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder),
             (MarketEvent.OrderFailure, self._failed_order_forwarder),
         ]
+        # Handlers of the order events, by event tag
+        self._order_event_handlers: Dict[int, Callable] = {
+            MarketEvent.OrderCancelled.value: self.process_order_canceled_event,
+            MarketEvent.BuyOrderCreated.value: self.process_order_created_event,
+            MarketEvent.SellOrderCreated.value: self.process_order_created_event,
+            MarketEvent.OrderFilled.value: self.process_order_filled_event,
+            MarketEvent.BuyOrderCompleted.value: self.process_order_completed_event,
+            MarketEvent.SellOrderCompleted.value: self.process_order_completed_event,
+            MarketEvent.OrderFailure.value: self.process_order_failed_event,
+        }
+        # When set before the executor starts, the router delivers to the executor only the events of its orders
+        self.order_event_router: Optional["OrderEventRouter"] = None
+        # The executor info is built again only after an order event, an order placed or a price change
+        self._executor_info: Optional[ExecutorInfo] = None
+        self._executor_info_changed = True
+        self._last_prices: Dict[Tuple[str, str, PriceType], Decimal] = {}
 
     @property
     def status(self):
@@ -106,8 +125,23 @@ class ExecutorBase(RunnableBase):
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
+        Returns the executor info. The last one is reused until the executor info changes, see
+        mark_executor_info_changed.
+        """
+        ei = self._executor_info
+        if self._executor_info_changed or ei is None or ei.status != self.status or ei.close_type != self.close_type:
+            ei = self._executor_info = self._build_executor_info()
+            self._executor_info_changed = False
+        return ei
+
+    def mark_executor_info_changed(self):
+        """
+        Makes the next executor_info be built again. Called on the order events, the orders placed and the price
+        changes seen in get_price; subclasses whose info depends on something else call it when that changes.
         """
+        self._executor_info_changed = True
+
+    def _build_executor_info(self) -> ExecutorInfo:
         ei = ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
@@ -247,6 +281,9 @@ class ExecutorBase(RunnableBase):
         """
         Registers the events with the connectors.
         """
+        if self.order_event_router is not None:
+            self.order_event_router.add_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.add_listener(event_pair[0], event_pair[1])
@@ -255,10 +292,20 @@ class ExecutorBase(RunnableBase):
         """
         Unregisters the events from the connectors.
         """
+        if self.order_event_router is not None:
+            self.order_event_router.remove_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.remove_listener(event_pair[0], event_pair[1])
 
+    def process_order_event(self, event_tag: int, market: ConnectorBase, event: any):
+        """
+        Processes an order event with the handler of its event tag.
+        """
+        self._executor_info_changed = True
+        self._order_event_handlers[event_tag](event_tag, market, event)
+
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
         Adjusts the order candidates based on the budget checker of the specified exchange.
@@ -287,9 +334,13 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        if self.order_event_router is not None:
+            self.order_event_router.add_order(order_id, self)
+        self._executor_info_changed = True
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
@@ -300,7 +351,12 @@ class ExecutorBase(RunnableBase):
         :param price_type: The type of the price.
         :return: The price.
         """
-        return self.connectors[connector_name].get_price_by_type(trading_pair, price_type)
+        price = self.connectors[connector_name].get_price_by_type(trading_pair, price_type)
+        key = (connector_name, trading_pair, price_type)
+        if self._last_prices.get(key) != price:
+            self._last_prices[key] = price
+            self._executor_info_changed = True
+        return price
 
     def get_trading_rules(self, connector_name: str, trading_pair: str) -> TradingRule:
         """
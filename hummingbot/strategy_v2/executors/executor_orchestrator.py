@@ -2,7 +2,7 @@ import logging
 import uuid
 from copy import deepcopy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from pydantic.main import BaseModel
 
@@ -15,8 +15,11 @@ from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor impo
 from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
@@ -107,14 +110,25 @@ class ExecutorOrchestrator:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0):
+    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0,
+                 use_executor_scheduler: bool = False):
+        """
+        :param use_executor_scheduler: Run the control tasks of the executors in the ticks of a single scheduler task
+            instead of in a control loop task per executor. See ExecutorScheduler for what it requires from the control
+            tasks.
+        """
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.active_executors = {}
+        # The active executors of each controller by executor id
+        self._active_executors_by_id: Dict[str, Dict[str, ExecutorBase]] = {}
         self.archived_executors = {}
         self.positions_held = {}
         self.executors_ids_position_held = []
         self.cached_performance = {}
+        # Delivers the order events of the connectors only to the executor that placed each order
+        self.order_event_router = OrderEventRouter()
+        self.executor_scheduler: Optional[ExecutorScheduler] = ExecutorScheduler() if use_executor_scheduler else None
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
@@ -127,6 +141,7 @@ class ExecutorOrchestrator:
             if controller_id not in self.cached_performance:
                 self.cached_performance[controller_id] = PerformanceReport()
                 self.active_executors[controller_id] = []
+                self._active_executors_by_id[controller_id] = {}
                 self.archived_executors[controller_id] = []
                 self.positions_held[controller_id] = []
             self._update_cached_performance(controller_id, executor)
@@ -191,6 +206,7 @@ class ExecutorOrchestrator:
                 MarketsRecorder.get_instance().store_or_update_executor(executor)
         # Remove the executors from the list
         self.active_executors = {}
+        self._active_executors_by_id = {}
 
     def execute_action(self, action: ExecutorAction):
         """
@@ -199,6 +215,7 @@ class ExecutorOrchestrator:
         controller_id = action.controller_id
         if controller_id not in self.cached_performance:
             self.active_executors[controller_id] = []
+            self._active_executors_by_id[controller_id] = {}
             self.archived_executors[controller_id] = []
             self.positions_held[controller_id] = []
             self.cached_performance[controller_id] = PerformanceReport()
@@ -243,8 +260,11 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.order_event_router = self.order_event_router
+        executor.scheduler = self.executor_scheduler
         executor.start()
         self.active_executors[controller_id].append(executor)
+        self._active_executors_by_id[controller_id][executor.config.id] = executor
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
         self.logger().debug(f"Created {type(executor).__name__} for controller {controller_id}")
 
@@ -255,9 +275,7 @@ class ExecutorOrchestrator:
         controller_id = action.controller_id
         executor_id = action.executor_id
 
-        executor = next(
-            (executor for executor in self.active_executors[controller_id] if executor.config.id == executor_id),
-            None)
+        executor = self._active_executors_by_id[controller_id].get(executor_id)
         if not executor:
             self.logger().error(f"Executor ID {executor_id} not found for controller {controller_id}.")
             return
@@ -270,9 +288,7 @@ class ExecutorOrchestrator:
         controller_id = action.controller_id
         executor_id = action.executor_id
 
-        executor = next(
-            (executor for executor in self.active_executors[controller_id] if executor.config.id == executor_id),
-            None)
+        executor = self._active_executors_by_id[controller_id].get(executor_id)
         if not executor:
             self.logger().error(f"Executor ID {executor_id} not found for controller {controller_id}.")
             return
@@ -287,6 +303,7 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor info: {executor.executor_info} | Config: {executor.config}")
 
         self.active_executors[controller_id].remove(executor)
+        del self._active_executors_by_id[controller_id][executor_id]
         self.archived_executors[controller_id].append(executor.executor_info)
         del executor
 
@@ -0,0 +1,220 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import types
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Coroutine, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+LATENCY_SAMPLES = 1000
+
+
+@dataclass
+class ExecutorTypeMetrics:
+    """
+    Run counters and latencies of the control tasks of one executor type. The percentiles are computed over the last
+    LATENCY_SAMPLES runs.
+
+    control_task_ms is the time from the start to the end of each control task, lag_ms is the time each control task
+    started after it was due.
+    """
+    runs: int = 0
+    errors: int = 0
+    deferred_runs: int = 0
+    control_task_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    lag_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+    def control_task_percentile_ms(self, percentile: float) -> float:
+        return float(np.percentile(self.control_task_ms, percentile)) if self.control_task_ms else 0.0
+
+    def lag_percentile_ms(self, percentile: float) -> float:
+        return float(np.percentile(self.lag_ms, percentile)) if self.lag_ms else 0.0
+
+
+@types.coroutine
+def _resume(coro: Coroutine, awaited: Any):
+    """
+    Drives to completion a coroutine that was already started and is waiting on `awaited`, so it can go on in a task.
+    """
+    while True:
+        try:
+            sent = yield awaited
+        except BaseException as e:
+            try:
+                awaited = coro.throw(e)
+            except StopIteration as stop:
+                return stop.value
+        else:
+            try:
+                awaited = coro.send(sent)
+            except StopIteration as stop:
+                return stop.value
+
+
+class ExecutorScheduler:
+    """
+    Runs the control tasks of the executors from a single asyncio task, in ticks, instead of one control loop task per
+    executor.
+
+    The executors are kept in a heap by the time of their next run. On each tick the scheduler runs the control tasks
+    that are due, earliest first, until the time budget of the tick is spent; the ones left are the first to run on
+    the next tick. A control task that has to wait, like for a request to the exchange, goes on in its own task, and
+    its executor runs again update_interval seconds after it finishes, like in RunnableBase.control_loop, and on_stop
+    runs as soon as the executor is stopped and not running a control task.
+
+    The steps are driven by the scheduler instead of each running in a task of its own, which is what saves the cost
+    of the event loop round trips. So the on_start and control tasks must stay synchronous until they first have to
+    wait: up to that point they run in the scheduler task, and must not use asyncio.current_task() nor cancel it. Once
+    they have waited they go on in their own task, to which asyncio.current_task() and cancellation apply.
+    """
+    _logger = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, tick_interval: float = 0.1, tick_budget: float = 0.05):
+        """
+        :param tick_interval: The time between ticks, in seconds.
+        :param tick_budget: The time after which a tick stops starting control tasks, in seconds.
+        """
+        self._tick_interval = tick_interval
+        self._tick_budget = tick_budget
+        # (due time, sequence, runnable, started), the sequence keeps the order of the runnables due at the same time
+        self._queue: List[Tuple[float, int, "RunnableBase", bool]] = []
+        self._sequence = itertools.count()
+        self._in_flight: Dict["RunnableBase", asyncio.Task] = {}
+        self._metrics: Dict[str, ExecutorTypeMetrics] = defaultdict(ExecutorTypeMetrics)
+        self._tick_task: Optional[asyncio.Task] = None
+        self.ticks = 0
+        self.budget_exceeded_ticks = 0
+
+    @property
+    def metrics(self) -> Dict[str, ExecutorTypeMetrics]:
+        """
+        The metrics of the control tasks by executor class name.
+        """
+        return self._metrics
+
+    @property
+    def runnables_count(self) -> int:
+        return len(self._queue) + len(self._in_flight)
+
+    def add(self, runnable: "RunnableBase"):
+        """
+        Runs the on_start of the runnable on the next tick, and then its control task every update_interval seconds
+        until it is terminated. Replaces RunnableBase.control_loop.
+        """
+        heapq.heappush(self._queue, (time.perf_counter(), next(self._sequence), runnable, False))
+        if self._tick_task is None:
+            self._tick_task = safe_ensure_future(self._tick_loop())
+
+    def runnable_stopped(self, runnable: "RunnableBase"):
+        """
+        Called by RunnableBase.stop. A runnable waiting for its next run leaves the scheduler and its on_stop runs right
+        away. A runnable running a step, or that has not run its on_start yet, stops as soon as that step finishes.
+        """
+        if runnable in self._in_flight:
+            return
+        for index, (_, _, queued_runnable, started) in enumerate(self._queue):
+            if queued_runnable is runnable:
+                if started:
+                    self._queue.pop(index)
+                    heapq.heapify(self._queue)
+                    self._stop_runnable(runnable)
+                return
+
+    async def _tick_loop(self):
+        try:
+            while len(self._queue) > 0 or len(self._in_flight) > 0:
+                self.run_tick()
+                await asyncio.sleep(self._tick_interval)
+        finally:
+            self._tick_task = None
+
+    def run_tick(self):
+        tick_start = time.perf_counter()
+        self.ticks += 1
+        while len(self._queue) > 0 and self._queue[0][0] <= tick_start:
+            due, _, runnable, started = heapq.heappop(self._queue)
+            if not started:
+                self._run_step(runnable, runnable.on_start(), due, is_control_task=False)
+            elif runnable.terminated.is_set():
+                self._stop_runnable(runnable)
+            else:
+                self._run_step(runnable, runnable.control_task(), due, is_control_task=True)
+            if time.perf_counter() - tick_start > self._tick_budget:
+                self._defer_due_runs(tick_start)
+                break
+
+    def _defer_due_runs(self, tick_start: float):
+        deferred = False
+        for due, _, runnable, _ in self._queue:
+            if due <= tick_start:
+                self._metrics[type(runnable).__name__].deferred_runs += 1
+                deferred = True
+        self.budget_exceeded_ticks += int(deferred)
+
+    def _run_step(self, runnable: "RunnableBase", coro: Coroutine, due: float, is_control_task: bool):
+        start = time.perf_counter()
+        if is_control_task:
+            self._metrics[type(runnable).__name__].lag_ms.append((start - due) * 1e3)
+        try:
+            awaited = coro.send(None)
+        except StopIteration:
+            self._finish_step(runnable, due, start, is_control_task, failed=False)
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
+            self._finish_step(runnable, due, start, is_control_task, failed=True)
+        else:
+            self._in_flight[runnable] = safe_ensure_future(
+                self._await_step(runnable, coro, awaited, due, start, is_control_task))
+
+    async def _await_step(self, runnable: "RunnableBase", coro: Coroutine, awaited: Any, due: float, start: float,
+                          is_control_task: bool):
+        failed = False
+        try:
+            await _resume(coro, awaited)
+        except asyncio.CancelledError:
+            self._in_flight.pop(runnable, None)
+            raise
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
+            failed = True
+        self._in_flight.pop(runnable, None)
+        self._finish_step(runnable, due, start, is_control_task, failed)
+
+    def _finish_step(self, runnable: "RunnableBase", due: float, start: float, is_control_task: bool, failed: bool):
+        now = time.perf_counter()
+        if is_control_task:
+            metrics = self._metrics[type(runnable).__name__]
+            metrics.runs += 1
+            metrics.errors += int(failed)
+            metrics.control_task_ms.append((now - start) * 1e3)
+        elif failed:
+            return
+        if runnable.terminated.is_set():
+            self._stop_runnable(runnable)
+        elif is_control_task:
+            heapq.heappush(self._queue, (now + runnable.update_interval, next(self._sequence), runnable, True))
+        else:
+            # The first control task runs right after on_start, in the same tick when on_start did not have to wait
+            heapq.heappush(self._queue, (min(due, now), next(self._sequence), runnable, True))
+
+    def _stop_runnable(self, runnable: "RunnableBase"):
+        try:
+            runnable.on_stop()
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
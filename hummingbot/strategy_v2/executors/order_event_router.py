@@ -0,0 +1,84 @@
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+class OrderEventRouter:
+    """
+    Delivers the order events of the connectors to the executor that placed the order, instead of to every executor.
+
+    The router adds a single listener per order event to each connector used by its executors, and keeps the
+    executors indexed by the client order ids they place. The events of orders not placed by an executor of the
+    router, like the orders placed directly by the strategy, are delivered to all the executors of the connector, as
+    they were when each executor listened to the connector events.
+    """
+
+    ORDER_EVENTS: Tuple[MarketEvent, ...] = (
+        MarketEvent.OrderCancelled,
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.OrderFilled,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+        MarketEvent.OrderFailure,
+    )
+
+    def __init__(self):
+        self._executors_by_order_id: Dict[str, "ExecutorBase"] = {}
+        self._order_ids_by_executor: Dict[str, List[str]] = {}
+        # Executors listening to each connector, by executor id
+        self._connector_executors: Dict[ConnectorBase, Dict[str, "ExecutorBase"]] = {}
+        self._event_forwarder = SourceInfoEventForwarder(self._route_event)
+
+    @property
+    def executors_by_order_id(self) -> Dict[str, "ExecutorBase"]:
+        return self._executors_by_order_id
+
+    def add_executor(self, executor: "ExecutorBase"):
+        """
+        Starts delivering to the executor the events of its connectors. Replaces ExecutorBase.register_events.
+        """
+        for connector in executor.connectors.values():
+            connector_executors = self._connector_executors.get(connector)
+            if connector_executors is None:
+                connector_executors = self._connector_executors[connector] = {}
+                for event in self.ORDER_EVENTS:
+                    connector.add_listener(event, self._event_forwarder)
+            connector_executors[executor.config.id] = executor
+        self._order_ids_by_executor.setdefault(executor.config.id, [])
+
+    def remove_executor(self, executor: "ExecutorBase"):
+        """
+        Stops delivering events to the executor, and removes the listeners of the connectors no executor uses.
+        """
+        for order_id in self._order_ids_by_executor.pop(executor.config.id, []):
+            self._executors_by_order_id.pop(order_id, None)
+        for connector in executor.connectors.values():
+            connector_executors = self._connector_executors.get(connector)
+            if connector_executors is None:
+                continue
+            connector_executors.pop(executor.config.id, None)
+            if len(connector_executors) == 0:
+                del self._connector_executors[connector]
+                for event in self.ORDER_EVENTS:
+                    connector.remove_listener(event, self._event_forwarder)
+
+    def add_order(self, order_id: str, executor: "ExecutorBase"):
+        """
+        Routes the events of the order to the executor that placed it.
+        """
+        self._executors_by_order_id[order_id] = executor
+        self._order_ids_by_executor.setdefault(executor.config.id, []).append(order_id)
+
+    def _route_event(self, event_tag: int, market: ConnectorBase, event: any):
+        executor = self._executors_by_order_id.get(event.order_id)
+        if executor is not None:
+            executor.process_order_event(event_tag, market, event)
+        else:
+            for executor in list(self._connector_executors.get(market, {}).values()):
+                executor.process_order_event(event_tag, market, event)
@@ -128,6 +128,8 @@ class XEMMExecutor(ExecutorBase):
         if self.status == RunnableStatus.RUNNING:
             await self.update_prices_and_tx_costs()
             await self.control_maker_order()
+            # The taker prices and profitability in the custom info do not go through get_price
+            self.mark_executor_info_changed()
         elif self.status == RunnableStatus.SHUTTING_DOWN:
             await self.control_shutdown_process()
 
@@ -1,11 +1,15 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+
 
 class RunnableBase(ABC):
     """
@@ -29,6 +33,8 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        # When set, the scheduler runs the control task instead of a control loop task of the component
+        self.scheduler: Optional["ExecutorScheduler"] = None
 
     @property
     def status(self):
@@ -42,12 +48,16 @@ class RunnableBase(ABC):
     def start(self):
         """
         Start the control loop of the smart component.
-        If the component is not already started, it will start the control loop.
+        If the component is not already started, it will start the control loop, or add the component to its
+        scheduler if it has one.
         """
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            if self.scheduler is not None:
+                self.scheduler.add(self)
+            else:
+                safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
@@ -57,6 +67,8 @@ class RunnableBase(ABC):
         if self._status != RunnableStatus.TERMINATED:
             self._status = RunnableStatus.TERMINATED
             self.terminated.set()
+            if self.scheduler is not None:
+                self.scheduler.runnable_stopped(self)
 
     async def control_loop(self):
         """
@@ -43,11 +43,11 @@ class DownloadTradesAndOrderBookSnapshots(ScriptStrategyBase):
 
     def get_order_book_dict(self, exchange: str, trading_pair: str, depth: int = 50):
         order_book = self.connectors[exchange].get_order_book(trading_pair)
-        snapshot = order_book.snapshot
+        bids, asks = order_book.top_n(depth)
         return {
             "ts": self.current_timestamp,
-            "bids": snapshot[0].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
-            "asks": snapshot[1].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
+            "bids": [[price, amount] for price, amount, _ in bids.tolist()],
+            "asks": [[price, amount] for price, amount, _ in asks.tolist()],
         }
 
     def dump_and_clean_temp_storage(self):
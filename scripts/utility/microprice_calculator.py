@@ -103,12 +103,12 @@ class MicropricePMM(ScriptStrategyBase):
         return f'{self.path_to_data}/microprice_{self.trading_pair}_{self.exchange}_{datetime.datetime.now().strftime("%Y-%m-%d")}.csv'
 
     def get_bid_ask(self):
-        bids, asks = self.connectors[self.exchange].get_order_book(self.trading_pair).snapshot
+        bids, asks = self.connectors[self.exchange].get_order_book(self.trading_pair).top_n(1)
         # if size > 0, return average of range
-        best_ask = asks.iloc[0].price
-        ask_volume = asks.iloc[0].amount
-        best_bid = bids.iloc[0].price
-        bid_volume = bids.iloc[0].amount
+        best_ask = asks[0]["price"]
+        ask_volume = asks[0]["amount"]
+        best_bid = bids[0]["price"]
+        bid_volume = bids[0]["amount"]
         return {'bid': best_bid, 'ask': best_ask, 'bs': bid_volume, 'as': ask_volume}
 
     # ! Microprice methods
@@ -89,6 +89,7 @@ def main():
         "prompt-toolkit",
         "protobuf",
         "psutil",
+        "pyarrow",
         "pydantic",
         "pyjwt",
         "pyperclip",
@@ -0,0 +1,65 @@
+"""
+Microbenchmark of the throttler engines when a connector bursts through order placements and cancels.
+
+Every request is checked against an "orders" or "cancels" limit, both linked to a shared per-second pool limit, so each
+request touches two windows. The time is frozen while the burst is being measured, so the logged requests pile up in
+the window and the cost of a capacity check grows with the requests made in the last time interval.
+
+Usage:
+    python -m test.benchmark.benchmark_async_throttler --requests 100 1000 5000
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+POOL_LIMIT_ID = "pool"
+
+
+def build_rate_limits(requests: int) -> List[RateLimit]:
+    # Limits high enough for the whole burst to fit, the benchmark measures the bookkeeping cost only
+    return [
+        RateLimit(limit_id=POOL_LIMIT_ID, limit=requests * 2, time_interval=60),
+        RateLimit(limit_id="orders", limit=requests * 2, time_interval=10,
+                  linked_limits=[LinkedLimitWeightPair(POOL_LIMIT_ID)]),
+        RateLimit(limit_id="cancels", limit=requests * 2, time_interval=10,
+                  linked_limits=[LinkedLimitWeightPair(POOL_LIMIT_ID)]),
+    ]
+
+
+async def burst(throttler: AsyncThrottlerBase, requests: int):
+    for index in range(requests):
+        async with throttler.execute_task(limit_id="orders" if index % 2 == 0 else "cancels"):
+            pass
+
+
+def measure(throttler_class, requests: int) -> float:
+    throttler = throttler_class(rate_limits=build_rate_limits(requests))
+    frozen_time = time.time()
+    with patch("time.time", return_value=frozen_time):
+        start = time.perf_counter()
+        asyncio.run(burst(throttler, requests))
+        return time.perf_counter() - start
+
+
+def main(args: argparse.Namespace):
+    print(f"{'requests':>10} {'AsyncThrottler':>20} {'SlidingWindowThrottler':>24} {'speedup':>10}")
+    for requests in args.requests:
+        list_elapsed = measure(AsyncThrottler, requests)
+        window_elapsed = measure(SlidingWindowThrottler, requests)
+        print(f"{requests:>10} "
+              f"{list_elapsed * 1e6 / requests:>15.1f} us/req "
+              f"{window_elapsed * 1e6 / requests:>19.1f} us/req "
+              f"{list_elapsed / window_elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, nargs="+", default=[100, 1000, 3000])
+    main(parser.parse_args())
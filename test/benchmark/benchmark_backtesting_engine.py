@@ -0,0 +1,81 @@
+"""
+Wall time benchmark of the row by row and the vectorized simulations of BacktestingEngineBase.
+
+Runs a controller that opens position executors following a synthetic signal over synthetic 1m candles, and checks
+that both simulations return the same executors.
+
+Usage:
+    python -m test.benchmark.benchmark_backtesting_engine --days 365 --executor position
+"""
+import argparse
+import asyncio
+import time
+from test.hummingbot.strategy_v2.backtesting.test_backtesting_engine_base import SignalController
+from typing import List, Optional
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+
+def synthetic_market_data(days: int, seed: int = 42):
+    rows = days * 24 * 60
+    rng = np.random.default_rng(seed)
+    close = np.round(2000 * np.exp(np.cumsum(rng.normal(0, 0.001, rows))), 2)
+    spread = np.round(np.abs(rng.normal(0, 0.5, rows)), 2)
+    candles = pd.DataFrame({
+        "timestamp": 1672531200.0 + 60.0 * np.arange(rows),
+        "open": close,
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": 1.0,
+    })
+    # Signal regimes of 1 minute to 2 hours
+    durations = rng.integers(1, 120, size=rows // 30)
+    signal = np.repeat(rng.choice([-1, 0, 0, 1], size=len(durations)), durations)
+    signal = np.resize(signal, rows)
+    features = pd.DataFrame({"timestamp": candles["timestamp"], "signal": signal})
+    return candles, features
+
+
+async def run(candles: pd.DataFrame, features: pd.DataFrame, use_dca: bool, vectorized: bool,
+              decision_columns: Optional[List[str]] = None):
+    # The connectors of the data provider are not needed to simulate the executors
+    with patch("hummingbot.strategy_v2.backtesting.backtesting_engine_base.BacktestingDataProvider", MagicMock()):
+        engine = BacktestingEngineBase(vectorized=vectorized, decision_columns=decision_columns)
+    engine.backtesting_resolution = "1m"
+    engine.controller = SignalController(candles, features.copy(), use_dca=use_dca)
+    start = time.perf_counter()
+    if vectorized:
+        executors_info = await engine.simulate_execution_vectorized(trade_cost=0.0006)
+    else:
+        executors_info = await engine.simulate_execution(trade_cost=0.0006)
+    return time.perf_counter() - start, executors_info
+
+
+async def main(args: argparse.Namespace):
+    candles, features = synthetic_market_data(args.days)
+    use_dca = args.executor == "dca"
+    print(f"{len(candles)} candles, {args.executor} executors")
+    vectorized_time, vectorized_info = await run(candles, features, use_dca, vectorized=True)
+    print(f"vectorized:                        {vectorized_time:9.2f}s  {len(vectorized_info)} executors")
+    skipping_time, skipping_info = await run(candles, features, use_dca, vectorized=True, decision_columns=["signal"])
+    print(f"vectorized, decision columns:      {skipping_time:9.2f}s  {len(skipping_info)} executors")
+    if not args.skip_row_by_row:
+        row_by_row_time, row_by_row_info = await run(candles, features, use_dca, vectorized=False)
+        print(f"row by row:                        {row_by_row_time:9.2f}s  {len(row_by_row_info)} executors")
+        print(f"speedup: {row_by_row_time / vectorized_time:.1f}x, "
+              f"{row_by_row_time / skipping_time:.1f}x with decision columns")
+        print(f"same executors: {row_by_row_info == vectorized_info == skipping_info}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--executor", choices=["position", "dca"], default="position")
+    parser.add_argument("--skip-row-by-row", action="store_true",
+                        help="Only run the vectorized simulation, the row by row one takes minutes for a year")
+    asyncio.run(main(parser.parse_args()))
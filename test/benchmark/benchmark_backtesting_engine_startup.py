@@ -0,0 +1,65 @@
+"""
+Startup time and memory benchmark of BacktestingEngineBase.
+
+Compares creating the engine, whose data provider creates the connectors on first use, with creating every connector
+supported for backtesting, like the data provider did before. The gateway client is replaced by a mock: it is a
+singleton created once per process, so it is not part of the cost of creating engines.
+
+Usage:
+    python -m test.benchmark.benchmark_backtesting_engine_startup --engines 20
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Tuple
+from unittest.mock import patch
+
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+
+def measure(create: Callable, engines: int) -> Tuple[float, float]:
+    """
+    Returns the mean seconds and the MB allocated to create an engine.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    created = [create() for _ in range(engines)]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del created
+    return elapsed / engines, peak / engines / 1e6
+
+
+def create_engine_with_all_connectors() -> BacktestingEngineBase:
+    engine = BacktestingEngineBase()
+    data_provider = engine.backtesting_data_provider
+    for connector_name in data_provider.conn_settings:
+        if data_provider.is_backtesting_connector(connector_name):
+            try:
+                data_provider.get_connector(connector_name)
+            except Exception as e:
+                print(f"Skipping {connector_name}: {e}")
+    return engine
+
+
+def main(args: argparse.Namespace):
+    # Loaded once per process in both cases
+    AllConnectorSettings.get_connector_settings()
+    with patch("hummingbot.data_feed.market_data_provider.GatewayHttpClient"):
+        lazy_time, lazy_memory = measure(BacktestingEngineBase, args.engines)
+        data_provider = BacktestingDataProvider(connectors={})
+        connectors = len([name for name in data_provider.conn_settings if data_provider.is_backtesting_connector(name)])
+        eager_time, eager_memory = measure(create_engine_with_all_connectors, max(1, args.engines // 10))
+
+    print(f"{'mode':<24}{'seconds/engine':>16}{'MB/engine':>12}")
+    print(f"{'lazy connectors':<24}{lazy_time:>16.4f}{lazy_memory:>12.2f}")
+    print(f"{f'all {connectors} connectors':<24}{eager_time:>16.4f}{eager_memory:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--engines", type=int, default=20, help="Engines created in each mode.")
+    main(parser.parse_args())
@@ -0,0 +1,60 @@
+"""
+Microbenchmark of the access to the candles through MarketDataProvider.get_candles_df, like the controllers do on
+every tick.
+
+Fills a candles feed with the given number of records, without starting it, and measures get_candles_df for all the
+records when the candles did not change and when the last candle was updated with a new close price before each call,
+like a candles feed does with the websocket messages.
+
+Usage:
+    python -m test.benchmark.benchmark_candles_df --records 150 1000 10000 --calls 200
+"""
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+
+
+def measure(action: Callable[[], object], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        action()
+    return (time.perf_counter() - start) * 1e6 / calls
+
+
+def main(args: argparse.Namespace):
+    print(f"{'records':>8} {'unchanged us':>13} {'last candle updated us':>23}")
+    for records in args.records:
+        config = CandlesConfig(connector="binance", trading_pair="ETH-USDT", interval="1m", max_records=records)
+        market_data_provider = MarketDataProvider(connectors={})
+        candles = CandlesFactory.get_candle(config)
+        market_data_provider.candles_feeds[market_data_provider._generate_candle_feed_key(config)] = candles
+        rng = np.random.default_rng(0)
+        close = 100 + np.cumsum(rng.normal(0, 1, records))
+        candles._candles.extend(np.column_stack([1700000000 + 60 * np.arange(records), close, close + 1, close - 1,
+                                                 close, np.full((records, 5), 10.0)]))
+        last_candle = candles._candles[-1]
+
+        def get_candles_df():
+            return market_data_provider.get_candles_df("binance", "ETH-USDT", "1m", max_records=records)
+
+        def update_last_candle_and_get_candles_df():
+            last_candle[4] += 0.01
+            candles._candles.update_last(last_candle)
+            return get_candles_df()
+
+        assert len(get_candles_df()) == records
+        print(f"{records:>8} {measure(get_candles_df, args.calls):>13.1f} "
+              f"{measure(update_last_candle_and_get_candles_df, args.calls):>23.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, nargs="+", default=[150, 1000, 10000])
+    parser.add_argument("--calls", type=int, default=200)
+    main(parser.parse_args())
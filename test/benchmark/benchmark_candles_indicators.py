@@ -0,0 +1,116 @@
+"""
+Benchmark of the CPU time per tick of the indicators of the candles-based controllers.
+
+On each tick the last candle is updated with a new close price, like a candles feed does with the websocket messages,
+and the indicators of a controller are computed: with pandas_ta over the candles DataFrame, like the controllers do in
+update_processed_data, and with an IndicatorPipeline updated with the last candle.
+
+Usage:
+    python -m test.benchmark.benchmark_candles_indicators --records 500 --ticks 200
+"""
+import argparse
+import time
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta  # noqa: F401
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.indicators import (
+    ATR,
+    EMA,
+    MACD,
+    NATR,
+    BBands,
+    CandlesIndicator,
+    Donchian,
+    IndicatorPipeline,
+    SuperTrend,
+)
+
+
+def bollinger(df: pd.DataFrame):
+    df.ta.bbands(length=100, std=2.0, append=True)
+
+
+def macd_bb(df: pd.DataFrame):
+    df.ta.bbands(length=100, std=2.0, append=True)
+    df.ta.macd(fast=21, slow=42, signal=9, append=True)
+
+
+def smugplug(df: pd.DataFrame):
+    df.ta.macd(fast=21, slow=42, signal=9, append=True)
+    df.ta.atr(length=11, append=True)
+    df.ta.ema(length=8, append=True)
+    df.ta.ema(length=29, append=True)
+    df.ta.ema(length=31, append=True)
+
+
+def xgridt(df: pd.DataFrame):
+    df.ta.ema(length=8, append=True)
+    df.ta.ema(length=29, append=True)
+    df.ta.ema(length=31, append=True)
+    df.ta.donchian(lower_length=100, upper_length=100, append=True)
+    df.ta.natr(length=100, append=True)
+
+
+def supertrend(df: pd.DataFrame):
+    df.ta.supertrend(length=20, multiplier=4.0, append=True)
+
+
+CONTROLLERS: Dict[str, Tuple[Callable[[pd.DataFrame], None], Callable[[], List[CandlesIndicator]]]] = {
+    "bollinger_v1": (bollinger, lambda: [BBands(length=100, std=2.0)]),
+    "macd_bb_v1": (macd_bb, lambda: [BBands(length=100, std=2.0), MACD(fast=21, slow=42, signal=9)]),
+    "smugplug": (smugplug, lambda: [MACD(fast=21, slow=42, signal=9), ATR(11), EMA(8), EMA(29), EMA(31)]),
+    "xgridt": (xgridt, lambda: [EMA(8), EMA(29), EMA(31), Donchian(lower_length=100, upper_length=100), NATR(100)]),
+    "supertrend_v1": (supertrend, lambda: [SuperTrend(length=20, multiplier=4.0)]),
+}
+
+
+def build_candles(records: int) -> deque:
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, records))
+    candles = deque(maxlen=records)
+    for index in range(records):
+        candles.append(np.array([1700000000 + 60 * index, close[index], close[index] + 1, close[index] - 1,
+                                 close[index], 10, 1000, 10, 5, 500], dtype=float))
+    return candles
+
+
+def measure(tick: Callable[[float], None], ticks: int) -> float:
+    rng = np.random.default_rng(1)
+    prices = 100 + rng.normal(0, 1, ticks)
+    start = time.process_time()
+    for price in prices:
+        tick(price)
+    return (time.process_time() - start) * 1e6 / ticks
+
+
+def main(args: argparse.Namespace):
+    print(f"{'controller':>14} {'pandas_ta us/tick':>18} {'pipeline us/tick':>17} {'speedup':>8}")
+    for name, (compute_df, indicators) in CONTROLLERS.items():
+        candles = build_candles(args.records)
+        pipeline = IndicatorPipeline(indicators(), max_records=args.records)
+        pipeline.update_candles(candles)
+
+        def full_tick(price: float):
+            candles[-1][4] = price
+            compute_df(pd.DataFrame(candles, columns=CandlesBase.columns, dtype=float))
+
+        def incremental_tick(price: float):
+            candles[-1][4] = price
+            pipeline.update(candles[-1])
+            pipeline.latest
+
+        full = measure(full_tick, args.ticks)
+        incremental = measure(incremental_tick, args.ticks)
+        print(f"{name:>14} {full:>18.1f} {incremental:>17.1f} {full / incremental:>7.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=500, help="candles in the feed")
+    parser.add_argument("--ticks", type=int, default=200)
+    main(parser.parse_args())
@@ -0,0 +1,95 @@
+"""
+Microbenchmark of the delivery of the connector order events to the strategy_v2 executors.
+
+Each executor places a few orders and, like the grid and position executors, looks up the order id of every event it
+receives among its own orders. Without the router every executor listens to the connector events; with the router the
+events are delivered only to the executor that placed the order.
+
+Usage:
+    python -m test.benchmark.benchmark_executor_order_events --executors 10 100 300 --events 5000
+"""
+import argparse
+import time
+from decimal import Decimal
+from typing import Optional
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
+
+ORDERS_PER_EXECUTOR = 4
+
+
+class OrderTrackingExecutor(ExecutorBase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.order_ids = []
+        self.filled_amount = Decimal("0")
+
+    def process_order_filled_event(self, event_tag, market, event: OrderFilledEvent):
+        if event.order_id in self.order_ids:
+            self.filled_amount += event.amount
+
+
+def build_executors(executors: int, router: Optional[OrderEventRouter]):
+    connector = PubSub()
+    strategy = MagicMock(spec=ScriptStrategyBase)
+    strategy.connectors = {"connector": connector}
+    strategy.buy.side_effect = (f"OID-{index}" for index in range(executors * ORDERS_PER_EXECUTOR))
+    executors_list = []
+    order_ids = []
+    for index in range(executors):
+        executor = OrderTrackingExecutor(strategy=strategy,
+                                         connectors=["connector"],
+                                         config=ExecutorConfigBase(id=f"executor{index}", type="test", timestamp=0))
+        executor.order_event_router = router
+        executor.register_events()
+        executors_list.append(executor)
+        for _ in range(ORDERS_PER_EXECUTOR):
+            order_id = executor.place_order("connector", "ETH-USDT", OrderType.LIMIT, TradeType.BUY, Decimal("1"),
+                                            price=Decimal("1000"))
+            executor.order_ids.append(order_id)
+            order_ids.append(order_id)
+    # The connector holds weak references to the listeners, the executors have to be kept alive
+    return connector, executors_list, order_ids
+
+
+def measure(executors: int, events: int, router: Optional[OrderEventRouter]) -> float:
+    connector, executors_list, order_ids = build_executors(executors, router)
+    fills = [OrderFilledEvent(timestamp=0,
+                              order_id=order_ids[index % len(order_ids)],
+                              trading_pair="ETH-USDT",
+                              trade_type=TradeType.BUY,
+                              order_type=OrderType.LIMIT,
+                              price=Decimal("1000"),
+                              amount=Decimal("0.01"),
+                              trade_fee=AddedToCostTradeFee())
+             for index in range(events)]
+    start = time.perf_counter()
+    for fill in fills:
+        connector.trigger_event(MarketEvent.OrderFilled, fill)
+    elapsed = time.perf_counter() - start
+    assert sum(executor.filled_amount for executor in executors_list) == Decimal("0.01") * events
+    return elapsed * 1e6 / events
+
+
+def main(args: argparse.Namespace):
+    print(f"{'executors':>10} {'broadcast us/event':>19} {'routed us/event':>16} {'speedup':>8}")
+    for executors in args.executors:
+        broadcast = measure(executors, args.events, router=None)
+        routed = measure(executors, args.events, router=OrderEventRouter())
+        print(f"{executors:>10} {broadcast:>19.1f} {routed:>16.1f} {broadcast / routed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--executors", type=int, nargs="+", default=[10, 100, 300])
+    parser.add_argument("--events", type=int, default=5000)
+    main(parser.parse_args())
@@ -0,0 +1,70 @@
+"""
+Benchmark of running the control tasks of many executors with a control loop task per executor and with the
+ExecutorScheduler.
+
+Each runnable has a short control task that does not wait, like most runs of the position, DCA and grid executors,
+and records how late it started after its update interval. The CPU time of the process is divided by the control
+tasks that ran.
+
+Usage:
+    python -m test.benchmark.benchmark_executor_scheduler --executors 100 500 2000 --seconds 5
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class TimedRunnable(RunnableBase):
+
+    def __init__(self, update_interval: float):
+        super().__init__(update_interval)
+        self.last_end: Optional[float] = None
+        self.lags_ms: List[float] = []
+
+    async def control_task(self):
+        start = time.perf_counter()
+        if self.last_end is not None:
+            self.lags_ms.append((start - self.last_end - self.update_interval) * 1e3)
+        sum(range(100))
+        self.last_end = time.perf_counter()
+
+
+async def run(executors: int, seconds: float, update_interval: float, scheduler: Optional[ExecutorScheduler]):
+    runnables = [TimedRunnable(update_interval) for _ in range(executors)]
+    cpu_start = time.process_time()
+    for runnable in runnables:
+        runnable.scheduler = scheduler
+        runnable.start()
+    await asyncio.sleep(seconds)
+    cpu = time.process_time() - cpu_start
+    for runnable in runnables:
+        runnable.stop()
+    await asyncio.sleep(update_interval * 2)
+    lags = np.concatenate([runnable.lags_ms for runnable in runnables])
+    control_tasks = len(lags) + executors
+    return cpu * 1e6 / control_tasks, np.percentile(lags, 50), np.percentile(lags, 99), lags.max()
+
+
+def main(args: argparse.Namespace):
+    print(f"{'executors':>10} {'mode':>10} {'cpu us/task':>12} {'lag p50 ms':>11} {'lag p99 ms':>11} "
+          f"{'lag max ms':>11}")
+    for executors in args.executors:
+        for mode in ("loops", "scheduler"):
+            scheduler = ExecutorScheduler(tick_interval=args.tick_interval) if mode == "scheduler" else None
+            cpu, p50, p99, lag_max = asyncio.run(run(executors, args.seconds, args.update_interval, scheduler))
+            print(f"{executors:>10} {mode:>10} {cpu:>12.1f} {p50:>11.1f} {p99:>11.1f} {lag_max:>11.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--executors", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--update-interval", type=float, default=0.5)
+    parser.add_argument("--tick-interval", type=float, default=0.1)
+    main(parser.parse_args())
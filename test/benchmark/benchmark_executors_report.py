@@ -0,0 +1,80 @@
+"""
+Microbenchmark of the executors report that the strategy_v2 strategies read on every tick.
+
+Creates position executors through the ExecutorOrchestrator, without starting them, and measures
+get_executors_report when no executor changed and when the price of a share of them moved, and the stop executor
+action on the last executor created.
+
+Usage:
+    python -m test.benchmark.benchmark_executors_report --executors 100 1000 --reports 50
+"""
+import argparse
+import time
+from decimal import Decimal
+from typing import Callable
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.executor_orchestrator import ExecutorOrchestrator
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+
+
+def build_orchestrator(executors: int) -> ExecutorOrchestrator:
+    strategy = MagicMock(spec=ScriptStrategyBase)
+    strategy.current_timestamp = 1234
+    connector = MagicMock(spec=ExchangePyBase)
+    type(connector).trading_rules = PropertyMock(return_value={"ETH-USDT": TradingRule(trading_pair="ETH-USDT")})
+    connector.get_price_by_type.return_value = Decimal("100")
+    strategy.connectors = {"binance": connector}
+    with patch.object(MarketsRecorder, "get_instance"):
+        orchestrator = ExecutorOrchestrator(strategy=strategy)
+    orchestrator.execute_actions([
+        CreateExecutorAction(controller_id="main", executor_config=PositionExecutorConfig(
+            timestamp=1234, connector_name="binance", trading_pair="ETH-USDT", side=TradeType.BUY,
+            entry_price=Decimal(100), amount=Decimal(10)))
+        for _ in range(executors)])
+    return orchestrator
+
+
+def measure(action: Callable[[], object], repetitions: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        action()
+    return (time.perf_counter() - start) * 1e6 / repetitions
+
+
+def main(args: argparse.Namespace):
+    print(f"{'executors':>10} {'report unchanged us':>20} {'report 10% moved us':>20} {'stop executor us':>17}")
+    with patch.object(PositionExecutor, "start"):
+        for executors in args.executors:
+            orchestrator = build_orchestrator(executors)
+            active_executors = orchestrator.active_executors["main"]
+            moved = active_executors[:max(1, executors // 10)]
+            orchestrator.get_executors_report()
+
+            def report_with_moved_prices():
+                for executor in moved:
+                    executor._last_prices = {}
+                    executor.get_price("binance", "ETH-USDT")
+                orchestrator.get_executors_report()
+
+            stop_action = StopExecutorAction(controller_id="main", executor_id=active_executors[-1].config.id)
+            with patch.object(PositionExecutor, "early_stop"):
+                stop = measure(lambda: orchestrator.stop_executor(stop_action), args.reports * 100)
+            print(f"{executors:>10} "
+                  f"{measure(orchestrator.get_executors_report, args.reports):>20.1f} "
+                  f"{measure(report_with_moved_prices, args.reports):>20.1f} "
+                  f"{stop:>17.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--executors", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--reports", type=int, default=50)
+    main(parser.parse_args())
@@ -0,0 +1,94 @@
+"""
+Microbenchmark of the CPU time spent per order book diff message, from the exchange payload to the updated order book.
+
+The messages are Binance depth updates with string prices and amounts. The row path keeps the price levels as lists in
+the message content and builds an OrderBookRow per level before applying the diff, like the diff messages did before
+they were parsed into numpy arrays. The array path parses the payload with BinanceOrderBook.diff_message_from_exchange
+and applies the arrays directly.
+
+Usage:
+    python -m test.benchmark.benchmark_order_book_diff_messages --levels 5 20 100 --messages 20000
+"""
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def build_payloads(levels: int, messages: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    payloads = []
+    for index in range(messages):
+        update_id = index + 2
+        payloads.append({
+            "e": "depthUpdate",
+            "E": 1640000000000 + index,
+            "s": "COINALPHAHBOT",
+            "U": update_id,
+            "u": update_id,
+            "b": [[f"{100 - rng.randint(1, 500) / 100:.8f}", f"{rng.randint(0, 1000) / 10:.8f}"]
+                  for _ in range(levels)],
+            "a": [[f"{100 + rng.randint(1, 500) / 100:.8f}", f"{rng.randint(0, 1000) / 10:.8f}"]
+                  for _ in range(levels)],
+        })
+    return payloads
+
+
+def build_order_book() -> OrderBook:
+    order_book = OrderBook()
+    bids = np.array([[100 - step / 100, 10, 1] for step in range(1, 501)], dtype=np.float64)
+    asks = np.array([[100 + step / 100, 10, 1] for step in range(1, 501)], dtype=np.float64)
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def measure_rows(payloads: List[Dict[str, Any]]) -> float:
+    order_book = build_order_book()
+    start = time.perf_counter()
+    for msg in payloads:
+        message = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": TRADING_PAIR,
+            "first_update_id": msg["U"],
+            "update_id": msg["u"],
+            "bids": msg["b"],
+            "asks": msg["a"]
+        }, timestamp=msg["E"] * 1e-3)
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+    return time.perf_counter() - start
+
+
+def measure_arrays(payloads: List[Dict[str, Any]]) -> float:
+    order_book = build_order_book()
+    metadata = {"trading_pair": TRADING_PAIR}
+    start = time.perf_counter()
+    for msg in payloads:
+        message = BinanceOrderBook.diff_message_from_exchange(msg, msg["E"] * 1e-3, metadata)
+        order_book.apply_numpy_diffs(message.content["bids"], message.content["asks"], message.update_id)
+    return time.perf_counter() - start
+
+
+def main(args: argparse.Namespace):
+    print(f"{'levels/side':>12} {'rows us/msg':>12} {'arrays us/msg':>14} {'speedup':>8}")
+    for levels in args.levels:
+        payloads = build_payloads(levels, args.messages)
+        rows_elapsed = measure_rows(payloads)
+        arrays_elapsed = measure_arrays(payloads)
+        print(f"{levels:>12} "
+              f"{rows_elapsed * 1e6 / args.messages:>12.2f} "
+              f"{arrays_elapsed * 1e6 / args.messages:>14.2f} "
+              f"{rows_elapsed / arrays_elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, nargs="+", default=[5, 20, 100])
+    parser.add_argument("--messages", type=int, default=20000)
+    main(parser.parse_args())
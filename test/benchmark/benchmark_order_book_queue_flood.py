@@ -0,0 +1,85 @@
+"""
+Stress test of the order book tracker queues under a flood of messages that the tracker does not consume, like when
+the event loop falls behind.
+
+A synthetic feed puts diff and trade messages in the tracker streams at the given rate, in bursts every 100 ms. The
+memory allocated since the start is printed every second, for the default queue limits and for queues large enough
+to never drop a message, like the unbounded queues the tracker used before.
+
+Usage:
+    python -m test.benchmark.benchmark_order_book_queue_flood --rate 10000 --seconds 10
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+TRADING_PAIR = "COINALPHA-HBOT"
+BURSTS_PER_SECOND = 10
+
+
+class IdleDataSource(OrderBookTrackerDataSource):
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+
+def diff_message(update_id: int) -> OrderBookMessage:
+    return OrderBookMessage(
+        message_type=OrderBookMessageType.DIFF,
+        content={
+            "trading_pair": TRADING_PAIR,
+            "update_id": update_id,
+            "bids": [["99.5", "1.25"], ["99.4", "0"]],
+            "asks": [["100.5", "3.5"]],
+        },
+        timestamp=time.time())
+
+
+async def flood(tracker: OrderBookTracker, rate: int, seconds: int) -> List[float]:
+    memory_per_second = []
+    update_id = 0
+    burst_size = rate // BURSTS_PER_SECOND
+    tracemalloc.start()
+    try:
+        for _ in range(seconds):
+            for _ in range(BURSTS_PER_SECOND):
+                for _ in range(burst_size):
+                    update_id += 1
+                    message = diff_message(update_id)
+                    if update_id % 2 == 0:
+                        tracker._order_book_diff_stream.put_nowait(message)
+                    else:
+                        tracker._order_book_trade_stream.put_nowait(message)
+                await asyncio.sleep(1 / BURSTS_PER_SECOND)
+            memory_per_second.append(tracemalloc.get_traced_memory()[0] / 1e6)
+    finally:
+        tracemalloc.stop()
+    return memory_per_second
+
+
+async def run(args: argparse.Namespace):
+    unbounded_limits = {"order_book_diff_stream": args.rate * args.seconds,
+                        "order_book_trade_stream": args.rate * args.seconds}
+    bounded = await flood(OrderBookTracker(IdleDataSource([TRADING_PAIR]), [TRADING_PAIR]), args.rate, args.seconds)
+    unbounded = await flood(OrderBookTracker(IdleDataSource([TRADING_PAIR]), [TRADING_PAIR], queue_limits=unbounded_limits),
+                            args.rate, args.seconds)
+    print(f"{'second':>7} {'bounded MB':>11} {'unbounded MB':>13}")
+    for second, (bounded_mb, unbounded_mb) in enumerate(zip(bounded, unbounded), start=1):
+        print(f"{second:>7} {bounded_mb:>11.1f} {unbounded_mb:>13.1f}")
+
+
+def main(args: argparse.Namespace):
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=10000, help="messages per second")
+    parser.add_argument("--seconds", type=int, default=10)
+    main(parser.parse_args())
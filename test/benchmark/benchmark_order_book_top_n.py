@@ -0,0 +1,61 @@
+"""
+Microbenchmark of the order book depth reads on a large book.
+
+Compares, for each depth, reading the rows of the whole book and slicing them like MarketsRecorder did, building the
+snapshot data frames and taking their first rows, and reading the structured arrays of OrderBook.top_n.
+
+Usage:
+    python -m test.benchmark.benchmark_order_book_top_n --levels 5000 --depths 5 20 0 --reads 2000
+"""
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def build_order_book(levels: int) -> OrderBook:
+    order_book = OrderBook()
+    bids = np.array([[10000 - step / 100, 1 + step % 7, 1] for step in range(1, levels + 1)], dtype=np.float64)
+    asks = np.array([[10000 + step / 100, 1 + step % 5, 1] for step in range(1, levels + 1)], dtype=np.float64)
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def measure(read: Callable[[], object], reads: int) -> float:
+    start = time.perf_counter()
+    for _ in range(reads):
+        read()
+    return (time.perf_counter() - start) * 1e6 / reads
+
+
+def main(args: argparse.Namespace):
+    order_book = build_order_book(args.levels)
+    print(f"{'depth':>6} {'rows us':>10} {'snapshot us':>12} {'top_n us':>10}")
+    for depth in args.depths:
+        depth = depth or args.levels
+
+        def read_rows():
+            return list(order_book.bid_entries())[:depth], list(order_book.ask_entries())[:depth]
+
+        def read_snapshot():
+            bids, asks = order_book.snapshot
+            return bids.head(depth), asks.head(depth)
+
+        def read_top_n():
+            return order_book.top_n(depth)
+
+        print(f"{depth:>6} "
+              f"{measure(read_rows, args.reads):>10.1f} "
+              f"{measure(read_snapshot, args.reads):>12.1f} "
+              f"{measure(read_top_n, args.reads):>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, default=5000, help="price levels on each side of the book")
+    parser.add_argument("--depths", type=int, nargs="+", default=[5, 20, 0], help="levels to read, 0 for all")
+    parser.add_argument("--reads", type=int, default=2000)
+    main(parser.parse_args())
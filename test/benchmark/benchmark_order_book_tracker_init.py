@@ -0,0 +1,88 @@
+"""
+Time-to-ready benchmark for OrderBookTracker initialization.
+
+Uses a mocked data source that simulates the REST latency of an order book snapshot request. Every snapshot request
+goes through an AsyncThrottler, like the connectors' data sources do, so the concurrent mode is measured under the same
+rate limits as the sequential one.
+
+Usage:
+    python -m test.benchmark.benchmark_order_book_tracker_init --pairs 80 --latency 0.2 --concurrency 1 5 10
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+SNAPSHOT_LIMIT_ID = "snapshot"
+
+
+class MockedLatencyDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str], latency: float, throttler: AsyncThrottler):
+        super().__init__(trading_pairs=trading_pairs)
+        self._latency = latency
+        self._throttler = throttler
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: 1.0 for trading_pair in trading_pairs}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        async with self._throttler.execute_task(limit_id=SNAPSHOT_LIMIT_ID):
+            await asyncio.sleep(self._latency)
+        levels = range(1, 101)
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "trading_pair": trading_pair,
+                "update_id": 1,
+                "bids": [[str(1000 - level), "1"] for level in levels],
+                "asks": [[str(1000 + level), "1"] for level in levels],
+            },
+            timestamp=time.time())
+
+
+async def measure_time_to_ready(pairs: int, latency: float, concurrency: Optional[int], rate_limit: int,
+                                sequential_delay: float) -> float:
+    trading_pairs = [f"COIN{i}-HBOT" for i in range(pairs)]
+    throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=SNAPSHOT_LIMIT_ID, limit=rate_limit, time_interval=1)])
+    data_source = MockedLatencyDataSource(trading_pairs=trading_pairs, latency=latency, throttler=throttler)
+    tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs, init_concurrency=concurrency)
+
+    async def _sleep(delay: float):
+        await asyncio.sleep(sequential_delay)
+
+    tracker._sleep = _sleep
+
+    start = time.perf_counter()
+    await tracker._init_order_books()
+    elapsed = time.perf_counter() - start
+    tracker.stop()
+    return elapsed
+
+
+async def main(args: argparse.Namespace):
+    print(f"{args.pairs} pairs, {args.latency * 1e3:.0f}ms snapshot latency, {args.rate_limit} snapshots/s limit")
+    elapsed = await measure_time_to_ready(
+        args.pairs, args.latency, None, args.rate_limit, args.sequential_delay)
+    print(f"sequential (delay {args.sequential_delay}s): {elapsed:8.3f}s to ready")
+    for concurrency in args.concurrency:
+        elapsed = await measure_time_to_ready(
+            args.pairs, args.latency, concurrency, args.rate_limit, args.sequential_delay)
+        print(f"concurrency {concurrency:>3}: {elapsed:8.3f}s to ready")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=80)
+    parser.add_argument("--latency", type=float, default=0.1, help="Simulated snapshot request latency in seconds")
+    parser.add_argument("--rate-limit", type=int, default=20, help="Snapshot requests allowed per second")
+    parser.add_argument("--sequential-delay", type=float, default=1.0,
+                        help="Delay between snapshots in the sequential mode (1 second in production)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 5, 10, 20])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,74 @@
+"""
+Microbenchmark of the limit order bookkeeping of the paper trade exchange with many resting orders, like a grid strategy.
+
+Each cycle places a limit order, reads the balances and the active orders the way a strategy tick does, and cancels the
+order. The resting orders are placed away from the order book so that none of them is filled.
+
+Usage:
+    python -m test.benchmark.benchmark_paper_trade_orders --resting-orders 100 1000 5000 --cycles 2000
+"""
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.common import OrderType
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def build_market(resting_orders: int) -> MockPaperExchange:
+    market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    market.set_balanced_order_book(TRADING_PAIR,
+                                   mid_price=100,
+                                   min_price=50,
+                                   max_price=150,
+                                   price_step_size=1,
+                                   volume_step_size=10)
+    market.set_quantization_param(QuantizationParams(TRADING_PAIR, 6, 6, 6, 6))
+    market.set_balance("COINALPHA", 1e9)
+    market.set_balance("HBOT", 1e12)
+    for index in range(resting_orders):
+        offset = Decimal(index) / Decimal(100)
+        if index % 2 == 0:
+            market.buy(TRADING_PAIR, Decimal("1"), OrderType.LIMIT, Decimal("40") - offset)
+        else:
+            market.sell(TRADING_PAIR, Decimal("1"), OrderType.LIMIT, Decimal("160") + offset)
+    return market
+
+
+def measure(market: MockPaperExchange, cycles: int) -> float:
+    start = time.perf_counter()
+    for index in range(cycles):
+        order_id = market.buy(TRADING_PAIR, Decimal("1"), OrderType.LIMIT, Decimal("30") - Decimal(index) / 1000)
+        market.get_available_balance("HBOT")
+        len(market.limit_orders)
+        market.cancel(TRADING_PAIR, order_id)
+    return time.perf_counter() - start
+
+
+async def run(args: argparse.Namespace):
+    print(f"{'resting orders':>15} {'cycles/s':>10} {'us/cycle':>10}")
+    for resting_orders in args.resting_orders:
+        market = build_market(resting_orders)
+        elapsed = measure(market, args.cycles)
+        print(f"{resting_orders:>15} {args.cycles / elapsed:>10.0f} {elapsed * 1e6 / args.cycles:>10.1f}")
+    # Drop the order created events scheduled by the orders placed
+    for task in asyncio.all_tasks():
+        if task is not asyncio.current_task():
+            task.cancel()
+
+
+def main(args: argparse.Namespace):
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resting-orders", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--cycles", type=int, default=2000)
+    main(parser.parse_args())
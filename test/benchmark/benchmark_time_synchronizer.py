@@ -0,0 +1,80 @@
+"""
+Microbenchmark of the construction of signed requests, which read the synchronized time for every signature.
+
+The requests are signed with the Binance authenticator, as a representative HMAC signature with a timestamp parameter.
+The baseline synchronizer recalculates the offset from the samples on every time() call, like the synchronizer did
+before caching the offset when the samples are added.
+
+Usage:
+    python -m test.benchmark.benchmark_time_synchronizer --requests 10000 100000
+"""
+import argparse
+import asyncio
+import time
+
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+
+SECRET_KEY = "13e56ca9cceebf1f33065c2c5376ab38570a114bc1b003b60d838f92be9d7930"  # noqa: mock
+
+
+class RecalculatingTimeSynchronizer(TimeSynchronizer):
+
+    @property
+    def time_offset_ms(self) -> float:
+        if not self._time_offset_ms:
+            return super().time_offset_ms
+        return self._calculate_time_offset_ms()
+
+
+async def sign_requests(auth: BinanceAuth, requests: int):
+    for index in range(requests):
+        request = RESTRequest(
+            method=RESTMethod.GET,
+            url="https://api.binance.com/api/v3/order",
+            params={"symbol": "BTCUSDT", "origClientOrderId": f"OID{index}"},
+            is_auth_required=True,
+        )
+        await auth.rest_authenticate(request)
+
+
+def measure(synchronizer: TimeSynchronizer, requests: int) -> float:
+    for offset in [10.0, 12.0, 9.0, 11.0, 10.5]:
+        synchronizer.add_time_offset_ms_sample(offset)
+    auth = BinanceAuth(api_key="someKey", secret_key=SECRET_KEY, time_provider=synchronizer)
+    start = time.perf_counter()
+    asyncio.run(sign_requests(auth, requests))
+    return time.perf_counter() - start
+
+
+def measure_time_calls(synchronizer: TimeSynchronizer, calls: int) -> float:
+    for offset in [10.0, 12.0, 9.0, 11.0, 10.5]:
+        synchronizer.add_time_offset_ms_sample(offset)
+    start = time.perf_counter()
+    for _ in range(calls):
+        synchronizer.time()
+    return time.perf_counter() - start
+
+
+def main(args: argparse.Namespace):
+    print(f"{'requests':>10} {'recalculated offset':>22} {'cached offset':>17} {'speedup':>10}")
+    for requests in args.requests:
+        recalculated_elapsed = measure(RecalculatingTimeSynchronizer(), requests)
+        cached_elapsed = measure(TimeSynchronizer(), requests)
+        print(f"{requests:>10} "
+              f"{requests / recalculated_elapsed:>16.0f} req/s "
+              f"{requests / cached_elapsed:>11.0f} req/s "
+              f"{recalculated_elapsed / cached_elapsed:>9.1f}x")
+
+    calls = max(args.requests)
+    recalculated_elapsed = measure_time_calls(RecalculatingTimeSynchronizer(), calls)
+    cached_elapsed = measure_time_calls(TimeSynchronizer(), calls)
+    print(f"\ntime() calls: {recalculated_elapsed * 1e9 / calls:.0f} ns recalculating the offset, "
+          f"{cached_elapsed * 1e9 / calls:.0f} ns with the cached offset")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, nargs="+", default=[10000, 50000])
+    main(parser.parse_args())
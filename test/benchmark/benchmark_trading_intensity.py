@@ -0,0 +1,79 @@
+"""
+Time per tick of the trading intensity estimators used by the Avellaneda strategy.
+
+Every tick registers a number of trades at exponentially distributed distances from the mid price, then calculates the
+indicator. The time of the ticks where the sampling buffer is full is measured.
+
+Usage:
+    python -m test.benchmark.benchmark_trading_intensity --buffer-sizes 50 200 --trades-per-tick 5 50 --ticks 400
+"""
+import argparse
+import time
+from decimal import Decimal
+from typing import List
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators.fast_trading_intensity import FastTradingIntensityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+ESTIMATORS = {
+    "curve_fit": lambda delegate, size: TradingIntensityIndicator(OrderBook(), delegate, size),
+    "log_linear": lambda delegate, size: FastTradingIntensityIndicator(OrderBook(), delegate, size),
+    "log_linear_refined": lambda delegate, size: FastTradingIntensityIndicator(
+        OrderBook(), delegate, size, refine=True),
+}
+
+
+def market_ticks(ticks: int, trades_per_tick: int, seed: int = 1):
+    rng = np.random.default_rng(seed)
+    mid_prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.0005, ticks)))
+    market = []
+    for tick, mid_price in enumerate(mid_prices):
+        distances = np.round(rng.exponential(0.05, trades_per_tick), 2)
+        sides = rng.choice([-1, 1], trades_per_tick)
+        trades = [OrderBookTradeEvent(trading_pair="COINALPHA-HBOT", timestamp=tick + 0.5,
+                                      price=float(mid_price + side * distance), amount=float(rng.exponential(1)),
+                                      type=TradeType.BUY if side > 0 else TradeType.SELL)
+                  for distance, side in zip(distances, sides)]
+        market.append((Decimal(str(mid_price)), trades))
+    return market
+
+
+def time_per_tick(estimator: str, buffer_size: int, market) -> float:
+    delegate = MagicMock()
+    indicator = ESTIMATORS[estimator](delegate, buffer_size)
+    elapsed = 0
+    measured_ticks = 0
+    for tick, (mid_price, trades) in enumerate(market):
+        delegate.get_price_by_type.return_value = mid_price
+        for trade in trades:
+            indicator.register_trade(trade)
+        start = time.perf_counter()
+        indicator.calculate(tick)
+        if indicator.is_sampling_buffer_full:
+            elapsed += time.perf_counter() - start
+            measured_ticks += 1
+    return elapsed / max(measured_ticks, 1)
+
+
+def main(buffer_sizes: List[int], trades_per_tick: List[int], ticks: int):
+    print(f"{'buffer':>8}{'trades/tick':>13}" + "".join(f"{name + ' (ms)':>24}" for name in ESTIMATORS))
+    for buffer_size in buffer_sizes:
+        for trades_count in trades_per_tick:
+            market = market_ticks(buffer_size + ticks, trades_count)
+            times = [time_per_tick(estimator, buffer_size, market) for estimator in ESTIMATORS]
+            print(f"{buffer_size:>8}{trades_count:>13}" + "".join(f"{t * 1e3:>24.3f}" for t in times))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--buffer-sizes", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--trades-per-tick", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--ticks", type=int, default=400, help="Measured ticks, after the buffer is full.")
+    args = parser.parse_args()
+    main(args.buffer_sizes, args.trades_per_tick, args.ticks)
@@ -0,0 +1,48 @@
+"""
+Time per sample of the trailing indicators, calculated from the whole sampling buffer and incrementally.
+
+Usage:
+    python -m test.benchmark.benchmark_trailing_indicators --windows 30 300 3000 --samples 5000
+"""
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.historical_volatility import HistoricalVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+
+def time_per_sample(indicator, samples: np.ndarray) -> float:
+    start = time.perf_counter()
+    for sample in samples:
+        indicator.add_sample(sample)
+        indicator.current_value
+    return (time.perf_counter() - start) / len(samples)
+
+
+def main(windows: List[int], samples_count: int):
+    samples = 25000 * np.exp(np.cumsum(np.random.default_rng(1).normal(0, 0.002, samples_count)))
+    print(f"{'indicator':<32}{'window':>8}{'full (us)':>12}{'incremental (us)':>18}{'speedup':>10}")
+    for indicator_class in (HistoricalVolatilityIndicator, InstantVolatilityIndicator):
+        for window in windows:
+            # Fill the buffers first, the steady state is what the bots run in
+            warm_up = samples[:window]
+            full_indicator = indicator_class(window, 15)
+            incremental_indicator = indicator_class(window, 15, incremental=True)
+            for indicator in (full_indicator, incremental_indicator):
+                for sample in warm_up:
+                    indicator.add_sample(sample)
+            full_time = time_per_sample(full_indicator, samples[window:])
+            incremental_time = time_per_sample(incremental_indicator, samples[window:])
+            print(f"{indicator_class.__name__:<32}{window:>8}{full_time * 1e6:>12.1f}{incremental_time * 1e6:>18.1f}"
+                  f"{full_time / incremental_time:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--windows", type=int, nargs="+", default=[30, 300, 3000])
+    parser.add_argument("--samples", type=int, default=5000)
+    args = parser.parse_args()
+    main(args.windows, args.samples)
@@ -58,3 +58,61 @@ class HyperliquidPerpetualAuthTests(TestCase):
         self.assertEqual(4, len(params))
         self.assertEqual(None, params.get("vaultAddress"))
         self.assertEqual("order", params.get("action")["type"])
+
+    @patch(
+        "hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_auth.HyperliquidPerpetualAuth._get_timestamp")
+    def test_sign_batch_order_params_post_request(self, ts_mock: MagicMock):
+        params = {
+            "type": "order",
+            "grouping": "na",
+            "orders": [
+                {
+                    "asset": 4,
+                    "isBuy": i % 2 == 0,
+                    "limitPx": 1201 + i,
+                    "sz": 0.01,
+                    "reduceOnly": False,
+                    "orderType": {"limit": {"tif": "Gtc"}},
+                    "cloid": f"0x{i:032x}",
+                }
+                for i in range(3)
+            ]
+        }
+        request = RESTRequest(
+            method=RESTMethod.POST,
+            url="https://test.url/exchange",
+            data=json.dumps(params),
+            is_auth_required=True,
+        )
+        ts_mock.return_value = self._get_timestamp()
+
+        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+
+        params = json.loads(request.data)
+        self.assertEqual("order", params["action"]["type"])
+        self.assertEqual(3, len(params["action"]["orders"]))
+        self.assertEqual(["0x{:032x}".format(i) for i in range(3)],
+                         [order["c"] for order in params["action"]["orders"]])
+        self.assertIn("signature", params)
+
+    @patch(
+        "hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_auth.HyperliquidPerpetualAuth._get_timestamp")
+    def test_sign_batch_cancel_params_post_request(self, ts_mock: MagicMock):
+        params = {
+            "type": "cancel",
+            "cancels": [{"asset": 4, "cloid": f"0x{i:032x}"} for i in range(3)],
+        }
+        request = RESTRequest(
+            method=RESTMethod.POST,
+            url="https://test.url/exchange",
+            data=json.dumps(params),
+            is_auth_required=True,
+        )
+        ts_mock.return_value = self._get_timestamp()
+
+        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+
+        params = json.loads(request.data)
+        self.assertEqual("cancelByCloid", params["action"]["type"])
+        self.assertEqual(3, len(params["action"]["cancels"]))
+        self.assertIn("signature", params)
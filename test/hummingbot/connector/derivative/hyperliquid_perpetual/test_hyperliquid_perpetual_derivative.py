@@ -8,7 +8,7 @@ from typing import Any, Callable, List, Optional, Tuple
 from unittest.mock import AsyncMock, patch
 
 import pandas as pd
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from aioresponses.core import RequestCall
 
 import hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_constants as CONSTANTS
@@ -24,8 +24,9 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
-from hummingbot.core.event.events import BuyOrderCreatedEvent, SellOrderCreatedEvent
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketOrderFailureEvent, SellOrderCreatedEvent
 from hummingbot.core.network_iterator import NetworkStatus
 
 
@@ -1790,3 +1791,117 @@ class HyperliquidPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.Perpe
                 f"at {Decimal('10000')}."
             )
         )
+
+    def _limit_orders_to_create(self, count: int, position: PositionAction = PositionAction.OPEN) -> List[LimitOrder]:
+        return [
+            LimitOrder(
+                client_order_id="",
+                trading_pair=self.trading_pair,
+                is_buy=i % 2 == 0,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("10000") + i,
+                quantity=Decimal("100"),
+                position=position,
+            )
+            for i in range(count)
+        ]
+
+    def _batch_response_callback(self, statuses_for_request: Callable, requests_sent: List, expected_requests: int,
+                                 event: asyncio.Event) -> Callable:
+        def callback(url, **kwargs):
+            action = json.loads(kwargs["data"])["action"]
+            requests_sent.append(action)
+            if len(requests_sent) >= expected_requests:
+                event.set()
+            return CallbackResult(payload={
+                "status": "ok",
+                "response": {"type": action["type"], "data": {"statuses": statuses_for_request(action)}}})
+        return callback
+
+    @aioresponses()
+    def test_batch_order_create_sends_one_request_per_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        requests_sent_event = asyncio.Event()
+        actions = []
+
+        orders_to_create = (self._limit_orders_to_create(count=43)
+                            + self._limit_orders_to_create(count=1, position=PositionAction.CLOSE)
+                            + self._limit_orders_to_create(count=1, position=PositionAction.NIL))
+        orders = self.exchange.batch_order_create(orders_to_create=orders_to_create)
+        rejected_order_id = orders[1].client_order_id
+        mock_api.post(
+            self.order_creation_url,
+            repeat=True,
+            callback=self._batch_response_callback(
+                statuses_for_request=lambda action: [
+                    {"error": "Insufficient margin to place order."}
+                    if order["c"] == rejected_order_id else {"resting": {"oid": index}}
+                    for index, order in enumerate(action["orders"])],
+                requests_sent=actions,
+                expected_requests=2,
+                event=requests_sent_event))
+        self.async_run_with_timeout(requests_sent_event.wait())
+
+        # The order without a valid position action is rejected before sending the batches
+        self.assertEqual(2, len(actions))
+        self.assertEqual([4, 40], sorted(len(action["orders"]) for action in actions))
+        sent_orders = {order["c"]: order for action in actions for order in action["orders"]}
+        self.assertNotIn(orders[-1].client_order_id, sent_orders)
+        self.assertTrue(sent_orders[orders[-2].client_order_id]["r"])
+        self.assertFalse(sent_orders[orders[0].client_order_id]["r"])
+
+        self.assertNotIn(rejected_order_id, self.exchange.in_flight_orders)
+        self.assertNotIn(orders[-1].client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual({rejected_order_id, orders[-1].client_order_id},
+                         {event.order_id for event in self.order_failure_logger.event_log})
+        for order in orders[:1] + orders[2:-1]:
+            in_flight_order = self.exchange.in_flight_orders[order.client_order_id]
+            self.assertTrue(in_flight_order.is_open)
+            self.assertEqual(order.position, in_flight_order.position)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual(OrderType.LIMIT, failure_event.order_type)
+
+    @aioresponses()
+    def test_batch_order_cancel_sends_one_request_per_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        requests_sent_event = asyncio.Event()
+        actions = []
+
+        orders_to_cancel = []
+        for i, order in enumerate(self._limit_orders_to_create(count=45)):
+            order_id = f"0x{i:032x}"
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=str(i),
+                trading_pair=order.trading_pair,
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                price=order.price,
+                amount=order.quantity,
+                order_type=OrderType.LIMIT,
+                position_action=PositionAction.OPEN,
+            )
+            orders_to_cancel.append(order.copy_with_id(client_order_id=order_id))
+        first_order_id = orders_to_cancel[0].client_order_id
+        mock_api.post(
+            self.order_creation_url,
+            repeat=True,
+            callback=self._batch_response_callback(
+                statuses_for_request=lambda action: [
+                    {"error": "Order was never placed, already canceled, or filled."}
+                    if cancel["cloid"] == first_order_id else "success"
+                    for cancel in action["cancels"]],
+                requests_sent=actions,
+                expected_requests=2,
+                event=requests_sent_event))
+
+        self.exchange.batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        self.async_run_with_timeout(requests_sent_event.wait())
+
+        self.assertEqual(2, len(actions))
+        self.assertEqual([5, 40], sorted(len(action["cancels"]) for action in actions))
+        self.assertTrue(self.is_logged("WARNING", f"Failed to cancel order {first_order_id} (order not found)"))
+        self.assertEqual([order.client_order_id for order in orders_to_cancel[1:]],
+                         sorted(event.order_id for event in self.order_cancelled_logger.event_log))
@@ -20,6 +20,7 @@ from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -2585,3 +2586,146 @@ class OkxPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualDeri
         mock_api.get(self.latest_prices_url, body=json.dumps(self.latest_prices_request_mock_response))
         lastprice_response = self.async_run_with_timeout(self.exchange._get_last_traded_price(self.trading_pair))
         self.assertEqual(lastprice_response, 9999.9)
+
+    def _limit_orders_to_create(self, count: int) -> List[LimitOrder]:
+        return [
+            LimitOrder(
+                client_order_id="",
+                trading_pair=self.trading_pair,
+                is_buy=i % 2 == 0,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("10000") + i,
+                quantity=Decimal("100"),
+                position=PositionAction.OPEN,
+            )
+            for i in range(count)
+        ]
+
+    def _set_event_after_requests(self, mock_api, url: str, expected_requests: int, event: asyncio.Event):
+        if len(self._all_executed_requests(mock_api, url)) >= expected_requests:
+            event.set()
+
+    @aioresponses()
+    def test_batch_order_create_sends_one_request_per_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self._simulate_contract_sizes_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        requests_sent_event = asyncio.Event()
+        url = web_utils.get_rest_url_for_endpoint(endpoint=CONSTANTS.REST_PLACE_BATCH_ORDERS[CONSTANTS.ENDPOINT])
+
+        orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create(count=25))
+        response = {
+            "code": "0",
+            "msg": "",
+            "data": [
+                {"clOrdId": order.client_order_id, "ordId": f"EOID{i}", "tag": "", "sCode": "0", "sMsg": ""}
+                for i, order in enumerate(orders)
+            ]
+        }
+        for _ in range(2):
+            mock_api.post(
+                url,
+                body=json.dumps(response),
+                callback=lambda *args, **kwargs: self._set_event_after_requests(
+                    mock_api, url, expected_requests=2, event=requests_sent_event))
+        self.async_run_with_timeout(requests_sent_event.wait())
+
+        batch_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(batch_requests))
+        self.assertEqual([5, 20], sorted(len(json.loads(request.kwargs["data"])) for request in batch_requests))
+        self.assertEqual(0, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+        first_order_data = next(order_data
+                                for request in batch_requests
+                                for order_data in json.loads(request.kwargs["data"])
+                                if order_data["clOrdId"] == orders[0].client_order_id)
+        self.assertEqual("buy", first_order_data["side"])
+        self.assertEqual("cross", first_order_data["tdMode"])
+        for order in orders:
+            in_flight_order = self.exchange.in_flight_orders[order.client_order_id]
+            self.assertTrue(in_flight_order.is_open)
+            self.assertEqual(PositionAction.OPEN, in_flight_order.position)
+        self.assertEqual(13, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(12, len(self.sell_order_created_logger.event_log))
+
+    @aioresponses()
+    def test_batch_order_create_marks_rejected_orders_as_failed(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self._simulate_contract_sizes_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        request_sent_event = asyncio.Event()
+        url = web_utils.get_rest_url_for_endpoint(endpoint=CONSTANTS.REST_PLACE_BATCH_ORDERS[CONSTANTS.ENDPOINT])
+
+        orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create(count=3))
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": order.client_order_id,
+                    "ordId": "" if i == 1 else f"EOID{i}",
+                    "tag": "",
+                    "sCode": "51008" if i == 1 else "0",
+                    "sMsg": "Insufficient margin" if i == 1 else "",
+                }
+                for i, order in enumerate(orders)
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        self.assertTrue(self.exchange.in_flight_orders[orders[0].client_order_id].is_open)
+        self.assertTrue(self.exchange.in_flight_orders[orders[2].client_order_id].is_open)
+        self.assertNotIn(orders[1].client_order_id, self.exchange.in_flight_orders)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual(orders[1].client_order_id, failure_event.order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_sends_one_request_per_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        requests_sent_event = asyncio.Event()
+        url = web_utils.get_rest_url_for_endpoint(endpoint=CONSTANTS.REST_CANCEL_BATCH_ORDERS[CONSTANTS.ENDPOINT])
+
+        orders_to_cancel = []
+        for i, order in enumerate(self._limit_orders_to_create(count=25)):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=order.trading_pair,
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                price=order.price,
+                amount=order.quantity,
+                order_type=OrderType.LIMIT,
+                position_action=PositionAction.OPEN,
+            )
+            orders_to_cancel.append(order.copy_with_id(client_order_id=f"OID{i}"))
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": order.client_order_id,
+                    "ordId": f"EOID{i}",
+                    "sCode": CONSTANTS.RET_CODE_PARAMS_ERROR if i == 0 else CONSTANTS.RET_CODE_OK,
+                    "sMsg": "",
+                }
+                for i, order in enumerate(orders_to_cancel)
+            ]
+        }
+        for _ in range(2):
+            mock_api.post(
+                url,
+                body=json.dumps(response),
+                callback=lambda *args, **kwargs: self._set_event_after_requests(
+                    mock_api, url, expected_requests=2, event=requests_sent_event))
+
+        self.exchange.batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        self.async_run_with_timeout(requests_sent_event.wait())
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(cancel_requests))
+        self.assertEqual([5, 20], sorted(len(json.loads(request.kwargs["data"])) for request in cancel_requests))
+        self.assertTrue(self.exchange.in_flight_orders["OID0"].is_open)
+        for i in range(1, 25):
+            self.assertTrue(self.exchange.in_flight_orders[f"OID{i}"].is_pending_cancel_confirmation)
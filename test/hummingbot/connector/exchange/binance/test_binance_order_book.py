@@ -66,6 +66,7 @@ class BinanceOrderBookTests(TestCase):
         self.assertEqual(2, diff_msg.update_id)
         self.assertEqual(1, diff_msg.first_update_id)
         self.assertEqual(-1, diff_msg.trade_id)
+        self.assertTrue(diff_msg.has_price_levels_arrays)
         self.assertEqual(1, len(diff_msg.bids))
         self.assertEqual(0.0024, diff_msg.bids[0].price)
         self.assertEqual(10.0, diff_msg.bids[0].amount)
@@ -8,7 +8,7 @@ from decimal import Decimal
 from typing import Any, Callable, List, Optional
 from unittest.mock import AsyncMock
 
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from aioresponses.core import RequestCall
 
 import hummingbot.connector.exchange.hyperliquid.hyperliquid_constants as CONSTANTS
@@ -22,6 +22,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import (
     BuyOrderCreatedEvent,
@@ -1826,3 +1827,123 @@ class HyperliquidExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorT
             "INFO",
             f"Recreating missing trade in TradeFill: {trade_fill_non_tracked_order}"
         ))
+
+    def _limit_orders_to_create(self, count: int) -> List[LimitOrder]:
+        return [
+            LimitOrder(
+                client_order_id="",
+                trading_pair=self.trading_pair,
+                is_buy=i % 2 == 0,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("10000") + i,
+                quantity=Decimal("100"),
+            )
+            for i in range(count)
+        ]
+
+    def _batch_response_callback(self, statuses_for_request: Callable, requests_sent: List, expected_requests: int,
+                                 event: asyncio.Event) -> Callable:
+        def callback(url, **kwargs):
+            action = json.loads(kwargs["data"])["action"]
+            requests_sent.append(action)
+            if len(requests_sent) >= expected_requests:
+                event.set()
+            return CallbackResult(payload={
+                "status": "ok",
+                "response": {"type": action["type"], "data": {"statuses": statuses_for_request(action)}}})
+        return callback
+
+    @aioresponses()
+    def test_batch_order_create_sends_one_request_per_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        requests_sent_event = asyncio.Event()
+        actions = []
+
+        orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create(count=45))
+        mock_api.post(
+            self.order_creation_url,
+            repeat=True,
+            callback=self._batch_response_callback(
+                statuses_for_request=lambda action: [{"resting": {"oid": int(order["c"], 16) % 1000000}}
+                                                     for order in action["orders"]],
+                requests_sent=actions,
+                expected_requests=2,
+                event=requests_sent_event))
+        self.async_run_with_timeout(requests_sent_event.wait())
+
+        self.assertEqual(2, len(actions))
+        self.assertEqual([5, 40], sorted(len(action["orders"]) for action in actions))
+        for order in orders:
+            in_flight_order = self.exchange.in_flight_orders[order.client_order_id]
+            self.assertTrue(in_flight_order.is_open)
+            self.assertEqual(str(int(order.client_order_id, 16) % 1000000), in_flight_order.exchange_order_id)
+        self.assertEqual(23, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(22, len(self.sell_order_created_logger.event_log))
+
+    @aioresponses()
+    def test_batch_order_create_marks_rejected_orders_as_failed(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        request_sent_event = asyncio.Event()
+
+        orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create(count=3))
+        mock_api.post(
+            self.order_creation_url,
+            callback=self._batch_response_callback(
+                statuses_for_request=lambda action: [{"resting": {"oid": 1}},
+                                                     {"error": "Insufficient spot balance asset=10000"},
+                                                     {"filled": {"totalSz": "100", "avgPx": "10002", "oid": 3}}],
+                requests_sent=[],
+                expected_requests=1,
+                event=request_sent_event))
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        self.assertEqual("1", self.exchange.in_flight_orders[orders[0].client_order_id].exchange_order_id)
+        self.assertEqual("3", self.exchange.in_flight_orders[orders[2].client_order_id].exchange_order_id)
+        self.assertNotIn(orders[1].client_order_id, self.exchange.in_flight_orders)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual(orders[1].client_order_id, failure_event.order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_sends_one_request_per_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        requests_sent_event = asyncio.Event()
+        actions = []
+
+        orders_to_cancel = []
+        for i, order in enumerate(self._limit_orders_to_create(count=45)):
+            order_id = f"0x{i:032x}"
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=str(i),
+                trading_pair=order.trading_pair,
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                price=order.price,
+                amount=order.quantity,
+                order_type=OrderType.LIMIT,
+            )
+            orders_to_cancel.append(order.copy_with_id(client_order_id=order_id))
+        first_order_id = orders_to_cancel[0].client_order_id
+        mock_api.post(
+            self.order_creation_url,
+            repeat=True,
+            callback=self._batch_response_callback(
+                statuses_for_request=lambda action: [
+                    {"error": "Order was never placed, already canceled, or filled."}
+                    if cancel["cloid"] == first_order_id else "success"
+                    for cancel in action["cancels"]],
+                requests_sent=actions,
+                expected_requests=2,
+                event=requests_sent_event))
+
+        self.exchange.batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        self.async_run_with_timeout(requests_sent_event.wait())
+
+        self.assertEqual(2, len(actions))
+        self.assertEqual([5, 40], sorted(len(action["cancels"]) for action in actions))
+        self.assertTrue(self.is_logged("WARNING", f"Failed to cancel order {first_order_id} (order not found)"))
+        self.assertEqual([order.client_order_id for order in orders_to_cancel[1:]],
+                         sorted(event.order_id for event in self.order_cancelled_logger.event_log))
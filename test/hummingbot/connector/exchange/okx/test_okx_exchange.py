@@ -16,8 +16,15 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
-from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderCancelledEvent, OrderType, TradeType
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderType,
+    TradeType,
+)
 
 
 class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -576,7 +583,7 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         regex_url = re.compile(url + r"\?.*")
         response = self._order_status_request_completely_filled_mock_response(order=order)
         mock_api.get(regex_url, body=json.dumps(response), callback=callback)
-        return url
+        return regex_url
 
     def configure_canceled_order_status_response(
             self,
@@ -587,7 +594,7 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         regex_url = re.compile(url + r"\?.*")
         response = self._order_status_request_canceled_mock_response(order=order)
         mock_api.get(regex_url, body=json.dumps(response), callback=callback)
-        return url
+        return regex_url
 
     def configure_open_order_status_response(
             self,
@@ -598,7 +605,7 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         regex_url = re.compile(url + r"\?.*")
         response = self._order_status_request_open_mock_response(order=order)
         mock_api.get(regex_url, body=json.dumps(response), callback=callback)
-        return url
+        return regex_url
 
     def configure_http_error_order_status_response(
             self,
@@ -608,7 +615,7 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_ORDER_DETAILS_PATH)
         regex_url = re.compile(url + r"\?.*")
         mock_api.get(regex_url, status=404, callback=callback)
-        return url
+        return regex_url
 
     def configure_partially_filled_order_status_response(
             self,
@@ -619,7 +626,7 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         regex_url = re.compile(url + r"\?.*")
         response = self._order_status_request_partially_filled_mock_response(order=order)
         mock_api.get(regex_url, body=json.dumps(response), callback=callback)
-        return url
+        return regex_url
 
     def configure_partial_fill_trade_response(
             self,
@@ -627,10 +634,10 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             mock_api: aioresponses,
             callback: Optional[Callable] = lambda *args, **kwargs: None) -> str:
         url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_TRADE_FILLS_PATH)
-        regex_url = re.compile(url + r"\?.*")
+        regex_url = re.compile(url + r"\?.*ordId=")
         response = self._order_fills_request_partial_fill_mock_response(order=order)
         mock_api.get(regex_url, body=json.dumps(response), callback=callback)
-        return url
+        return regex_url
 
     def configure_full_fill_trade_response(
             self,
@@ -638,10 +645,10 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             mock_api: aioresponses,
             callback: Optional[Callable] = lambda *args, **kwargs: None) -> str:
         url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_TRADE_FILLS_PATH)
-        regex_url = re.compile(url + r"\?.*")
+        regex_url = re.compile(url + r"\?.*ordId=")
         response = self._order_fills_request_full_fill_mock_response(order=order)
         mock_api.get(regex_url, body=json.dumps(response), callback=callback)
-        return url
+        return regex_url
 
     def configure_erroneous_http_fill_trade_response(
             self,
@@ -649,9 +656,9 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             mock_api: aioresponses,
             callback: Optional[Callable] = lambda *args, **kwargs: None) -> str:
         url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_TRADE_FILLS_PATH)
-        regex_url = re.compile(url + r"\?.*")
+        regex_url = re.compile(url + r"\?.*ordId=")
         mock_api.get(regex_url, status=400, callback=callback)
-        return url
+        return regex_url
 
     def order_event_for_new_order_websocket_update(self, order: InFlightOrder):
         return {
@@ -1283,3 +1290,231 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 f"{Decimal('100.000000')} {self.trading_pair} at {Decimal('10000')}."
             )
         )
+
+    def _limit_orders_to_create(self, count: int) -> List[LimitOrder]:
+        return [
+            LimitOrder(
+                client_order_id="",
+                trading_pair=self.trading_pair,
+                is_buy=i % 2 == 0,
+                base_currency=self.base_asset,
+                quote_currency=self.quote_asset,
+                price=Decimal("10000") + i,
+                quantity=Decimal("100"),
+            )
+            for i in range(count)
+        ]
+
+    def _set_event_after_requests(self, mock_api, url: str, expected_requests: int, event: asyncio.Event):
+        if len(self._all_executed_requests(mock_api, url)) >= expected_requests:
+            event.set()
+
+    def _batch_order_creation_mock_response(self, orders: List[LimitOrder], rejected_order_id: str = None) -> Any:
+        return {
+            "code": "0" if rejected_order_id is None else "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": order.client_order_id,
+                    "ordId": f"EOID{i}",
+                    "tag": "",
+                    "sCode": "51008" if order.client_order_id == rejected_order_id else "0",
+                    "sMsg": "Insufficient balance" if order.client_order_id == rejected_order_id else "",
+                }
+                for i, order in enumerate(orders)
+            ]
+        }
+
+    @aioresponses()
+    def test_batch_order_create_sends_one_request_per_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        requests_sent_event = asyncio.Event()
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH)
+
+        orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create(count=25))
+        response = self._batch_order_creation_mock_response(orders=orders)
+        for _ in range(2):
+            mock_api.post(
+                url,
+                body=json.dumps(response),
+                callback=lambda *args, **kwargs: self._set_event_after_requests(
+                    mock_api, url, expected_requests=2, event=requests_sent_event))
+        self.async_run_with_timeout(requests_sent_event.wait())
+
+        batch_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(batch_requests))
+        self.assertEqual([5, 20], sorted(len(json.loads(request.kwargs["data"])) for request in batch_requests))
+        self.assertEqual(0, len(self._all_executed_requests(mock_api, self.order_creation_url)))
+        self.validate_auth_credentials_present(batch_requests[0])
+        for order in orders:
+            in_flight_order = self.exchange.in_flight_orders[order.client_order_id]
+            self.assertTrue(in_flight_order.is_open)
+            self.assertIsNotNone(in_flight_order.exchange_order_id)
+        self.assertEqual(13, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(12, len(self.sell_order_created_logger.event_log))
+
+    @aioresponses()
+    def test_batch_order_create_marks_rejected_orders_as_failed(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        request_sent_event = asyncio.Event()
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH)
+
+        orders = self.exchange.batch_order_create(orders_to_create=self._limit_orders_to_create(count=3))
+        response = self._batch_order_creation_mock_response(orders=orders, rejected_order_id=orders[1].client_order_id)
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, url)))
+        self.assertTrue(self.exchange.in_flight_orders[orders[0].client_order_id].is_open)
+        self.assertTrue(self.exchange.in_flight_orders[orders[2].client_order_id].is_open)
+        self.assertNotIn(orders[1].client_order_id, self.exchange.in_flight_orders)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual(orders[1].client_order_id, failure_event.order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_sends_one_request_per_batch(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        requests_sent_event = asyncio.Event()
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+
+        orders_to_cancel = []
+        for i, order in enumerate(self._limit_orders_to_create(count=25)):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=order.trading_pair,
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                price=order.price,
+                amount=order.quantity,
+                order_type=OrderType.LIMIT,
+            )
+            orders_to_cancel.append(order.copy_with_id(client_order_id=f"OID{i}"))
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": order.client_order_id,
+                    "ordId": f"EOID{i}",
+                    "sCode": "51000" if i == 0 else "0",
+                    "sMsg": "",
+                }
+                for i, order in enumerate(orders_to_cancel)
+            ]
+        }
+        for _ in range(2):
+            mock_api.post(
+                url,
+                body=json.dumps(response),
+                callback=lambda *args, **kwargs: self._set_event_after_requests(
+                    mock_api, url, expected_requests=2, event=requests_sent_event))
+
+        self.exchange.batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        self.async_run_with_timeout(requests_sent_event.wait())
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(cancel_requests))
+        self.assertEqual([5, 20], sorted(len(json.loads(request.kwargs["data"])) for request in cancel_requests))
+        self.assertTrue(self.exchange.in_flight_orders["OID0"].is_open)
+        for i in range(1, 25):
+            self.assertTrue(self.exchange.in_flight_orders[f"OID{i}"].is_pending_cancel_confirmation)
+
+    def _start_tracking_orders_for_status_update(self, count: int) -> List[InFlightOrder]:
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return [self.exchange.in_flight_orders[f"OID{i}"] for i in range(count)]
+
+    @aioresponses()
+    def test_update_order_status_uses_open_orders_and_account_fills_queries(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        open_order, partially_filled_order, canceled_order = self._start_tracking_orders_for_status_update(count=3)
+
+        open_orders_url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_OPEN_ORDERS_PATH)
+        open_orders_response = self._order_status_request_open_mock_response(order=open_order)
+        open_orders_response["data"].extend(
+            self._order_status_request_partially_filled_mock_response(order=partially_filled_order)["data"])
+        mock_api.get(re.compile(open_orders_url + r"\?.*"), body=json.dumps(open_orders_response))
+
+        fills_url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_TRADE_FILLS_PATH)
+        fills_response = self._order_fills_request_partial_fill_mock_response(order=partially_filled_order)
+        mock_api.get(re.compile(fills_url + r"\?.*begin=.*"), body=json.dumps(fills_response))
+
+        order_status_url = self.configure_canceled_order_status_response(order=canceled_order, mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        open_orders_request = self._all_executed_requests(mock_api, open_orders_url)[0]
+        self.assertEqual({"instType": "SPOT", "limit": "100"}, open_orders_request.kwargs["params"])
+        fills_requests = self._all_executed_requests(mock_api, fills_url)
+        self.assertEqual(1, len(fills_requests))
+        self.assertEqual(str(int((1640780000 - self.exchange.TRADE_UPDATES_QUERY_OVERLAP) * 1e3)),
+                         fills_requests[0].kwargs["params"]["begin"])
+        self.assertNotIn("ordId", fills_requests[0].kwargs["params"])
+        # Only the order missing from the open orders is requested on its own
+        order_status_requests = self._all_executed_requests(mock_api, order_status_url)
+        self.assertEqual(1, len(order_status_requests))
+        self.assertEqual(canceled_order.client_order_id, order_status_requests[0].kwargs["params"]["clOrdId"])
+
+        self.assertEqual(self.expected_partial_fill_amount, partially_filled_order.executed_amount_base)
+        self.assertEqual(1, len(self.order_filled_logger.event_log))
+        self.assertIn(open_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertNotIn(canceled_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertTrue(canceled_order.is_cancelled)
+
+    @aioresponses()
+    def test_update_order_status_requests_each_order_when_bulk_queries_fail(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders_for_status_update(count=2)
+
+        open_orders_url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_OPEN_ORDERS_PATH)
+        error_response = {"code": "50011", "msg": "Rate limit reached", "data": []}
+        mock_api.get(re.compile(open_orders_url + r"\?.*"), body=json.dumps(error_response))
+        fills_url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_TRADE_FILLS_PATH)
+        mock_api.get(re.compile(fills_url + r"\?.*begin=.*"), body=json.dumps(error_response))
+        for order in orders:
+            order_status_url = self.configure_open_order_status_response(order=order, mock_api=mock_api)
+            order_fills_url = self.configure_partial_fill_trade_response(order=order, mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, order_status_url)))
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, order_fills_url)))
+        self.assertTrue(self.is_logged(
+            "WARNING",
+            f"Failed to fetch the open orders. Requesting the status of each order. Error: Error requesting "
+            f"{CONSTANTS.OKX_OPEN_ORDERS_PATH}: {error_response}"))
+        self.assertTrue(all(order.is_open for order in orders))
+        self.assertEqual(2, len(self.order_filled_logger.event_log))
+
+    @aioresponses()
+    def test_request_trade_updates_since_requests_all_pages(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._start_tracking_orders_for_status_update(count=1)[0]
+
+        fill_data = self._order_fills_request_partial_fill_mock_response(order=order)["data"][0]
+        first_page = [dict(fill_data, tradeId=str(i), billId=str(1000 - i)) for i in range(CONSTANTS.MAX_RESULTS_PER_PAGE)]
+        second_page = [dict(fill_data, tradeId="100", billId="900"), dict(fill_data, clOrdId="", ordId="unknown")]
+        fills_url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_TRADE_FILLS_PATH)
+        regex_url = re.compile(fills_url + r"\?.*")
+        mock_api.get(regex_url, body=json.dumps({"code": "0", "msg": "", "data": first_page}))
+        mock_api.get(regex_url, body=json.dumps({"code": "0", "msg": "", "data": second_page}))
+
+        trade_updates = self.async_run_with_timeout(self.exchange._request_trade_updates_since(timestamp=1640779000))
+
+        fills_requests = self._all_executed_requests(mock_api, fills_url)
+        self.assertEqual(2, len(fills_requests))
+        self.assertEqual("1640779000000", fills_requests[0].kwargs["params"]["begin"])
+        self.assertNotIn("after", fills_requests[0].kwargs["params"])
+        self.assertEqual("901", fills_requests[1].kwargs["params"]["after"])
+        self.assertEqual(101, len(trade_updates))
+        self.assertTrue(all(trade_update.client_order_id == order.client_order_id for trade_update in trade_updates))
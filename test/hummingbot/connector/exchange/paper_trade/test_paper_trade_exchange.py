@@ -1,11 +1,24 @@
+import random
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, List, Tuple
 from unittest import TestCase
 
+import pandas as pd
+
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -29,3 +42,235 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+
+class PaperTradeQueuePositionFillModelTests(TestCase):
+    start_timestamp: float = pd.Timestamp("2019-01-01", tz="UTC").timestamp()
+    end_timestamp: float = pd.Timestamp("2019-01-01 01:00:00", tz="UTC").timestamp()
+    trading_pair = "COINALPHA-HBOT"
+
+    def create_market(self, queue_position_fill_model: bool) -> MockPaperExchange:
+        market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                   queue_position_fill_model=queue_position_fill_model)
+        # Bids at 99.5 (10), 98.5 (20)... and asks at 100.5 (10), 101.5 (20)...
+        market.set_balanced_order_book(self.trading_pair,
+                                       mid_price=100,
+                                       min_price=90,
+                                       max_price=110,
+                                       price_step_size=1,
+                                       volume_step_size=10)
+        market.set_balance("COINALPHA", 100)
+        market.set_balance("HBOT", 10000)
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.end_timestamp)
+        self.clock.add_iterator(market)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        return market
+
+    def simulate_trade(self, market: MockPaperExchange, trade_type: TradeType, price: str, amount: str):
+        market.get_order_book(self.trading_pair).apply_trade(OrderBookTradeEvent(
+            trading_pair=self.trading_pair,
+            timestamp=self.clock.current_timestamp,
+            type=trade_type,
+            price=Decimal(price),
+            amount=Decimal(amount),
+        ))
+
+    def replay(self, market: MockPaperExchange) -> List[Tuple[str, Decimal]]:
+        fill_logger = EventLogger()
+        market.add_listener(MarketEvent.OrderFilled, fill_logger)
+        buy_order_id = market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.5"))
+        sell_order_id = market.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100.5"))
+        for trade_type, price, amount in [(TradeType.SELL, "99.5", "4"),
+                                          (TradeType.BUY, "100.5", "10.3"),
+                                          (TradeType.SELL, "99.5", "7"),
+                                          (TradeType.BUY, "100.5", "0.4"),
+                                          (TradeType.SELL, "99.5", "3"),
+                                          (TradeType.SELL, "99", "0.1"),
+                                          (TradeType.BUY, "101", "0.1")]:
+            self.simulate_trade(market, trade_type, price, amount)
+        order_names = {buy_order_id: "buy", sell_order_id: "sell"}
+        return [(order_names[event.order_id], event.amount) for event in fill_logger.event_log]
+
+    def test_limit_orders_wait_for_the_volume_ahead_in_the_queue(self):
+        market = self.create_market(queue_position_fill_model=True)
+        completed_logger = EventLogger()
+        market.add_listener(MarketEvent.BuyOrderCompleted, completed_logger)
+        order_id = market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.5"))
+        self.assertEqual(Decimal("10"), market.queue_positions[order_id])
+
+        self.simulate_trade(market, TradeType.SELL, "99.5", "4")
+        self.assertEqual(Decimal("6"), market.queue_positions[order_id])
+        self.assertEqual(Decimal("199"), market.on_hold_balances["HBOT"])
+
+        self.simulate_trade(market, TradeType.SELL, "99.5", "7")
+        self.assertEqual(Decimal("0"), market.queue_positions[order_id])
+        self.assertEqual(Decimal("1"), market.limit_orders[0].filled_quantity)
+        self.assertEqual(Decimal("99.5"), market.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal("101"), market.get_balance("COINALPHA"))
+        self.assertEqual(0, len(completed_logger.event_log))
+
+        self.simulate_trade(market, TradeType.SELL, "99.5", "3")
+        self.assertEqual(0, len(market.limit_orders))
+        self.assertNotIn(order_id, market.queue_positions)
+        self.assertEqual(Decimal("102"), market.get_balance("COINALPHA"))
+        self.assertEqual(Decimal("9801"), market.get_balance("HBOT"))
+        completed_event = completed_logger.event_log[0]
+        self.assertEqual(order_id, completed_event.order_id)
+        self.assertEqual(Decimal("2"), completed_event.base_asset_amount)
+        self.assertEqual(Decimal("199"), completed_event.quote_asset_amount)
+
+    def test_trades_are_consumed_across_the_orders_at_a_price_in_time_priority(self):
+        market = self.create_market(queue_position_fill_model=True)
+        fill_logger = EventLogger()
+        market.add_listener(MarketEvent.OrderFilled, fill_logger)
+        first_order_id = market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.5"))
+        second_order_id = market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.simulate_trade(market, TradeType.SELL, "99.5", "13")
+
+        fills = {event.order_id: event.amount for event in fill_logger.event_log}
+        self.assertEqual({first_order_id: Decimal("2"), second_order_id: Decimal("1")}, fills)
+        self.assertEqual(Decimal("0"), market.queue_positions[second_order_id])
+        self.assertEqual(Decimal("1"), market.limit_orders[0].filled_quantity)
+
+    def test_queue_position_excludes_the_volume_taken_by_paper_fills(self):
+        market = self.create_market(queue_position_fill_model=True)
+        market.sell(self.trading_pair, Decimal("3"), OrderType.MARKET)
+        self.clock.backtest_til(self.start_timestamp + 1 + market.TRADE_EXECUTION_DELAY)
+
+        order_id = market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.assertEqual(Decimal("7"), market.queue_positions[order_id])
+
+    def test_replay_of_trades_is_deterministic(self):
+        expected_fills = [("sell", Decimal("0.3")),
+                          ("buy", Decimal("1")),
+                          ("sell", Decimal("0.4")),
+                          ("buy", Decimal("1")),
+                          ("sell", Decimal("0.3"))]
+
+        self.assertEqual(expected_fills, self.replay(self.create_market(queue_position_fill_model=True)))
+        self.assertEqual(expected_fills, self.replay(self.create_market(queue_position_fill_model=True)))
+
+    def test_orders_are_filled_in_full_without_queue_position_fill_model(self):
+        self.assertEqual([("buy", Decimal("2")), ("sell", Decimal("1"))],
+                         self.replay(self.create_market(queue_position_fill_model=False)))
+
+    def test_trades_through_the_order_price_fill_the_whole_order(self):
+        market = self.create_market(queue_position_fill_model=True)
+        fill_logger = EventLogger()
+        market.add_listener(MarketEvent.OrderFilled, fill_logger)
+        market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.simulate_trade(market, TradeType.SELL, "99", "1")
+
+        self.assertEqual(Decimal("2"), fill_logger.event_log[0].amount)
+        self.assertEqual(0, len(market.limit_orders))
+
+    def test_queue_position_moves_forward_when_the_level_volume_decreases(self):
+        market = self.create_market(queue_position_fill_model=True)
+        order_id = market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.5"))
+        order_book = market.get_order_book(self.trading_pair)
+
+        order_book.apply_diffs([OrderBookRow(99.5, 3, 2)], [], 2)
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(Decimal("3"), market.queue_positions[order_id])
+
+        order_book.apply_diffs([OrderBookRow(99.5, 30, 3)], [], 3)
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual(Decimal("3"), market.queue_positions[order_id])
+
+    def test_touching_the_order_price_does_not_fill_the_order(self):
+        market = self.create_market(queue_position_fill_model=True)
+        market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.5"))
+        order_book = market.get_order_book(self.trading_pair)
+
+        order_book.apply_diffs([], [OrderBookRow(99.5, 5, 2)], 2)
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(1, len(market.limit_orders))
+
+        order_book.apply_diffs([], [OrderBookRow(99, 5, 3)], 3)
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual(0, len(market.limit_orders))
+
+
+class PaperTradeLimitOrdersIndexTests(TestCase):
+    start_timestamp: float = pd.Timestamp("2019-01-01", tz="UTC").timestamp()
+    end_timestamp: float = pd.Timestamp("2019-01-01 01:00:00", tz="UTC").timestamp()
+    trading_pairs = ["COINALPHA-HBOT", "HBOT-USDT"]
+
+    def setUp(self):
+        super().setUp()
+        self.market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        for trading_pair in self.trading_pairs:
+            self.market.set_balanced_order_book(trading_pair,
+                                                mid_price=100,
+                                                min_price=50,
+                                                max_price=150,
+                                                price_step_size=1,
+                                                volume_step_size=10)
+            self.market.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+        self.market.set_balance("COINALPHA", 1000)
+        self.market.set_balance("HBOT", 100000)
+        self.market.set_balance("USDT", 100000)
+        self.clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.end_timestamp)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.cancel_logger = EventLogger()
+        self.market.add_listener(MarketEvent.OrderCancelled, self.cancel_logger)
+
+    def recomputed_on_hold_balances(self) -> Dict[str, Decimal]:
+        on_hold_balances = defaultdict(Decimal)
+        for limit_order in self.market.limit_orders:
+            remaining_quantity = limit_order.quantity - limit_order.filled_quantity
+            if limit_order.is_buy:
+                on_hold_balances[limit_order.quote_currency] += remaining_quantity * limit_order.price
+            else:
+                on_hold_balances[limit_order.base_currency] += remaining_quantity
+        return on_hold_balances
+
+    def test_cancel_finds_the_order_by_client_order_id(self):
+        buy_order_id = self.market.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("90"))
+        sell_order_id = self.market.sell("COINALPHA-HBOT", Decimal("2"), OrderType.LIMIT, Decimal("110"))
+        self.assertEqual({"HBOT": Decimal("90"), "COINALPHA": Decimal("2")}, self.market.on_hold_balances)
+        self.assertEqual(Decimal("99910"), self.market.get_available_balance("HBOT"))
+
+        self.market.cancel("HBOT-USDT", buy_order_id)
+        self.market.cancel("COINALPHA-HBOT", "buy://COINALPHA-HBOT/unknown")
+        self.assertEqual(2, len(self.market.limit_orders))
+        self.assertEqual(0, len(self.cancel_logger.event_log))
+
+        self.market.cancel("COINALPHA-HBOT", buy_order_id)
+        self.assertEqual([sell_order_id], [order.client_order_id for order in self.market.limit_orders])
+        self.assertEqual(buy_order_id, self.cancel_logger.event_log[0].order_id)
+        self.assertEqual({"COINALPHA": Decimal("2")}, self.market.on_hold_balances)
+        self.assertEqual(Decimal("100000"), self.market.get_available_balance("HBOT"))
+
+    def test_random_orders_are_consistent_with_recomputation(self):
+        rng = random.Random(42)
+        open_order_ids = set()
+        for _ in range(300):
+            action = rng.random()
+            trading_pair = rng.choice(self.trading_pairs)
+            if action < 0.5 or not open_order_ids:
+                is_buy = rng.random() < 0.5
+                place = self.market.buy if is_buy else self.market.sell
+                price = Decimal(rng.randint(60, 99) if is_buy else rng.randint(101, 140))
+                open_order_ids.add(place(trading_pair, Decimal(rng.randint(1, 30)) / 10, OrderType.LIMIT, price))
+            elif action < 0.8:
+                order = rng.choice(self.market.limit_orders)
+                self.market.cancel(order.trading_pair, order.client_order_id)
+                open_order_ids.remove(order.client_order_id)
+            else:
+                self.market.get_order_book(trading_pair).apply_trade(OrderBookTradeEvent(
+                    trading_pair=trading_pair,
+                    timestamp=self.clock.current_timestamp,
+                    type=rng.choice([TradeType.BUY, TradeType.SELL]),
+                    price=Decimal(rng.choice([80, 120])),
+                    amount=Decimal("1"),
+                ))
+                open_order_ids = {order.client_order_id for order in self.market.limit_orders}
+
+            self.assertEqual(open_order_ids, {order.client_order_id for order in self.market.limit_orders})
+            self.assertEqual(self.recomputed_on_hold_balances(), self.market.on_hold_balances)
@@ -0,0 +1,173 @@
+import copy
+import random
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.balance_ledger import BalanceLedger
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent
+
+ASSETS = ["COINALPHA", "HBOT", "USDT"]
+TRADING_PAIRS = ["COINALPHA-HBOT", "HBOT-USDT", "COINALPHA-USDT"]
+
+
+class MockExchange(ExchangeBase):
+
+    def __init__(self, client_config_map: ClientConfigAdapter):
+        super().__init__(client_config_map)
+        self.order_tracker = ClientOrderTracker(connector=self)
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return dict()
+
+    @property
+    def in_flight_orders(self) -> Dict[str, InFlightOrder]:
+        return self.order_tracker.active_orders
+
+
+class BalanceLedgerTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self):
+        super().setUp()
+        fee_patch = patch("hummingbot.connector.connector_base.estimate_fee",
+                          return_value=AddedToCostTradeFee(percent=Decimal("0.001")))
+        fee_patch.start()
+        self.addCleanup(fee_patch.stop)
+        self.connector = MockExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.connector.real_time_balance_update = False
+        self.connector._set_current_timestamp(1640000000.0)
+        self.ledger = BalanceLedger(maker_fee_pct=lambda: self.connector.estimate_fee_pct(True))
+        self.connector._balance_ledger = self.ledger
+        self.connector.order_tracker.balance_ledger = self.ledger
+        self.connector.add_listener(MarketEvent.OrderFilled, self.ledger.fill_forwarder)
+        self.order_count = 0
+        self.trade_count = 0
+
+    def recomputed_balance(self, currency: str, available_balance: Decimal) -> Decimal:
+        self.connector._balance_ledger = None
+        try:
+            return self.connector.apply_balance_update_since_snapshot(currency, available_balance)
+        finally:
+            self.connector._balance_ledger = self.ledger
+
+    def assert_consistent_with_recomputation(self):
+        for asset in ASSETS:
+            self.assertEqual(self.recomputed_balance(asset, Decimal("1000")),
+                             self.connector.apply_balance_update_since_snapshot(asset, Decimal("1000")),
+                             asset)
+
+    def advance_time(self):
+        self.connector._set_current_timestamp(self.connector.current_timestamp + 1)
+
+    def create_order(self, trade_type: TradeType, amount: Decimal, price: Decimal,
+                     trading_pair: str = TRADING_PAIRS[0]) -> InFlightOrder:
+        self.order_count += 1
+        order = InFlightOrder(client_order_id=f"OID{self.order_count}",
+                              trading_pair=trading_pair,
+                              order_type=OrderType.LIMIT,
+                              trade_type=trade_type,
+                              amount=amount,
+                              price=price,
+                              creation_timestamp=self.connector.current_timestamp)
+        self.connector.order_tracker.start_tracking_order(order)
+        return order
+
+    def fill_order(self, order: InFlightOrder, amount: Decimal):
+        self.trade_count += 1
+        self.connector.order_tracker.process_trade_update(TradeUpdate(
+            trade_id=str(self.trade_count),
+            client_order_id=order.client_order_id,
+            exchange_order_id=str(self.order_count),
+            trading_pair=order.trading_pair,
+            fill_timestamp=self.connector.current_timestamp,
+            fill_price=order.price,
+            fill_base_amount=amount,
+            fill_quote_amount=amount * order.price,
+            fee=AddedToCostTradeFee(),
+        ))
+
+    async def update_order_state(self, order: InFlightOrder, new_state: OrderState):
+        await self.connector.order_tracker._process_order_update(OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=self.connector.current_timestamp,
+            new_state=new_state,
+        ))
+
+    def take_snapshot(self):
+        self.connector.in_flight_orders_snapshot = {
+            order_id: copy.copy(order) for order_id, order in self.connector.in_flight_orders.items()}
+        self.connector.in_flight_orders_snapshot_timestamp = self.connector.current_timestamp
+
+    async def test_order_lifecycle(self):
+        buy_order = self.create_order(TradeType.BUY, Decimal("1"), Decimal("900"))
+        sell_order = self.create_order(TradeType.SELL, Decimal("0.5"), Decimal("1100"))
+        self.assertEqual(Decimal("900.9"), self.ledger.in_flight_balance("HBOT"))
+        self.assertEqual(Decimal("0.5"), self.ledger.in_flight_balance("COINALPHA"))
+        self.take_snapshot()
+        self.assert_consistent_with_recomputation()
+        self.assertEqual(Decimal("1000"), self.connector.apply_balance_update_since_snapshot("HBOT", Decimal("1000")))
+
+        self.advance_time()
+        self.fill_order(buy_order, Decimal("0.4"))
+        self.assert_consistent_with_recomputation()
+        self.assertEqual(Decimal("1000.4"),
+                         self.connector.apply_balance_update_since_snapshot("COINALPHA", Decimal("1000")))
+
+        await self.update_order_state(sell_order, OrderState.CANCELED)
+        self.assertNotIn(sell_order.client_order_id, self.connector.in_flight_orders)
+        self.assert_consistent_with_recomputation()
+
+        self.fill_order(buy_order, Decimal("0.6"))
+        await self.update_order_state(buy_order, OrderState.FILLED)
+        self.assertEqual({}, self.connector.in_flight_orders)
+        self.assertEqual(Decimal("0"), self.ledger.in_flight_balance("HBOT"))
+        self.assert_consistent_with_recomputation()
+
+        self.advance_time()
+        self.take_snapshot()
+        self.assertEqual(Decimal("1000"), self.connector.apply_balance_update_since_snapshot("HBOT", Decimal("1000")))
+        self.assert_consistent_with_recomputation()
+
+    async def test_random_orders_are_consistent_with_recomputation(self):
+        rng = random.Random(42)
+        orders = []
+        for _ in range(300):
+            action = rng.random()
+            open_orders = [order for order in orders if order.client_order_id in self.connector.in_flight_orders]
+            if action < 0.35 or not open_orders:
+                orders.append(self.create_order(rng.choice([TradeType.BUY, TradeType.SELL]),
+                                                Decimal(rng.randint(1, 100)) / 10,
+                                                Decimal(rng.randint(900, 1100)) / 100,
+                                                rng.choice(TRADING_PAIRS)))
+            elif action < 0.7:
+                order = rng.choice(open_orders)
+                self.fill_order(order, min(order.amount - order.executed_amount_base, Decimal(rng.randint(1, 30)) / 10))
+                if order.is_filled:
+                    await self.update_order_state(order, OrderState.FILLED)
+            elif action < 0.9:
+                await self.update_order_state(rng.choice(open_orders), OrderState.CANCELED)
+            else:
+                self.take_snapshot()
+            if rng.random() < 0.5:
+                self.advance_time()
+            self.assert_consistent_with_recomputation()
+
+    def test_orders_tracked_before_setting_the_ledger_are_included(self):
+        self.connector.order_tracker.balance_ledger = None
+        self.create_order(TradeType.SELL, Decimal("2"), Decimal("10"))
+
+        ledger = BalanceLedger(maker_fee_pct=lambda: Decimal("0"))
+        self.connector.order_tracker.balance_ledger = ledger
+
+        self.assertEqual(Decimal("2"), ledger.in_flight_balance("COINALPHA"))
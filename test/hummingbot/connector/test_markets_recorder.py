@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
@@ -24,6 +26,7 @@ from hummingbot.core.event.events import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
@@ -85,13 +88,33 @@ class MarketsRecorderTests(TestCase):
         )
 
         self.tracking_states = dict()
+        self.recorded_trade_fills = set()
+        self.recorded_exchange_order_ids = dict()
 
     def add_trade_fills_from_market_recorder(self, current_trade_fills):
-        pass
+        self.recorded_trade_fills.update(current_trade_fills)
 
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        self.recorded_exchange_order_ids.update(current_exchange_order_ids)
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
         pass
 
+    def create_file_db_manager(self) -> SQLConnectionManager:
+        # The write-behind worker uses its own connection, so an in-memory database can't be shared with it
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        with patch("hummingbot.model.sql_connection_manager.create_engine") as engine_mock:
+            engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir.name, 'test_DB.sqlite')}")
+            manager = SQLConnectionManager(
+                ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+            )
+        self.addCleanup(manager.engine.dispose)
+        return manager
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -441,6 +464,8 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+        self.assertEqual([[3, 1, 3], [2, 1, 2], [1, 1, 1]], market_data[0].order_book["bid"])
+        self.assertIsInstance(market_data[0].order_book["bid"][0][2], int)
 
     def test_store_position(self):
         recorder = MarketsRecorder(
@@ -495,3 +520,307 @@ class MarketsRecorderTests(TestCase):
             query = session.query(Executors)
             executors = query.all()
         self.assertEqual(1, len(executors))
+
+    def test_write_behind_records_events_in_batches_and_updates_reconciliation_sets_immediately(self):
+        manager = self.create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_behind=True,
+            write_behind_batch_size=10,
+            write_behind_flush_interval=60,
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642030000,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * fill_event.price,
+            order_type=create_event.type,
+        )
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+        # The connector reconciliation collections don't wait for the database writes
+        self.assertEqual({"EOID1": "OID1"}, self.recorded_exchange_order_ids)
+        self.assertEqual(1, len(self.recorded_trade_fills))
+        self.assertEqual("TradeId1", list(self.recorded_trade_fills)[0].exchange_trade_id)
+        # The batch is not full and the flush interval has not passed yet
+        self.assertEqual(0, len(recorder.get_trades_for_config(self.config_file_path)))
+
+        recorder.stop()
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = orders[0].status
+            trade_fills = orders[0].trade_fills
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+        self.assertEqual([MarketEvent.BuyOrderCreated.name, MarketEvent.OrderFilled.name,
+                          MarketEvent.BuyOrderCompleted.name],
+                         [status.status for status in order_status])
+        self.assertEqual(1, len(trade_fills))
+        self.assertEqual(1, len(market_states))
+
+    def test_write_behind_flushes_by_time(self):
+        manager = self.create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_behind=True,
+            write_behind_flush_interval=0.01,
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.MARKET,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder.flush()
+
+        self.assertEqual(1, len(recorder.get_trades_for_config(self.config_file_path)))
+
+    def test_append_to_csv_keeps_one_writer_per_file(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(data_dir.cleanup)
+
+        trades = [
+            TradeFill(
+                config_file_path="test_config.yml",
+                strategy=self.strategy_name,
+                market=self.display_name,
+                symbol=self.symbol,
+                base_asset=self.base,
+                quote_asset=self.quote,
+                timestamp=1640000000000 + index,
+                order_id=f"OID{index}",
+                trade_type=TradeType.BUY.name,
+                order_type=OrderType.LIMIT.name,
+                price=Decimal(1000),
+                amount=Decimal(1),
+                leverage=1,
+                trade_fee=AddedToCostTradeFee().to_json(),
+                trade_fee_in_quote=Decimal(0),
+                exchange_trade_id=f"EOID{index}",
+                position=PositionAction.NIL.value)
+            for index in range(3)
+        ]
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=data_dir.name):
+            for trade in trades:
+                recorder.append_to_csv(trade)
+
+        self.assertEqual(1, len(recorder._trades_csv_writers))
+        recorder.stop()
+        self.assertEqual(0, len(recorder._trades_csv_writers))
+
+        with open(os.path.join(data_dir.name, "trades_test_config.csv")) as file:
+            lines = file.read().splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertTrue(lines[0].startswith("exchange_trade_id,config_file_path"))
+        self.assertTrue(lines[0].endswith(",age"))
+        self.assertTrue(lines[1].startswith("EOID0,test_config.yml"))
+        self.assertTrue(lines[1].endswith(",n/a"))
+
+    def test_filled_trades_are_exported_when_enabled(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path="test_config.yml",
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            trades_export_format="csv",
+            trades_export_flush_interval=60,
+        )
+        data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(data_dir.cleanup)
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1642019000,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=data_dir.name):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        csv_path = os.path.join(data_dir.name, "trades_test_config.csv")
+        # Buffered until the flush interval passes or the recorder stops
+        self.assertEqual(0, os.path.getsize(csv_path))
+        self.assertEqual(1, len(recorder.get_trades_for_config("test_config.yml")))
+
+        recorder.stop()
+        with open(csv_path) as file:
+            lines = file.read().splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[1].startswith("TradeId1,test_config.yml"))
+        self.assertTrue(lines[1].endswith(",00:16:40"))
+
+    def test_export_errors_do_not_prevent_storing_the_trade(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path="test_config.yml",
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            trades_export_format="parquet",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        with patch("hummingbot.connector.trade_fill_exporter.pa", None):
+            with self.assertLogs(level="ERROR") as logs:
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        self.assertIn("Unexpected error exporting the trade TradeId1.", logs.output[0])
+        self.assertEqual(1, len(recorder.get_trades_for_config("test_config.yml")))
+
+    def test_filled_trades_are_not_exported_by_default(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        with patch.object(recorder, "export_trade_fill") as export_mock:
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        export_mock.assert_not_called()
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_exported_trades_are_flushed_periodically(self, sleep_mock):
+        sleep_mock.side_effect = [None, asyncio.CancelledError]
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            trades_export_format="csv_and_parquet",
+            trades_export_flush_interval=5,
+        )
+        csv_writer = MagicMock()
+        parquet_writer = MagicMock()
+        recorder._trades_csv_writers["trades_test"] = csv_writer
+        recorder._trades_parquet_writers["trades_test"] = parquet_writer
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(recorder._flush_trade_exporters_loop())
+
+        sleep_mock.assert_called_with(5)
+        csv_writer.flush_if_due.assert_called_once()
+        parquet_writer.flush_if_due.assert_called_once()
@@ -75,3 +75,58 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_time_offset_calculated_only_when_adding_samples(self, seconds_counter_mock):
+        seconds_counter_mock.return_value = 100
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000)
+        time_provider.add_time_offset_ms_sample(3000)
+
+        with patch("hummingbot.connector.time_synchronizer.numpy") as numpy_mock:
+            for _ in range(3):
+                self.assertEqual(100 + 2.25, time_provider.time())
+            numpy_mock.median.assert_not_called()
+            numpy_mock.average.assert_not_called()
+
+        time_provider.clear_time_offset_ms_samples()
+        with patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time", return_value=1640000000.0):
+            self.assertEqual(1640000000.0, time_provider.time())
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_update_interval_grows_while_the_offset_is_stable(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer()
+        self.assertTrue(time_provider.is_update_required())
+
+        expected_intervals = [0, 10, 20, 40, 80, 160, 320, 600, 600]
+        for index, expected_interval in enumerate(expected_intervals):
+            local_time = index * 1000
+            seconds_counter_mock.side_effect = [local_time, local_time]
+            self.async_run_with_timeout(
+                time_provider.update_server_time_offset_with_time_provider(
+                    time_provider=self.configurable_timestamp_provider(local_time * 1e3 + 500 + index)
+                ))
+            self.assertEqual(expected_interval, time_provider.update_interval)
+
+        seconds_counter_mock.side_effect = [8000 + 599]
+        self.assertFalse(time_provider.is_update_required())
+        seconds_counter_mock.side_effect = [8000 + 600]
+        self.assertTrue(time_provider.is_update_required())
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_update_interval_reset_when_the_offset_changes(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer()
+        for server_time_ms, expected_interval in [(500, 0), (510, 10), (520, 20), (1020, 0)]:
+            seconds_counter_mock.side_effect = [0, 0]
+            self.async_run_with_timeout(
+                time_provider.update_server_time_offset_with_time_provider(
+                    time_provider=self.configurable_timestamp_provider(server_time_ms)
+                ))
+            self.assertEqual(expected_interval, time_provider.update_interval)
+
+        seconds_counter_mock.side_effect = [0]
+        self.assertTrue(time_provider.is_update_required())
+
+        time_provider.clear_time_offset_ms_samples()
+        self.assertEqual(0, time_provider.update_interval)
+        self.assertTrue(time_provider.is_update_required())
@@ -0,0 +1,159 @@
+import csv
+import glob
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.connector.trade_fill_exporter import TradeFillCsvWriter, TradeFillParquetWriter
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+FIELD_NAMES = ("exchange_trade_id", "timestamp", "price", "amount", "leverage", "trade_fee_in_quote", "age")
+
+
+class TradeFillCsvWriterTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "trades_test.csv")
+
+    def read_rows(self, path: str):
+        with open(path, newline="") as file:
+            return list(csv.reader(file))
+
+    @staticmethod
+    def row(index: int):
+        return (f"TID{index}", 1640000000000 + index, Decimal("1000.5"), Decimal("1"), 1, 0.1, "n/a")
+
+    def test_header_written_once_and_rows_appended(self):
+        writer = TradeFillCsvWriter(path=self.path, field_names=FIELD_NAMES)
+        writer.write_row(self.row(0))
+        writer.write_row(self.row(1))
+        writer.close()
+
+        writer = TradeFillCsvWriter(path=self.path, field_names=FIELD_NAMES)
+        writer.write_row(self.row(2))
+        writer.close()
+
+        rows = self.read_rows(self.path)
+        self.assertEqual(list(FIELD_NAMES), rows[0])
+        self.assertEqual(["TID0", "1640000000000", "1000.5", "1", "1", "0.1", "n/a"], rows[1])
+        self.assertEqual(["TID1", "TID2"], [row[0] for row in rows[2:]])
+
+    def test_file_with_different_header_is_moved(self):
+        with open(self.path, "w") as file:
+            file.write("some,other,header\n1,2,3\n")
+
+        writer = TradeFillCsvWriter(path=self.path, field_names=FIELD_NAMES)
+        writer.write_row(self.row(0))
+        writer.close()
+
+        old_files = glob.glob(os.path.join(self.directory.name, "trades_test_old_*.csv"))
+        self.assertEqual(1, len(old_files))
+        self.assertEqual(["some", "other", "header"], self.read_rows(old_files[0])[0])
+        self.assertEqual(2, len(self.read_rows(self.path)))
+
+    def test_header_is_checked_only_when_opening_the_file(self):
+        writer = TradeFillCsvWriter(path=self.path, field_names=FIELD_NAMES)
+        with patch.object(writer, "_file_matches_header", wraps=writer._file_matches_header) as check_mock:
+            writer.write_row(self.row(0))
+            writer.close()
+            writer.write_row(self.row(1))
+            writer.write_row(self.row(2))
+            writer.close()
+
+        self.assertEqual(1, check_mock.call_count)
+
+    def test_rows_are_flushed_after_flush_interval(self):
+        writer = TradeFillCsvWriter(path=self.path, field_names=FIELD_NAMES, flush_interval=10)
+        self.addCleanup(writer.close)
+
+        with patch.object(TradeFillCsvWriter, "_time", return_value=100):
+            writer.write_row(self.row(0))
+        self.assertEqual(0, os.path.getsize(self.path))
+
+        with patch.object(TradeFillCsvWriter, "_time", return_value=110):
+            writer.write_row(self.row(1))
+        self.assertEqual(3, len(self.read_rows(self.path)))
+
+    def test_pending_rows_are_flushed_when_due(self):
+        writer = TradeFillCsvWriter(path=self.path, field_names=FIELD_NAMES, flush_interval=10)
+        self.addCleanup(writer.close)
+
+        with patch.object(TradeFillCsvWriter, "_time", return_value=100):
+            writer.write_row(self.row(0))
+            writer.flush_if_due()
+        self.assertEqual(0, os.path.getsize(self.path))
+
+        with patch.object(TradeFillCsvWriter, "_time", return_value=110):
+            writer.flush_if_due()
+        self.assertEqual(2, len(self.read_rows(self.path)))
+
+    def test_rows_are_flushed_after_batch_size(self):
+        writer = TradeFillCsvWriter(path=self.path, field_names=FIELD_NAMES, flush_interval=60, batch_size=2)
+        self.addCleanup(writer.close)
+
+        writer.write_row(self.row(0))
+        self.assertEqual(0, os.path.getsize(self.path))
+        writer.write_row(self.row(1))
+        self.assertEqual(3, len(self.read_rows(self.path)))
+
+    def test_file_is_rotated_by_size(self):
+        writer = TradeFillCsvWriter(path=self.path, field_names=FIELD_NAMES, max_file_size=200)
+        for index in range(10):
+            writer.write_row(self.row(index))
+        writer.close()
+
+        rotated_files = [path for path in glob.glob(os.path.join(self.directory.name, "trades_test_*.csv"))]
+        self.assertGreater(len(rotated_files), 0)
+        all_rows = []
+        for path in rotated_files + ([self.path] if os.path.exists(self.path) else []):
+            rows = self.read_rows(path)
+            self.assertEqual(list(FIELD_NAMES), rows[0])
+            all_rows.extend(row[0] for row in rows[1:])
+        self.assertEqual({f"TID{index}" for index in range(10)}, set(all_rows))
+
+
+@unittest.skipIf(pq is None, "pyarrow is not installed")
+class TradeFillParquetWriterTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "trades_test.parquet")
+
+    def test_rows_written_with_typed_schema(self):
+        writer = TradeFillParquetWriter(path=self.path, field_names=FIELD_NAMES, batch_size=2)
+        for index in range(3):
+            writer.write_row((f"TID{index}", 1640000000000 + index, Decimal("1000.5"), Decimal("1"), 1, None, "n/a"))
+        writer.close()
+
+        table = pq.read_table(self.path)
+        self.assertEqual(list(FIELD_NAMES), table.schema.names)
+        self.assertEqual("int64", str(table.schema.field("timestamp").type))
+        self.assertEqual("double", str(table.schema.field("price").type))
+        self.assertEqual("string", str(table.schema.field("exchange_trade_id").type))
+        self.assertEqual(3, table.num_rows)
+        self.assertEqual([1000.5] * 3, table.column("price").to_pylist())
+        self.assertEqual([None] * 3, table.column("trade_fee_in_quote").to_pylist())
+
+    def test_buffered_rows_are_written_when_due(self):
+        writer = TradeFillParquetWriter(path=self.path, field_names=FIELD_NAMES, batch_size=100, flush_interval=10)
+        with patch.object(TradeFillParquetWriter, "_time", return_value=100):
+            writer.write_row(("TID0", 1640000000000, Decimal("1000.5"), Decimal("1"), 1, 0.1, "n/a"))
+            writer.flush_if_due()
+        self.assertIsNone(writer._writer)
+
+        with patch.object(TradeFillParquetWriter, "_time", return_value=110):
+            writer.flush_if_due()
+        self.assertIsNotNone(writer._writer)
+        writer.close()
+        self.assertEqual(1, pq.read_table(self.path).num_rows)
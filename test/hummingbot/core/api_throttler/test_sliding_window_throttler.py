@@ -0,0 +1,224 @@
+import asyncio
+import random
+import sys
+import time
+import unittest
+from decimal import Decimal
+from typing import Dict, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.sliding_window_throttler import LimitWindow, SlidingWindowThrottler
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class SlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits)
+
+    def test_init_with_rate_limits_share_pct(self):
+        throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, limits_share_percentage=Decimal("55"))
+
+        self.assertEqual(Decimal("1"), throttler._id_to_limit_map[TEST_POOL_ID].limit)
+        self.assertEqual(5, throttler._id_to_limit_map[TEST_WEIGHTED_POOL_ID].limit)
+
+    def test_limit_window_expires_old_entries_and_keeps_running_total(self):
+        window = LimitWindow(rate_limit=RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=1.0),
+                             safety_margin_pct=0)
+        window.append(timestamp=100.0, weight=2)
+        window.append(timestamp=100.5, weight=3)
+        window.append(timestamp=101.0, weight=4)
+
+        window.expire(now=101.0)
+        self.assertEqual(9, window.used_capacity)
+
+        window.expire(now=101.2)
+        self.assertEqual(7, window.used_capacity)
+        self.assertEqual(2, len(window.entries))
+
+        window.expire(now=103.0)
+        self.assertEqual(0, window.used_capacity)
+        self.assertEqual(0, len(window.entries))
+
+    def test_limit_window_seconds_until_capacity(self):
+        window = LimitWindow(rate_limit=RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=1.0),
+                             safety_margin_pct=0)
+        window.append(timestamp=100.0, weight=1)
+        window.append(timestamp=100.2, weight=1)
+        window.append(timestamp=100.4, weight=1)
+
+        self.assertAlmostEqual(0.5, window.seconds_until_capacity(weight=1, now=100.5))
+        self.assertAlmostEqual(0.9, window.seconds_until_capacity(weight=3, now=100.5))
+
+    def test_within_capacity_singular_non_weighted_task(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertTrue(context.within_capacity())
+
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_within_capacity_pool_non_weighted_task(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_PATH_URL).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        self.assertEqual(6, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used_capacity)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = SlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+
+        self.ev_loop.run_until_complete(context.acquire())
+        self.assertEqual({}, throttler._windows)
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire(), 1.0)
+            )
+
+    def test_acquire_sleeps_until_oldest_request_leaves_the_window(self):
+        throttler = SlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2)],
+            safety_margin_pct=0)
+
+        async def run_requests():
+            for _ in range(3):
+                async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                    pass
+
+        with patch("asyncio.sleep", wraps=asyncio.sleep) as sleep_mock:
+            start = time.time()
+            self.ev_loop.run_until_complete(run_requests())
+            elapsed = time.time() - start
+
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertLess(elapsed, 0.5)
+        # A single timed sleep instead of polling every retry interval
+        self.assertEqual(1, sleep_mock.call_count)
+
+    def test_execute_requests_respects_limits_over_time(self):
+        throttler = SlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=5, time_interval=0.1)],
+            safety_margin_pct=0)
+        timestamps: List[float] = []
+
+        async def run_requests():
+            for _ in range(20):
+                async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                    timestamps.append(time.time())
+
+        self.ev_loop.run_until_complete(run_requests())
+
+        for index in range(5, len(timestamps)):
+            self.assertGreater(timestamps[index] - timestamps[index - 5], 0.1 - 1e-3)
+
+    def test_set_rate_limits_keeps_requests_of_existing_limits(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_PATH_URL).acquire())
+
+        self.throttler.set_rate_limits([RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=5.0)])
+
+        self.assertEqual([TEST_POOL_ID], list(self.throttler._windows))
+        self.assertEqual(1, self.throttler._windows[TEST_POOL_ID].used_capacity)
+        self.assertEqual(2, self.throttler._windows[TEST_POOL_ID].rate_limit.limit)
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+        self.throttler.set_rate_limits([RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0)])
+
+        # The request made before the update still counts against the new limit
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_capacity_decisions_match_async_throttler(self):
+        per_second_limit = RateLimit(limit_id="generic_per_second", limit=30, time_interval=1)
+        per_millisecond_limit = RateLimit(limit_id="generic_per_millisecond", limit=5, time_interval=0.2)
+        rate_limits = [
+            per_second_limit,
+            per_millisecond_limit,
+            RateLimit(limit_id="orders", limit=sys.maxsize, time_interval=1, linked_limits=[
+                LinkedLimitWeightPair(per_second_limit.limit_id, 2),
+                LinkedLimitWeightPair(per_millisecond_limit.limit_id),
+            ]),
+            RateLimit(limit_id="cancels", limit=10, time_interval=0.5, linked_limits=[
+                LinkedLimitWeightPair(per_second_limit.limit_id),
+            ]),
+        ]
+        list_throttler = AsyncThrottler(rate_limits=rate_limits, safety_margin_pct=0.05)
+        window_throttler = SlidingWindowThrottler(rate_limits=rate_limits, safety_margin_pct=0.05)
+        task_logs: List[TaskLog] = list_throttler._task_logs
+        requests_done: Dict[str, int] = {"orders": 0, "cancels": 0}
+        rng = random.Random(42)
+        now = 1640000000.0
+
+        for _ in range(2000):
+            now += rng.choice([0.001, 0.01, 0.05])
+            limit_id = rng.choice(["orders", "cancels"])
+            list_context = list_throttler.execute_task(limit_id=limit_id)
+            window_context = window_throttler.execute_task(limit_id=limit_id)
+            with patch("hummingbot.core.api_throttler.async_throttler.AsyncRequestContext._time", return_value=now):
+                expected = list_context.within_capacity()
+            with patch.object(window_context, "_time", return_value=now):
+                window_context.flush()
+                result = window_context.within_capacity()
+            self.assertEqual(expected, result)
+
+            if expected:
+                requests_done[limit_id] += 1
+                rate_limit, related_limits = list_throttler.get_related_limits(limit_id)
+                task_logs.append(TaskLog(timestamp=now, rate_limit=rate_limit, weight=rate_limit.weight))
+                for related_limit, weight in related_limits:
+                    task_logs.append(TaskLog(timestamp=now, rate_limit=related_limit, weight=weight))
+                for window, weight in window_context._limits_with_weights:
+                    window.append(timestamp=now, weight=weight)
+
+        self.assertGreater(requests_done["orders"], 0)
+        self.assertGreater(requests_done["cancels"], 0)
+
+    def test_exchange_uses_sliding_window_throttler_when_configured(self):
+        from hummingbot.client.config.client_config_map import ClientConfigMap
+        from hummingbot.client.config.config_helpers import ClientConfigAdapter
+        from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        exchange = BinanceExchange(client_config_map, "testAPIKey", "testSecret", trading_pairs=["COINALPHA-HBOT"])
+        self.assertIsInstance(exchange._throttler, AsyncThrottler)
+
+        client_config_map.sliding_window_throttler = True
+        exchange = BinanceExchange(client_config_map, "testAPIKey", "testSecret", trading_pairs=["COINALPHA-HBOT"])
+        self.assertIsInstance(exchange._throttler, SlidingWindowThrottler)
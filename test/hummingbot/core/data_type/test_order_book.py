@@ -3,6 +3,7 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 import numpy as np
 
 
@@ -50,6 +51,58 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_top_n(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 2, 1], [3, 1, 2]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 3, 1]], dtype=np.float64))
+
+        bids, asks = order_book.top_n(2)
+        self.assertEqual(("price", "amount", "update_id"), bids.dtype.names)
+        self.assertEqual([(3., 1., 2.), (2., 2., 1.)], bids.tolist())
+        self.assertEqual([4., 5.], asks["price"].tolist())
+
+        bids, asks = order_book.top_n()
+        self.assertEqual(3, len(bids))
+        self.assertEqual(order_book.snapshot[0].values.tolist(), [list(level) for level in bids.tolist()])
+        self.assertEqual(0, len(order_book.top_n(0)[1]))
+        with self.assertRaises(ValueError):
+            order_book.top_n(-1)
+
+    def test_top_n_keeps_the_update_ids_as_integers(self):
+        order_book = OrderBook()
+        update_id = 2 ** 53 + 1
+        order_book.apply_snapshot([OrderBookRow(1., 1., update_id)], [OrderBookRow(2., 1., update_id)], update_id)
+
+        bids, asks = order_book.top_n(1)
+        self.assertEqual(np.int64, bids.dtype["update_id"])
+        self.assertEqual([(1., 1., update_id)], bids.tolist())
+        self.assertIsInstance(asks.tolist()[0][2], int)
+        self.assertEqual(update_id, order_book.snapshot[0]["update_id"].iloc[0])
+
+    def test_price_levels_array(self):
+        levels = OrderBook.price_levels_array([["0.0024", "10"], ["0.0023", "0"]], 7)
+        self.assertEqual(np.float64, levels.dtype)
+        self.assertEqual([[0.0024, 10., 7.], [0.0023, 0., 7.]], levels.tolist())
+        self.assertEqual((0, 3), OrderBook.price_levels_array([], 7).shape)
+
+    def test_apply_numpy_diffs_with_update_id(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 1]], dtype=np.float64),
+                                        np.array([[3, 1, 1], [4, 1, 1]], dtype=np.float64))
+        bids = OrderBook.price_levels_array([["2", "0"], ["1.5", "3"]], 5)
+        asks = OrderBook.price_levels_array([["3", "2"]], 5)
+        order_book.apply_numpy_diffs(bids, asks, 5)
+
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([[1.5, 3., 5.], [1., 1., 1.]], bids_df.values.tolist())
+        self.assertEqual([[3., 2., 5.], [4., 1., 1.]], asks_df.values.tolist())
+        self.assertEqual(5, order_book.last_diff_uid)
+
+        # An empty diff still advances the update id when it is given explicitly
+        empty = OrderBook.price_levels_array([], 6)
+        order_book.apply_numpy_diffs(empty, empty, 6)
+        self.assertEqual(6, order_book.last_diff_uid)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
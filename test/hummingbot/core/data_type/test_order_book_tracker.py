@@ -0,0 +1,338 @@
+import asyncio
+import time
+import tracemalloc
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.bounded_queue import QueueStats
+
+
+class MockSnapshotDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str], snapshot_delay: float = 0.0):
+        super().__init__(trading_pairs=trading_pairs)
+        self.snapshot_delay = snapshot_delay
+        self.requested_pairs: List[str] = []
+        self.in_flight_requests = 0
+        self.max_in_flight_requests = 0
+        self.release_events: Dict[str, asyncio.Event] = {}
+        self.failing_pairs: List[str] = []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: 1.0 for trading_pair in trading_pairs}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.requested_pairs.append(trading_pair)
+        self.in_flight_requests += 1
+        self.max_in_flight_requests = max(self.max_in_flight_requests, self.in_flight_requests)
+        try:
+            if trading_pair in self.failing_pairs:
+                raise IOError(f"Snapshot request failed for {trading_pair}")
+            if trading_pair in self.release_events:
+                await self.release_events[trading_pair].wait()
+            else:
+                await asyncio.sleep(self.snapshot_delay)
+        finally:
+            self.in_flight_requests -= 1
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "trading_pair": trading_pair,
+                "update_id": 1,
+                "bids": [["99", "1"]],
+                "asks": [["101", "1"]],
+            },
+            timestamp=1640000000.0)
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = [f"COINALPHA{i}-HBOT" for i in range(6)]
+        self.data_source = MockSnapshotDataSource(trading_pairs=self.trading_pairs)
+        self.tracker: Optional[OrderBookTracker] = None
+
+    def tearDown(self) -> None:
+        if self.tracker is not None:
+            self.tracker.stop()
+        super().tearDown()
+
+    def test_invalid_init_concurrency_raises(self):
+        with self.assertRaises(ValueError):
+            OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs, init_concurrency=0)
+
+    def test_unknown_queue_limit_raises(self):
+        with self.assertRaises(ValueError):
+            OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs, queue_limits={"x": 1})
+
+    async def test_sequential_init_sleeps_between_snapshots(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        sleep_calls = []
+
+        async def _sleep(delay: float):
+            sleep_calls.append(delay)
+
+        self.tracker._sleep = _sleep
+
+        await self.tracker._init_order_books()
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.data_source.requested_pairs)
+        self.assertEqual(1, self.data_source.max_in_flight_requests)
+        self.assertEqual([1] * len(self.trading_pairs), sleep_calls)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+
+    async def test_concurrent_init_respects_concurrency_limit(self):
+        self.data_source.snapshot_delay = 0.01
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs, init_concurrency=2)
+
+        await self.tracker._init_order_books()
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(2, self.data_source.max_in_flight_requests)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books))
+        self.assertEqual(set(self.trading_pairs), set(self.tracker._tracking_tasks))
+        for order_book in self.tracker.order_books.values():
+            self.assertEqual(99, order_book.get_price(False))
+            self.assertEqual(101, order_book.get_price(True))
+
+    async def test_concurrent_init_exposes_per_pair_readiness(self):
+        slow_pair = self.trading_pairs[0]
+        self.data_source.release_events[slow_pair] = asyncio.Event()
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs, init_concurrency=len(self.trading_pairs))
+
+        init_task = asyncio.ensure_future(self.tracker._init_order_books())
+        await self.tracker.wait_trading_pair_ready(self.trading_pairs[1])
+        await asyncio.sleep(0)
+
+        self.assertFalse(self.tracker.ready)
+        self.assertFalse(self.tracker.is_trading_pair_ready(slow_pair))
+        self.assertNotIn(slow_pair, self.tracker.ready_trading_pairs)
+        self.assertEqual(self.trading_pairs[1:], self.tracker.ready_trading_pairs)
+
+        self.data_source.release_events[slow_pair].set()
+        await init_task
+
+        self.assertTrue(self.tracker.ready)
+        self.assertTrue(self.tracker.is_trading_pair_ready(slow_pair))
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+
+    async def test_concurrent_init_cancels_pending_snapshots_when_one_fails(self):
+        slow_pair = self.trading_pairs[0]
+        self.data_source.release_events[slow_pair] = asyncio.Event()
+        self.data_source.failing_pairs = [self.trading_pairs[1]]
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs, init_concurrency=len(self.trading_pairs))
+
+        with self.assertRaises(IOError):
+            await self.tracker._init_order_books()
+
+        self.assertEqual(0, self.data_source.in_flight_requests)
+        self.assertFalse(self.tracker.ready)
+        self.assertFalse(self.tracker.is_trading_pair_ready(slow_pair))
+
+    async def test_stop_clears_per_pair_readiness(self):
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=self.trading_pairs, init_concurrency=3)
+
+        await self.tracker._init_order_books()
+        self.tracker.stop()
+
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+    async def test_wait_for_untracked_trading_pair_raises(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+
+        with self.assertRaises(KeyError):
+            await self.tracker.wait_trading_pair_ready("UNKNOWN-HBOT")
+
+    def start_tracking(self, coalesce_diffs: bool, messages: List[OrderBookMessage],
+                       queue_limits: Optional[Dict[str, int]] = None) -> OrderBook:
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source,
+            trading_pairs=self.trading_pairs[:1],
+            coalesce_diffs=coalesce_diffs,
+            queue_limits=queue_limits)
+        order_book = self.initial_order_book()
+        self.tracker._start_tracking_order_book(self.trading_pairs[0], order_book)
+        for message in messages:
+            self.tracker._tracking_message_queues[self.trading_pairs[0]].put_nowait(message)
+        return order_book
+
+    @staticmethod
+    def initial_order_book() -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 1, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 1, 1]], dtype=np.float64))
+        return order_book
+
+    def diff_message(self, update_id: int, bids: List[List[str]], asks: List[List[str]],
+                     timestamp: Optional[float] = None) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "trading_pair": self.trading_pairs[0],
+                "update_id": update_id,
+                "bids": bids,
+                "asks": asks,
+            },
+            timestamp=time.time() if timestamp is None else timestamp)
+
+    def array_diff_message(self, update_id: int, bids: List[List[str]], asks: List[List[str]]) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "trading_pair": self.trading_pairs[0],
+                "update_id": update_id,
+                "bids": OrderBook.price_levels_array(bids, update_id),
+                "asks": OrderBook.price_levels_array(asks, update_id),
+            },
+            timestamp=time.time())
+
+    async def test_coalesced_diffs_match_diffs_applied_one_by_one(self):
+        messages = [
+            self.array_diff_message(2, [["99", "0"], ["97", "2"]], [["101", "3"]]),
+            self.diff_message(3, [["97", "4"], ["96", "1"]], [["101", "0"], ["103", "1"]]),
+            self.array_diff_message(4, [["99", "5"]], [["103", "0"]]),
+        ]
+        coalesced_book = self.start_tracking(coalesce_diffs=True, messages=messages)
+        await asyncio.sleep(0.01)
+        metrics = self.tracker.tracking_metrics[self.trading_pairs[0]]
+        window = list(self.tracker._past_diffs_windows[self.trading_pairs[0]])
+        self.tracker.stop()
+        sequential_book = self.start_tracking(coalesce_diffs=False, messages=messages)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([[99., 5., 4.], [98., 1., 1.], [97., 4., 3.], [96., 1., 3.]],
+                         coalesced_book.snapshot[0].values.tolist())
+        self.assertEqual([[102., 1., 1.]], coalesced_book.snapshot[1].values.tolist())
+        for coalesced, sequential in zip(coalesced_book.snapshot, sequential_book.snapshot):
+            self.assertEqual(sequential.values.tolist(), coalesced.values.tolist())
+        self.assertEqual(4, coalesced_book.last_diff_uid)
+        self.assertEqual(messages, window)
+        self.assertEqual(3, metrics.diffs_applied)
+        self.assertEqual(1, metrics.diff_batches_applied)
+        self.assertEqual(2, metrics.max_queue_depth)
+        self.assertEqual(2, metrics.queue_depth)
+        sequential_metrics = self.tracker.tracking_metrics[self.trading_pairs[0]]
+        self.assertEqual(3, sequential_metrics.diff_batches_applied)
+
+    async def test_coalescing_stops_at_snapshots(self):
+        snapshot = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "trading_pair": self.trading_pairs[0],
+                "update_id": 3,
+                "bids": [["90", "1"]],
+                "asks": [["110", "1"]],
+            },
+            timestamp=time.time())
+        messages = [
+            self.diff_message(2, [["99", "2"]], []),
+            snapshot,
+            self.diff_message(4, [["91", "2"]], []),
+            self.diff_message(5, [["91", "3"]], [["110", "0"], ["111", "1"]]),
+        ]
+        coalesced_book = self.start_tracking(coalesce_diffs=True, messages=messages)
+        await asyncio.sleep(0.01)
+        self.assertEqual(2, self.tracker.tracking_metrics[self.trading_pairs[0]].diff_batches_applied)
+        self.tracker.stop()
+        sequential_book = self.start_tracking(coalesce_diffs=False, messages=messages)
+        await asyncio.sleep(0.01)
+
+        # The diffs after the snapshot are applied on top of it
+        self.assertIn([91., 3., 5.], coalesced_book.snapshot[0].values.tolist())
+        self.assertEqual([[111., 1., 5.]], coalesced_book.snapshot[1].values.tolist())
+        for coalesced, sequential in zip(coalesced_book.snapshot, sequential_book.snapshot):
+            self.assertEqual(sequential.values.tolist(), coalesced.values.tolist())
+
+    @patch("hummingbot.core.data_type.order_book_tracker.time.time")
+    async def test_lagging_trading_pairs(self, time_mock):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        coalesce_diffs=True)
+        self.tracker._order_book_diff_router_task = safe_ensure_future(self.tracker._order_book_diff_router())
+        time_mock.return_value = 1000.0
+        # The exchange timestamp, in milliseconds, is not used to measure the lag
+        self.tracker._order_book_diff_stream.put_nowait(self.diff_message(2, [["99", "2"]], [], timestamp=1e12))
+        await asyncio.sleep(0.01)
+        time_mock.return_value = 1002.5
+        self.tracker._start_tracking_order_book(self.trading_pairs[0], self.initial_order_book())
+        await asyncio.sleep(0.01)
+
+        metrics = self.tracker.tracking_metrics[self.trading_pairs[0]]
+        self.assertEqual(1, metrics.diffs_applied)
+        self.assertEqual(2500, metrics.lag_ms)
+        self.assertEqual(metrics.lag_ms, metrics.max_lag_ms)
+        self.assertEqual([self.trading_pairs[0]], self.tracker.lagging_trading_pairs(max_lag_ms=1000))
+        self.assertEqual([], self.tracker.lagging_trading_pairs(max_lag_ms=10000))
+
+    async def test_full_tracking_queue_drops_oldest_diff_and_resnapshots(self):
+        messages = [self.diff_message(update_id, [["97", str(update_id)]], []) for update_id in range(2, 7)]
+        order_book = self.start_tracking(coalesce_diffs=False, messages=messages,
+                                         queue_limits={"tracking_messages": 3})
+        stats = self.tracker.queue_stats[f"tracking_messages:{self.trading_pairs[0]}"]
+        self.assertEqual(QueueStats(size=3, max_size=3, high_water_mark=3, dropped=2), stats)
+
+        await asyncio.sleep(0.01)
+
+        # The book is restored from the new snapshot, which does not have the 98 level of the initial one
+        self.assertEqual([self.trading_pairs[0]], self.data_source.requested_pairs)
+        self.assertEqual(1, self.tracker.tracking_metrics[self.trading_pairs[0]].resnapshots)
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertNotIn(98., order_book.snapshot[0]["price"].tolist())
+        self.assertEqual({}, self.tracker._resnapshot_tasks)
+
+    async def test_saved_messages_stats(self):
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        queue_limits={"saved_messages": 2})
+        router_task = asyncio.ensure_future(self.tracker._order_book_diff_router())
+        for update_id in range(2, 6):
+            self.tracker._order_book_diff_stream.put_nowait(self.diff_message(update_id, [["97", "1"]], []))
+        await asyncio.sleep(0.01)
+        router_task.cancel()
+
+        self.assertEqual(QueueStats(size=2, max_size=2, high_water_mark=2, dropped=2),
+                         self.tracker.queue_stats[f"saved_messages:{self.trading_pairs[0]}"])
+        self.assertEqual(QueueStats(size=0, max_size=10000, high_water_mark=4, dropped=0),
+                         self.tracker.queue_stats["order_book_diff_stream"])
+
+    async def test_memory_is_flat_under_message_flood(self):
+        # A stalled tracker receiving a 10k msg/s feed of diffs and trades for a few seconds
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1],
+                                        queue_limits={"order_book_diff_stream": 1000, "order_book_trade_stream": 1000})
+
+        def flood(first_update_id: int):
+            for update_id in range(first_update_id, first_update_id + 10000):
+                message = self.diff_message(update_id, [["97", "1"]], [])
+                if update_id % 2 == 0:
+                    self.tracker._order_book_diff_stream.put_nowait(message)
+                else:
+                    self.tracker._order_book_trade_stream.put_nowait(message)
+
+        tracemalloc.start()
+        try:
+            flood(first_update_id=2)
+            memory_after_first_second, _ = tracemalloc.get_traced_memory()
+            for second in range(1, 5):
+                flood(first_update_id=2 + second * 10000)
+            memory_after_last_second, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        stats = self.tracker.queue_stats
+        self.assertEqual(1000, stats["order_book_diff_stream"].high_water_mark)
+        self.assertEqual(24000, stats["order_book_diff_stream"].dropped)
+        self.assertEqual(24000, stats["order_book_trade_stream"].dropped)
+        self.assertLess(memory_after_last_second - memory_after_first_second, 0.1 * memory_after_first_second)
@@ -0,0 +1,45 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.utils.bounded_queue import BoundedQueue, QueueOverflowPolicy, QueueStats
+
+
+class BoundedQueueTests(IsolatedAsyncioWrapperTestCase):
+
+    def test_invalid_size_raises(self):
+        with self.assertRaises(ValueError):
+            BoundedQueue(maxsize=0)
+
+    async def test_drop_oldest(self):
+        dropped = []
+        queue = BoundedQueue(maxsize=2, overflow_policy=QueueOverflowPolicy.DROP_OLDEST, on_overflow=dropped.append)
+
+        for item in range(5):
+            await queue.put(item)
+
+        self.assertEqual([0, 1, 2], dropped)
+        self.assertEqual(3, queue.get_nowait())
+        self.assertEqual(4, queue.get_nowait())
+        self.assertEqual(QueueStats(size=0, max_size=2, high_water_mark=2, dropped=3), queue.stats)
+
+    async def test_drop_newest(self):
+        dropped = []
+        queue = BoundedQueue(maxsize=2, overflow_policy=QueueOverflowPolicy.DROP_NEWEST, on_overflow=dropped.append)
+
+        for item in range(5):
+            queue.put_nowait(item)
+
+        self.assertEqual([2, 3, 4], dropped)
+        self.assertEqual(0, queue.get_nowait())
+        self.assertEqual(1, queue.get_nowait())
+        self.assertEqual(3, queue.stats.dropped)
+
+    async def test_waiting_consumer_receives_items(self):
+        queue = BoundedQueue(maxsize=1)
+        consumer = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+
+        queue.put_nowait("item")
+
+        self.assertEqual("item", await consumer)
+        self.assertEqual(QueueStats(size=0, max_size=1, high_water_mark=1, dropped=0), queue.stats)
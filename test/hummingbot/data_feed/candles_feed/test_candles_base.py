@@ -8,11 +8,13 @@ from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCa
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pandas as pd
 from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.indicators import EMA
 
 
 class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
@@ -92,6 +94,24 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_is_cached_until_the_candles_change(self):
+        candles = np.array(self._candles_data_mock(), dtype=float)
+        self.data_feed._candles.extend(candles[:3])
+        candles_df = self.data_feed.candles_df
+        candles_df["close"] = 0.0
+        candles_df["signal"] = 1
+
+        self.assertEqual(candles[:3, 4].tolist(), self.data_feed.candles_df["close"].tolist())
+        self.assertEqual(self.data_feed.columns, self.data_feed.candles_df.columns.tolist())
+
+        self.data_feed._candles.append(candles[3])
+        self.assertEqual(candles[:, 4].tolist(), self.data_feed.candles_df["close"].tolist())
+
+        updated_candle = candles[3].copy()
+        updated_candle[4] += 1
+        self.data_feed._candles.update_last(updated_candle)
+        self.assertEqual(updated_candle[4], self.data_feed.candles_df["close"].iloc[-1])
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -153,6 +173,21 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
         self.assertEqual(len(self.data_feed._candles), 0)
         self.assertEqual(self.data_feed._ws_candle_available.is_set(), False)
 
+    def test_add_indicators(self):
+        candles = np.array(self._candles_data_mock(), dtype=float)
+        self.data_feed._candles.extend(candles)
+        pipeline = self.data_feed.add_indicators([EMA(2)], max_records=4)
+
+        closes = candles[:, 4]
+        self.assertEqual(candles[-1][0], pipeline.last_timestamp)
+        self.assertEqual(4, len(pipeline.history))
+        self.assertAlmostEqual(closes[3] * 2 / 3 + (closes[2] * 2 / 3 + (closes[0] + closes[1]) / 2 / 3) / 3,
+                               pipeline.latest["EMA_2"])
+
+        self.data_feed._reset_candles()
+        self.assertIsNone(pipeline.last_timestamp)
+        self.assertEqual(0, len(pipeline.history))
+
     def test_ensure_timestamp_in_seconds(self):
         self.assertEqual(self.data_feed.ensure_timestamp_in_seconds(1622505600), 1622505600)
         self.assertEqual(self.data_feed.ensure_timestamp_in_seconds(1622505600000), 1622505600)
@@ -303,6 +338,28 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
         self.assertEqual(self.data_feed.candles_df.shape[0], 2)
         self.assertEqual(self.data_feed.candles_df.shape[1], 10)
 
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_process_websocket_messages_updates_indicators(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        pipeline = self.data_feed.add_indicators([EMA(1)], max_records=2)
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.get_candles_ws_data_mock_1()))
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.get_candles_ws_data_mock_2()))
+
+        self.listening_task = self.local_event_loop.create_task(self.data_feed.listen_for_subscriptions())
+
+        await self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        candles_df = self.data_feed.candles_df
+        self.assertEqual(candles_df["timestamp"].iloc[-1], pipeline.last_timestamp)
+        self.assertEqual(candles_df["close"].tolist(), pipeline.history[:, 0].tolist())
+
     def _create_exception_and_unlock_test_with_event(self, exception):
         self.resume_test_event.set()
         raise exception
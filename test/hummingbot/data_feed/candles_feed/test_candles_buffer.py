@@ -0,0 +1,66 @@
+import unittest
+from collections import deque
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+class CandlesBufferTest(unittest.TestCase):
+
+    @staticmethod
+    def rows(start: int, count: int) -> np.ndarray:
+        return np.array([[timestamp, timestamp * 10] for timestamp in range(start, start + count)], dtype=float)
+
+    def test_append_keeps_the_last_candles(self):
+        buffer = CandlesBuffer(maxlen=3, columns=2)
+        for row in self.rows(0, 5):
+            buffer.append(row)
+
+        self.assertEqual(3, len(buffer))
+        np.testing.assert_array_equal(self.rows(2, 3), buffer.values)
+        np.testing.assert_array_equal([2, 20], buffer[0])
+        np.testing.assert_array_equal([4, 40], buffer[-1])
+
+    def test_extend_and_extendleft_behave_like_a_deque(self):
+        buffer = CandlesBuffer(maxlen=4, columns=2)
+        candles = deque(maxlen=4)
+        for method, rows in (("extend", self.rows(10, 2)), ("extendleft", self.rows(5, 3)),
+                             ("extend", self.rows(20, 3)), ("extendleft", self.rows(0, 6)), ("extend", self.rows(30, 9))):
+            getattr(buffer, method)(rows)
+            getattr(candles, method)(rows)
+            np.testing.assert_array_equal(np.array(candles), buffer.values)
+
+    def test_update_last_changes_the_last_candle_in_place(self):
+        buffer = CandlesBuffer(maxlen=2, columns=2)
+        with self.assertRaises(IndexError):
+            buffer.update_last([1, 1])
+        buffer.extend(self.rows(0, 3))
+        version = buffer.version
+
+        buffer.update_last(["2", 25])
+
+        np.testing.assert_array_equal([[1, 10], [2, 25]], buffer.values)
+        self.assertGreater(buffer.version, version)
+
+    def test_values_is_a_read_only_view(self):
+        buffer = CandlesBuffer(maxlen=2, columns=2)
+        buffer.extend(self.rows(0, 2))
+        values = buffer.values
+
+        with self.assertRaises(ValueError):
+            values[0, 0] = 5
+        buffer.update_last([1, 15])
+        self.assertEqual(15, values[-1, 1])
+
+    def test_clear_removes_the_candles(self):
+        buffer = CandlesBuffer(maxlen=2, columns=2)
+        buffer.extend(self.rows(0, 2))
+        version = buffer.version
+
+        buffer.clear()
+
+        self.assertEqual(0, len(buffer))
+        self.assertEqual((0, 2), buffer.values.shape)
+        self.assertGreater(buffer.version, version)
+        self.assertEqual([], list(buffer))
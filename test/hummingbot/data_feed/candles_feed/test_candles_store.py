@@ -0,0 +1,163 @@
+import os
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List, Tuple
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_store import CANDLES_COLUMNS, CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+
+def candles_between(start_time: int, end_time: int, interval_in_seconds: int = 60) -> pd.DataFrame:
+    timestamps = np.arange(start_time, end_time + 1, interval_in_seconds, dtype=float)
+    candles = pd.DataFrame({column: timestamps / 1000 for column in CANDLES_COLUMNS})
+    candles["timestamp"] = timestamps
+    return candles
+
+
+class FakeCandlesFeed:
+    candles_max_result_per_rest_request = 10
+
+    def __init__(self):
+        self.requests: List[Tuple[int, int]] = []
+        # Like a pair listed at this time, there are no candles before it
+        self.first_candle_time: int = 0
+        # Like a maintenance, there are no candles at these times
+        self.missing_timestamps: List[float] = []
+
+    async def get_historical_candles(self, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        self.requests.append((config.start_time, config.end_time))
+        if config.end_time < self.first_candle_time:
+            return pd.DataFrame()
+        candles = candles_between(max(config.start_time, self.first_candle_time), config.end_time)
+        return candles[~candles["timestamp"].isin(self.missing_timestamps)].reset_index(drop=True)
+
+
+class CandlesStoreTests(IsolatedAsyncioWrapperTestCase):
+    # 2024-01-01 00:00:00 UTC
+    start_time = 1704067200
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = CandlesStore(self.temp_dir.name)
+        self.feed = FakeCandlesFeed()
+        time_patch = patch.object(CandlesStore, "_time", return_value=self.start_time + 3 * 86400)
+        time_patch.start()
+        self.addCleanup(time_patch.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def config(self, start_time: int, end_time: int) -> HistoricalCandlesConfig:
+        return HistoricalCandlesConfig(connector_name="binance", trading_pair="ETH-USDT", interval="1m",
+                                       start_time=start_time, end_time=end_time)
+
+    def test_missing_ranges(self):
+        timestamps = np.array([0, 60, 240, 600, 660], dtype=float)
+
+        self.assertEqual([(120, 180), (300, 540), (720, 780)],
+                         CandlesStore.missing_ranges(timestamps, 0, 780, 60))
+        # Ranges separated by only one stored candle are downloaded together
+        self.assertEqual([(120, 540), (720, 780)], CandlesStore.missing_ranges(timestamps, 0, 780, 60, 1))
+        self.assertEqual([], CandlesStore.missing_ranges(timestamps, 0, 60, 60))
+        self.assertEqual([(300, 480), (720, 780)],
+                         CandlesStore.missing_ranges(timestamps, 0, 780, 60, covered_ranges=[(100, 180), (540, 540)]))
+
+    async def test_downloads_only_missing_candles(self):
+        start_time = self.start_time + 3600
+        end_time = start_time + 86400
+        candles = await self.store.get_historical_candles(self.feed, self.config(start_time, end_time))
+
+        pd.testing.assert_frame_equal(candles_between(start_time, end_time), candles)
+        self.assertEqual(1, len(self.feed.requests))
+        # The candles are stored in a file per day, next to the downloaded ranges
+        directory = os.path.join(self.temp_dir.name, "binance", "ETH-USDT", "1m")
+        self.assertEqual(["2024-01-01.parquet", "2024-01-02.parquet", "covered_ranges.json"],
+                         sorted(os.listdir(directory)))
+
+        self.feed.requests.clear()
+        candles = await self.store.get_historical_candles(self.feed, self.config(start_time + 600, end_time))
+
+        pd.testing.assert_frame_equal(candles_between(start_time + 600, end_time), candles)
+        self.assertEqual([], self.feed.requests)
+
+        extended_end_time = end_time + 7200
+        candles = await self.store.get_historical_candles(self.feed, self.config(start_time, extended_end_time))
+
+        pd.testing.assert_frame_equal(candles_between(start_time, extended_end_time), candles)
+        self.assertEqual([(end_time + 60, extended_end_time + 60)], self.feed.requests)
+
+    async def test_only_the_span_returned_by_the_feed_is_covered(self):
+        self.feed.first_candle_time = self.start_time + 43200
+        end_time = self.start_time + 86400
+        candles = await self.store.get_historical_candles(self.feed, self.config(self.start_time, end_time))
+
+        pd.testing.assert_frame_equal(candles_between(self.feed.first_candle_time, end_time), candles)
+        self.assertEqual(1, len(self.feed.requests))
+        self.assertEqual([(self.feed.first_candle_time, end_time)],
+                         self.store.load_covered_ranges("binance", "ETH-USDT", "1m"))
+
+        self.feed.requests.clear()
+        candles = await self.store.get_historical_candles(self.feed, self.config(self.start_time, end_time))
+
+        pd.testing.assert_frame_equal(candles_between(self.feed.first_candle_time, end_time), candles)
+        # The range the feed returned no candles for is requested again
+        self.assertEqual([(self.start_time - 60, self.feed.first_candle_time)], self.feed.requests)
+
+    async def test_periods_without_candles_inside_a_download_are_not_requested_again(self):
+        end_time = self.start_time + 3600
+        self.feed.missing_timestamps = list(range(self.start_time + 600, self.start_time + 1201, 60))
+
+        await self.store.get_historical_candles(self.feed, self.config(self.start_time, end_time))
+
+        self.assertEqual([(self.start_time, end_time)], self.store.load_covered_ranges("binance", "ETH-USDT", "1m"))
+
+    async def test_download_without_candles(self):
+        self.feed.first_candle_time = self.start_time + 86400
+        end_time = self.start_time + 3600
+        candles = await self.store.get_historical_candles(self.feed, self.config(self.start_time, end_time))
+
+        self.assertTrue(candles.empty)
+        self.assertEqual(CANDLES_COLUMNS, list(candles.columns))
+
+        self.feed.requests.clear()
+        await self.store.get_historical_candles(self.feed, self.config(self.start_time + 600, end_time + 600))
+
+        self.assertEqual([(self.start_time + 540, end_time + 660)], self.feed.requests)
+        self.assertEqual([], self.store.load_covered_ranges("binance", "ETH-USDT", "1m"))
+
+    async def test_open_candles_are_not_stored(self):
+        now = self.start_time + 3600 + 30
+        end_time = self.start_time + 7200
+        with patch.object(CandlesStore, "_time", return_value=now):
+            candles = await self.store.get_historical_candles(self.feed, self.config(self.start_time, end_time))
+
+        self.assertEqual(now - 90, candles["timestamp"].iloc[-1])
+        stored = self.store.load("binance", "ETH-USDT", "1m", self.start_time, end_time)
+        self.assertEqual(now - 90, stored["timestamp"].iloc[-1])
+
+    def test_save_merges_and_cleans_candles(self):
+        self.store.save("binance", "ETH-USDT", "1m", candles_between(self.start_time + 600, self.start_time + 1200))
+        new_candles = candles_between(self.start_time, self.start_time + 900)
+        new_candles.loc[len(new_candles)] = [self.start_time + 30] * len(CANDLES_COLUMNS)
+        self.store.save("binance", "ETH-USDT", "1m", new_candles.iloc[::-1])
+
+        stored = self.store.load("binance", "ETH-USDT", "1m", self.start_time, self.start_time + 86400)
+
+        pd.testing.assert_frame_equal(candles_between(self.start_time, self.start_time + 1200), stored)
+
+    def test_import_csv(self):
+        file_path = os.path.join(self.temp_dir.name, "candles_binance_ETH-USDT_1m.csv")
+        candles_between(self.start_time, self.start_time + 3600).to_csv(file_path, index=False)
+
+        self.store.import_csv(file_path, "binance", "ETH-USDT", "1m")
+
+        stored = self.store.load("binance", "ETH-USDT", "1m", self.start_time, self.start_time + 3600)
+        pd.testing.assert_frame_equal(candles_between(self.start_time, self.start_time + 3600), stored)
+        with self.assertRaises(FileNotFoundError):
+            self.store.import_csv(file_path + ".missing", "binance", "ETH-USDT", "1m")
@@ -0,0 +1,212 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.indicators import (
+    ATR,
+    EMA,
+    MACD,
+    NATR,
+    BBands,
+    Donchian,
+    IndicatorPipeline,
+    SuperTrend,
+)
+
+try:
+    import pandas_ta as ta  # noqa: F401
+except ImportError:
+    ta = None
+
+
+def ema_reference(values: pd.Series, length: int) -> pd.Series:
+    # Seeded with the simple average of the first values, like pandas_ta.ema
+    values = values.copy()
+    values.iloc[length - 1] = values.iloc[:length].mean()
+    values.iloc[:length - 1] = np.nan
+    return values.ewm(span=length, adjust=False).mean()
+
+
+def atr_reference(df: pd.DataFrame, length: int) -> pd.Series:
+    previous_close = df["close"].shift(1)
+    true_range = pd.concat([df["high"] - df["low"], (df["high"] - previous_close).abs(),
+                            (df["low"] - previous_close).abs()], axis=1).max(axis=1, skipna=False)
+    return true_range.ewm(alpha=1 / length, min_periods=length).mean()
+
+
+def supertrend_reference(df: pd.DataFrame, length: int, multiplier: float) -> pd.DataFrame:
+    mid = 0.5 * (df["high"] + df["low"]).values
+    band = multiplier * atr_reference(df, length).values
+    upper, lower = mid + band, mid - band
+    close = df["close"].values
+    direction = np.ones(len(df))
+    trend, long, short = np.zeros(len(df)), np.full(len(df), np.nan), np.full(len(df), np.nan)
+    for i in range(1, len(df)):
+        if close[i] > upper[i - 1]:
+            direction[i] = 1
+        elif close[i] < lower[i - 1]:
+            direction[i] = -1
+        else:
+            direction[i] = direction[i - 1]
+            if direction[i] > 0 and lower[i] < lower[i - 1]:
+                lower[i] = lower[i - 1]
+            if direction[i] < 0 and upper[i] > upper[i - 1]:
+                upper[i] = upper[i - 1]
+        if direction[i] > 0:
+            trend[i] = long[i] = lower[i]
+        else:
+            trend[i] = short[i] = upper[i]
+    return pd.DataFrame({"trend": trend, "direction": direction, "long": long, "short": short})
+
+
+class IndicatorTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        rng = np.random.default_rng(42)
+        records = 300
+        close = 100 + np.cumsum(rng.normal(0, 1, records))
+        candles = np.zeros((records, len(CandlesBase.columns)))
+        candles[:, 0] = 1700000000 + 60 * np.arange(records)
+        candles[:, 1] = np.roll(close, 1)
+        candles[:, 2] = close + rng.uniform(0, 1, records)
+        candles[:, 3] = close - rng.uniform(0, 1, records)
+        candles[:, 4] = close
+        candles[:, 5] = rng.uniform(1, 10, records)
+        cls.candles = candles
+
+    def run_pipeline(self, indicators) -> IndicatorPipeline:
+        pipeline = IndicatorPipeline(indicators, max_records=len(self.candles))
+        for candle in self.candles:
+            # Each candle is first received before it closes, with other prices, and then updated
+            open_candle = candle.copy()
+            open_candle[2:5] = [candle[4] + 2, candle[4] - 2, candle[4] + 1]
+            pipeline.update(open_candle)
+            pipeline.update(candle)
+        return pipeline
+
+    def assert_parity(self, pipeline: IndicatorPipeline, df: pd.DataFrame):
+        for index, column in enumerate(pipeline.columns):
+            np.testing.assert_allclose(pipeline.history[:, index], df[column].values.astype(float), rtol=1e-9,
+                                       atol=1e-12, equal_nan=True, err_msg=column)
+            np.testing.assert_allclose(pipeline.latest[column], df[column].iloc[-1], rtol=1e-9, equal_nan=True)
+
+    def candles_df(self) -> pd.DataFrame:
+        return pd.DataFrame(self.candles, columns=CandlesBase.columns)
+
+
+class IndicatorPipelineTest(IndicatorTestCase):
+
+    def test_ema(self):
+        df = self.candles_df()
+        df["EMA_10"] = ema_reference(df["close"], 10)
+        df["EMA_50"] = ema_reference(df["close"], 50)
+        self.assert_parity(self.run_pipeline([EMA(10), EMA(50)]), df)
+
+    def test_bbands(self):
+        df = self.candles_df()
+        mid = df["close"].rolling(20).mean()
+        deviation = 2 * df["close"].rolling(20).std(ddof=0)
+        df["BBL_20_2.0"], df["BBM_20_2.0"], df["BBU_20_2.0"] = mid - deviation, mid, mid + deviation
+        df["BBB_20_2.0"] = 100 * 2 * deviation / mid
+        df["BBP_20_2.0"] = (df["close"] - df["BBL_20_2.0"]) / (2 * deviation)
+        self.assert_parity(self.run_pipeline([BBands(length=20, std=2.0)]), df)
+
+    def test_macd(self):
+        df = self.candles_df()
+        macd = ema_reference(df["close"], 12) - ema_reference(df["close"], 26)
+        signal = ema_reference(macd.dropna(), 9).reindex(df.index)
+        df["MACD_12_26_9"], df["MACDh_12_26_9"], df["MACDs_12_26_9"] = macd, macd - signal, signal
+        self.assert_parity(self.run_pipeline([MACD(fast=12, slow=26, signal=9)]), df)
+
+    def test_atr_and_natr(self):
+        df = self.candles_df()
+        df["ATRr_14"] = atr_reference(df, 14)
+        df["NATR_14"] = 100 * df["ATRr_14"] / df["close"]
+        self.assert_parity(self.run_pipeline([ATR(14), NATR(14)]), df)
+
+    def test_donchian(self):
+        df = self.candles_df()
+        df["DCL_20_10"] = df["low"].rolling(20).min()
+        df["DCU_20_10"] = df["high"].rolling(10).max()
+        df["DCM_20_10"] = 0.5 * (df["DCL_20_10"] + df["DCU_20_10"])
+        self.assert_parity(self.run_pipeline([Donchian(lower_length=20, upper_length=10)]), df)
+
+    def test_supertrend(self):
+        df = self.candles_df()
+        reference = supertrend_reference(df, length=7, multiplier=3.0)
+        df["SUPERT_7_3.0"], df["SUPERTd_7_3.0"] = reference["trend"], reference["direction"]
+        df["SUPERTl_7_3.0"], df["SUPERTs_7_3.0"] = reference["long"], reference["short"]
+        self.assert_parity(self.run_pipeline([SuperTrend(length=7, multiplier=3.0)]), df)
+
+    def test_zero_prices_do_not_raise(self):
+        pipeline = IndicatorPipeline([BBands(length=2), NATR(1)])
+        pipeline.update([1, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+        pipeline.update([2, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+
+        self.assertTrue(np.isnan(pipeline.latest["BBB_2_2.0"]))
+        self.assertTrue(np.isnan(pipeline.latest["BBP_2_2.0"]))
+        self.assertTrue(np.isnan(pipeline.latest["NATR_1"]))
+
+    def test_history_keeps_the_last_records(self):
+        pipeline = IndicatorPipeline([EMA(3)], max_records=5)
+        pipeline.update_candles(self.candles[:8])
+
+        self.assertEqual((5, 1), pipeline.history.shape)
+        full_pipeline = self.run_pipeline([EMA(3)])
+        np.testing.assert_allclose(full_pipeline.history[3:8], pipeline.history)
+        self.assertEqual(self.candles[7][0], pipeline.last_timestamp)
+        with self.assertRaises(ValueError):
+            pipeline.history[0, 0] = 1
+
+    def test_older_candles_are_ignored_and_reset_clears_the_state(self):
+        pipeline = IndicatorPipeline([EMA(2)], max_records=3)
+        pipeline.update_candles(self.candles[:3])
+        latest = pipeline.latest
+
+        pipeline.update(self.candles[0])
+        self.assertEqual(latest, pipeline.latest)
+
+        pipeline.reset()
+        self.assertIsNone(pipeline.last_timestamp)
+        self.assertTrue(np.isnan(pipeline.latest["EMA_2"]))
+        self.assertEqual(0, len(pipeline.history))
+
+
+@unittest.skipIf(ta is None, "pandas_ta is not installed")
+class PandasTaParityTest(IndicatorTestCase):
+
+    def test_ema_parity(self):
+        df = self.candles_df()
+        df.ta.ema(length=10, append=True)
+        df.ta.ema(length=50, append=True)
+        self.assert_parity(self.run_pipeline([EMA(10), EMA(50)]), df)
+
+    def test_bbands_parity(self):
+        df = self.candles_df()
+        df.ta.bbands(length=20, std=2.0, append=True)
+        self.assert_parity(self.run_pipeline([BBands(length=20, std=2.0)]), df)
+
+    def test_macd_parity(self):
+        df = self.candles_df()
+        df.ta.macd(fast=12, slow=26, signal=9, append=True)
+        self.assert_parity(self.run_pipeline([MACD(fast=12, slow=26, signal=9)]), df)
+
+    def test_atr_and_natr_parity(self):
+        df = self.candles_df()
+        df.ta.atr(length=14, append=True)
+        df.ta.natr(length=14, append=True)
+        self.assert_parity(self.run_pipeline([ATR(14), NATR(14)]), df)
+
+    def test_donchian_parity(self):
+        df = self.candles_df()
+        df.ta.donchian(lower_length=20, upper_length=10, append=True)
+        self.assert_parity(self.run_pipeline([Donchian(lower_length=20, upper_length=10)]), df)
+
+    def test_supertrend_parity(self):
+        df = self.candles_df()
+        df.ta.supertrend(length=7, multiplier=3.0, append=True)
+        self.assert_parity(self.run_pipeline([SuperTrend(length=7, multiplier=3.0)]), df)
@@ -2,13 +2,16 @@ from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.indicators import EMA, IndicatorPipeline
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 
@@ -62,6 +65,16 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 100)
         self.assertIsInstance(result, pd.DataFrame)
 
+    def test_add_candles_indicators(self):
+        self.provider.initialize_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100))
+        pipeline = self.provider.add_candles_indicators("binance", "BTC-USDT", "1m", [EMA(10)], 100)
+        self.assertIsInstance(pipeline, IndicatorPipeline)
+        self.assertEqual(["EMA_10"], pipeline.columns)
+        feed = self.provider.get_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100))
+        self.assertIn(pipeline, feed._indicator_pipelines)
+
     def test_get_trading_pairs(self):
         self.mock_connector.trading_pairs = ["BTC-USDT"]
         trading_pairs = self.provider.get_trading_pairs("mock_connector")
@@ -82,6 +95,21 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
 
+    def test_get_order_book_snapshot_with_depth(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64))
+        self.mock_connector.get_order_book.return_value = order_book
+
+        bids, asks = self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT", depth=2)
+
+        self.assertEqual(["price", "amount", "update_id"], list(bids.columns))
+        self.assertEqual([[99., 1., 1.], [98., 2., 1.]], bids.values.tolist())
+        self.assertEqual([[101., 1., 1.], [102., 2., 1.]], asks.values.tolist())
+        top_bids, top_asks = self.provider.get_order_book_top_n("mock_connector", "BTC-USDT", 1)
+        self.assertEqual(99, top_bids["price"][0])
+        self.assertEqual(1, len(top_asks))
+
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
             get_price_for_quote_volume=MagicMock(return_value=OrderBookQueryResult(100, 2, 100, 2)))
@@ -0,0 +1,121 @@
+import threading
+from contextlib import contextmanager
+from typing import List
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
+from hummingbot.model.transaction_base import TransactionBase
+
+
+class RecordingSQLManager(TransactionBase):
+    """
+    Stands in for the SQL connection manager, recording the operations committed in each transaction.
+    """
+
+    def __init__(self):
+        self.committed_batches: List[List[str]] = []
+        self.fail_batches_with: str = ""
+
+    def get_new_session(self):
+        return MagicMock()
+
+    @contextmanager
+    def begin(self):
+        session = []
+        yield session
+        if self.fail_batches_with in session and len(session) > 1:
+            raise Exception("Batch failure")
+        if self.fail_batches_with not in session:
+            self.committed_batches.append(session)
+
+
+def record(name: str):
+    return lambda session: session.append(name)
+
+
+class SQLWriteBehindQueueTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.sql_manager = RecordingSQLManager()
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            SQLWriteBehindQueue(sql_manager=self.sql_manager, batch_size=0)
+        with self.assertRaises(ValueError):
+            SQLWriteBehindQueue(sql_manager=self.sql_manager, batch_size=10, max_backlog=5)
+
+    def test_operations_are_written_in_batches_of_batch_size(self):
+        write_queue = SQLWriteBehindQueue(sql_manager=self.sql_manager, batch_size=3, flush_interval=60)
+        write_queue.start()
+
+        for index in range(6):
+            write_queue.put(record(f"op{index}"))
+        write_queue.flush()
+
+        self.assertEqual([["op0", "op1", "op2"], ["op3", "op4", "op5"]], self.sql_manager.committed_batches)
+        write_queue.stop()
+
+    def test_partial_batch_is_written_after_flush_interval(self):
+        write_queue = SQLWriteBehindQueue(sql_manager=self.sql_manager, batch_size=100, flush_interval=0.01)
+        write_queue.start()
+
+        write_queue.put(record("op0"))
+        write_queue.flush()
+
+        self.assertEqual([["op0"]], self.sql_manager.committed_batches)
+        write_queue.stop()
+
+    def test_stop_writes_pending_operations(self):
+        write_queue = SQLWriteBehindQueue(sql_manager=self.sql_manager, batch_size=100, flush_interval=60)
+        write_queue.start()
+
+        write_queue.put(record("op0"))
+        write_queue.put(record("op1"))
+        write_queue.stop()
+
+        self.assertFalse(write_queue.is_running)
+        self.assertEqual([["op0", "op1"]], self.sql_manager.committed_batches)
+
+    def test_failed_batch_is_retried_one_by_one(self):
+        self.sql_manager.fail_batches_with = "bad"
+        write_queue = SQLWriteBehindQueue(sql_manager=self.sql_manager, batch_size=3, flush_interval=60)
+        write_queue.start()
+
+        write_queue.put(record("op0"))
+        write_queue.put(record("bad"))
+        write_queue.put(record("op2"))
+        write_queue.flush()
+
+        self.assertEqual([["op0"], ["op2"]], self.sql_manager.committed_batches)
+        write_queue.stop()
+
+    def test_put_waits_for_room_when_backlog_is_full(self):
+        release_worker = threading.Event()
+        worker_busy = threading.Event()
+        write_queue = SQLWriteBehindQueue(
+            sql_manager=self.sql_manager, batch_size=1, flush_interval=60, max_backlog=1)
+        write_queue.start()
+
+        def block_worker(session):
+            worker_busy.set()
+            release_worker.wait()
+
+        write_queue.put(block_worker)
+        worker_busy.wait(timeout=1)
+        write_queue.put(record("op1"))
+
+        with self.assertLogs(level="WARNING") as logs:
+            producer = threading.Thread(target=lambda: (write_queue.put(record("op2")), write_queue.put(record("op3"))))
+            producer.start()
+            producer.join(timeout=0.1)
+            self.assertTrue(producer.is_alive())
+            release_worker.set()
+            producer.join(timeout=1)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(1, len(logs.records))
+        self.assertGreaterEqual(write_queue.overflow_count, 1)
+
+        write_queue.stop()
+        self.assertEqual([["op1"], ["op2"], ["op3"]], self.sql_manager.committed_batches[1:])
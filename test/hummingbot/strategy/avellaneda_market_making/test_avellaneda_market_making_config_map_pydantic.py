@@ -200,6 +200,17 @@ class AvellanedaMarketMakingConfigMapPydanticTest(unittest.TestCase):
         model.hanging_orders_cancel_pct = "3"
         self.assertEqual(3, model.hanging_orders_cancel_pct)
 
+        self.assertEqual("curve_fit", self.config_map.trading_intensity_estimator)
+        self.config_map.trading_intensity_estimator = "log_linear"
+        self.assertEqual("log_linear", self.config_map.trading_intensity_estimator)
+
+        with self.assertRaises(ConfigValidationError) as e:
+            self.config_map.trading_intensity_estimator = "XXX"
+
+        error_msg = ("Invalid trading intensity estimator, please choose value from "
+                     "['curve_fit', 'log_linear', 'log_linear_refined'].")
+        self.assertEqual(error_msg, str(e.exception))
+
     def test_load_configs_from_yaml(self):
         cur_dir = Path(__file__).parent
         f_path = cur_dir / "test_config.yml"
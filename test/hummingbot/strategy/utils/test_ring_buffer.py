@@ -107,3 +107,44 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_running_mean_and_variance(self):
+        buffer = RingBuffer(50, track_stats=True)
+        self.assertTrue(np.isnan(buffer.running_mean))
+        self.assertTrue(np.isnan(buffer.running_variance))
+
+        samples = np.random.default_rng(1).normal(1000, 5, 500)
+        for sample in samples:
+            buffer.add_value(sample)
+            values = buffer.get_as_numpy_array()
+            self.assertAlmostEqual(np.mean(values), buffer.running_mean, delta=1e-9)
+            self.assertAlmostEqual(np.var(values), buffer.running_variance, delta=1e-9)
+        self.assertEqual(50, buffer.size)
+
+    def test_running_stats_recover_from_nan(self):
+        buffer = RingBuffer(5, track_stats=True)
+        buffer.add_value(np.nan)
+        self.assertTrue(np.isnan(buffer.running_mean))
+
+        for value in range(5):
+            buffer.add_value(value)
+
+        self.assertEqual(2, buffer.running_mean)
+        self.assertEqual(2, buffer.running_variance)
+
+    def test_running_stats_after_length_change(self):
+        buffer = RingBuffer(10, track_stats=True)
+        for value in range(20):
+            buffer.add_value(value)
+
+        buffer.length = 4
+
+        self.assertEqual(17.5, buffer.running_mean)
+        self.assertEqual(1.25, buffer.running_variance)
+
+    def test_values_are_stored_with_single_precision(self):
+        buffer = RingBuffer(5, track_stats=True)
+        buffer.add_value(0.1)
+
+        self.assertEqual(float(np.float32(0.1)), buffer.get_last_value())
+        self.assertEqual(float(np.float32(0.1)), buffer.running_mean)
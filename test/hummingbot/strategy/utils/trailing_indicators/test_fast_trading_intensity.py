@@ -0,0 +1,155 @@
+import unittest
+from decimal import Decimal
+from test.hummingbot.strategy.utils.trailing_indicators.test_trading_intensity import TradingIntensityTest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators.fast_trading_intensity import (
+    FastTradingIntensityIndicator,
+    fit_log_linear_intensity,
+)
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+
+class FastTradingIntensityTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+    BUFFER_LENGTH = 50
+
+    start_timestamp: float = pd.Timestamp("2019-01-01", tz="UTC").timestamp()
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+        self.price_delegate = MagicMock()
+        self.mid_price = Decimal("1")
+        self.price_delegate.get_price_by_type.side_effect = lambda _: self.mid_price
+
+    def trade(self, timestamp: float, price: float, amount: float) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(trading_pair="COINALPHA-HBOT", timestamp=timestamp, price=price, amount=amount,
+                                   type=TradeType.SELL)
+
+    def run_random_scenario(self, indicators):
+        """
+        Runs the indicators over the random order books of TradingIntensityTest and returns their values on each tick
+        where the sampling buffers are full.
+        """
+        bids_df, asks_df = TradingIntensityTest.make_order_books(
+            100, Decimal("10"), Decimal("1"), Decimal("0.05"), Decimal("0.1"), Decimal("0.01"), 300)
+        trades = TradingIntensityTest.make_trades(bids_df, asks_df)
+        values = []
+        timestamp = self.start_timestamp
+        for bid_df, ask_df, trades_tick in zip(bids_df, asks_df, trades):
+            self.mid_price = Decimal(str((bid_df["price"].iloc[0] + ask_df["price"].iloc[0]) / 2))
+            for indicator in indicators:
+                for trade in trades_tick:
+                    indicator.register_trade(trade)
+                indicator.calculate(timestamp)
+            if all(indicator.is_sampling_buffer_full for indicator in indicators):
+                values.append([indicator.current_value for indicator in indicators])
+            timestamp += 1
+        return np.array(values, dtype=float)
+
+    def test_refined_estimate_matches_curve_fit(self):
+        values = self.run_random_scenario([
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, self.BUFFER_LENGTH),
+            FastTradingIntensityIndicator(OrderBook(), self.price_delegate, self.BUFFER_LENGTH, refine=True),
+        ])
+
+        self.assertGreater(len(values), 200)
+        np.testing.assert_allclose(values[:, 0], values[:, 1], rtol=1e-6, atol=1e-8)
+
+    def test_closed_form_estimate_accuracy(self):
+        values = self.run_random_scenario([
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, self.BUFFER_LENGTH),
+            FastTradingIntensityIndicator(OrderBook(), self.price_delegate, self.BUFFER_LENGTH),
+        ])
+
+        self.assertGreater(len(values), 200)
+        # Alpha within 0.1% and kappa within 1e-5 of the nonlinear fit
+        np.testing.assert_allclose(values[:, 0, 0], values[:, 1, 0], rtol=1e-3)
+        np.testing.assert_allclose(values[:, 0, 1], values[:, 1, 1], atol=1e-5)
+
+    def test_fit_log_linear_intensity(self):
+        price_levels = np.array([0.5, 1, 2, 4])
+
+        alpha, kappa = fit_log_linear_intensity(price_levels, 3 * np.exp(-0.7 * price_levels))
+        self.assertAlmostEqual(3, alpha, 10)
+        self.assertAlmostEqual(0.7, kappa, 10)
+
+        # Intensities growing with the price level are fitted with a flat line
+        self.assertEqual((2.5, 0.0), fit_log_linear_intensity(price_levels, np.array([1, 2, 3, 4])))
+        self.assertIsNone(fit_log_linear_intensity(np.array([1.0]), np.array([2.0])))
+
+    def test_calculate_trading_intensity_deterministic(self):
+        price_levels = [2, 3, 4, 5]
+        indicator = FastTradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 1}]
+
+        for price in price_levels:
+            indicator.register_trade(self.trade(self.start_timestamp + 1, price, 2 * np.exp(-0.1 * (price - 1))))
+        indicator.calculate(self.start_timestamp + 1)
+        alpha, kappa = indicator.current_value
+
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+
+    def test_trades_are_matched_to_the_last_quote_before_them(self):
+        order_book = OrderBook()
+        indicator = FastTradingIntensityIndicator(order_book, self.price_delegate, 2)
+
+        self.mid_price = Decimal("10")
+        indicator.calculate(1)
+        # Trades before the first quote are discarded
+        order_book.trigger_event(OrderBookEvent.TradeEvent, self.trade(0.5, 12, 1))
+        order_book.trigger_event(OrderBookEvent.TradeEvent, self.trade(1.5, 11, 1))
+        self.mid_price = Decimal("20")
+        indicator.calculate(2)
+
+        self.assertFalse(indicator.is_sampling_buffer_full)
+        self.assertTrue(indicator.is_sampling_buffer_changed)
+        self.assertFalse(indicator.is_sampling_buffer_changed)
+        self.assertEqual([{"timestamp": 2, "price": 20}, {"timestamp": 1, "price": 10}], indicator.last_quotes)
+
+        indicator.register_trade(self.trade(2.5, 22, 1))
+        indicator.register_trade(self.trade(2.5, 24, 1))
+        self.mid_price = Decimal("30")
+        indicator.calculate(3)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        # Only the quotes from the last one matched by a trade are kept
+        self.assertEqual([{"timestamp": 3, "price": 30}, {"timestamp": 2, "price": 20}], indicator.last_quotes)
+        # Trades at 1, 2 and 4 from the mid price, with one unit each
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(1, alpha, 10)
+        self.assertAlmostEqual(0, kappa, 10)
+
+        indicator.register_trade(self.trade(3.5, 35, 1))
+        indicator.calculate(4)
+
+        # The trades of the oldest tick leave the sampling window
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        np.testing.assert_array_equal([3, 3, 4], indicator._trade_ticks)
+
+    def test_price_level_amounts_follow_the_sampling_window(self):
+        order_book = OrderBook()
+        indicator = FastTradingIntensityIndicator(order_book, self.price_delegate, 20)
+        rng = np.random.default_rng(5)
+        for tick in range(300):
+            self.mid_price = Decimal("100")
+            for _ in range(rng.integers(0, 4)):
+                # Some trades are older than the last quote
+                trade_time = tick - rng.integers(0, 3) + 0.5
+                indicator.register_trade(self.trade(trade_time, 100 + float(rng.integers(1, 6)), float(rng.random())))
+            indicator.calculate(tick)
+
+            ticks = indicator._trade_ticks
+            self.assertTrue(np.all(np.diff(ticks) >= 0))
+            self.assertEqual(min(len(np.unique(ticks)), 20), indicator._ticks_count)
+            levels, level_indexes = np.unique(indicator._trades.column(1), return_inverse=True)
+            amounts = np.bincount(level_indexes, weights=indicator._trades.column(2), minlength=len(levels))
+            self.assertEqual(set(levels), set(indicator._level_amounts))
+            np.testing.assert_allclose(amounts, [indicator._level_amounts[level][0] for level in levels])
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.base_trailing_indicator import BaseTrailingIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.historical_volatility import HistoricalVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+
+def random_walk(size: int, seed: int) -> np.ndarray:
+    returns = np.random.default_rng(seed).normal(0, 0.002, size)
+    return 25000 * np.exp(np.cumsum(returns))
+
+
+class IncrementalTrailingIndicatorsTest(unittest.TestCase):
+    """
+    The incremental indicators must return the same values as the ones calculated from the whole sampling buffer.
+    """
+    INDICATOR_CLASSES = [HistoricalVolatilityIndicator, InstantVolatilityIndicator]
+
+    def assert_equivalent(self, indicator, incremental_indicator, samples: np.ndarray):
+        for sample in samples:
+            indicator.add_sample(sample)
+            incremental_indicator.add_sample(sample)
+            # The ring buffers store single precision values, and each calculation rounds at different steps
+            self.assertTrue(np.isclose(indicator.current_value, incremental_indicator.current_value,
+                                       rtol=1e-5, atol=1e-12),
+                            f"{indicator.current_value} != {incremental_indicator.current_value}")
+
+    def test_equivalence_across_lengths(self):
+        samples = random_walk(600, seed=7)
+        for indicator_class in self.INDICATOR_CLASSES:
+            for sampling_length, processing_length in [(1, 1), (2, 1), (30, 15), (200, 1), (50, 100)]:
+                with self.subTest(indicator=indicator_class.__name__, sampling_length=sampling_length,
+                                  processing_length=processing_length):
+                    self.assert_equivalent(indicator_class(sampling_length, processing_length),
+                                           indicator_class(sampling_length, processing_length, incremental=True),
+                                           samples)
+
+    def test_equivalence_after_length_changes(self):
+        samples = random_walk(300, seed=11)
+        for indicator_class in self.INDICATOR_CLASSES:
+            with self.subTest(indicator=indicator_class.__name__):
+                indicator = indicator_class(40, 10)
+                incremental_indicator = indicator_class(40, 10, incremental=True)
+                self.assert_equivalent(indicator, incremental_indicator, samples[:100])
+
+                for changed_indicator in (indicator, incremental_indicator):
+                    changed_indicator.sampling_length = 25
+                    changed_indicator.processing_length = 5
+                self.assert_equivalent(indicator, incremental_indicator, samples[100:200])
+
+                for changed_indicator in (indicator, incremental_indicator):
+                    changed_indicator.sampling_length = 60
+                self.assert_equivalent(indicator, incremental_indicator, samples[200:])
+
+    def test_indicators_without_incremental_calculation_are_rejected(self):
+        class LastValueIndicator(BaseTrailingIndicator):
+            def _indicator_calculation(self) -> float:
+                return self._sampling_buffer.get_last_value()
+
+        LastValueIndicator(sampling_length=30, processing_length=1)
+        with self.assertRaises(ValueError):
+            LastValueIndicator(sampling_length=30, processing_length=1, incremental=True)
@@ -0,0 +1,91 @@
+import random
+import unittest
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.executors_simulator.test_position_executor_simulator import (
+    SIMULATION_COLUMNS,
+    synthetic_candles,
+)
+
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import MarketDataArrays
+from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
+from hummingbot.strategy_v2.executors.position_executor.data_types import TrailingStop
+
+
+class DCAExecutorSimulatorTests(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.simulator = DCAExecutorSimulator()
+        self.df = synthetic_candles(3000, seed=3)
+        self.market_data = MarketDataArrays(self.df)
+
+    def get_config(self, start_index: int, side: TradeType, prices, **kwargs) -> DCAExecutorConfig:
+        return DCAExecutorConfig(
+            id="test",
+            timestamp=self.df["timestamp"].iloc[start_index],
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            side=side,
+            prices=prices,
+            amounts_quote=[Decimal("10") * (i + 1) for i in range(len(prices))],
+            **kwargs,
+        )
+
+    def assert_same_simulation(self, start_index: int, config: DCAExecutorConfig, trade_cost: float = 0.0006):
+        expected = self.simulator.simulate(self.df.loc[start_index:], config, trade_cost)
+        result = self.simulator.simulate_from_index(self.market_data, start_index, config, trade_cost)
+
+        self.assertEqual(expected.close_type, result.close_type)
+        pd.testing.assert_frame_equal(expected.executor_simulation[SIMULATION_COLUMNS],
+                                      result.executor_simulation[SIMULATION_COLUMNS],
+                                      check_exact=True)
+        for timestamp in expected.executor_simulation["timestamp"].iloc[[0, -1]]:
+            self.assertEqual(expected.get_executor_info_at_timestamp(timestamp),
+                             result.get_executor_info_at_timestamp(timestamp))
+
+    def test_taker_mode_not_supported(self):
+        config = self.get_config(0, TradeType.BUY, [Decimal("100")], stop_loss=Decimal("0.01"), mode=DCAMode.TAKER)
+
+        with self.assertRaises(NotImplementedError):
+            self.simulator.simulate_from_index(self.market_data, 0, config, 0.0006)
+
+    def test_no_order_filled(self):
+        config = self.get_config(0, TradeType.BUY, [Decimal("1"), Decimal("0.5")], stop_loss=Decimal("0.01"),
+                                 time_limit=60 * 100)
+
+        self.assert_same_simulation(0, config)
+
+    def test_random_configurations_match_dataframe_simulation(self):
+        rng = random.Random(11)
+        for _ in range(150):
+            start_index = rng.randrange(0, len(self.df) - 1)
+            side = rng.choice([TradeType.BUY, TradeType.SELL])
+            side_multiplier = -1 if side == TradeType.BUY else 1
+            close = Decimal(str(self.df["close"].iloc[start_index]))
+            step = Decimal(rng.choice([1, 2, 5])) / 1000
+            levels = rng.randint(1, 4)
+            prices = [close * (1 + side_multiplier * step * i) for i in range(levels)]
+            trailing_stop = None
+            if rng.random() < 0.5:
+                trailing_stop = TrailingStop(activation_price=Decimal(rng.choice(["0.002", "0.005"])),
+                                             trailing_delta=Decimal(rng.choice(["0.001", "0.002"])))
+            config = self.get_config(
+                start_index, side, prices,
+                stop_loss=rng.choice([None, Decimal("0.005"), Decimal("0.02")]),
+                take_profit=rng.choice([None, Decimal("0.003"), Decimal("0.01")]),
+                time_limit=rng.choice([None, 60 * 30, 60 * 500]),
+                trailing_stop=trailing_stop)
+
+            try:
+                expected_error = None
+                self.simulator.simulate(self.df.loc[start_index:], config, 0.0006)
+            except Exception as e:
+                expected_error = type(e)
+            if expected_error is not None:
+                with self.assertRaises(expected_error):
+                    self.simulator.simulate_from_index(self.market_data, start_index, config, 0.0006)
+            else:
+                self.assert_same_simulation(start_index, config)
@@ -0,0 +1,111 @@
+import random
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import MarketDataArrays
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.executors import CloseType
+
+SIMULATION_COLUMNS = ["timestamp", "close", "net_pnl_pct", "net_pnl_quote", "cum_fees_quote", "filled_amount_quote",
+                      "current_position_average_price"]
+
+
+def synthetic_candles(rows: int, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows))), 2)
+    spread = np.round(np.abs(rng.normal(0, 0.1, rows)), 2)
+    return pd.DataFrame({
+        "timestamp": 1700000000.0 + 60.0 * np.arange(rows),
+        "open": close,
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": 1.0,
+    })
+
+
+class PositionExecutorSimulatorTests(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.simulator = PositionExecutorSimulator()
+        self.df = synthetic_candles(3000)
+        self.market_data = MarketDataArrays(self.df)
+
+    def get_config(self, start_index: int, side: TradeType, entry_price: Decimal, **barriers) -> PositionExecutorConfig:
+        return PositionExecutorConfig(
+            id="test",
+            timestamp=self.df["timestamp"].iloc[start_index],
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            side=side,
+            entry_price=entry_price,
+            amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(**barriers),
+        )
+
+    def assert_same_simulation(self, start_index: int, config: PositionExecutorConfig, trade_cost: float = 0.0006):
+        expected = self.simulator.simulate(self.df.loc[start_index:], config, trade_cost)
+        result = self.simulator.simulate_from_index(self.market_data, start_index, config, trade_cost)
+
+        self.assertEqual(expected.close_type, result.close_type)
+        pd.testing.assert_frame_equal(expected.executor_simulation[SIMULATION_COLUMNS],
+                                      result.executor_simulation[SIMULATION_COLUMNS],
+                                      check_exact=True)
+        for timestamp in expected.executor_simulation["timestamp"].iloc[[0, -1]]:
+            self.assertEqual(expected.get_executor_info_at_timestamp(timestamp),
+                             result.get_executor_info_at_timestamp(timestamp))
+
+    def test_take_profit(self):
+        start_price = Decimal(str(self.df["close"].iloc[10]))
+        config = self.get_config(10, TradeType.SELL, start_price, stop_loss=Decimal("0.5"),
+                                 take_profit=Decimal("0.002"))
+
+        self.assert_same_simulation(10, config)
+        self.assertEqual(CloseType.TAKE_PROFIT,
+                         self.simulator.simulate_from_index(self.market_data, 10, config, 0.0006).close_type)
+
+    def test_limit_order_entry_at_exact_price(self):
+        entry_price = Decimal(str(self.df["close"].iloc[50]))
+        config = self.get_config(0, TradeType.SELL, entry_price, stop_loss=Decimal("0.01"),
+                                 take_profit=Decimal("0.01"), time_limit=60 * 2000)
+
+        self.assert_same_simulation(0, config)
+
+    def test_limit_order_never_filled(self):
+        config = self.get_config(0, TradeType.BUY, Decimal("1"), stop_loss=Decimal("0.01"),
+                                 take_profit=Decimal("0.01"), time_limit=60 * 100)
+
+        self.assert_same_simulation(0, config)
+        simulation = self.simulator.simulate_from_index(self.market_data, 0, config, 0.0006)
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(101, len(simulation.executor_simulation))
+
+    def test_random_configurations_match_dataframe_simulation(self):
+        rng = random.Random(7)
+        for _ in range(150):
+            start_index = rng.randrange(0, len(self.df) - 1)
+            side = rng.choice([TradeType.BUY, TradeType.SELL])
+            close = Decimal(str(self.df["close"].iloc[start_index]))
+            entry_price = close * (1 + Decimal(rng.choice([-3, -1, 0, 1, 3])) / 1000)
+            trailing_stop = None
+            if rng.random() < 0.5:
+                trailing_stop = TrailingStop(activation_price=Decimal(rng.choice(["0.002", "0.005", "0.01"])),
+                                             trailing_delta=Decimal(rng.choice(["0.001", "0.002"])))
+            config = self.get_config(
+                start_index, side, entry_price,
+                stop_loss=rng.choice([None, Decimal("0.005"), Decimal("0.02")]),
+                take_profit=rng.choice([None, Decimal("0.005"), Decimal("0.02")]),
+                time_limit=rng.choice([None, 60 * 30, 60 * 500]),
+                trailing_stop=trailing_stop,
+                open_order_type=rng.choice([OrderType.LIMIT, OrderType.MARKET]))
+
+            self.assert_same_simulation(start_index, config)
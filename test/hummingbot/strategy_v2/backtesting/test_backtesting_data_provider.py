@@ -0,0 +1,115 @@
+import os
+import tempfile
+import time
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+CREATE_CONNECTOR = BacktestingDataProvider._create_connector
+
+
+class BacktestingDataProviderTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        gateway_patch = patch("hummingbot.data_feed.market_data_provider.GatewayHttpClient")
+        gateway_patch.start()
+        self.addCleanup(gateway_patch.stop)
+        create_connector_patch = patch.object(BacktestingDataProvider, "_create_connector",
+                                              side_effect=self.create_connector)
+        self.create_connector_mock = create_connector_patch.start()
+        self.addCleanup(create_connector_patch.stop)
+        BacktestingDataProvider._trading_rules_cache = {}
+        self.addCleanup(setattr, BacktestingDataProvider, "_trading_rules_cache", {})
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.trading_rule = TradingRule(trading_pair="ETH-USDT",
+                                        min_order_size=Decimal("0.001"),
+                                        min_price_increment=Decimal("0.01"),
+                                        min_base_amount_increment=Decimal("0.0001"),
+                                        supports_market_orders=False)
+
+    def create_connector(self, connector_name: str):
+        connector = MagicMock()
+        connector.trading_rules = {"ETH-USDT": self.trading_rule}
+        connector._update_trading_rules = AsyncMock()
+        return connector
+
+    def test_connectors_are_created_on_first_use(self):
+        provider = BacktestingDataProvider(connectors={})
+
+        self.assertEqual({}, provider.connectors)
+        connector = provider.get_connector("binance")
+
+        self.assertIs(connector, provider.get_connector("binance"))
+        self.create_connector_mock.assert_called_once_with("binance")
+
+    def test_unsupported_connector_raises_error(self):
+        provider = BacktestingDataProvider(connectors={})
+
+        self.assertTrue(provider.is_backtesting_connector("binance"))
+        with patch.object(BacktestingDataProvider, "_create_connector", CREATE_CONNECTOR):
+            with self.assertRaises(ValueError):
+                provider.get_connector("unknown_exchange")
+            with self.assertRaises(ValueError):
+                provider.get_connector("kraken")
+
+    async def test_trading_rules_are_shared_by_instances(self):
+        provider = BacktestingDataProvider(connectors={})
+        await provider.initialize_trading_rules("binance")
+        other_provider = BacktestingDataProvider(connectors={})
+        await other_provider.initialize_trading_rules("binance")
+
+        self.assertIs(self.trading_rule, other_provider.get_trading_rules("binance", "ETH-USDT"))
+        self.create_connector_mock.assert_called_once_with("binance")
+        self.assertEqual({}, other_provider.connectors)
+
+    async def test_trading_rules_are_saved_to_disk(self):
+        provider = BacktestingDataProvider(connectors={}, trading_rules_path=self.temp_dir.name)
+        await provider.initialize_trading_rules("binance")
+        BacktestingDataProvider._trading_rules_cache = {}
+
+        other_provider = BacktestingDataProvider(connectors={}, trading_rules_path=self.temp_dir.name)
+        await other_provider.initialize_trading_rules("binance")
+
+        self.create_connector_mock.assert_called_once_with("binance")
+        self.assertEqual(repr(self.trading_rule), repr(other_provider.get_trading_rules("binance", "ETH-USDT")))
+
+    async def test_outdated_trading_rules_are_downloaded_again(self):
+        provider = BacktestingDataProvider(connectors={}, trading_rules_path=self.temp_dir.name)
+        await provider.initialize_trading_rules("binance")
+        BacktestingDataProvider._trading_rules_cache = {}
+        file_path = os.path.join(self.temp_dir.name, "binance.json")
+        outdated_time = time.time() - 2 * 86400
+        os.utime(file_path, (outdated_time, outdated_time))
+
+        other_provider = BacktestingDataProvider(connectors={}, trading_rules_path=self.temp_dir.name)
+        await other_provider.initialize_trading_rules("binance")
+
+        self.assertEqual(2, self.create_connector_mock.call_count)
+        self.assertGreater(os.path.getmtime(file_path), outdated_time)
+
+    async def test_outdated_cached_trading_rules_are_downloaded_again(self):
+        provider = BacktestingDataProvider(connectors={}, trading_rules_max_age=60)
+        await provider.initialize_trading_rules("binance")
+        update_time, trading_rules = BacktestingDataProvider._trading_rules_cache["binance"]
+        BacktestingDataProvider._trading_rules_cache["binance"] = (update_time - 120, trading_rules)
+
+        other_provider = BacktestingDataProvider(connectors={}, trading_rules_max_age=60)
+        await other_provider.initialize_trading_rules("binance")
+
+        self.assertEqual(2, self.create_connector_mock.call_count)
+        self.assertGreater(BacktestingDataProvider._trading_rules_cache["binance"][0], update_time - 120)
+
+    async def test_instances_get_their_own_trading_rules(self):
+        provider = BacktestingDataProvider(connectors={})
+        await provider.initialize_trading_rules("binance")
+        provider.trading_rules["binance"]["BTC-USDT"] = self.trading_rule
+
+        other_provider = BacktestingDataProvider(connectors={})
+        await other_provider.initialize_trading_rules("binance")
+
+        self.assertEqual(["ETH-USDT"], list(other_provider.trading_rules["binance"]))
+        self.assertEqual(["ETH-USDT"], list(BacktestingDataProvider._trading_rules_cache["binance"][1]))
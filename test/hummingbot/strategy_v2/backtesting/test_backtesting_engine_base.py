@@ -0,0 +1,130 @@
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.executors_simulator.test_position_executor_simulator import (
+    synthetic_candles,
+)
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class CandlesDataProvider:
+    def __init__(self, candles: pd.DataFrame):
+        self.candles = candles
+        self.prices = {}
+        self._time = None
+
+    def time(self):
+        return self._time
+
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
+        return self.candles
+
+
+class SignalController:
+    """
+    Opens an executor on the side of the signal when there is none active on that side, and stops the executors of the
+    opposite side. Its actions only depend on the signal and on the active executors.
+    """
+
+    def __init__(self, candles: pd.DataFrame, features: pd.DataFrame, use_dca: bool = False):
+        self.config = SimpleNamespace(connector_name="binance", trading_pair="ETH-USDT")
+        self.market_data_provider = CandlesDataProvider(candles)
+        self.processed_data = {"features": features}
+        self.executors_info: List[ExecutorInfo] = []
+        self.use_dca = use_dca
+        self.determine_executor_actions_calls = 0
+
+    def determine_executor_actions(self) -> List[ExecutorAction]:
+        self.determine_executor_actions_calls += 1
+        signal = self.processed_data["signal"]
+        if signal == 0:
+            return []
+        side = TradeType.BUY if signal > 0 else TradeType.SELL
+        active_executors = [executor for executor in self.executors_info if executor.is_active]
+        actions = [StopExecutorAction(executor_id=executor.id) for executor in active_executors
+                   if executor.custom_info["side"] != side]
+        if not any(executor.custom_info["side"] == side for executor in active_executors):
+            actions.append(CreateExecutorAction(executor_config=self.get_executor_config(side)))
+        return actions
+
+    def get_executor_config(self, side: TradeType):
+        timestamp = self.market_data_provider.time()
+        price = self.market_data_provider.prices["binance_ETH-USDT"]
+        if self.use_dca:
+            direction = -1 if side == TradeType.BUY else 1
+            return DCAExecutorConfig(
+                id=f"{timestamp}-{side.name}", timestamp=timestamp, connector_name="binance", trading_pair="ETH-USDT",
+                side=side, prices=[price * (1 + direction * Decimal("0.002") * i) for i in range(3)],
+                amounts_quote=[Decimal("10"), Decimal("20"), Decimal("30")], take_profit=Decimal("0.004"),
+                stop_loss=Decimal("0.01"), time_limit=60 * 240)
+        return PositionExecutorConfig(
+            id=f"{timestamp}-{side.name}", timestamp=timestamp, connector_name="binance", trading_pair="ETH-USDT",
+            side=side, entry_price=price * Decimal("0.999") if side == TradeType.BUY else price * Decimal("1.001"),
+            amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(
+                stop_loss=Decimal("0.01"), take_profit=Decimal("0.008"), time_limit=60 * 360,
+                trailing_stop=TrailingStop(activation_price=Decimal("0.004"), trailing_delta=Decimal("0.001")),
+                open_order_type=OrderType.LIMIT))
+
+
+class BacktestingEngineBaseTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.candles = synthetic_candles(4000, seed=5)
+        rng = np.random.default_rng(5)
+        # The signal changes every 30 minutes on average
+        signal = np.repeat(rng.choice([-1, 0, 1], size=400), rng.integers(1, 60, size=400))[:len(self.candles)]
+        self.features = pd.DataFrame({"timestamp": self.candles["timestamp"], "signal": signal})
+
+    async def run_simulation(self, vectorized: bool, decision_columns: Optional[List[str]] = None,
+                             use_dca: bool = False):
+        with patch("hummingbot.strategy_v2.backtesting.backtesting_engine_base.BacktestingDataProvider", MagicMock()):
+            engine = BacktestingEngineBase(vectorized=vectorized, decision_columns=decision_columns)
+        engine.backtesting_resolution = "1m"
+        engine.controller = SignalController(self.candles, self.features.copy(), use_dca=use_dca)
+        if vectorized:
+            executors_info = await engine.simulate_execution_vectorized(trade_cost=0.0006)
+        else:
+            executors_info = await engine.simulate_execution(trade_cost=0.0006)
+        return engine, executors_info
+
+    async def test_vectorized_simulation_matches_row_by_row_simulation(self):
+        engine, expected = await self.run_simulation(vectorized=False)
+        vectorized_engine, result = await self.run_simulation(vectorized=True)
+
+        self.assertGreater(len(expected), 10)
+        self.assertEqual(expected, result)
+        self.assertEqual(engine.controller.processed_data["signal"],
+                         vectorized_engine.controller.processed_data["signal"])
+        self.assertEqual(len(self.candles), vectorized_engine.controller.determine_executor_actions_calls)
+
+    async def test_vectorized_simulation_with_dca_executors(self):
+        _, expected = await self.run_simulation(vectorized=False, use_dca=True)
+        _, result = await self.run_simulation(vectorized=True, use_dca=True)
+
+        self.assertGreater(len(expected), 10)
+        self.assertEqual(expected, result)
+
+    async def test_decision_columns_skip_unchanged_rows(self):
+        engine, expected = await self.run_simulation(vectorized=False)
+        vectorized_engine, result = await self.run_simulation(vectorized=True, decision_columns=["signal"])
+
+        self.assertEqual(expected, result)
+        self.assertEqual(engine.controller.processed_data["close"], vectorized_engine.controller.processed_data["close"])
+        self.assertLess(vectorized_engine.controller.determine_executor_actions_calls,
+                        engine.controller.determine_executor_actions_calls / 4)
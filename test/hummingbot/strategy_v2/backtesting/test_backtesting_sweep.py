@@ -0,0 +1,141 @@
+import os
+import tempfile
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.executors_simulator.test_position_executor_simulator import (
+    synthetic_candles,
+)
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.backtesting_sweep import (
+    BacktestingSweep,
+    SharedCandles,
+    SweepResult,
+    SweepResultsStore,
+)
+
+
+class OfflineDataProvider:
+    def __init__(self):
+        self.candles_feeds = {}
+        self.trading_rules = {}
+        self.candles_feed_requests = 0
+
+    def update_backtesting_time(self, start: int, end: int):
+        pass
+
+    async def initialize_trading_rules(self, connector_name: str):
+        self.trading_rules[connector_name] = {"ETH-USDT": "rules"}
+
+    async def initialize_candles_feed(self, config: CandlesConfig):
+        self.candles_feed_requests += 1
+        key = f"{config.connector}_{config.trading_pair}_{config.interval}"
+        self.candles_feeds[key] = synthetic_candles(500)
+
+
+class OfflineBacktestingEngine(BacktestingEngineBase):
+    """
+    Engine that returns the mean close price of the candles shared by the sweep, scaled by the controller config.
+    """
+
+    def __init__(self):
+        self.backtesting_data_provider = OfflineDataProvider()
+
+    @classmethod
+    def get_controller_config_instance_from_dict(cls, config_data: Dict[str, Any], controllers_module: str = ""):
+        return SimpleNamespace(candles_config=[], **config_data)
+
+    async def run_backtesting(self, controller_config, start: int, end: int, backtesting_resolution: str = "1m",
+                              trade_cost=0.0006):
+        data_provider = self.backtesting_data_provider
+        candles = data_provider.candles_feeds[
+            f"{controller_config.connector_name}_{controller_config.trading_pair}_{backtesting_resolution}"]
+        return {"results": {
+            "net_pnl_quote": float(candles["close"].mean() * controller_config.multiplier),
+            "trading_rules": data_provider.trading_rules[controller_config.connector_name]["ETH-USDT"],
+            "candles_feed_requests": data_provider.candles_feed_requests,
+        }}
+
+
+class BacktestingSweepTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.results_path = os.path.join(self.temp_dir.name, "results.jsonl")
+        self.base_config = {"connector_name": "binance", "trading_pair": "ETH-USDT", "multiplier": 1}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def get_sweep(self) -> BacktestingSweep:
+        return BacktestingSweep(base_config=self.base_config, start=0, end=1, max_workers=2,
+                                results_path=self.results_path, engine_class=OfflineBacktestingEngine)
+
+    def test_grid(self):
+        params = BacktestingSweep.grid({"a": [1, 2], "b": ["x", "y", "z"]})
+
+        self.assertEqual(6, len(params))
+        self.assertIn({"a": 2, "b": "z"}, params)
+
+    def test_random_search(self):
+        space = {"window": (10, 20), "spread": (Decimal("0.1"), Decimal("0.5")), "ratio": (0.5, 1.5),
+                 "interval": ["1m", "5m"]}
+        params = BacktestingSweep.random_search(space, n_samples=50, seed=1)
+
+        self.assertEqual(params, BacktestingSweep.random_search(space, n_samples=50, seed=1))
+        for sample in params:
+            self.assertIsInstance(sample["window"], int)
+            self.assertTrue(10 <= sample["window"] <= 20)
+            self.assertIsInstance(sample["spread"], Decimal)
+            self.assertTrue(Decimal("0.1") <= sample["spread"] <= Decimal("0.5"))
+            self.assertTrue(0.5 <= sample["ratio"] <= 1.5)
+            self.assertIn(sample["interval"], ["1m", "5m"])
+
+    def test_results_store_skips_incomplete_lines(self):
+        store = SweepResultsStore(self.results_path)
+        store.append(SweepResult(params={"spread": Decimal("0.1")}, results={"net_pnl": 1.5}))
+        with open(self.results_path, "a") as file:
+            file.write('{"params": {"spread": "0.2"}, "res')
+
+        results = store.load()
+
+        self.assertEqual(1, len(results))
+        self.assertEqual({"net_pnl": 1.5}, list(results.values())[0].results)
+
+    def test_shared_candles(self):
+        candles = synthetic_candles(100)
+        shared_candles = SharedCandles(self.temp_dir.name)
+        shared_candles.add("binance_ETH-USDT_1m", candles)
+
+        loaded = shared_candles.load()["binance_ETH-USDT_1m"]
+        pd.testing.assert_frame_equal(candles, loaded)
+
+        # Changes in a loaded copy are not written to the shared file
+        loaded.loc[0, "close"] = 0
+        self.assertEqual(candles["close"].iloc[0], shared_candles.load()["binance_ETH-USDT_1m"]["close"].iloc[0])
+
+    async def test_run_streams_results_and_resumes(self):
+        sweep = self.get_sweep()
+        params_list = BacktestingSweep.grid({"multiplier": [1, 2, 3]})
+
+        results = [result async for result in sweep.run(params_list)]
+
+        self.assertEqual(3, len(results))
+        mean_close = synthetic_candles(500)["close"].mean()
+        for result in results:
+            self.assertAlmostEqual(mean_close * result.params["multiplier"], result.results["net_pnl_quote"])
+            self.assertEqual("rules", result.results["trading_rules"])
+            # The workers receive the candles loaded before the sweep, they never request them
+            self.assertEqual(0, result.results["candles_feed_requests"])
+
+        params_list = BacktestingSweep.grid({"multiplier": [1, 2, 3, 4]})
+        resumed_results = [result async for result in self.get_sweep().run(params_list)]
+
+        self.assertEqual([{"multiplier": 4}], [result.params for result in resumed_results])
+        self.assertEqual(4, len(SweepResultsStore(self.results_path).load()))
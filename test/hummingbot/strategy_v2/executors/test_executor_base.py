@@ -11,6 +11,7 @@ from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
+    MarketEvent,
     MarketOrderFailureEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
@@ -162,6 +163,38 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         executor_info = self.component.executor_info
         self.assertEqual(executor_info.id, "test")
 
+    @patch.object(ExecutorBase, "get_net_pnl_pct", return_value=Decimal("0.01"))
+    @patch.object(ExecutorBase, "get_net_pnl_quote", return_value=Decimal("1.0"))
+    @patch.object(ExecutorBase, "get_cum_fees_quote", return_value=Decimal("0.1"))
+    @patch.object(ExecutorBase, "get_custom_info", return_value={})
+    def test_executor_info_is_reused_until_it_changes(self, get_custom_info_mock, *_):
+        executor_info = self.component.executor_info
+        self.assertIs(executor_info, self.component.executor_info)
+        self.assertEqual(1, get_custom_info_mock.call_count)
+
+        # The same price does not change the executor info, a different one does
+        self.component.get_price("connector1", "ETH-USDT")
+        executor_info = self.component.executor_info
+        self.component.get_price("connector1", "ETH-USDT")
+        self.assertIs(executor_info, self.component.executor_info)
+        self.strategy.connectors["connector1"].get_price_by_type.return_value = Decimal("1001")
+        self.component.get_price("connector1", "ETH-USDT")
+        self.assertIsNot(executor_info, self.component.executor_info)
+
+        executor_info = self.component.executor_info
+        self.component.process_order_event(MarketEvent.OrderCancelled.value, MagicMock(),
+                                           OrderCancelledEvent(timestamp=1234567890, order_id="OID-BUY-1"))
+        self.assertIsNot(executor_info, self.component.executor_info)
+
+        executor_info = self.component.executor_info
+        self.component.place_order("connector1", "ETH-USDT", OrderType.LIMIT, TradeType.BUY, Decimal("1"),
+                                   price=Decimal("1000"))
+        self.assertIsNot(executor_info, self.component.executor_info)
+
+        executor_info = self.component.executor_info
+        self.component._status = RunnableStatus.SHUTTING_DOWN
+        self.assertEqual(RunnableStatus.SHUTTING_DOWN, self.component.executor_info.status)
+
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
         self.assertEqual(price, Decimal("1000.0"))
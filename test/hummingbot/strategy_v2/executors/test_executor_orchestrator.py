@@ -14,6 +14,7 @@ from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
 from hummingbot.strategy_v2.executors.executor_orchestrator import ExecutorOrchestrator, PositionHeld
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
@@ -97,6 +98,25 @@ class TestExecutorOrchestrator(unittest.TestCase):
         ]
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 5)
+        for executor in self.orchestrator.active_executors["test"]:
+            self.assertIs(self.orchestrator.order_event_router, executor.order_event_router)
+            self.assertIsNone(executor.scheduler)
+            self.assertIs(executor, self.orchestrator._active_executors_by_id["test"][executor.config.id])
+
+    @patch.object(PositionExecutor, "start")
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_create_executor_with_scheduler(self, markets_recorder_mock, position_start_mock: MagicMock):
+        markets_recorder_mock.return_value = MagicMock(spec=MarketsRecorder)
+        orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy, use_executor_scheduler=True)
+        position_executor_config = PositionExecutorConfig(
+            timestamp=1234, connector_name="binance",
+            trading_pair="ETH-USDT", side=TradeType.BUY, entry_price=Decimal(100), amount=Decimal(10))
+        orchestrator.execute_action(CreateExecutorAction(executor_config=position_executor_config, controller_id="test"))
+
+        executor = orchestrator.active_executors["test"][0]
+        self.assertIsInstance(orchestrator.executor_scheduler, ExecutorScheduler)
+        self.assertIs(orchestrator.executor_scheduler, executor.scheduler)
+        position_start_mock.assert_called_once()
 
     def test_execute_actions_store_executor_active(self):
         position_executor = MagicMock(spec=PositionExecutor)
@@ -107,6 +127,7 @@ class TestExecutorOrchestrator(unittest.TestCase):
         position_executor.config = config_mock
         self.orchestrator.cached_performance["test"] = PerformanceReport()
         self.orchestrator.active_executors["test"] = [position_executor]
+        self.orchestrator._active_executors_by_id["test"] = {"test": position_executor}
         actions = [StoreExecutorAction(executor_id="test", controller_id="test")]
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 1)
@@ -122,11 +143,13 @@ class TestExecutorOrchestrator(unittest.TestCase):
         config_mock.controller_id = "test"
         position_executor.config = config_mock
         self.orchestrator.active_executors["test"] = [position_executor]
+        self.orchestrator._active_executors_by_id["test"] = {"test": position_executor}
         self.orchestrator.archived_executors["test"] = []
         self.orchestrator.cached_performance["test"] = PerformanceReport()
         actions = [StoreExecutorAction(executor_id="test", controller_id="test")]
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 0)
+        self.assertEqual({}, self.orchestrator._active_executors_by_id["test"])
 
     @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
     def test_generate_performance_report(self, mock_get_instance):
@@ -277,4 +300,5 @@ class TestExecutorOrchestrator(unittest.TestCase):
         position_executor.config = MagicMock(PositionExecutorConfig)
         position_executor.config.id = "123"
         self.orchestrator.active_executors["test"] = [position_executor]
+        self.orchestrator._active_executors_by_id["test"] = {"123": position_executor}
         self.orchestrator.stop_executor(StopExecutorAction(executor_id="123", controller_id="test"))
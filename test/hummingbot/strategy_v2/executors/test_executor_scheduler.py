@@ -0,0 +1,177 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class CountingRunnable(RunnableBase):
+
+    def __init__(self, update_interval: float = 0.01, wait: float = 0):
+        super().__init__(update_interval)
+        self.wait = wait
+        self.starts = 0
+        self.control_tasks = 0
+        self.stops = 0
+
+    async def on_start(self):
+        self.starts += 1
+
+    async def control_task(self):
+        if self.wait > 0:
+            await asyncio.sleep(self.wait)
+        self.control_tasks += 1
+
+    def on_stop(self):
+        self.stops += 1
+
+
+class FailingRunnable(CountingRunnable):
+
+    async def control_task(self):
+        raise Exception("Control task failed")
+
+
+class TaskRecordingRunnable(CountingRunnable):
+
+    def __init__(self, update_interval: float = 0.01):
+        super().__init__(update_interval)
+        self.tasks_before_waiting = []
+        self.tasks_after_waiting = []
+
+    async def control_task(self):
+        self.tasks_before_waiting.append(asyncio.current_task())
+        await asyncio.sleep(0)
+        self.tasks_after_waiting.append(asyncio.current_task())
+        await super().control_task()
+
+
+class SelfStoppingRunnable(CountingRunnable):
+
+    async def control_task(self):
+        await super().control_task()
+        self.stop()
+
+
+class TestExecutorScheduler(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+
+    def setUp(self):
+        super().setUp()
+        self.scheduler = ExecutorScheduler(tick_interval=0.01)
+        self.set_loggers(loggers=[self.scheduler.logger()])
+
+    def start(self, runnable: RunnableBase) -> RunnableBase:
+        runnable.scheduler = self.scheduler
+        runnable.start()
+        return runnable
+
+    async def test_runs_control_tasks_without_a_task_per_runnable(self):
+        tasks_before = len(asyncio.all_tasks())
+        runnables = [self.start(CountingRunnable()) for _ in range(20)]
+        # Only the tick task of the scheduler is added
+        self.assertEqual(tasks_before + 1, len(asyncio.all_tasks()))
+
+        await asyncio.sleep(0.1)
+
+        for runnable in runnables:
+            self.assertEqual(RunnableStatus.RUNNING, runnable.status)
+            self.assertEqual(1, runnable.starts)
+            self.assertGreater(runnable.control_tasks, 1)
+        metrics = self.scheduler.metrics["CountingRunnable"]
+        self.assertEqual(sum(runnable.control_tasks for runnable in runnables), metrics.runs)
+        self.assertEqual(metrics.runs, len(metrics.control_task_ms))
+        self.assertGreaterEqual(metrics.lag_percentile_ms(99), 0)
+        self.assertGreaterEqual(metrics.control_task_percentile_ms(99), metrics.control_task_percentile_ms(50))
+
+    async def test_waiting_control_task_does_not_block_other_runnables(self):
+        waiting = self.start(CountingRunnable(wait=10))
+        running = self.start(CountingRunnable())
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(0, waiting.control_tasks)
+        self.assertGreater(running.control_tasks, 1)
+        self.assertEqual(2, self.scheduler.runnables_count)
+
+    async def test_stopped_runnables_leave_the_scheduler(self):
+        runnables = [self.start(CountingRunnable()), self.start(CountingRunnable(wait=0.02))]
+        await asyncio.sleep(0.05)
+
+        for runnable in runnables:
+            runnable.stop()
+        await asyncio.sleep(0.1)
+
+        for runnable in runnables:
+            self.assertEqual(1, runnable.stops)
+        self.assertEqual(0, self.scheduler.runnables_count)
+        self.assertIsNone(self.scheduler._tick_task)
+
+    async def test_control_tasks_run_in_the_scheduler_task_until_they_first_wait(self):
+        runnable = self.start(TaskRecordingRunnable())
+        await asyncio.sleep(0.05)
+
+        self.assertGreater(runnable.control_tasks, 1)
+        self.assertEqual({self.scheduler._tick_task}, set(runnable.tasks_before_waiting))
+        self.assertNotIn(self.scheduler._tick_task, runnable.tasks_after_waiting)
+        # Each control task goes on in a task of its own
+        self.assertEqual(len(runnable.tasks_after_waiting), len(set(runnable.tasks_after_waiting)))
+
+    async def test_on_stop_runs_as_soon_as_a_waiting_runnable_is_stopped(self):
+        runnable = self.start(CountingRunnable(update_interval=10))
+        await asyncio.sleep(0.05)
+        self.assertEqual(1, runnable.control_tasks)
+
+        runnable.stop()
+
+        self.assertEqual(1, runnable.stops)
+        self.assertEqual(0, self.scheduler.runnables_count)
+
+    async def test_on_stop_runs_when_the_control_task_that_stopped_the_runnable_finishes(self):
+        runnable = self.start(SelfStoppingRunnable(update_interval=10))
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, runnable.control_tasks)
+        self.assertEqual(1, runnable.stops)
+        self.assertEqual(0, self.scheduler.runnables_count)
+
+    async def test_runnable_stopped_before_starting_runs_on_start_and_on_stop(self):
+        runnable = self.start(CountingRunnable())
+        runnable.stop()
+        self.assertEqual(0, runnable.stops)
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, runnable.starts)
+        self.assertEqual(0, runnable.control_tasks)
+        self.assertEqual(1, runnable.stops)
+
+    async def test_control_task_errors_are_logged(self):
+        runnable = self.start(FailingRunnable())
+        await asyncio.sleep(0.05)
+
+        self.assertTrue(self.is_logged("ERROR", "Control task failed"))
+        metrics = self.scheduler.metrics["FailingRunnable"]
+        self.assertGreater(metrics.errors, 1)
+        self.assertEqual(metrics.runs, metrics.errors)
+        self.assertEqual(RunnableStatus.RUNNING, runnable.status)
+
+    async def test_tick_budget_defers_due_runs(self):
+        scheduler = ExecutorScheduler(tick_interval=10, tick_budget=0)
+        runnables = [CountingRunnable() for _ in range(3)]
+        for runnable in runnables:
+            runnable.scheduler = scheduler
+            runnable.start()
+        scheduler.run_tick()
+
+        # Each tick runs at least one step: the start of the first runnable, its control task is deferred with the
+        # starts of the other two
+        self.assertEqual([1, 0, 0], [runnable.starts for runnable in runnables])
+        self.assertEqual(1, scheduler.budget_exceeded_ticks)
+        self.assertEqual(3, scheduler.metrics["CountingRunnable"].deferred_runs)
+
+        scheduler.run_tick()
+
+        self.assertEqual(1, runnables[0].control_tasks)
+        self.assertEqual([1, 0, 0], [runnable.starts for runnable in runnables])
@@ -0,0 +1,112 @@
+import unittest
+from decimal import Decimal
+from typing import List, Tuple
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderCancelledEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
+
+
+class RecordingExecutor(ExecutorBase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.processed_events: List[Tuple[str, str]] = []
+
+    def process_order_filled_event(self, event_tag, market, event: OrderFilledEvent):
+        self.processed_events.append(("filled", event.order_id))
+
+    def process_order_canceled_event(self, event_tag, market, event: OrderCancelledEvent):
+        self.processed_events.append(("canceled", event.order_id))
+
+
+class OrderEventRouterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = PubSub()
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        self.strategy.connectors = {"connector1": self.connector}
+        self.strategy.buy.side_effect = [f"OID-{i}" for i in range(10)]
+        self.router = OrderEventRouter()
+        self.executors = [self.create_executor(f"executor{i}") for i in range(3)]
+
+    def create_executor(self, executor_id: str) -> RecordingExecutor:
+        executor = RecordingExecutor(strategy=self.strategy,
+                                     connectors=["connector1"],
+                                     config=ExecutorConfigBase(id=executor_id, type="test", timestamp=1234567890))
+        executor.order_event_router = self.router
+        executor.register_events()
+        return executor
+
+    def place_buy_order(self, executor: ExecutorBase) -> str:
+        return executor.place_order(connector_name="connector1",
+                                    trading_pair="ETH-USDT",
+                                    order_type=OrderType.LIMIT,
+                                    side=TradeType.BUY,
+                                    amount=Decimal("1"),
+                                    price=Decimal("1000"))
+
+    def trigger_fill(self, order_id: str):
+        self.connector.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+            timestamp=1234567890,
+            order_id=order_id,
+            trading_pair="ETH-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("1000"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+
+    def test_single_listener_per_connector_event(self):
+        for event in OrderEventRouter.ORDER_EVENTS:
+            self.assertEqual(1, len(self.connector.get_listeners(event)))
+
+    def test_events_are_delivered_to_the_order_owner(self):
+        order_id = self.place_buy_order(self.executors[1])
+
+        self.trigger_fill(order_id)
+        self.connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(1234567890, order_id))
+
+        self.assertEqual([], self.executors[0].processed_events)
+        self.assertEqual([("filled", order_id), ("canceled", order_id)], self.executors[1].processed_events)
+        self.assertEqual([], self.executors[2].processed_events)
+
+    def test_events_of_unknown_orders_are_delivered_to_all_executors(self):
+        self.trigger_fill("OID-STRATEGY")
+
+        for executor in self.executors:
+            self.assertEqual([("filled", "OID-STRATEGY")], executor.processed_events)
+
+    def test_remove_executor(self):
+        order_id = self.place_buy_order(self.executors[0])
+        self.executors[0].unregister_events()
+
+        self.assertNotIn(order_id, self.router.executors_by_order_id)
+        self.trigger_fill(order_id)
+        self.assertEqual([], self.executors[0].processed_events)
+        self.assertEqual([("filled", order_id)], self.executors[1].processed_events)
+
+        for executor in self.executors[1:]:
+            executor.unregister_events()
+        for event in OrderEventRouter.ORDER_EVENTS:
+            self.assertEqual(0, len(self.connector.get_listeners(event)))
+
+    def test_executor_without_router_listens_to_all_events(self):
+        executor = RecordingExecutor(strategy=self.strategy,
+                                     connectors=["connector1"],
+                                     config=ExecutorConfigBase(id="standalone", type="test", timestamp=1234567890))
+        executor.register_events()
+        order_id = self.place_buy_order(self.executors[0])
+
+        self.trigger_fill(order_id)
+
+        self.assertEqual([("filled", order_id)], executor.processed_events)
+        self.assertEqual([("filled", order_id)], self.executors[0].processed_events)
+        self.assertEqual(2, len(self.connector.get_listeners(MarketEvent.OrderFilled)))